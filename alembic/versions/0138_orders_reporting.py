@@ -0,0 +1,133 @@
+"""Materialize vw_orders into an indexed orders_reporting table."""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0138_orders_reporting"
+down_revision = "0137_package_sales_proof"
+branch_labels = None
+depends_on = None
+
+
+# Statement-level triggers see every row an ingest batch, recovery update or
+# manual edit touched through transition tables, so one refresh statement per
+# DML statement replaces exactly those orders; there is no periodic full
+# refresh to schedule or forget. PostgreSQL allows transition tables only on
+# single-event triggers, hence one trigger per event sharing this function.
+SYNC_FUNCTION_SQL = """
+CREATE OR REPLACE FUNCTION public.sync_orders_reporting() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        DELETE FROM public.orders_reporting AS r
+        USING old_orders AS o
+        WHERE r.id = o.id;
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        INSERT INTO public.orders_reporting
+        SELECT s.*
+        FROM public.vw_orders_source AS s
+        WHERE s.id IN (SELECT n.id FROM new_orders AS n);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+SYNC_TRIGGERS = {
+    "trg_orders_reporting_insert": "INSERT ON public.orders REFERENCING NEW TABLE AS new_orders",
+    "trg_orders_reporting_update": (
+        "UPDATE ON public.orders REFERENCING OLD TABLE AS old_orders NEW TABLE AS new_orders"
+    ),
+    "trg_orders_reporting_delete": "DELETE ON public.orders REFERENCING OLD TABLE AS old_orders",
+}
+
+
+def _view_columns(bind: sa.Connection, view_name: str) -> list[str]:
+    return [column["name"] for column in sa.inspect(bind).get_columns(view_name, schema="public")]
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        # SQLite test databases keep the plain vw_orders view from 0117.
+        return
+
+    view_definition = bind.execute(
+        sa.text("SELECT pg_get_viewdef('public.vw_orders'::regclass, true)")
+    ).scalar_one()
+    view_columns = _view_columns(bind, "vw_orders")
+    preparer = bind.dialect.identifier_preparer
+    select_list = ",\n    ".join(preparer.quote(column) for column in view_columns)
+
+    # vw_orders_source keeps the canonical order_amount/recovery_status logic;
+    # orders_reporting stores its output and vw_orders becomes a projection of
+    # that table, so every existing reader gets index lookups unchanged.
+    op.execute(f"CREATE VIEW public.vw_orders_source AS {view_definition}")
+    op.execute(
+        """
+        CREATE TABLE public.orders_reporting AS
+        SELECT s.*
+        FROM public.vw_orders_source AS s
+        """
+    )
+    op.execute("ALTER TABLE public.orders_reporting ADD PRIMARY KEY (id)")
+    op.create_index(
+        "ix_orders_reporting_cost_center_order_date",
+        "orders_reporting",
+        ["cost_center", "order_date"],
+        schema="public",
+    )
+    op.create_index(
+        "ix_orders_reporting_cost_center_order_number",
+        "orders_reporting",
+        ["cost_center", "order_number"],
+        schema="public",
+    )
+    op.create_index(
+        "ix_orders_reporting_store_code_order_date",
+        "orders_reporting",
+        ["store_code", "order_date"],
+        schema="public",
+    )
+    op.execute(SYNC_FUNCTION_SQL)
+    for trigger_name, event in SYNC_TRIGGERS.items():
+        op.execute(
+            f"""
+            CREATE TRIGGER {trigger_name}
+            AFTER {event}
+            FOR EACH STATEMENT EXECUTE FUNCTION public.sync_orders_reporting();
+            """
+        )
+    op.execute(
+        f"""
+        CREATE OR REPLACE VIEW public.vw_orders AS
+        SELECT
+            {select_list}
+        FROM public.orders_reporting;
+        """
+    )
+    op.execute(
+        """
+        COMMENT ON TABLE public.orders_reporting IS
+        'Materialized vw_orders_source rows refreshed per statement by the trg_orders_reporting_* triggers. Columns added to orders must be added to vw_orders_source, orders_reporting and vw_orders together.';
+        """
+    )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+
+    source_definition = bind.execute(
+        sa.text("SELECT pg_get_viewdef('public.vw_orders_source'::regclass, true)")
+    ).scalar_one()
+    op.execute(f"CREATE OR REPLACE VIEW public.vw_orders AS {source_definition}")
+    for trigger_name in SYNC_TRIGGERS:
+        op.execute(f"DROP TRIGGER IF EXISTS {trigger_name} ON public.orders")
+    op.execute("DROP FUNCTION IF EXISTS public.sync_orders_reporting()")
+    op.execute("DROP TABLE IF EXISTS public.orders_reporting")
+    op.execute("DROP VIEW IF EXISTS public.vw_orders_source")
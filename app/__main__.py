@@ -126,6 +126,13 @@ def _build_parser() -> argparse.ArgumentParser:
             "mtd-same-day-fulfillment", help="Run MTD same-day fulfillment report"
         )
     )
+    _add_common_report_args(
+        report_subparsers.add_parser(
+            "run-all",
+            help="Run all report pipelines in one process, respecting report dependencies",
+        ),
+        include_orders_sync_upstream=True,
+    )
 
     crm_parser = subparsers.add_parser("crm", help="Run CRM maintenance commands")
     crm_subparsers = crm_parser.add_subparsers(dest="crm_command", required=True)
@@ -160,6 +167,15 @@ def _build_parser() -> argparse.ArgumentParser:
         default=None,
         help="Requested window size in days; CRM fetches are capped at 30 days",
     )
+    oli_rebuild.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help=(
+            "Number of stores rebuilt concurrently, each worker reusing one "
+            "browser; defaults to ORDER_LINE_ITEMS_REBUILD_WORKERS"
+        ),
+    )
     oli_rebuild.add_argument("--dry-run", action="store_true")
     oli_rebuild.add_argument(
         "--resume",
@@ -235,6 +251,8 @@ def main(argv: Sequence[str] | None = None) -> int:
                 rebuild_args.extend(["--start-date", parsed.start_date])
             if parsed.window_size:
                 rebuild_args.extend(["--window-size", str(parsed.window_size)])
+            if parsed.workers is not None:
+                rebuild_args.extend(["--workers", str(parsed.workers)])
             if parsed.stores:
                 rebuild_args.append("--stores")
                 rebuild_args.extend(parsed.stores)
@@ -320,6 +338,22 @@ def main(argv: Sequence[str] | None = None) -> int:
 
             mtd_same_day_fulfillment_main(report_args)
             return 0
+        if parsed.report_command == "run-all":
+            from datetime import date
+            from app.reports.run_all import run_all
+
+            statuses = run_all(
+                report_date=(
+                    date.fromisoformat(parsed.report_date) if parsed.report_date else None
+                ),
+                env=parsed.env,
+                force=parsed.force,
+                orders_sync_upstream_status=orders_sync_upstream_status,
+                orders_sync_upstream_run_id=orders_sync_upstream_run_id,
+            )
+            for step_name, status in statuses.items():
+                print(f"report {step_name} status={status}", flush=True)
+            return 0 if all(status == "ok" for status in statuses.values()) else 1
 
     parser.error("Unknown command")
     return 1
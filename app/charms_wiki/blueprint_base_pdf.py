@@ -1,4 +1,5 @@
 import asyncio
+import contextlib
 import csv
 import json
 import random
@@ -20,6 +21,7 @@ RAW_CSV = BASE_DIR / "wiki_links.csv"
 GROUPED_CSV = BASE_DIR / "wiki_links_grouped.csv"
 
 STATE_PATH = OUT_DIR / "merge_state.json"
+STATE_TMP = OUT_DIR / "merge_state.tmp.json"
 MERGED_PDF = OUT_DIR / "CharmsWiki_REFERENCE_MERGED.pdf"
 MERGED_TMP = OUT_DIR / "CharmsWiki_REFERENCE_MERGED.tmp.pdf"
 
@@ -28,6 +30,10 @@ MERGED_TMP = OUT_DIR / "CharmsWiki_REFERENCE_MERGED.tmp.pdf"
 NAV_TIMEOUT_MS = 45_000
 RETRY_COUNT = 2
 
+# Browser tabs capturing pages at the same time; each tab waits
+# DELAY_MIN..DELAY_MAX seconds between its own fetches.
+CAPTURE_CONCURRENCY = 3
+
 # Keep 2 for validation, then set to None for full run (388+)
 MAX_TO_SAVE = 2
 
@@ -96,13 +102,40 @@ def cache_pdf_path(design_seq: int, label: str) -> Path:
 
 
 def load_state() -> dict:
+    """
+    Manifest of cached page PDFs keyed by zero-padded design sequence:
+    {"pages": {"0001": {"file": "0001 - Name.pdf", "page_count": 3}}}.
+    State files from the old incremental merge carry no manifest; their
+    cached PDFs are picked up again as cache hits.
+    """
     if STATE_PATH.exists():
-        return json.loads(STATE_PATH.read_text(encoding="utf-8"))
-    return {"last_completed_design_seq": 0, "merged_design_seqs": []}
+        state = json.loads(STATE_PATH.read_text(encoding="utf-8"))
+        if isinstance(state.get("pages"), dict):
+            return state
+    return {"pages": {}}
 
 
 def save_state(state: dict) -> None:
-    STATE_PATH.write_text(json.dumps(state, indent=2), encoding="utf-8")
+    STATE_TMP.write_text(json.dumps(state, indent=2), encoding="utf-8")
+    STATE_TMP.replace(STATE_PATH)
+
+
+def manifest_entry(state: dict, row: LinkRow) -> dict | None:
+    """
+    Manifest entry for row, or None when it is not recorded or its cache file is gone.
+    """
+    entry = state["pages"].get(f"{row.design_seq:04d}")
+    if entry and (CACHE_DIR / entry["file"]).exists():
+        return entry
+    return None
+
+
+def record_cached_page(state: dict, row: LinkRow, pdf_path: Path) -> None:
+    state["pages"][f"{row.design_seq:04d}"] = {
+        "file": pdf_path.name,
+        "page_count": len(PdfReader(str(pdf_path)).pages),
+    }
+    save_state(state)
 
 
 def read_grouped_csv(path: Path) -> list[LinkRow]:
@@ -140,18 +173,29 @@ def read_grouped_csv(path: Path) -> list[LinkRow]:
     return [x for x in rows if x.name and x.url]
 
 
-async def download_page_pdf(context, row: LinkRow, idx: int, total: int) -> Path:
+async def discard_page(page) -> None:
+    """
+    Closes a tab left in an unknown state by a failed fetch.
+    """
+    with contextlib.suppress(Exception):
+        await page.close()
+
+
+async def download_page_pdf(context, page, row: LinkRow, idx: int, total: int):
     """
-    Downloads a single page as PDF into CACHE_DIR.
+    Downloads a single page as PDF into CACHE_DIR using a pooled browser tab.
     Idempotent: if cached PDF exists, it is reused.
+    A tab that fails an attempt is closed and the retry runs on a fresh one.
+    Returns (pdf_path, page); page is the tab to keep using, or None if none is open.
     """
     pdf_path = cache_pdf_path(row.design_seq, row.name)
     if pdf_path.exists():
         print(f"[{idx}/{total}] CACHE HIT  {pdf_path.name}")
-        return pdf_path
+        return pdf_path, page
 
     for attempt in range(RETRY_COUNT + 1):
-        page = await context.new_page()
+        if page is None:
+            page = await context.new_page()
         try:
             print(f"[{idx}/{total}] FETCH      {row.group} > {row.subgroup} :: {row.name}")
             await page.goto(row.url, wait_until="networkidle", timeout=NAV_TIMEOUT_MS)
@@ -163,49 +207,77 @@ async def download_page_pdf(context, row: LinkRow, idx: int, total: int) -> Path
                 margin={"top": "12mm", "right": "12mm", "bottom": "12mm", "left": "12mm"},
                 prefer_css_page_size=True,
             )
+            return pdf_path, page
 
-            await page.close()
-            return pdf_path
-
-        except PlaywrightTimeoutError:
-            await page.close()
+        except Exception as exc:
+            await discard_page(page)
+            page = None
             if attempt >= RETRY_COUNT:
                 raise
-            print(f"[{idx}/{total}] Timeout, retrying ({attempt+1}/{RETRY_COUNT})...")
+            kind = "Timeout" if isinstance(exc, PlaywrightTimeoutError) else "Error"
+            print(f"[{idx}/{total}] {kind}, retrying ({attempt+1}/{RETRY_COUNT})...")
             await asyncio.sleep(1.5)
 
-        except Exception:
-            await page.close()
-            if attempt >= RETRY_COUNT:
-                raise
-            print(f"[{idx}/{total}] Error, retrying ({attempt+1}/{RETRY_COUNT})...")
-            await asyncio.sleep(1.5)
+    # Should never reach here
+    return pdf_path, page
 
 
-def append_to_merged(merged_path: Path, new_pdf: Path) -> None:
+async def capture_pages(context, pending: list[tuple[int, LinkRow]], state: dict, total: int) -> None:
     """
-    Idempotent append:
-    - Reads existing merged PDF (if any)
-    - Appends new_pdf pages
-    - Writes to temp, replaces final
-
-    Ensures MERGED_PDF remains valid after each step.
+    Captures pending (idx, row) pairs on CAPTURE_CONCURRENCY tabs. Each finished
+    page is recorded in the manifest straight away, so an interrupted run only
+    repeats the pages that were in flight. If one tab fails for good, the other
+    tabs are cancelled and awaited before the error propagates.
     """
-    writer = PdfWriter()
+    queue: asyncio.Queue = asyncio.Queue()
+    for item in pending:
+        queue.put_nowait(item)
 
-    if merged_path.exists():
-        existing = PdfReader(str(merged_path))
-        for p in existing.pages:
-            writer.add_page(p)
+    async def worker() -> None:
+        page = None
+        try:
+            while not queue.empty():
+                idx, row = queue.get_nowait()
+                cached = cache_pdf_path(row.design_seq, row.name).exists()
+                pdf_path, page = await download_page_pdf(context, page, row, idx, total)
+                record_cached_page(state, row, pdf_path)
+                if cached:
+                    continue
+                delay = random.randint(DELAY_MIN, DELAY_MAX)
+                print(f"[{idx}/{total}] WAIT       {delay}s\n")
+                await asyncio.sleep(delay)
+        finally:
+            if page is not None:
+                await discard_page(page)
+
+    tasks = [asyncio.create_task(worker()) for _ in range(min(CAPTURE_CONCURRENCY, len(pending)))]
+    try:
+        await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
+def write_merged_pdf(sources: list[Path], out_pdf: Path, tmp_pdf: Path) -> None:
+    """
+    Single-pass merge:
+    - Appends each cached page PDF in order
+    - Writes to temp once, replaces final
 
-    incoming = PdfReader(str(new_pdf))
-    for p in incoming.pages:
-        writer.add_page(p)
+    Replaces the old per-page append that re-read and rewrote the whole
+    merged PDF on every step.
+    """
+    writer = PdfWriter()
+    for source in sources:
+        writer.append(str(source))
 
-    with MERGED_TMP.open("wb") as f:
+    with tmp_pdf.open("wb") as f:
         writer.write(f)
+    writer.close()
 
-    MERGED_TMP.replace(merged_path)
+    tmp_pdf.replace(out_pdf)
 
 
 async def main():
@@ -236,44 +308,35 @@ async def main():
     print(f"Total rows to process now: {total}")
 
     state = load_state()
-    last_completed = int(state.get("last_completed_design_seq", 0))
-    merged_set = set(state.get("merged_design_seqs", []))
-    print(f"Resume state: last_completed_design_seq={last_completed}, merged={len(merged_set)}\n")
-
-    chrome_path = chrome_executable_path()
-    print(f"Using local Chrome executable: {chrome_path}\n")
-
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(
-            headless=True,
-            executable_path=chrome_path,
-            args=["--no-first-run", "--no-default-browser-check", "--disable-dev-shm-usage"],
-        )
-        context = await browser.new_context()
-
-        for idx, row in enumerate(rows, start=1):
-            if row.design_seq <= last_completed:
-                print(f"[{idx}/{total}] SKIP DONE  {row.design_seq:04d} :: {row.name}")
-                continue
-
-            pdf_path = await download_page_pdf(context, row, idx, total)
-
-            if row.design_seq not in merged_set:
-                print(f"[{idx}/{total}] MERGE      + {pdf_path.name}")
-                append_to_merged(MERGED_PDF, pdf_path)
-                merged_set.add(row.design_seq)
-
-            # checkpoint after successful fetch+merge
-            state["last_completed_design_seq"] = row.design_seq
-            state["merged_design_seqs"] = sorted(merged_set)
-            save_state(state)
-
-            delay = random.randint(DELAY_MIN, DELAY_MAX)
-            print(f"[{idx}/{total}] WAIT       {delay}s\n")
-            await asyncio.sleep(delay)
-
-        await context.close()
-        await browser.close()
+    done = sum(1 for row in rows if manifest_entry(state, row))
+    print(f"Resume state: cached={done}, capture tabs={CAPTURE_CONCURRENCY}\n")
+
+    pending = []
+    for idx, row in enumerate(rows, start=1):
+        if manifest_entry(state, row):
+            print(f"[{idx}/{total}] SKIP DONE  {row.design_seq:04d} :: {row.name}")
+            continue
+        pending.append((idx, row))
+
+    if pending:
+        chrome_path = chrome_executable_path()
+        print(f"Using local Chrome executable: {chrome_path}\n")
+
+        async with async_playwright() as p:
+            browser = await p.chromium.launch(
+                headless=True,
+                executable_path=chrome_path,
+                args=["--no-first-run", "--no-default-browser-check", "--disable-dev-shm-usage"],
+            )
+            context = await browser.new_context()
+            await capture_pages(context, pending, state, total)
+            await context.close()
+            await browser.close()
+
+    sources = [CACHE_DIR / entry["file"] for row in rows if (entry := manifest_entry(state, row))]
+    if sources:
+        print(f"Writing merged PDF from {len(sources)} cached pages...")
+        write_merged_pdf(sources, MERGED_PDF, MERGED_TMP)
 
     print("Done.")
     print(f"Merged PDF: {MERGED_PDF}")
@@ -4,16 +4,19 @@ CharmsWiki Reference Binder Builder (PDF-only)
 
 - Reads existing wiki_links_grouped.csv (authoritative order) from the same folder as this script.
 - Uses local Google Chrome (not Playwright bundled Chromium) for compatibility.
+- Captures pages concurrently on a small pool of browser tabs (CAPTURE_CONCURRENCY).
 - Caches each visited page as an individual PDF (idempotent).
-- Maintains resume state (merge_state.json) so runs can continue after interruptions.
-- Produces:
-  1) CharmsWiki_REFERENCE_MERGED.pdf  (content-only, incremental merge)
+- Records every cached page PDF (and its page count) in a manifest kept in
+  merge_state.json, so runs can continue after interruptions.
+- Produces, each in a single write from the cached pages:
+  1) CharmsWiki_REFERENCE_MERGED.pdf  (content-only)
   2) CharmsWiki_REFERENCE_FINAL.pdf   (Intro + Table of Contents prepended)
 
 Table of Contents is generated AFTER download/merge, then inserted at the front of FINAL.
 """
 
 import asyncio
+import contextlib
 import csv
 import json
 import random
@@ -21,7 +24,7 @@ import re
 import sys
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Optional
 
 from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
 from pypdf import PdfReader, PdfWriter
@@ -40,6 +43,7 @@ OUT_DIR = BASE_DIR / "Wiki-PDF"
 CACHE_DIR = OUT_DIR / "_cache_pages_pdf"
 
 STATE_PATH = OUT_DIR / "merge_state.json"
+STATE_TMP = OUT_DIR / "merge_state.tmp.json"
 
 MERGED_PDF = OUT_DIR / "CharmsWiki_REFERENCE_MERGED.pdf"
 MERGED_TMP = OUT_DIR / "CharmsWiki_REFERENCE_MERGED.tmp.pdf"
@@ -52,6 +56,10 @@ FINAL_TMP = OUT_DIR / "CharmsWiki_REFERENCE_FINAL.tmp.pdf"
 NAV_TIMEOUT_MS = 45_000
 RETRY_COUNT = 2
 
+# Browser tabs capturing pages at the same time; each tab waits
+# DELAY_MIN..DELAY_MAX seconds between its own fetches.
+CAPTURE_CONCURRENCY = 3
+
 # Validation run: keep 2; set to None for full run (388+)
 MAX_TO_SAVE: Optional[int] = None
 
@@ -116,13 +124,40 @@ def cache_pdf_path(design_seq: int, label: str) -> Path:
 
 
 def load_state() -> dict:
+    """
+    Manifest of cached page PDFs keyed by zero-padded design sequence:
+    {"pages": {"0001": {"file": "0001 - Name.pdf", "page_count": 3}}}.
+    State files from the old incremental merge carry no manifest; their
+    cached PDFs are picked up again as cache hits.
+    """
     if STATE_PATH.exists():
-        return json.loads(STATE_PATH.read_text(encoding="utf-8"))
-    return {"last_completed_design_seq": 0, "merged_design_seqs": []}
+        state = json.loads(STATE_PATH.read_text(encoding="utf-8"))
+        if isinstance(state.get("pages"), dict):
+            return state
+    return {"pages": {}}
 
 
 def save_state(state: dict) -> None:
-    STATE_PATH.write_text(json.dumps(state, indent=2), encoding="utf-8")
+    STATE_TMP.write_text(json.dumps(state, indent=2), encoding="utf-8")
+    STATE_TMP.replace(STATE_PATH)
+
+
+def manifest_entry(state: dict, row: LinkRow) -> Optional[dict]:
+    """
+    Manifest entry for row, or None when it is not recorded or its cache file is gone.
+    """
+    entry = state["pages"].get(f"{row.design_seq:04d}")
+    if entry and (CACHE_DIR / entry["file"]).exists():
+        return entry
+    return None
+
+
+def record_cached_page(state: dict, row: LinkRow, pdf_path: Path) -> None:
+    state["pages"][f"{row.design_seq:04d}"] = {
+        "file": pdf_path.name,
+        "page_count": len(PdfReader(str(pdf_path)).pages),
+    }
+    save_state(state)
 
 
 def read_grouped_csv(path: Path) -> List[LinkRow]:
@@ -163,18 +198,29 @@ def read_grouped_csv(path: Path) -> List[LinkRow]:
     return rows
 
 
-async def download_page_pdf(context, row: LinkRow, idx: int, total: int) -> Path:
+async def discard_page(page) -> None:
     """
-    Downloads a single page as a PDF (rendered) into CACHE_DIR.
-    Idempotent: returns existing cache if present.
+    Closes a tab left in an unknown state by a failed fetch.
+    """
+    with contextlib.suppress(Exception):
+        await page.close()
+
+
+async def download_page_pdf(context, page, row: LinkRow, idx: int, total: int):
+    """
+    Renders a single page as a PDF into CACHE_DIR using a pooled browser tab.
+    Idempotent: if cached PDF exists, it is reused.
+    A tab that fails an attempt is closed and the retry runs on a fresh one.
+    Returns (pdf_path, page); page is the tab to keep using, or None if none is open.
     """
     pdf_path = cache_pdf_path(row.design_seq, row.name)
     if pdf_path.exists():
         print(f"[{idx}/{total}] CACHE HIT  {pdf_path.name}")
-        return pdf_path
+        return pdf_path, page
 
     for attempt in range(RETRY_COUNT + 1):
-        page = await context.new_page()
+        if page is None:
+            page = await context.new_page()
         try:
             print(f"[{idx}/{total}] FETCH      {row.group} > {row.subgroup} :: {row.name}")
             await page.goto(row.url, wait_until="networkidle", timeout=NAV_TIMEOUT_MS)
@@ -186,89 +232,97 @@ async def download_page_pdf(context, row: LinkRow, idx: int, total: int) -> Path
                 margin={"top": "12mm", "right": "12mm", "bottom": "12mm", "left": "12mm"},
                 prefer_css_page_size=True,
             )
-            await page.close()
-            return pdf_path
+            return pdf_path, page
 
-        except PlaywrightTimeoutError:
-            await page.close()
+        except Exception as exc:
+            await discard_page(page)
+            page = None
             if attempt >= RETRY_COUNT:
                 raise
-            print(f"[{idx}/{total}] Timeout, retrying ({attempt+1}/{RETRY_COUNT})...")
-            await asyncio.sleep(1.5)
-
-        except Exception:
-            await page.close()
-            if attempt >= RETRY_COUNT:
-                raise
-            print(f"[{idx}/{total}] Error, retrying ({attempt+1}/{RETRY_COUNT})...")
+            kind = "Timeout" if isinstance(exc, PlaywrightTimeoutError) else "Error"
+            print(f"[{idx}/{total}] {kind}, retrying ({attempt+1}/{RETRY_COUNT})...")
             await asyncio.sleep(1.5)
 
     # Should never reach here
-    return pdf_path
+    return pdf_path, page
 
 
-def append_to_merged(merged_path: Path, new_pdf: Path) -> None:
+async def capture_pages(context, pending: List[tuple], state: dict, total: int) -> None:
     """
-    Incrementally appends a PDF onto merged_path. merged_path remains valid after each call.
+    Captures pending (idx, row) pairs on CAPTURE_CONCURRENCY tabs. Each finished
+    page is recorded in the manifest straight away, so an interrupted run only
+    repeats the pages that were in flight. If one tab fails for good, the other
+    tabs are cancelled and awaited before the error propagates.
     """
-    writer = PdfWriter()
+    queue: asyncio.Queue = asyncio.Queue()
+    for item in pending:
+        queue.put_nowait(item)
 
-    if merged_path.exists():
-        existing = PdfReader(str(merged_path))
-        for p in existing.pages:
-            writer.add_page(p)
-
-    incoming = PdfReader(str(new_pdf))
-    for p in incoming.pages:
-        writer.add_page(p)
-
-    with MERGED_TMP.open("wb") as f:
-        writer.write(f)
-
-    MERGED_TMP.replace(merged_path)
-
-
-def rebuild_merged_from_cache(rows: List[LinkRow]) -> None:
+    async def worker() -> None:
+        page = None
+        try:
+            while not queue.empty():
+                idx, row = queue.get_nowait()
+                cached = cache_pdf_path(row.design_seq, row.name).exists()
+                pdf_path, page = await download_page_pdf(context, page, row, idx, total)
+                record_cached_page(state, row, pdf_path)
+                if cached:
+                    continue
+                delay = random.randint(DELAY_MIN, DELAY_MAX)
+                print(f"[{idx}/{total}] WAIT       {delay}s\n")
+                await asyncio.sleep(delay)
+        finally:
+            if page is not None:
+                await discard_page(page)
+
+    tasks = [asyncio.create_task(worker()) for _ in range(min(CAPTURE_CONCURRENCY, len(pending)))]
+    try:
+        await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
+def write_merged_pdf(sources: List[Path], out_pdf: Path, tmp_pdf: Path) -> None:
     """
-    Self-heal: rebuild MERGED_PDF from cached PDFs in design order.
-    Useful when state indicates completion but merged file is missing/corrupt.
+    Concatenates sources in order and writes out_pdf once (via tmp_pdf, so a
+    crash never leaves a truncated file behind).
     """
     writer = PdfWriter()
-    added_any = False
+    for source in sources:
+        writer.append(str(source))
 
-    for row in rows:
-        p = cache_pdf_path(row.design_seq, row.name)
-        if not p.exists():
-            continue
-        reader = PdfReader(str(p))
-        for page in reader.pages:
-            writer.add_page(page)
-        added_any = True
+    with tmp_pdf.open("wb") as f:
+        writer.write(f)
+    writer.close()
 
-    if not added_any:
-        return
+    tmp_pdf.replace(out_pdf)
 
-    with MERGED_TMP.open("wb") as f:
-        writer.write(f)
 
-    MERGED_TMP.replace(MERGED_PDF)
+def cached_sources(rows: List[LinkRow], state: dict) -> List[Path]:
+    """
+    Cached page PDFs recorded in the manifest, in design order.
+    """
+    return [CACHE_DIR / entry["file"] for row in rows if (entry := manifest_entry(state, row))]
 
 
-def compute_start_pages(rows: List[LinkRow], frontmatter_pages: int = 0) -> Dict[int, int]:
+def compute_start_pages(rows: List[LinkRow], state: dict, frontmatter_pages: int = 0) -> Dict[int, int]:
     """
     Starting page number (1-based) for each design_seq within the FINAL PDF.
     frontmatter_pages is added as an offset because intro+TOC are prepended.
+    Page counts come from the manifest, so no cached PDF is re-read.
     """
     starts: Dict[int, int] = {}
     cursor = 1 + int(frontmatter_pages)
 
     for row in rows:
-        p = cache_pdf_path(row.design_seq, row.name)
-        if not p.exists():
+        entry = manifest_entry(state, row)
+        if entry is None:
             continue
         starts[row.design_seq] = cursor
-        reader = PdfReader(str(p))
-        cursor += len(reader.pages)
+        cursor += int(entry["page_count"])
 
     return starts
 
@@ -388,27 +442,6 @@ def generate_frontmatter_pdf(rows: List[LinkRow], starts: Dict[int, int], out_pd
     return len(fm_reader.pages)
 
 
-def prepend_frontmatter(frontmatter_pdf: Path, merged_pdf: Path, final_pdf: Path) -> None:
-    """
-    final_pdf = frontmatter + merged
-    """
-    writer = PdfWriter()
-
-    fm = PdfReader(str(frontmatter_pdf))
-    for p in fm.pages:
-        writer.add_page(p)
-
-    if merged_pdf.exists():
-        merged = PdfReader(str(merged_pdf))
-        for p in merged.pages:
-            writer.add_page(p)
-
-    with FINAL_TMP.open("wb") as f:
-        writer.write(f)
-
-    FINAL_TMP.replace(final_pdf)
-
-
 async def main() -> None:
     # Hard requirement: read existing files, do not regenerate
     if not RAW_CSV.exists():
@@ -429,8 +462,7 @@ async def main() -> None:
         raise RuntimeError("No rows found in wiki_links_grouped.csv (after filtering).")
 
     state = load_state()
-    last_completed = int(state.get("last_completed_design_seq", 0))
-    merged_set: Set[int] = set(state.get("merged_design_seqs", []))
+    done = sum(1 for row in rows if manifest_entry(state, row))
 
     print(f"Script dir:      {BASE_DIR}")
     print(f"Grouped CSV:     {GROUPED_CSV.name}")
@@ -439,76 +471,56 @@ async def main() -> None:
     print(f"Final PDF:       {FINAL_PDF.name}")
     print(f"State file:      {STATE_PATH.name}")
     print(f"Total (this run):{total}")
-    print(f"Resume: last_completed_design_seq={last_completed}, merged={len(merged_set)}\n")
-
-    chrome_path = chrome_executable_path()
-    print(f"Using local Chrome: {chrome_path}\n")
-
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(
-            headless=True,
-            executable_path=chrome_path,
-            args=["--no-first-run", "--no-default-browser-check", "--disable-dev-shm-usage"],
-        )
-        context = await browser.new_context()
-
-        for idx, row in enumerate(rows, start=1):
-            cached_pdf = cache_pdf_path(row.design_seq, row.name)
-
-            # Self-healing skip rule:
-            # - Only skip if state says done AND the cache file exists.
-            # - If cache is missing, we must fetch again even if state says done.
-            if row.design_seq <= last_completed and cached_pdf.exists():
-                print(f"[{idx}/{total}] SKIP DONE  {row.design_seq:04d} :: {row.name}")
-                continue
-
-            pdf_path = await download_page_pdf(context, row, idx, total)
-
-            # Merge rule:
-            # - If state says it's already merged, we do not append again.
-            # - BUT if MERGED_PDF is missing, we'll rebuild later from cache.
-            if row.design_seq not in merged_set:
-                print(f"[{idx}/{total}] MERGE      + {pdf_path.name}")
-                append_to_merged(MERGED_PDF, pdf_path)
-                merged_set.add(row.design_seq)
-
-            # checkpoint after successful fetch (+ merge attempt)
-            state["last_completed_design_seq"] = row.design_seq
-            state["merged_design_seqs"] = sorted(merged_set)
-            save_state(state)
-
-            delay = random.randint(DELAY_MIN, DELAY_MAX)
-            print(f"[{idx}/{total}] WAIT       {delay}s\n")
-            await asyncio.sleep(delay)
+    print(f"Resume: cached={done}, capture tabs={CAPTURE_CONCURRENCY}\n")
+
+    # Self-healing skip rule:
+    # - Only skip if the manifest records the page AND the cache file exists.
+    # - If cache is missing, we must fetch again even if the manifest has it.
+    pending = []
+    for idx, row in enumerate(rows, start=1):
+        if manifest_entry(state, row):
+            print(f"[{idx}/{total}] SKIP DONE  {row.design_seq:04d} :: {row.name}")
+            continue
+        pending.append((idx, row))
 
-        await context.close()
-        await browser.close()
+    if pending:
+        chrome_path = chrome_executable_path()
+        print(f"Using local Chrome: {chrome_path}\n")
 
-    # Self-heal merged PDF if missing
-    if not MERGED_PDF.exists():
-        print("Merged PDF missing. Rebuilding from cached PDFs...")
-        rebuild_merged_from_cache(rows)
+        async with async_playwright() as p:
+            browser = await p.chromium.launch(
+                headless=True,
+                executable_path=chrome_path,
+                args=["--no-first-run", "--no-default-browser-check", "--disable-dev-shm-usage"],
+            )
+            context = await browser.new_context()
+            await capture_pages(context, pending, state, total)
+            await context.close()
+            await browser.close()
 
-    # If still missing, we can't make a final binder
-    if not MERGED_PDF.exists():
+    sources = cached_sources(rows, state)
+    if not sources:
         raise RuntimeError(
-            "Merged PDF was not created and could not be rebuilt. "
+            "No cached page PDFs are recorded in the manifest. "
             "Verify that cached per-page PDFs exist in Wiki-PDF/_cache_pages_pdf/."
         )
 
+    print(f"Writing merged binder from {len(sources)} cached pages...")
+    write_merged_pdf(sources, MERGED_PDF, MERGED_TMP)
+
     # Two-pass frontmatter:
     # Pass 1: build frontmatter with temporary page numbers (no offset)
     print("Generating Intro + TOC (pass 1)...")
-    starts_pass1 = compute_start_pages(rows, frontmatter_pages=0)
+    starts_pass1 = compute_start_pages(rows, state, frontmatter_pages=0)
     fm_pages = generate_frontmatter_pdf(rows, starts_pass1, FRONTMATTER_PDF)
 
     # Pass 2: rebuild TOC with correct offset
     print("Generating Intro + TOC (pass 2 with correct offsets)...")
-    starts_pass2 = compute_start_pages(rows, frontmatter_pages=fm_pages)
+    starts_pass2 = compute_start_pages(rows, state, frontmatter_pages=fm_pages)
     generate_frontmatter_pdf(rows, starts_pass2, FRONTMATTER_PDF)
 
-    print("Prepending Intro + TOC to merged binder...")
-    prepend_frontmatter(FRONTMATTER_PDF, MERGED_PDF, FINAL_PDF)
+    print("Writing final binder (Intro + TOC + cached pages)...")
+    write_merged_pdf([FRONTMATTER_PDF, *sources], FINAL_PDF, FINAL_TMP)
 
     # Sanity check: final should have more pages than frontmatter alone
     final_pages = len(PdfReader(str(FINAL_PDF)).pages)
@@ -516,7 +528,7 @@ async def main() -> None:
     if final_pages <= fm_pages_check:
         raise RuntimeError(
             "Final PDF contains only frontmatter (Intro/TOC) and no merged content. "
-            "This indicates cached PDFs were not merged or MERGED_PDF is empty."
+            "This indicates the cached page PDFs are empty."
         )
 
     print("\nDone.")
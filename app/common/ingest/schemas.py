@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 import re
+from dataclasses import dataclass
 from datetime import date, datetime
 from functools import lru_cache
-from typing import Any, Dict, Iterable, Optional
+from typing import Any, Callable, Dict, Iterable, Optional, Sequence
 
 from pydantic import BaseModel, ConfigDict, ValidationError, create_model
 
@@ -52,6 +53,63 @@ class BucketRow(BaseModel):
     model_config = ConfigDict(extra="ignore", arbitrary_types_allowed=True)
 
 
+DATE_FORMATS: tuple[str | None, ...] = (
+    None,  # datetime.fromisoformat
+    "%Y-%m-%d",
+    "%d-%m-%Y",
+    "%d/%m/%Y",
+    "%m/%d/%Y",
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%d %H:%M",
+    "%d-%m-%Y %H:%M:%S",
+    "%d-%m-%Y %H:%M",
+    "%d/%m/%Y %H:%M:%S",
+    "%d/%m/%Y %H:%M",
+    "%m/%d/%Y %H:%M:%S",
+    "%m/%d/%Y %H:%M",
+)
+
+# A month-first format only wins when its earlier day-first twin fails to parse.
+_DAY_FIRST_TWIN = {
+    "%m/%d/%Y": "%d/%m/%Y",
+    "%m/%d/%Y %H:%M:%S": "%d/%m/%Y %H:%M:%S",
+    "%m/%d/%Y %H:%M": "%d/%m/%Y %H:%M",
+}
+
+
+def _parse_date_format(fmt: str | None, raw: str) -> date:
+    if fmt is None:
+        return datetime.fromisoformat(raw).date()
+    return datetime.strptime(raw, fmt).date()
+
+
+def _parse_date_text(raw: str) -> tuple[date | None, str | None]:
+    """Return the first date parsed from ``DATE_FORMATS`` and the format used."""
+
+    for fmt in DATE_FORMATS:
+        try:
+            return _parse_date_format(fmt, raw), fmt
+        except ValueError:
+            continue
+    return None, None
+
+
+def _coerce_int(raw: str) -> int:
+    try:
+        return int(float(raw))
+    except ValueError:
+        return int(raw)
+
+
+def _coerce_bool(raw: str) -> bool:
+    lowered = raw.lower()
+    if lowered in {"1", "true"}:
+        return True
+    if lowered in {"0", "false"}:
+        return False
+    return False
+
+
 def _coerce_value(kind: str, value: Any) -> Any:
     if value is None:
         return None
@@ -63,40 +121,14 @@ def _coerce_value(kind: str, value: Any) -> Any:
         return None
 
     if kind == "int":
-        try:
-            return int(float(raw))
-        except ValueError:
-            return int(raw)
+        return _coerce_int(raw)
     if kind == "float":
         return float(raw)
     if kind == "bool":
-        lowered = raw.lower()
-        if lowered in {"1", "true"}:
-            return True
-        if lowered in {"0", "false"}:
-            return False
-        return False
+        return _coerce_bool(raw)
     if kind == "date":
-        for parser in (
-            lambda value: datetime.fromisoformat(value).date(),
-            lambda value: datetime.strptime(value, "%Y-%m-%d").date(),
-            lambda value: datetime.strptime(value, "%d-%m-%Y").date(),
-            lambda value: datetime.strptime(value, "%d/%m/%Y").date(),
-            lambda value: datetime.strptime(value, "%m/%d/%Y").date(),
-            lambda value: datetime.strptime(value, "%Y-%m-%d %H:%M:%S").date(),
-            lambda value: datetime.strptime(value, "%Y-%m-%d %H:%M").date(),
-            lambda value: datetime.strptime(value, "%d-%m-%Y %H:%M:%S").date(),
-            lambda value: datetime.strptime(value, "%d-%m-%Y %H:%M").date(),
-            lambda value: datetime.strptime(value, "%d/%m/%Y %H:%M:%S").date(),
-            lambda value: datetime.strptime(value, "%d/%m/%Y %H:%M").date(),
-            lambda value: datetime.strptime(value, "%m/%d/%Y %H:%M:%S").date(),
-            lambda value: datetime.strptime(value, "%m/%d/%Y %H:%M").date(),
-        ):
-            try:
-                return parser(raw)
-            except ValueError:
-                continue
-        return None
+        parsed, _ = _parse_date_text(raw)
+        return parsed
     return raw
 
 
@@ -208,9 +240,19 @@ def coerce_csv_row(
     data = validated.model_dump()
     if extra_fields:
         data.update(extra_fields)
+    return _finalize_row(bucket, data, _required_columns(spec))
+
 
+def _required_columns(spec: Dict[str, Any]) -> tuple[str, ...]:
     required_columns = set(spec.get("required_columns", []))
     required_columns.update(spec.get("dedupe_keys", []))
+    return tuple(required_columns)
+
+
+def _finalize_row(
+    bucket: str, data: Dict[str, Any], required_columns: Iterable[str]
+) -> Dict[str, Any]:
+    """Apply per-bucket identity and required-column rules to a coerced row."""
 
     if bucket == "missed_leads" and data.get("mobile_number") is None:
         raise SkipRow(
@@ -250,3 +292,150 @@ def coerce_csv_row(
         raise ValueError(f"Missing required values for: {', '.join(sorted(missing))}")
 
     return data
+
+
+_MISSING = object()
+_DATE_MEMO_LIMIT = 4096
+
+
+class _DateColumnParser:
+    """Per-column date converter that tries the last matching format first.
+
+    Results are identical to ``_parse_date_text``: the only earlier format that
+    can yield a different date for the same text is the day-first twin of a
+    month-first format, which is checked before the hint is accepted.
+    """
+
+    __slots__ = ("_format", "_memo")
+
+    def __init__(self) -> None:
+        self._format: Any = _MISSING
+        self._memo: Dict[str, date | None] = {}
+
+    def __call__(self, raw: str) -> date | None:
+        cached = self._memo.get(raw, _MISSING)
+        if cached is not _MISSING:
+            return cached  # type: ignore[return-value]
+        parsed = self._parse(raw)
+        if len(self._memo) < _DATE_MEMO_LIMIT:
+            self._memo[raw] = parsed
+        return parsed
+
+    def _parse(self, raw: str) -> date | None:
+        fmt = self._format
+        if fmt is not _MISSING:
+            try:
+                parsed = _parse_date_format(fmt, raw)
+            except ValueError:
+                pass
+            else:
+                twin = _DAY_FIRST_TWIN.get(fmt)
+                if twin is None:
+                    return parsed
+                try:
+                    return _parse_date_format(twin, raw)
+                except ValueError:
+                    return parsed
+        parsed, matched = _parse_date_text(raw)
+        if parsed is not None:
+            self._format = matched
+        return parsed
+
+
+def _column_converter(kind: str) -> Callable[[str], Any] | None:
+    if kind == "int":
+        return _coerce_int
+    if kind == "float":
+        return float
+    if kind == "bool":
+        return _coerce_bool
+    if kind == "date":
+        return _DateColumnParser()
+    return None
+
+
+@dataclass(frozen=True)
+class BucketRowPlan:
+    """Header resolution and converters for one bucket CSV, built once per file.
+
+    ``coerce_row`` takes the positional values produced by ``csv.reader`` and
+    returns the same dicts (and raises the same ``SkipRow``/``ValueError``) as
+    ``coerce_csv_row`` does for the equivalent ``csv.DictReader`` row.
+    """
+
+    bucket: str
+    fieldnames: tuple[str, ...]
+    output_fields: tuple[str, ...]
+    slots: tuple[tuple[str, tuple[int, ...], Callable[[str], Any] | None], ...]
+    required_columns: tuple[str, ...]
+
+    def coerce_row(
+        self,
+        values: Sequence[str | None],
+        *,
+        extra_fields: Dict[str, Any] | None = None,
+    ) -> Dict[str, Any]:
+        width = len(values)
+        data: Dict[str, Any] = dict.fromkeys(self.output_fields)
+        for dest_key, indices, converter in self.slots:
+            value = None
+            for index in indices:
+                if index < width:
+                    value = values[index]
+                    if value is not None:
+                        break
+            if value is None:
+                data[dest_key] = None
+                continue
+            raw = value.strip() if isinstance(value, str) else str(value).strip()
+            if raw == "":
+                data[dest_key] = None
+            elif converter is None:
+                data[dest_key] = raw
+            else:
+                data[dest_key] = converter(raw)
+        if extra_fields:
+            data.update(extra_fields)
+        return _finalize_row(self.bucket, data, self.required_columns)
+
+    def as_mapping(self, values: Sequence[str | None]) -> Dict[str, Any]:
+        """Rebuild the ``csv.DictReader`` view of ``values`` for logging."""
+
+        mapping: Dict[Any, Any] = dict(zip(self.fieldnames, values))
+        if len(values) > len(self.fieldnames):
+            mapping[None] = list(values[len(self.fieldnames):])
+        for fieldname in self.fieldnames[len(values):]:
+            mapping[fieldname] = None
+        return mapping
+
+
+def compile_bucket_plan(bucket: str, fieldnames: Sequence[str]) -> BucketRowPlan:
+    """Resolve ``bucket`` destination columns against a CSV header row."""
+
+    spec = MERGE_BUCKET_DB_SPECS[bucket]
+    coerce_spec: Dict[str, str] = spec["coerce"]
+    header_map = normalize_headers(list(fieldnames))
+    # csv.DictReader keeps the last value for repeated header names.
+    index_by_name = {name: index for index, name in enumerate(fieldnames)}
+
+    slots: list[tuple[str, tuple[int, ...], Callable[[str], Any] | None]] = []
+    for csv_key, dest_key in spec["column_map"].items():
+        if dest_key not in coerce_spec:
+            # Model fields come from ``coerce``; anything else is dropped.
+            continue
+        keys = (csv_key,) if isinstance(csv_key, str) else tuple(csv_key)
+        indices: list[int] = []
+        for key in keys:
+            for name in (_header_lookup(header_map, key), key):
+                index = index_by_name.get(name) if name is not None else None
+                if index is not None and index not in indices:
+                    indices.append(index)
+        slots.append((dest_key, tuple(indices), _column_converter(coerce_spec[dest_key])))
+
+    return BucketRowPlan(
+        bucket=bucket,
+        fieldnames=tuple(fieldnames),
+        output_fields=tuple(coerce_spec),
+        slots=tuple(slots),
+        required_columns=_required_columns(spec),
+    )
@@ -1,21 +1,35 @@
 from __future__ import annotations
 
 import csv
+import itertools
 from datetime import date
 from pathlib import Path
 from collections import defaultdict
 from typing import Any, Dict, Iterable, List
 
-from sqlalchemy import func, select
+from sqlalchemy import (
+    BigInteger,
+    Column,
+    Date,
+    MetaData,
+    Table,
+    Text,
+    cast,
+    false,
+    func,
+    literal_column,
+    select,
+)
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.schema import CreateTable
 
 from app.dashboard_downloader.data_quality import SKIPPED_REQUIRED_ROWS, threshold_for
 from app.dashboard_downloader.json_logger import JsonLogger, log_event
 
 from ..db import session_scope
 from .models import BUCKET_MODEL_MAP
-from .schemas import MERGE_BUCKET_DB_SPECS, SkipRow, coerce_csv_row, normalize_headers
+from .schemas import MERGE_BUCKET_DB_SPECS, SkipRow, compile_bucket_plan
 
 
 def _batched(iterable: Iterable[Dict[str, Any]], size: int) -> Iterable[List[Dict[str, Any]]]:
@@ -59,6 +73,25 @@ def _looks_like_html(csv_path: Path) -> bool:
 MAX_FAILURE_LOGS = 5
 MAX_VALUE_LENGTH = 128
 BULK_INSERT_BATCH_SIZE = 500
+STAGING_ORDINAL_COLUMN = "_ingest_ordinal"
+
+# Later values win when two rows share dedupe keys; compared left to right.
+RECENCY_FIELDS_BY_BUCKET: Dict[str, List[str]] = {
+    "missed_leads": ["pickup_created_date", "pickup_created_time"],
+    "repeat_customers": ["run_date"],
+    "nonpackage_all": [
+        "run_date",
+        "order_date",
+        "expected_delivery_date",
+        "actual_delivery_date",
+    ],
+    "undelivered_all": [
+        "run_date",
+        "order_date",
+        "expected_deliver_on",
+        "actual_deliver_on",
+    ],
+}
 
 
 def _compact_row(raw_row: Dict[str, Any]) -> Dict[str, Any]:
@@ -130,7 +163,8 @@ def _load_csv_rows(
         nonlocal total_rows, coerced_rows, failed_rows, skipped_rows, suppressed_failures, failure_logs_emitted
         with csv_path.open("r", newline="", encoding="utf-8", errors="ignore") as handle:
             try:
-                reader = csv.DictReader(handle)
+                reader = csv.reader(handle)
+                fieldnames = next(reader, None)
             except csv.Error as exc:
                 if logger:
                     sample = _read_text_sample(csv_path, limit=512)
@@ -147,7 +181,7 @@ def _load_csv_rows(
                 emit_summary("failed to parse csv file", status="warning")
                 return
 
-            if not reader.fieldnames:
+            if not fieldnames:
                 if logger:
                     sample = _read_text_sample(csv_path, limit=512)
                     log_event(
@@ -161,14 +195,17 @@ def _load_csv_rows(
                     )
                 emit_summary("csv file missing header row", status="warning")
                 return
-            header_map = normalize_headers(reader.fieldnames)
+            plan = compile_bucket_plan(bucket, fieldnames)
             try:
-                for row_index, raw_row in enumerate(reader, start=1):
+                row_index = 0
+                for raw_values in reader:
+                    if not raw_values:
+                        # csv.DictReader semantics: blank lines are not rows.
+                        continue
+                    row_index += 1
                     total_rows += 1
                     try:
-                        coerced_row = coerce_csv_row(
-                            bucket, raw_row, header_map, extra_fields=row_context
-                        )
+                        coerced_row = plan.coerce_row(raw_values, extra_fields=row_context)
                     except SkipRow as exc:
                         skipped_rows += 1
                         if skip_counters is not None:
@@ -197,7 +234,7 @@ def _load_csv_rows(
                                     message="failed to coerce csv row",
                                     row_index=row_index,
                                     error=str(exc),
-                                    raw_row=_compact_row(raw_row),
+                                    raw_row=_compact_row(plan.as_mapping(raw_values)),
                                 )
                             else:
                                 suppressed_failures += 1
@@ -282,24 +319,7 @@ def _dedupe_rows(bucket: str, spec: dict, rows: List[Dict[str, Any]]) -> List[Di
     if not dedupe_keys:
         return rows
 
-    recency_fields_by_bucket = {
-        "missed_leads": ["pickup_created_date", "pickup_created_time"],
-        "repeat_customers": ["run_date"],
-        "nonpackage_all": [
-            "run_date",
-            "order_date",
-            "expected_delivery_date",
-            "actual_delivery_date",
-        ],
-        "undelivered_all": [
-            "run_date",
-            "order_date",
-            "expected_deliver_on",
-            "actual_deliver_on",
-        ],
-    }
-
-    recency_fields = recency_fields_by_bucket.get(bucket) or ["run_date"]
+    recency_fields = RECENCY_FIELDS_BY_BUCKET.get(bucket) or ["run_date"]
 
     def key(row: Dict[str, Any]) -> tuple[Any, ...]:
         return tuple(row[field] for field in dedupe_keys)
@@ -341,29 +361,25 @@ def _dedupe_rows(bucket: str, spec: dict, rows: List[Dict[str, Any]]) -> List[Di
     return list(by_key.values())
 
 
-async def _upsert_rows(
-    session: AsyncSession,
+def _apply_conflict_policy(
+    insert_stmt: Any,
     bucket: str,
-    rows: List[Dict[str, Any]],
-) -> Dict[str, int]:
-    if not rows:
-        return {"affected_rows": 0, "deduped_rows": 0}
-
-    model = BUCKET_MODEL_MAP[bucket]
-    spec = MERGE_BUCKET_DB_SPECS[bucket]
-
-    deduped_rows = _dedupe_rows(bucket, spec, rows)
+    model: Any,
+    spec: dict,
+    *,
+    columns: List[str],
+) -> Any:
+    """Attach the per-bucket ``ON CONFLICT`` rules to ``insert_stmt``."""
 
-    insert_stmt = insert(model).values(deduped_rows)
     dedupe_keys = spec["dedupe_keys"]
     timestamp_update = {}
     if "updated_at" in model.__table__.c:
         timestamp_update["updated_at"] = func.now()
 
     if spec.get("insert_only"):
-        stmt = insert_stmt.on_conflict_do_nothing(index_elements=dedupe_keys)
-    elif bucket == "missed_leads":
-        stmt = insert_stmt.on_conflict_do_update(
+        return insert_stmt.on_conflict_do_nothing(index_elements=dedupe_keys)
+    if bucket == "missed_leads":
+        return insert_stmt.on_conflict_do_update(
             index_elements=dedupe_keys,
             set_={
                 "is_order_placed": insert_stmt.excluded["is_order_placed"],
@@ -373,8 +389,8 @@ async def _upsert_rows(
                 insert_stmt.excluded["is_order_placed"]
             ),
         )
-    elif bucket == "undelivered_all":
-        stmt = insert_stmt.on_conflict_do_update(
+    if bucket == "undelivered_all":
+        return insert_stmt.on_conflict_do_update(
             index_elements=dedupe_keys,
             set_={
                 "actual_deliver_on": insert_stmt.excluded["actual_deliver_on"],
@@ -384,17 +400,33 @@ async def _upsert_rows(
                 insert_stmt.excluded["actual_deliver_on"]
             ),
         )
-    else:
-        update_cols = {
-            col: insert_stmt.excluded[col]
-            for col in deduped_rows[0].keys()
-            if col not in dedupe_keys
-        }
-        update_cols.update(timestamp_update)
-        stmt = insert_stmt.on_conflict_do_update(
-            index_elements=dedupe_keys,
-            set_=update_cols,
-        )
+    update_cols = {
+        col: insert_stmt.excluded[col] for col in columns if col not in dedupe_keys
+    }
+    update_cols.update(timestamp_update)
+    return insert_stmt.on_conflict_do_update(
+        index_elements=dedupe_keys,
+        set_=update_cols,
+    )
+
+
+async def _upsert_rows(
+    session: AsyncSession,
+    bucket: str,
+    rows: List[Dict[str, Any]],
+) -> Dict[str, int]:
+    if not rows:
+        return {"affected_rows": 0, "deduped_rows": 0}
+
+    model = BUCKET_MODEL_MAP[bucket]
+    spec = MERGE_BUCKET_DB_SPECS[bucket]
+
+    deduped_rows = _dedupe_rows(bucket, spec, rows)
+
+    insert_stmt = insert(model).values(deduped_rows)
+    stmt = _apply_conflict_policy(
+        insert_stmt, bucket, model, spec, columns=list(deduped_rows[0].keys())
+    )
 
     result = await session.execute(stmt)
 
@@ -407,6 +439,135 @@ async def _upsert_rows(
     return {"affected_rows": rowcount, "deduped_rows": len(deduped_rows)}
 
 
+def supports_copy_load(session: AsyncSession) -> bool:
+    """Return True when ``session`` is bound to PostgreSQL through asyncpg."""
+
+    try:
+        bind = session.get_bind()
+    except Exception:  # pragma: no cover - defensive for unbound sessions
+        return False
+    dialect = getattr(bind, "dialect", None)
+    return getattr(dialect, "name", None) == "postgresql" and getattr(
+        dialect, "driver", None
+    ) == "asyncpg"
+
+
+def _staging_table(bucket: str, model: Any, columns: List[str]) -> Table:
+    table_columns = [Column(name, model.__table__.c[name].type) for name in columns]
+    table_columns.append(Column(STAGING_ORDINAL_COLUMN, BigInteger, nullable=False))
+    return Table(
+        f"_ingest_stage_{bucket}",
+        MetaData(),
+        *table_columns,
+        prefixes=["TEMPORARY"],
+        postgresql_on_commit="DROP",
+    )
+
+
+def _staging_order_by(bucket: str, staging: Table, dedupe_keys: List[str]) -> List[Any]:
+    """Mirror ``_dedupe_rows`` precedence as ``DISTINCT ON`` ordering."""
+
+    order_by: List[Any] = [staging.c[key] for key in dedupe_keys]
+    if bucket == "undelivered_all":
+        order_by.append(staging.c.actual_deliver_on.is_(None).asc())
+    if bucket == "missed_leads":
+        order_by.append(func.coalesce(staging.c.is_order_placed, false()).desc())
+    for field in RECENCY_FIELDS_BY_BUCKET.get(bucket) or ["run_date"]:
+        if field not in staging.c:
+            continue
+        column = staging.c[field]
+        if isinstance(column.type, Date):
+            order_by.append(column.desc().nulls_last())
+        else:
+            order_by.append(func.coalesce(cast(column, Text), "").desc())
+    # Ties go to the row that appeared last in the file, as in ``_dedupe_rows``.
+    order_by.append(staging.c[STAGING_ORDINAL_COLUMN].desc())
+    return order_by
+
+
+async def _copy_upsert_rows(
+    session: AsyncSession,
+    bucket: str,
+    rows: Iterable[Dict[str, Any]],
+    *,
+    batch_size: int,
+    store_counts: Dict[str, int] | None = None,
+) -> Dict[str, int]:
+    """COPY ``rows`` into a temp table and upsert them with one statement.
+
+    Rows are streamed to the staging table in ``batch_size`` chunks, deduped in
+    SQL with ``DISTINCT ON`` using the same precedence as ``_dedupe_rows`` and
+    promoted with the per-bucket conflict rules from ``_apply_conflict_policy``.
+    """
+
+    totals = {"affected_rows": 0, "deduped_rows": 0}
+    iterator = iter(rows)
+    first_row = next(iterator, None)
+    if first_row is None:
+        return totals
+
+    model = BUCKET_MODEL_MAP[bucket]
+    spec = MERGE_BUCKET_DB_SPECS[bucket]
+    dedupe_keys: List[str] = spec["dedupe_keys"]
+    columns = [column for column in first_row.keys() if column in model.__table__.c]
+    staging = _staging_table(bucket, model, columns)
+
+    connection = await session.connection()
+    await connection.execute(CreateTable(staging))
+    raw_connection = await connection.get_raw_connection()
+    driver_connection = raw_connection.driver_connection
+    copy_columns = [*columns, STAGING_ORDINAL_COLUMN]
+
+    ordinal = 0
+    for batch in _batched(itertools.chain([first_row], iterator), batch_size):
+        records = []
+        for row in batch:
+            ordinal += 1
+            records.append((*(row.get(column) for column in columns), ordinal))
+        await driver_connection.copy_records_to_table(
+            staging.name, records=records, columns=copy_columns
+        )
+
+    deduped = (
+        select(*(staging.c[column] for column in columns))
+        .distinct(*(staging.c[key] for key in dedupe_keys))
+        .order_by(*_staging_order_by(bucket, staging, dedupe_keys))
+        .cte("deduped")
+    )
+
+    if store_counts is not None:
+        store_results = await session.execute(
+            select(deduped.c.store_code, func.count())
+            .where(deduped.c.store_code.is_not(None))
+            .group_by(deduped.c.store_code)
+        )
+        for store_code, count in store_results:
+            if store_code:
+                store_counts[store_code] += int(count)
+
+    insert_stmt = insert(model).from_select(
+        columns, select(*(deduped.c[column] for column in columns))
+    )
+    upserted = (
+        _apply_conflict_policy(insert_stmt, bucket, model, spec, columns=columns)
+        .returning(literal_column("1"))
+        .cte("upserted")
+    )
+    result = await session.execute(
+        select(
+            select(func.count()).select_from(deduped).scalar_subquery(),
+            select(func.count()).select_from(upserted).scalar_subquery(),
+        )
+    )
+    deduped_count, affected_count = result.one()
+    deduped_count = int(deduped_count or 0)
+    # Keep the chunked path's accounting: conflicts skipped by the bucket rules
+    # still count as ingested rows for audit purposes.
+    totals["affected_rows"] = int(affected_count or 0) or deduped_count
+    totals["deduped_rows"] = deduped_count
+    return totals
+
+
 async def ingest_bucket(
     *,
     bucket: str,
@@ -416,6 +577,7 @@ async def ingest_bucket(
     logger: JsonLogger,
     run_id: str,
     run_date: date,
+    bulk_load: bool = False,
 ) -> Dict[str, Any]:
     totals = {"rows": 0, "deduped_rows": 0}
     ingested_by_store: Dict[str, int] = defaultdict(int)
@@ -425,22 +587,41 @@ async def ingest_bucket(
     if bucket == "missed_leads":
         store_counts = defaultdict(int)
     async with session_scope(database_url) as session:
+        use_copy_load = bulk_load and supports_copy_load(session)
+        if bulk_load and not use_copy_load:
+            log_event(
+                logger=logger,
+                phase="ingest",
+                bucket=bucket,
+                merged_file=str(csv_path),
+                status="info",
+                message="bulk load requires postgresql+asyncpg; using batched upserts",
+            )
         async with session.begin():
-            for batch in _batched(
-                _load_csv_rows(
+            csv_rows = _load_csv_rows(
+                bucket,
+                csv_path,
+                logger,
+                row_context=row_context,
+                skip_counters=skipped_required_rows,
+            )
+            if use_copy_load:
+                bulk_totals = await _copy_upsert_rows(
+                    session,
                     bucket,
-                    csv_path,
-                    logger,
-                    row_context=row_context,
-                    skip_counters=skipped_required_rows,
-                ),
-                batch_size,
-            ):
-                batch_totals = await _upsert_batch(
-                    session, bucket, batch, store_counts=store_counts
+                    csv_rows,
+                    batch_size=batch_size,
+                    store_counts=store_counts,
                 )
-                totals["rows"] += batch_totals["affected_rows"]
-                totals["deduped_rows"] += batch_totals["deduped_rows"]
+                totals["rows"] += bulk_totals["affected_rows"]
+                totals["deduped_rows"] += bulk_totals["deduped_rows"]
+            else:
+                for batch in _batched(csv_rows, batch_size):
+                    batch_totals = await _upsert_batch(
+                        session, bucket, batch, store_counts=store_counts
+                    )
+                    totals["rows"] += batch_totals["affected_rows"]
+                    totals["deduped_rows"] += batch_totals["deduped_rows"]
 
         if bucket == "missed_leads":
             model = BUCKET_MODEL_MAP[bucket]
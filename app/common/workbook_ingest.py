@@ -0,0 +1,137 @@
+"""Helpers shared by the TD and UC CRM workbook ingests."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, Mapping, Sequence
+
+import openpyxl
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, AsyncSession
+
+_TABLES_READY: set[tuple[str, tuple[str, ...]]] = set()
+
+
+def iter_sheet_rows(workbook_path: Path, *, values_only: bool = True) -> Iterator[Sequence[Any]]:
+    """Stream rows of the active sheet (header first) from a read-only workbook."""
+    wb = openpyxl.load_workbook(workbook_path, read_only=True, data_only=True)
+    try:
+        sheet = wb.active
+        # Exported workbooks do not always carry an accurate <dimension>; read every row present.
+        sheet.reset_dimensions()
+        yield from sheet.iter_rows(values_only=values_only)
+    finally:
+        wb.close()
+
+
+def without_trailing_footers(
+    rows: Iterable[Sequence[Any]], *, is_footer: Callable[[Sequence[Any]], bool]
+) -> Iterator[Sequence[Any]]:
+    """Yield ``rows`` minus any trailing run of footer rows.
+
+    Footer-looking rows are held back until a regular row follows them, so only the
+    run at the very end of the sheet is dropped.
+    """
+    pending: list[Sequence[Any]] = []
+    for values in rows:
+        if is_footer(values):
+            pending.append(values)
+            continue
+        if pending:
+            yield from pending
+            pending.clear()
+        yield values
+
+
+async def ensure_tables(
+    session: AsyncSession, metadata: sa.MetaData, *, database_url: str, label: str
+) -> None:
+    """Run ``metadata.create_all`` once per process for each database and table set."""
+
+    key = (database_url, tuple(sorted(metadata.tables)))
+    if key in _TABLES_READY:
+        return
+    bind = session.bind
+    if isinstance(bind, AsyncEngine):
+        async with bind.begin() as conn:
+            await conn.run_sync(metadata.create_all)
+    elif isinstance(bind, AsyncConnection):
+        await bind.run_sync(metadata.create_all)
+    else:
+        raise TypeError(f"Unsupported SQLAlchemy bind for {label}: {type(bind)!r}")
+    _TABLES_READY.add(key)
+
+
+def conflict_columns(table: sa.Table) -> list[str]:
+    """Return the upsert key: the first unique constraint, else the primary key."""
+
+    conflict_cols = [col.name for col in table.primary_key.columns] if table.primary_key else []
+    for constraint in table.constraints:
+        if isinstance(constraint, sa.UniqueConstraint):
+            conflict_cols = [col.name for col in constraint.columns]
+            break
+    return conflict_cols
+
+
+async def bulk_upsert(
+    session: AsyncSession,
+    table: sa.Table,
+    rows: Sequence[Mapping[str, Any]],
+    *,
+    use_sqlite: bool,
+    chunk_size: int = 500,
+) -> tuple[int, int]:
+    """Upsert ``rows`` with one multi-row statement per chunk and return (inserted, updated).
+
+    Rows sharing a conflict key collapse to the last one, matching the outcome of
+    per-row upserts. PostgreSQL reports inserts via ``RETURNING (xmax = 0)``;
+    SQLite has no ``xmax``, so inserts are the growth in the table's row count.
+    A table without a key gets plain multi-row inserts of every row.
+    """
+
+    insert_fn = sqlite_insert if use_sqlite else pg_insert
+    conflict_cols = conflict_columns(table)
+    if not conflict_cols:
+        for start in range(0, len(rows), chunk_size):
+            await session.execute(insert_fn(table).values(list(rows[start : start + chunk_size])))
+        return len(rows), 0
+
+    deduped: dict[tuple[Any, ...], Mapping[str, Any]] = {}
+    for row in rows:
+        key = tuple(row.get(col) for col in conflict_cols)
+        deduped.pop(key, None)
+        deduped[key] = row
+    if not deduped:
+        return 0, 0
+
+    count_stmt = sa.select(sa.func.count()).select_from(table)
+    rows_before = (await session.execute(count_stmt)).scalar_one() if use_sqlite else 0
+
+    deduped_rows = list(deduped.values())
+    inserted = 0
+    for start in range(0, len(deduped_rows), chunk_size):
+        chunk = deduped_rows[start : start + chunk_size]
+        insert = insert_fn(table).values(chunk)
+        stmt = insert.on_conflict_do_update(
+            index_elements=conflict_cols, set_={key: insert.excluded[key] for key in chunk[0]}
+        )
+        if use_sqlite:
+            await session.execute(stmt)
+            continue
+        result = await session.execute(stmt.returning(sa.literal_column("(xmax = 0)").label("inserted")))
+        inserted += sum(1 for (was_inserted,) in result if was_inserted)
+
+    if use_sqlite:
+        inserted = (await session.execute(count_stmt)).scalar_one() - rows_before
+    return inserted, len(deduped_rows) - inserted
+
+
+__all__ = [
+    "bulk_upsert",
+    "conflict_columns",
+    "ensure_tables",
+    "iter_sheet_rows",
+    "without_trailing_footers",
+]
@@ -65,6 +65,11 @@ DEFAULT_TD_LEADS_STORE_WORKER_TIMEOUT_SECONDS = 240
 DEFAULT_TD_LEADS_GATHER_TIMEOUT_SECONDS = 270
 DEFAULT_TD_LEADS_CANCELLATION_DRAIN_TIMEOUT_SECONDS = 10
 DEFAULT_CUSTOMER_FOLLOWUP_BACKLOG_WARNING_THRESHOLD = 20
+DEFAULT_DASHBOARD_DOWNLOAD_CONCURRENCY = 1
+DEFAULT_DASHBOARD_DOWNLOAD_MIN_REQUEST_INTERVAL_SECONDS = 0.5
+DEFAULT_PDF_RENDER_CONCURRENCY = 2
+DEFAULT_ORDER_LINE_ITEMS_REBUILD_WORKERS = 1
+DEFAULT_UC_GST_INVOICE_CACHE_TTL_DAYS = 30
 
 ENV_ONLY_KEYS = [
     "SECRET_KEY",
@@ -394,6 +399,7 @@ class Config:
     td_global_username: str
     td_global_password: str
     ingest_batch_size: int
+    ingest_bulk_load: bool
     report_email_from: str
     report_email_smtp_host: str
     report_email_smtp_port: int
@@ -408,7 +414,11 @@ class Config:
     pdf_render_headless: bool
     etl_headless: bool
     etl_step_timeout_seconds: int
+    dashboard_download_concurrency: int
+    dashboard_download_min_request_interval_seconds: float
     pdf_render_timeout_seconds: int
+    pdf_render_concurrency: int
+    order_line_items_rebuild_workers: int
     pipeline_skip_dom_logging: bool
     skip_lead_assignment: bool
     uc_ignore_https_errors: bool
@@ -422,6 +432,8 @@ class Config:
     customer_followup_external_input_dir: str
     customer_followup_archive_dir: str
     customer_followup_output_dir: str
+    uc_gst_invoice_cache_dir: str
+    uc_gst_invoice_cache_ttl_days: int
     customer_followup_backlog_warning_threshold: int
     target_compute_type: str
 
@@ -446,6 +458,9 @@ class Config:
         td_home_url = _clean_url(db_values["TD_HOME_URL"], key="TD_HOME_URL")
 
         ingest_batch_size = _parse_int(db_values["INGEST_BATCH_SIZE"], key="INGEST_BATCH_SIZE")
+        ingest_bulk_load = _parse_bool(
+            db_values.get("INGEST_BULK_LOAD", "false"), key="INGEST_BULK_LOAD"
+        )
         report_email_smtp_port = _parse_int(
             db_values["REPORT_EMAIL_SMTP_PORT"], key="REPORT_EMAIL_SMTP_PORT"
         )
@@ -499,9 +514,38 @@ class Config:
         etl_step_timeout_seconds = _parse_int(
             db_values["ETL_STEP_TIMEOUT_SECONDS"], key="ETL_STEP_TIMEOUT_SECONDS"
         )
+        dashboard_download_concurrency = _parse_positive_int(
+            db_values.get(
+                "DASHBOARD_DOWNLOAD_CONCURRENCY",
+                str(DEFAULT_DASHBOARD_DOWNLOAD_CONCURRENCY),
+            ),
+            key="DASHBOARD_DOWNLOAD_CONCURRENCY",
+        )
+        dashboard_download_min_request_interval_seconds = _parse_float(
+            db_values.get(
+                "DASHBOARD_DOWNLOAD_MIN_REQUEST_INTERVAL_SECONDS",
+                str(DEFAULT_DASHBOARD_DOWNLOAD_MIN_REQUEST_INTERVAL_SECONDS),
+            ),
+            key="DASHBOARD_DOWNLOAD_MIN_REQUEST_INTERVAL_SECONDS",
+        )
+        if dashboard_download_min_request_interval_seconds < 0:
+            raise ConfigError(
+                "Config key DASHBOARD_DOWNLOAD_MIN_REQUEST_INTERVAL_SECONDS must be >= 0"
+            )
         pdf_render_timeout_seconds = _parse_int(
             db_values["PDF_RENDER_TIMEOUT_SECONDS"], key="PDF_RENDER_TIMEOUT_SECONDS"
         )
+        pdf_render_concurrency = _parse_positive_int(
+            db_values.get("PDF_RENDER_CONCURRENCY", str(DEFAULT_PDF_RENDER_CONCURRENCY)),
+            key="PDF_RENDER_CONCURRENCY",
+        )
+        order_line_items_rebuild_workers = _parse_positive_int(
+            db_values.get(
+                "ORDER_LINE_ITEMS_REBUILD_WORKERS",
+                str(DEFAULT_ORDER_LINE_ITEMS_REBUILD_WORKERS),
+            ),
+            key="ORDER_LINE_ITEMS_REBUILD_WORKERS",
+        )
         pipeline_skip_dom_logging = _parse_bool(
             db_values["pipeline_skip_dom_logging"], key="pipeline_skip_dom_logging"
         )
@@ -574,6 +618,17 @@ class Config:
             db_values.get("CUSTOMER_FOLLOWUP_OUTPUT_DIR"),
             default=str(Path(reports_root) / "outputs" / "customer_followup"),
         )
+        uc_gst_invoice_cache_dir = _clean_optional_path_config(
+            db_values.get("UC_GST_INVOICE_CACHE_DIR"),
+            default=str(Path(reports_root) / "cache" / "uc_gst_invoices"),
+        )
+        uc_gst_invoice_cache_ttl_days = _parse_positive_int(
+            db_values.get(
+                "UC_GST_INVOICE_CACHE_TTL_DAYS",
+                str(DEFAULT_UC_GST_INVOICE_CACHE_TTL_DAYS),
+            ),
+            key="UC_GST_INVOICE_CACHE_TTL_DAYS",
+        )
         customer_followup_backlog_warning_threshold = _parse_positive_int(
             db_values.get(
                 "CUSTOMER_FOLLOWUP_BACKLOG_WARNING_THRESHOLD",
@@ -640,6 +695,7 @@ class Config:
             td_global_username=td_global_username,
             td_global_password=td_global_password,
             ingest_batch_size=ingest_batch_size,
+            ingest_bulk_load=ingest_bulk_load,
             report_email_from=report_email_from,
             report_email_smtp_host=report_email_smtp_host,
             report_email_smtp_port=report_email_smtp_port,
@@ -654,7 +710,13 @@ class Config:
             pdf_render_headless=pdf_render_headless,
             etl_headless=etl_headless,
             etl_step_timeout_seconds=etl_step_timeout_seconds,
+            dashboard_download_concurrency=dashboard_download_concurrency,
+            dashboard_download_min_request_interval_seconds=(
+                dashboard_download_min_request_interval_seconds
+            ),
             pdf_render_timeout_seconds=pdf_render_timeout_seconds,
+            pdf_render_concurrency=pdf_render_concurrency,
+            order_line_items_rebuild_workers=order_line_items_rebuild_workers,
             pipeline_skip_dom_logging=pipeline_skip_dom_logging,
             skip_lead_assignment=skip_lead_assignment,
             uc_ignore_https_errors=uc_ignore_https_errors,
@@ -668,6 +730,8 @@ class Config:
             customer_followup_external_input_dir=customer_followup_external_input_dir,
             customer_followup_archive_dir=customer_followup_archive_dir,
             customer_followup_output_dir=customer_followup_output_dir,
+            uc_gst_invoice_cache_dir=uc_gst_invoice_cache_dir,
+            uc_gst_invoice_cache_ttl_days=uc_gst_invoice_cache_ttl_days,
             customer_followup_backlog_warning_threshold=customer_followup_backlog_warning_threshold,
             target_compute_type=target_compute_type,
         )
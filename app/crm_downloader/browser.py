@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+import asyncio
+import contextlib
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, AsyncIterator, Dict
 
-from playwright.async_api import Browser
+from playwright.async_api import Browser, async_playwright
 
 from app.config import config
 from app.dashboard_downloader.json_logger import JsonLogger, log_event
@@ -61,3 +65,106 @@ async def launch_browser(*, playwright: Any, logger: JsonLogger) -> Browser:
             )
             return await playwright.chromium.launch(**launch_kwargs)
         raise
+
+
+@dataclass
+class _PooledBrowser:
+    slot: int
+    browser: Browser | None = None
+    uses: int = 0
+
+
+class BrowserPool:
+    """Fixed number of browsers shared by concurrent store workers.
+
+    Each lease hands one browser to a single worker, which opens its own isolated
+    contexts on it. Browsers are launched on first use, relaunched after ``max_uses``
+    leases or once found disconnected, and any contexts a lease leaves open are closed
+    when it is returned.
+    """
+
+    def __init__(self, *, size: int, logger: JsonLogger, max_uses: int = 20) -> None:
+        self.size = max(1, size)
+        self.max_uses = max(1, max_uses)
+        self._logger = logger
+        self._idle: asyncio.Queue[_PooledBrowser] = asyncio.Queue()
+        for slot in range(self.size):
+            self._idle.put_nowait(_PooledBrowser(slot=slot))
+        self._playwright: Any = None
+        self._playwright_lock = asyncio.Lock()
+        self.launches = 0
+        self.recycles = 0
+        self.leases = 0
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "browser_pool_size": self.size,
+            "browser_pool_launches": self.launches,
+            "browser_pool_recycles": self.recycles,
+            "browser_pool_leases": self.leases,
+        }
+
+    @asynccontextmanager
+    async def lease(self) -> AsyncIterator[Browser]:
+        pooled = await self._idle.get()
+        try:
+            browser = await self._checkout(pooled)
+            self.leases += 1
+            yield browser
+        finally:
+            try:
+                await self._checkin(pooled)
+            finally:
+                self._idle.put_nowait(pooled)
+
+    async def close(self) -> None:
+        while not self._idle.empty():
+            pooled = self._idle.get_nowait()
+            await self._discard(pooled, reason=None)
+        if self._playwright is not None:
+            with contextlib.suppress(Exception):
+                await self._playwright.stop()
+            self._playwright = None
+
+    async def _checkout(self, pooled: _PooledBrowser) -> Browser:
+        if pooled.browser is not None:
+            if not pooled.browser.is_connected():
+                await self._discard(pooled, reason="disconnected")
+            elif pooled.uses >= self.max_uses:
+                await self._discard(pooled, reason="max_uses")
+        if pooled.browser is None:
+            async with self._playwright_lock:
+                if self._playwright is None:
+                    self._playwright = await async_playwright().start()
+            pooled.browser = await launch_browser(playwright=self._playwright, logger=self._logger)
+            pooled.uses = 0
+            self.launches += 1
+        pooled.uses += 1
+        return pooled.browser
+
+    async def _checkin(self, pooled: _PooledBrowser) -> None:
+        browser = pooled.browser
+        if browser is None:
+            return
+        if not browser.is_connected():
+            await self._discard(pooled, reason="disconnected")
+            return
+        for context in list(browser.contexts):
+            with contextlib.suppress(Exception):
+                await context.close()
+
+    async def _discard(self, pooled: _PooledBrowser, *, reason: str | None) -> None:
+        browser, pooled.browser, pooled.uses = pooled.browser, None, 0
+        if browser is None:
+            return
+        if reason:
+            self.recycles += 1
+            log_event(
+                logger=self._logger,
+                phase="init",
+                message="Recycling pooled browser",
+                browser_slot=pooled.slot,
+                reason=reason,
+            )
+        with contextlib.suppress(Exception):
+            await browser.close()
@@ -3,12 +3,13 @@ from __future__ import annotations
 import argparse
 import asyncio
 import contextlib
+import contextvars
 import json
 from dataclasses import dataclass, field
 from datetime import date, datetime, timezone
 from pathlib import Path
 from types import SimpleNamespace
-from typing import Any, Literal, Mapping, Protocol, Sequence
+from typing import Any, Awaitable, Callable, Literal, Mapping, Protocol, Sequence
 
 import sqlalchemy as sa
 
@@ -1363,6 +1364,80 @@ def _storage_state_path(store: RebuildStore) -> Path | None:
     return Path(raw_path) if raw_path else None
 
 
+class _WorkerBrowser:
+    """Browser launched lazily on first UC fetch and shared by one rebuild worker."""
+
+    def __init__(self, *, logger: JsonLogger) -> None:
+        self._logger = logger
+        self._playwright: Any = None
+        self._browser: Any = None
+
+    async def get(self) -> Any:
+        if self._browser is not None and self._browser.is_connected():
+            return self._browser
+        if self._playwright is None:
+            from playwright.async_api import async_playwright
+
+            self._playwright = await async_playwright().start()
+        self._browser = await launch_browser(
+            playwright=self._playwright, logger=self._logger
+        )
+        return self._browser
+
+    async def close(self) -> None:
+        browser, self._browser = self._browser, None
+        playwright, self._playwright = self._playwright, None
+        if browser is not None:
+            with contextlib.suppress(Exception):
+                await browser.close()
+        if playwright is not None:
+            with contextlib.suppress(Exception):
+                await playwright.stop()
+
+
+_WORKER_BROWSER: contextvars.ContextVar[_WorkerBrowser | None] = contextvars.ContextVar(
+    "order_line_items_rebuild_worker_browser", default=None
+)
+
+
+async def _run_store_workers(
+    stores: Sequence[RebuildStore],
+    rebuild_store: Callable[[RebuildStore], Awaitable[None]],
+    *,
+    worker_count: int,
+    logger: JsonLogger,
+) -> None:
+    """Rebuild ``stores`` on ``worker_count`` workers, each reusing one browser.
+
+    Stores are independent, so each worker takes the next pending store and
+    runs its windows in order. The first error escaping a store cancels the
+    other workers and is re-raised.
+    """
+
+    pending: asyncio.Queue[RebuildStore] = asyncio.Queue()
+    for store in stores:
+        pending.put_nowait(store)
+
+    async def worker() -> None:
+        worker_browser = _WorkerBrowser(logger=logger)
+        token = _WORKER_BROWSER.set(worker_browser)
+        try:
+            while not pending.empty():
+                await rebuild_store(pending.get_nowait())
+        finally:
+            _WORKER_BROWSER.reset(token)
+            await worker_browser.close()
+
+    tasks = [asyncio.create_task(worker()) for _ in range(worker_count)]
+    try:
+        await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
 async def default_fetch_snapshot(
     *,
     source: Source,
@@ -1396,52 +1471,79 @@ async def default_fetch_snapshot(
             logger=logger,
         )
 
+    worker_browser = _WORKER_BROWSER.get()
+    if worker_browser is not None:
+        return await _fetch_uc_snapshot(
+            browser=await worker_browser.get(),
+            store=store,
+            window=window,
+            logger=logger,
+            close_context=True,
+        )
+
     from playwright.async_api import async_playwright
 
     async with async_playwright() as playwright:
         browser = await launch_browser(playwright=playwright, logger=logger)
         try:
-            if store.raw_store is None:
-                raise ValueError(
-                    "UC rebuild stores must include the raw UcStore auth config"
-                )
-            page_preparation = await prepare_uc_api_page_for_store(
-                browser=browser,
-                store=store.raw_store,
-                logger=logger,
-                source="order_line_items_rebuild",
-            )
-            if not page_preparation.ok or page_preparation.page is None:
-                raise RuntimeError(
-                    f"UC API page preparation failed for {store.store_code}: "
-                    f"{page_preparation.message}"
-                )
-            extract = await collect_gst_orders_via_api(
-                page=page_preparation.page,
-                store_code=store.store_code,
-                logger=logger,
-                from_date=window.start,
-                to_date=window.end,
-            )
-            diagnostics = _uc_diagnostics_from_gst_extract(extract)
-            zero_snapshot_class = _classify_uc_zero_snapshot(diagnostics)
-            return SourceSnapshot(
-                line_item_rows=list(getattr(extract, "order_detail_rows", []) or []),
-                order_snapshots=list(
-                    getattr(extract, "order_detail_snapshot_rows", []) or []
-                ),
-                zero_snapshot_class=zero_snapshot_class,
-                source_fetch_error_class=(
-                    zero_snapshot_class
-                    if zero_snapshot_class == "source_fetch_auth_failure"
-                    else None
-                ),
-                uc_diagnostics=diagnostics,
+            return await _fetch_uc_snapshot(
+                browser=browser, store=store, window=window, logger=logger
             )
         finally:
             await browser.close()
 
 
+async def _fetch_uc_snapshot(
+    *,
+    browser: Any,
+    store: RebuildStore,
+    window: RebuildWindow,
+    logger: JsonLogger,
+    close_context: bool = False,
+) -> SourceSnapshot:
+    if store.raw_store is None:
+        raise ValueError("UC rebuild stores must include the raw UcStore auth config")
+    page_preparation = await prepare_uc_api_page_for_store(
+        browser=browser,
+        store=store.raw_store,
+        logger=logger,
+        source="order_line_items_rebuild",
+    )
+    try:
+        if not page_preparation.ok or page_preparation.page is None:
+            raise RuntimeError(
+                f"UC API page preparation failed for {store.store_code}: "
+                f"{page_preparation.message}"
+            )
+        extract = await collect_gst_orders_via_api(
+            page=page_preparation.page,
+            store_code=store.store_code,
+            logger=logger,
+            from_date=window.start,
+            to_date=window.end,
+        )
+    finally:
+        # A shared worker browser outlives the window, so the store's context
+        # must not; a per-window browser closes it along with the browser.
+        context = getattr(page_preparation, "context", None)
+        if close_context and context is not None:
+            with contextlib.suppress(Exception):
+                await context.close()
+    diagnostics = _uc_diagnostics_from_gst_extract(extract)
+    zero_snapshot_class = _classify_uc_zero_snapshot(diagnostics)
+    return SourceSnapshot(
+        line_item_rows=list(getattr(extract, "order_detail_rows", []) or []),
+        order_snapshots=list(getattr(extract, "order_detail_snapshot_rows", []) or []),
+        zero_snapshot_class=zero_snapshot_class,
+        source_fetch_error_class=(
+            zero_snapshot_class
+            if zero_snapshot_class == "source_fetch_auth_failure"
+            else None
+        ),
+        uc_diagnostics=diagnostics,
+    )
+
+
 def _source_snapshot_from_td_source_result(
     *,
     source_result: TdSourceSnapshotFetchResult,
@@ -2211,10 +2313,15 @@ async def run_rebuild(
     fetch_snapshot: SnapshotFetcher = default_fetch_snapshot,
     skip_auth_preflight: bool = False,
     allow_ambiguous_empty: bool = False,
+    workers: int | None = None,
 ) -> list[WindowMetrics]:
     started_at = datetime.now(timezone.utc)
     if resume_run_id and not resume:
         raise ValueError("resume_run_id requires resume=True")
+    if workers is None:
+        workers = int(getattr(config, "order_line_items_rebuild_workers", 1) or 1)
+    if workers < 1:
+        raise ValueError("workers must be at least 1")
     run_id = run_id or new_run_id()
     logger = logger or get_logger(run_id)
     database_url = getattr(config, "database_url", None)
@@ -2299,6 +2406,7 @@ async def run_rebuild(
             resume_scope="source_store_window" if resume else None,
             resume_run_id_filter=resume_run_id,
             resume_ignores_current_run_id=bool(resume and resume_run_id is None),
+            workers=workers,
         )
         if resume:
             log_event(
@@ -2314,7 +2422,8 @@ async def run_rebuild(
                 resume_run_id_filter=resume_run_id,
                 resume_ignores_current_run_id=resume_run_id is None,
             )
-        for store in stores:
+
+        async def _rebuild_store(store: RebuildStore) -> None:
             store_start_date = start_date or store.start_date
             if store_start_date is None:
                 raise RuntimeError(
@@ -2519,6 +2628,23 @@ async def run_rebuild(
                                 dry_run=False,
                             )
                         break
+
+        await _run_store_workers(
+            stores,
+            _rebuild_store,
+            worker_count=min(workers, len(stores)) or 1,
+            logger=logger,
+        )
+        # Workers finish stores in any order; report windows in store order.
+        store_order = {
+            (store.source, store.store_code.upper()): index
+            for index, store in enumerate(stores)
+        }
+        metrics.sort(
+            key=lambda metric: store_order.get(
+                (metric.source, metric.store_code.upper()), len(store_order)
+            )
+        )
         skipped_windows = [
             skipped_window_details[key]
             for key in sorted(
@@ -2880,6 +3006,15 @@ def _build_parser() -> argparse.ArgumentParser:
             "independently verifying source sessions."
         ),
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help=(
+            "Number of stores rebuilt concurrently, each worker reusing one "
+            "browser; defaults to ORDER_LINE_ITEMS_REBUILD_WORKERS"
+        ),
+    )
     parser.add_argument("--run-id", default=None)
     return parser
 
@@ -2890,6 +3025,8 @@ async def _async_entrypoint(argv: Sequence[str] | None = None) -> None:
         raise SystemExit("--fresh/--ignore-progress cannot be combined with --resume")
     if args.resume_run_id and not args.resume:
         raise SystemExit("--resume-run-id requires --resume")
+    if args.workers is not None and args.workers < 1:
+        raise SystemExit("--workers must be at least 1")
     try:
         await run_rebuild(
             source_selection=args.source,
@@ -2904,6 +3041,7 @@ async def _async_entrypoint(argv: Sequence[str] | None = None) -> None:
             resume_run_id=args.resume_run_id,
             run_id=args.run_id,
             skip_auth_preflight=args.skip_auth_preflight,
+            workers=args.workers,
         )
     except (
         OrderLineItemsRebuildIncomplete,
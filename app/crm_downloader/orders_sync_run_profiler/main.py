@@ -29,6 +29,7 @@ except Exception:  # pragma: no cover - fallback when asyncpg symbol path change
 from app.common.date_utils import aware_now, get_timezone, normalize_store_codes
 from app.common.db import PoolSettings, session_scope
 from app.config import config
+from app.crm_downloader.browser import BrowserPool
 from app.crm_downloader.config import default_download_dir
 from app.crm_downloader.orders_sync_window import (
     fetch_last_success_window_end,
@@ -86,6 +87,9 @@ STORE_LOCK_TIMEOUT_ENV = "ORDERS_SYNC_PROFILER_STORE_LOCK_TIMEOUT_SECONDS"
 WINDOW_STATE_TIMEOUT_ENV = "ORDERS_SYNC_PROFILER_WINDOW_STATE_TIMEOUT_SECONDS"
 DEFAULT_STORE_LOCK_TIMEOUT_SECONDS = 30.0
 DEFAULT_WINDOW_STATE_TIMEOUT_SECONDS = 30.0
+SHARED_BROWSER_POOL_ENV = "ORDERS_SYNC_PROFILER_SHARED_BROWSER_POOL"
+BROWSER_MAX_USES_ENV = "ORDERS_SYNC_PROFILER_BROWSER_MAX_USES"
+DEFAULT_BROWSER_MAX_USES = 20
 STORE_LOCK_RETRY_INTERVAL_SECONDS = 0.1
 UC_WARNING_ROW_SAMPLE_LIMIT = 5
 
@@ -2565,6 +2569,7 @@ async def _run_store_windows(
     overlap_days: int | None,
     from_date: date | None,
     to_date: date | None,
+    browser_pool: BrowserPool | None = None,
 ) -> tuple[
     str,
     list[tuple[date, date]],
@@ -2685,15 +2690,20 @@ async def _run_store_windows(
                 window_attempt=attempts,
                 window_run_id=attempt_run_id,
             )
-            await pipeline_fn(
-                run_env=run_env,
-                run_id=attempt_run_id,
-                from_date=window_start,
-                to_date=window_end,
-                store_codes=[store.store_code],
-                run_orders=True,
-                run_sales=True,
-            )
+            pipeline_kwargs: dict[str, Any] = {
+                "run_env": run_env,
+                "run_id": attempt_run_id,
+                "from_date": window_start,
+                "to_date": window_end,
+                "store_codes": [store.store_code],
+                "run_orders": True,
+                "run_sales": True,
+            }
+            if browser_pool is None:
+                await pipeline_fn(**pipeline_kwargs)
+            else:
+                async with browser_pool.lease() as shared_browser:
+                    await pipeline_fn(**pipeline_kwargs, shared_browser=shared_browser)
             summary = await fetch_summary_for_run(config.database_url, attempt_run_id)
             attempt_row_facts = _extract_row_facts_from_summary(summary)
             if pipeline_name == "uc_orders_sync":
@@ -3161,6 +3171,7 @@ async def _process_store(
     from_date: date | None,
     to_date: date | None,
     enable_store_locks: bool,
+    browser_pool: BrowserPool | None = None,
 ) -> StoreRunResult:
     try:
         if enable_store_locks:
@@ -3186,6 +3197,7 @@ async def _process_store(
                     overlap_days=overlap_days,
                     from_date=from_date,
                     to_date=to_date,
+                    browser_pool=browser_pool,
                 )
         else:
             (
@@ -3209,6 +3221,7 @@ async def _process_store(
                 overlap_days=overlap_days,
                 from_date=from_date,
                 to_date=to_date,
+                browser_pool=browser_pool,
             )
     except StoreLockTimeoutError as exc:
         return _failed_store_result(
@@ -3267,6 +3280,7 @@ async def main(
         return
     pool_settings = _resolve_pool_settings()
     enable_store_locks = _env_flag(STORE_LOCKS_ENABLED_ENV)
+    shared_browser_pool = _env_flag(SHARED_BROWSER_POOL_ENV)
     log_event(
         logger=logger,
         phase="init",
@@ -3276,6 +3290,7 @@ async def main(
         requested_max_workers=max_workers,
         db_pool_size=pool_settings.pool_size,
         db_pool_max_overflow=pool_settings.max_overflow,
+        shared_browser_pool=shared_browser_pool,
     )
     if enable_store_locks:
         log_event(
@@ -3332,6 +3347,16 @@ async def main(
         else:
             group_max_workers = max_workers
         semaphore = asyncio.Semaphore(max(1, group_max_workers))
+        # Opt-in: one browser per worker for the whole run instead of a launch per store window.
+        browser_pool = (
+            BrowserPool(
+                size=group_max_workers,
+                logger=logger,
+                max_uses=max(1, _env_int(BROWSER_MAX_USES_ENV, DEFAULT_BROWSER_MAX_USES)),
+            )
+            if shared_browser_pool
+            else None
+        )
 
         active_workers = 0
 
@@ -3372,12 +3397,26 @@ async def main(
                             from_date=from_date,
                             to_date=to_date,
                             enable_store_locks=enable_store_locks,
+                            browser_pool=browser_pool,
                         ),
                     )
                 finally:
                     active_workers = max(0, active_workers - 1)
 
-        return await asyncio.gather(*[_guarded(store) for store in stores])
+        try:
+            return await asyncio.gather(*[_guarded(store) for store in stores])
+        finally:
+            if browser_pool is not None:
+                await browser_pool.close()
+                log_event(
+                    logger=logger,
+                    phase="store",
+                    status="info",
+                    message="Closed shared browser pool",
+                    run_id=resolved_run_id,
+                    pipeline_group=group,
+                    **browser_pool.stats(),
+                )
 
     group_results = await asyncio.gather(
         *[
@@ -12,7 +12,7 @@ from dataclasses import dataclass, field
 from datetime import date, datetime, timezone
 from decimal import Decimal, InvalidOperation
 from pathlib import Path
-from typing import Any, Awaitable, Mapping, Sequence, TypeVar
+from typing import Any, Awaitable, Collection, Mapping, Sequence, TypeVar
 from zoneinfo import ZoneInfo
 
 import openpyxl
@@ -730,56 +730,82 @@ def _set_td_order_history_diagnostics(
     row["order_history_matched_rows_for_mobile"] = matched_rows_for_mobile
 
 
-async def _fetch_td_customer_last_order_facts(
+@dataclass
+class _TdOrderHistoryIndex:
+    """Order history for one cost center, keyed by normalized mobile, built from a single vw_orders scan."""
+
+    candidate_rows: int = 0
+    order_counts: dict[str, int] = field(default_factory=dict)
+    order_amounts: dict[str, list[Decimal]] = field(default_factory=dict)
+    latest_orders: dict[str, Mapping[str, Any]] = field(default_factory=dict)
+
+
+async def _load_td_order_history_index(
     *,
     session: Any,
-    cost_center: Any,
-    mobile_number: Any,
-) -> dict[str, Any]:
-    default_facts: dict[str, Any] = {
-        "last_order_date": None,
-        "last_order_number": None,
-        "last_payment_date": None,
-        "last_service_names": "",
-    }
-    scoped_cost_center = str(cost_center or "").strip()
-    normalized_mobile = _normalize_mobile_number(mobile_number)
-    if not scoped_cost_center or not normalized_mobile:
-        return default_facts
-
+    lookup_column: str,
+    lookup_value: str,
+    normalized_mobiles: Collection[str],
+    include_amounts: bool = True,
+    include_latest_orders: bool = True,
+) -> _TdOrderHistoryIndex:
     vw_orders = sa.table(
         "vw_orders",
         sa.column("cost_center"),
+        sa.column("store_code"),
         sa.column("mobile_number"),
         sa.column("order_number"),
         sa.column("order_date"),
+        sa.column("order_amount"),
     )
-    order_rows = (
-        await session.execute(
-            sa.select(vw_orders.c.order_number, vw_orders.c.order_date, vw_orders.c.mobile_number)
-            .where(vw_orders.c.cost_center == scoped_cost_center)
-            .order_by(vw_orders.c.order_date.desc(), vw_orders.c.order_number.desc())
+    columns = [vw_orders.c.mobile_number]
+    if include_amounts:
+        columns.append(vw_orders.c.order_amount)
+    query = sa.select(*columns).where(vw_orders.c[lookup_column] == lookup_value)
+    if include_latest_orders:
+        # Newest first so the first match per mobile is its last order.
+        query = query.add_columns(vw_orders.c.order_number, vw_orders.c.order_date).order_by(
+            vw_orders.c.order_date.desc(), vw_orders.c.order_number.desc()
         )
-    ).mappings().all()
-    latest_order = next(
-        (
-            order_row
-            for order_row in order_rows
-            if _normalize_mobile_number(order_row.get("mobile_number")) == normalized_mobile
-        ),
-        None,
+
+    index = _TdOrderHistoryIndex()
+    normalized_by_raw_mobile: dict[Any, str | None] = {}
+    for order_row in (await session.execute(query)).mappings():
+        index.candidate_rows += 1
+        raw_mobile = order_row.get("mobile_number")
+        if raw_mobile not in normalized_by_raw_mobile:
+            normalized_by_raw_mobile[raw_mobile] = _normalize_mobile_number(raw_mobile)
+        normalized_order_mobile = normalized_by_raw_mobile[raw_mobile]
+        if normalized_order_mobile not in normalized_mobiles:
+            continue
+        index.order_counts[normalized_order_mobile] = index.order_counts.get(normalized_order_mobile, 0) + 1
+        if include_amounts:
+            amount = _as_decimal(order_row.get("order_amount"))
+            if amount is not None:
+                index.order_amounts.setdefault(normalized_order_mobile, []).append(amount)
+        if include_latest_orders:
+            index.latest_orders.setdefault(normalized_order_mobile, order_row)
+    return index
+
+
+async def _fetch_td_last_order_facts_by_mobile(
+    *,
+    session: Any,
+    cost_center: str,
+    latest_orders: Mapping[str, Mapping[str, Any]],
+) -> dict[str, dict[str, Any]]:
+    facts_by_mobile: dict[str, dict[str, Any]] = {}
+    for normalized_mobile, latest_order in latest_orders.items():
+        facts_by_mobile[normalized_mobile] = {
+            **_td_empty_last_order_facts(),
+            "last_order_date": latest_order.get("order_date"),
+            "last_order_number": str(latest_order.get("order_number") or "").strip() or None,
+        }
+    order_numbers = sorted(
+        {facts["last_order_number"] for facts in facts_by_mobile.values() if facts["last_order_number"]}
     )
-    if latest_order is None:
-        return default_facts
-
-    last_order_number = str(latest_order.get("order_number") or "").strip() or None
-    facts = {
-        **default_facts,
-        "last_order_date": latest_order.get("order_date"),
-        "last_order_number": last_order_number,
-    }
-    if last_order_number is None:
-        return facts
+    if not order_numbers:
+        return facts_by_mobile
 
     sales = sa.table(
         "sales",
@@ -787,16 +813,17 @@ async def _fetch_td_customer_last_order_facts(
         sa.column("order_number"),
         sa.column("payment_date"),
     )
-    payment_row = (
+    payment_rows = (
         await session.execute(
-            sa.select(sales.c.payment_date)
-            .where(sales.c.cost_center == scoped_cost_center)
-            .where(sales.c.order_number == last_order_number)
-            .order_by(sales.c.payment_date.desc())
-            .limit(1)
+            sa.select(sales.c.order_number, sales.c.payment_date)
+            .where(sales.c.cost_center == cost_center)
+            .where(sales.c.order_number.in_(order_numbers))
+            .order_by(sales.c.order_number.asc(), sales.c.payment_date.desc())
         )
-    ).mappings().first()
-    facts["last_payment_date"] = payment_row.get("payment_date") if payment_row else None
+    ).mappings()
+    last_payment_by_order: dict[str, Any] = {}
+    for payment_row in payment_rows:
+        last_payment_by_order.setdefault(payment_row.get("order_number"), payment_row.get("payment_date"))
 
     order_line_items = sa.table(
         "order_line_items",
@@ -807,16 +834,51 @@ async def _fetch_td_customer_last_order_facts(
     service_expr = sa.func.trim(order_line_items.c.service_name)
     service_rows = (
         await session.execute(
-            sa.select(service_expr.label("service_name"))
+            sa.select(order_line_items.c.order_number, service_expr.label("service_name"))
             .distinct()
-            .where(order_line_items.c.cost_center == scoped_cost_center)
-            .where(order_line_items.c.order_number == last_order_number)
+            .where(order_line_items.c.cost_center == cost_center)
+            .where(order_line_items.c.order_number.in_(order_numbers))
             .where(sa.func.trim(sa.func.coalesce(order_line_items.c.service_name, "")) != "")
-            .order_by(service_expr.asc())
+            .order_by(order_line_items.c.order_number.asc(), service_expr.asc())
         )
-    ).mappings().all()
-    facts["last_service_names"] = ", ".join(str(row.get("service_name") or "").strip() for row in service_rows)
-    return facts
+    ).mappings()
+    service_names_by_order: dict[str, list[str]] = defaultdict(list)
+    for service_row in service_rows:
+        service_names_by_order[service_row.get("order_number")].append(str(service_row.get("service_name") or "").strip())
+
+    for facts in facts_by_mobile.values():
+        last_order_number = facts["last_order_number"]
+        if last_order_number is None:
+            continue
+        facts["last_payment_date"] = last_payment_by_order.get(last_order_number)
+        facts["last_service_names"] = ", ".join(service_names_by_order.get(last_order_number, []))
+    return facts_by_mobile
+
+
+async def _fetch_td_customer_last_order_facts(
+    *,
+    session: Any,
+    cost_center: Any,
+    mobile_number: Any,
+) -> dict[str, Any]:
+    scoped_cost_center = str(cost_center or "").strip()
+    normalized_mobile = _normalize_mobile_number(mobile_number)
+    if not scoped_cost_center or not normalized_mobile:
+        return _td_empty_last_order_facts()
+
+    index = await _load_td_order_history_index(
+        session=session,
+        lookup_column="cost_center",
+        lookup_value=scoped_cost_center,
+        normalized_mobiles={normalized_mobile},
+        include_amounts=False,
+    )
+    facts_by_mobile = await _fetch_td_last_order_facts_by_mobile(
+        session=session,
+        cost_center=scoped_cost_center,
+        latest_orders=index.latest_orders,
+    )
+    return facts_by_mobile.get(normalized_mobile) or _td_empty_last_order_facts()
 
 
 async def _resolve_td_lead_cost_centers(
@@ -863,10 +925,8 @@ async def _enrich_td_lead_rows_with_order_history(*, database_url: str | None, r
     if not database_url or not rows:
         return rows
 
-    metrics_by_cost_center_mobile: dict[tuple[str, str], dict[str, Any]] = {}
-    candidate_rows_by_cost_center: dict[str, int] = defaultdict(int)
-    matched_rows_by_cost_center_mobile: dict[tuple[str, str], int] = defaultdict(int)
     cost_center_by_row_id: dict[int, str] = {}
+    index_by_cost_center: dict[str, _TdOrderHistoryIndex] = {}
     last_order_facts_by_cost_center_mobile: dict[tuple[str, str], dict[str, Any]] = {}
 
     async with session_scope(database_url) as session:
@@ -882,67 +942,60 @@ async def _enrich_td_lead_rows_with_order_history(*, database_url: str | None, r
             if cost_center and normalized_mobile:
                 mobiles_by_cost_center[cost_center].add(normalized_mobile)
 
-        if mobiles_by_cost_center:
-            vw_orders = sa.table(
-                "vw_orders",
-                sa.column("cost_center"),
-                sa.column("store_code"),
-                sa.column("mobile_number"),
-                sa.column("order_amount"),
+        # One vw_orders scan per cost center answers counts, averages and last orders for every lead in the batch.
+        for cost_center, normalized_mobiles in mobiles_by_cost_center.items():
+            index_by_cost_center[cost_center] = await _load_td_order_history_index(
+                session=session,
+                lookup_column="store_code" if use_store_code_lookup else "cost_center",
+                lookup_value=cost_center,
+                normalized_mobiles=normalized_mobiles,
+                include_latest_orders=not use_store_code_lookup,
             )
-            lookup_column = vw_orders.c.store_code if use_store_code_lookup else vw_orders.c.cost_center
-            for cost_center, normalized_mobiles in mobiles_by_cost_center.items():
-                order_rows = (
-                    await session.execute(
-                        sa.select(vw_orders.c.mobile_number, vw_orders.c.order_amount).where(
-                            lookup_column == cost_center
-                        )
-                    )
-                ).mappings().all()
-                candidate_rows_by_cost_center[cost_center] = len(order_rows)
-                amounts_by_mobile: dict[str, list[Decimal]] = defaultdict(list)
-                counts_by_mobile: dict[str, int] = defaultdict(int)
-                for order_row in order_rows:
-                    normalized_order_mobile = _normalize_mobile_number(order_row.get("mobile_number"))
-                    if normalized_order_mobile not in normalized_mobiles:
-                        continue
-                    counts_by_mobile[normalized_order_mobile] += 1
-                    amount = _as_decimal(order_row.get("order_amount"))
-                    if amount is not None:
-                        amounts_by_mobile[normalized_order_mobile].append(amount)
 
+        existing_mobiles_by_cost_center: dict[str, set[str]] = defaultdict(set)
+        for row in rows:
+            cost_center = cost_center_by_row_id.get(id(row), "")
+            normalized_mobile = _normalize_mobile_number(row.get("mobile"))
+            index = index_by_cost_center.get(cost_center)
+            if index is None or not normalized_mobile:
+                continue
+            customer_type = _resolve_td_customer_type_display(
+                source_customer_type=row.get("customer_type"),
+                previous_number_of_orders=index.order_counts.get(normalized_mobile, 0),
+            )
+            if customer_type.strip().lower() == "existing":
+                existing_mobiles_by_cost_center[cost_center].add(normalized_mobile)
+        if not use_store_code_lookup:
+            for cost_center, normalized_mobiles in existing_mobiles_by_cost_center.items():
+                index = index_by_cost_center[cost_center]
+                facts_by_mobile = await _fetch_td_last_order_facts_by_mobile(
+                    session=session,
+                    cost_center=cost_center,
+                    latest_orders={
+                        mobile: order for mobile, order in index.latest_orders.items() if mobile in normalized_mobiles
+                    },
+                )
                 for normalized_mobile in normalized_mobiles:
-                    order_count = counts_by_mobile.get(normalized_mobile, 0)
-                    amounts = amounts_by_mobile.get(normalized_mobile, [])
-                    lookup_key = (cost_center, normalized_mobile)
-                    matched_rows_by_cost_center_mobile[lookup_key] = order_count
-                    metrics_by_cost_center_mobile[lookup_key] = {
-                        "previous_number_of_orders": order_count,
-                        "average_order_amount": (sum(amounts) / Decimal(len(amounts))) if amounts else None,
-                    }
+                    last_order_facts_by_cost_center_mobile[(cost_center, normalized_mobile)] = facts_by_mobile.get(
+                        normalized_mobile
+                    ) or _td_empty_last_order_facts()
 
         for row in rows:
             store_code = str(row.get("store_code") or "").strip()
             cost_center = cost_center_by_row_id.get(id(row), "")
             normalized_mobile = _normalize_mobile_number(row.get("mobile"))
-            lookup_key = (cost_center, normalized_mobile or "")
-            metrics = metrics_by_cost_center_mobile.get(lookup_key, {})
-            previous_number_of_orders = int(metrics.get("previous_number_of_orders") or 0)
+            index = index_by_cost_center.get(cost_center) or _TdOrderHistoryIndex()
+            previous_number_of_orders = index.order_counts.get(normalized_mobile or "", 0)
+            amounts = index.order_amounts.get(normalized_mobile or "", [])
             row["previous_number_of_orders"] = previous_number_of_orders
-            row["average_order_amount"] = metrics.get("average_order_amount")
+            row["average_order_amount"] = (sum(amounts) / Decimal(len(amounts))) if amounts else None
             row["customer_type"] = _resolve_td_customer_type_display(
                 source_customer_type=row.get("customer_type"),
                 previous_number_of_orders=previous_number_of_orders,
             )
             is_existing_customer = str(row.get("customer_type") or "").strip().lower() == "existing"
-            if is_existing_customer and cost_center and normalized_mobile and not use_store_code_lookup:
-                facts_key = (cost_center, normalized_mobile)
-                if facts_key not in last_order_facts_by_cost_center_mobile:
-                    last_order_facts_by_cost_center_mobile[facts_key] = await _fetch_td_customer_last_order_facts(
-                        session=session,
-                        cost_center=cost_center,
-                        mobile_number=normalized_mobile,
-                    )
+            facts_key = (cost_center, normalized_mobile or "")
+            if is_existing_customer and facts_key in last_order_facts_by_cost_center_mobile:
                 row.update(last_order_facts_by_cost_center_mobile[facts_key])
             else:
                 for fact_key, fact_value in _td_empty_last_order_facts().items():
@@ -952,8 +1005,8 @@ async def _enrich_td_lead_rows_with_order_history(*, database_url: str | None, r
                 lookup_store_code=store_code,
                 lookup_mobile=row.get("mobile"),
                 normalized_mobile=normalized_mobile,
-                candidate_rows_for_store=candidate_rows_by_cost_center.get(cost_center, 0),
-                matched_rows_for_mobile=matched_rows_by_cost_center_mobile.get(lookup_key, 0),
+                candidate_rows_for_store=index.candidate_rows,
+                matched_rows_for_mobile=previous_number_of_orders,
             )
             if is_existing_customer and previous_number_of_orders == 0:
                 row["order_history_warning_marker"] = TD_ORDER_HISTORY_EXISTING_ZERO_WARNING_MARKER
@@ -1068,6 +1121,7 @@ async def build_td_leads_reporting_payload(
     )
 
     completed_leads_today: list[dict[str, Any]] = []
+    orders_by_store_mobile: dict[Any, dict[str | None, list[Mapping[str, Any]]]] = {}
     async with session_scope(database_url) as session:
         completed_rows = (await session.execute(completed_query)).mappings().all()
         for row in completed_rows:
@@ -1076,17 +1130,18 @@ async def build_td_leads_reporting_payload(
             order_rows: list[Mapping[str, Any]] = []
             reconciliation_note: str | None = None
             if lead_mobile:
-                order_query = (
-                    sa.select(vw_orders.c.order_number, vw_orders.c.order_date, vw_orders.c.mobile_number)
-                    .where(vw_orders.c.store_code == row.get("store_code"))
-                    .order_by(vw_orders.c.order_date.asc(), vw_orders.c.order_number.asc())
-                )
-                scoped_order_rows = (await session.execute(order_query)).mappings().all()
-                order_rows = [
-                    order
-                    for order in scoped_order_rows
-                    if _normalize_mobile_number(order.get("mobile_number")) == lead_mobile
-                ]
+                store_code = row.get("store_code")
+                if store_code not in orders_by_store_mobile:
+                    order_query = (
+                        sa.select(vw_orders.c.order_number, vw_orders.c.order_date, vw_orders.c.mobile_number)
+                        .where(vw_orders.c.store_code == store_code)
+                        .order_by(vw_orders.c.order_date.asc(), vw_orders.c.order_number.asc())
+                    )
+                    store_orders: dict[str | None, list[Mapping[str, Any]]] = defaultdict(list)
+                    for order in (await session.execute(order_query)).mappings():
+                        store_orders[_normalize_mobile_number(order.get("mobile_number"))].append(order)
+                    orders_by_store_mobile[store_code] = store_orders
+                order_rows = orders_by_store_mobile[store_code].get(lead_mobile, [])
             else:
                 reconciliation_note = "No normalized lead mobile available for order matching"
 
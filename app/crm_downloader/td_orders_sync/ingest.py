@@ -1,22 +1,21 @@
 from __future__ import annotations
 
 from collections import Counter
+from contextlib import closing
 import json
 import re
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from decimal import Decimal, InvalidOperation
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Mapping, Sequence, Tuple
+from typing import Any, Dict, List, Mapping, Sequence, Tuple
 from zoneinfo import ZoneInfo
 
-import openpyxl
 import sqlalchemy as sa
 from dateutil import parser
-from sqlalchemy.dialects.postgresql import insert as pg_insert
-from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 
 from app.common.db import session_scope
+from app.common.workbook_ingest import bulk_upsert, ensure_tables, iter_sheet_rows, without_trailing_footers
 from app.common.date_utils import get_timezone
 from app.dashboard_downloader.json_logger import JsonLogger, log_event
 
@@ -264,27 +263,6 @@ class _PhoneFallbackStats:
     fallback_rows: int = 0
 
 
-def _chunked(values: Sequence[tuple[Any, ...]], chunk_size: int = 500) -> Iterable[list[tuple[Any, ...]]]:
-    for index in range(0, len(values), chunk_size):
-        yield list(values[index : index + chunk_size])
-
-
-async def _fetch_existing_keys(
-    session: sa.ext.asyncio.AsyncSession,
-    table: sa.Table,
-    key_columns: Sequence[sa.Column],
-    keys: Sequence[tuple[Any, ...]],
-) -> set[tuple[Any, ...]]:
-    if not keys:
-        return set()
-    existing: set[tuple[Any, ...]] = set()
-    for chunk in _chunked(list(keys)):
-        stmt = sa.select(*key_columns).where(sa.tuple_(*key_columns).in_(chunk))
-        result = await session.execute(stmt)
-        existing.update(tuple(row) for row in result.fetchall())
-    return existing
-
-
 def _stg_td_orders_table(metadata: sa.MetaData) -> sa.Table:
     return sa.Table(
         "stg_td_orders",
@@ -609,54 +587,52 @@ def _is_footer_row(values: Sequence[Any]) -> bool:
 def _read_workbook_rows(
     workbook_path: Path, *, tz: ZoneInfo, warnings: list[str], logger: JsonLogger, store_code: str
 ) -> tuple[list[Dict[str, Any]], list[dict[str, Any]], list[dict[str, Any]], int, _PhoneFallbackStats]:
-    wb = openpyxl.load_workbook(workbook_path, data_only=True)
-    sheet = wb.active
-    header_cells = list(next(sheet.iter_rows(min_row=1, max_row=1, values_only=True)))
-    headers = [cell for cell in header_cells if cell]
-    missing = REQUIRED_HEADERS - set(headers)
-    if missing:
-        raise ValueError(f"TD Orders workbook missing expected columns: {sorted(missing)}")
-
     rows: list[Dict[str, Any]] = []
     warning_rows: list[dict[str, Any]] = []
     dropped_rows: list[dict[str, Any]] = []
-    data_rows = list(sheet.iter_rows(min_row=2, values_only=True))
-    while data_rows and _is_footer_row(data_rows[-1]):
-        data_rows.pop()
-    rows_downloaded = len(data_rows)
-
+    rows_downloaded = 0
     phone_fallback_stats = _PhoneFallbackStats()
 
-    for values in data_rows:
-        raw_row = {header: values[idx] if idx < len(values) else None for idx, header in enumerate(headers)}
-        normalized, row_remarks, drop_reason = _coerce_row(
-            raw_row, tz=tz, warnings=warnings, phone_fallback_stats=phone_fallback_stats
-        )
-        order_number = _stringify_value(raw_row.get("Order No."))
-        if normalized:
-            if normalized.get("_has_ingest_warning"):
-                warning_rows.append(
+    with closing(iter_sheet_rows(workbook_path)) as sheet_rows:
+        header_cells = list(next(sheet_rows, ()))
+        headers = [cell for cell in header_cells if cell]
+        missing = REQUIRED_HEADERS - set(headers)
+        if missing:
+            raise ValueError(f"TD Orders workbook missing expected columns: {sorted(missing)}")
+
+        for values in without_trailing_footers(sheet_rows, is_footer=_is_footer_row):
+            rows_downloaded += 1
+            raw_row = {header: values[idx] if idx < len(values) else None for idx, header in enumerate(headers)}
+            normalized, row_remarks, drop_reason = _coerce_row(
+                raw_row, tz=tz, warnings=warnings, phone_fallback_stats=phone_fallback_stats
+            )
+            order_number = _stringify_value(raw_row.get("Order No."))
+            if normalized:
+                if normalized.get("_has_ingest_warning"):
+                    warning_rows.append(
+                        {
+                            "store_code": store_code,
+                            "order_number": order_number,
+                            "headers": headers,
+                            "values": {header: _stringify_value(raw_row.get(header)) for header in headers},
+                            "remarks": normalized.get("ingest_remarks"),
+                            "ingest_remarks": normalized.get("ingest_remarks"),
+                        }
+                    )
+                rows.append(normalized)
+            else:
+                dropped_rows.append(
                     {
                         "store_code": store_code,
                         "order_number": order_number,
                         "headers": headers,
                         "values": {header: _stringify_value(raw_row.get(header)) for header in headers},
-                        "remarks": normalized.get("ingest_remarks"),
-                        "ingest_remarks": normalized.get("ingest_remarks"),
+                        "remarks": drop_reason or "; ".join(row_remarks) or "Row dropped due to missing required values",
+                        "ingest_remarks": drop_reason
+                        or "; ".join(row_remarks)
+                        or "Row dropped due to missing required values",
                     }
                 )
-            rows.append(normalized)
-        else:
-            dropped_rows.append(
-                {
-                    "store_code": store_code,
-                    "order_number": order_number,
-                    "headers": headers,
-                    "values": {header: _stringify_value(raw_row.get(header)) for header in headers},
-                    "remarks": drop_reason or "; ".join(row_remarks) or "Row dropped due to missing required values",
-                    "ingest_remarks": drop_reason or "; ".join(row_remarks) or "Row dropped due to missing required values",
-                }
-            )
     return rows, warning_rows, dropped_rows, rows_downloaded, phone_fallback_stats
 
 
@@ -734,19 +710,6 @@ def _phone_fallback_top_invalid_values(phone_fallback_stats: _PhoneFallbackStats
     ]
 
 
-def _make_insert(table: sa.Table, values: Mapping[str, Any], *, use_sqlite: bool) -> sa.sql.dml.Insert:
-    insert_fn = sqlite_insert if use_sqlite else pg_insert
-    insert = insert_fn(table).values(**values)
-    conflict_cols = [col.name for col in table.primary_key.columns] if table.primary_key else []
-    for constraint in table.constraints:
-        if isinstance(constraint, sa.UniqueConstraint):
-            conflict_cols = [col.name for col in constraint.columns]
-            break
-    if not conflict_cols:
-        return insert
-    return insert.on_conflict_do_update(index_elements=conflict_cols, set_={key: insert.excluded[key] for key in values})
-
-
 async def ingest_td_orders_workbook(
     *,
     workbook_path: Path,
@@ -869,42 +832,10 @@ async def _ingest_td_orders_rows(
     use_sqlite = database_url.startswith("sqlite")
 
     async with session_scope(database_url) as session:
-        bind = session.bind
-        if isinstance(bind, sa.ext.asyncio.AsyncEngine):
-            async with bind.begin() as conn:
-                await conn.run_sync(metadata.create_all)
-        elif isinstance(bind, sa.ext.asyncio.AsyncConnection):
-            await bind.run_sync(metadata.create_all)
-        else:
-            raise TypeError(f"Unsupported SQLAlchemy bind for TD Orders ingest: {type(bind)!r}")
-
-        staging_keys = [
-            (store_code, row.get("order_number"), row.get("order_date")) for row in rows
-        ]
-        final_keys = [
-            (cost_center, row.get("order_number"), row.get("order_date")) for row in rows
-        ]
-        existing_staging = await _fetch_existing_keys(
-            session,
-            stg_table,
-            (stg_table.c.store_code, stg_table.c.order_number, stg_table.c.order_date),
-            staging_keys,
-        )
-        existing_final = await _fetch_existing_keys(
-            session,
-            final_table,
-            (final_table.c.cost_center, final_table.c.order_number, final_table.c.order_date),
-            final_keys,
-        )
-        staging_key_set = set(staging_keys)
-        final_key_set = set(final_keys)
-        staging_inserted = len(staging_key_set - existing_staging)
-        staging_updated = len(staging_key_set & existing_staging)
-        final_inserted = len(final_key_set - existing_final)
-        final_updated = len(final_key_set & existing_final)
-
-        staging_count = 0
-        final_count = 0
+        await ensure_tables(session, metadata, database_url=database_url, label="TD Orders ingest")
+
+        staging_batch: list[dict[str, Any]] = []
+        final_batch: list[dict[str, Any]] = []
         for row in rows:
             stg_values = {
                 **{field: row.get(field) for field in STG_TD_ORDERS_COLUMNS},
@@ -913,9 +844,7 @@ async def _ingest_td_orders_rows(
                 "cost_center": cost_center,
                 "store_code": store_code,
             }
-            stmt = _make_insert(stg_table, stg_values, use_sqlite=use_sqlite)
-            await session.execute(stmt)
-            staging_count += 1
+            staging_batch.append(stg_values)
 
             order_date = stg_values["order_date"]
             due_date = stg_values["due_date"]
@@ -930,54 +859,62 @@ async def _ingest_td_orders_rows(
             complete_processing_by = default_due_date - timedelta(days=1)
             package_flag = False if (stg_values.get("package") or "").strip().lower() == "no" else True
 
-            final_values = {
-                "cost_center": cost_center,
-                "store_code": store_code,
-                "source_system": "TumbleDry",
-                "order_number": stg_values["order_number"],
-                "invoice_number": None,
-                "order_date": order_date,
-                "customer_code": stg_values.get("customer_code"),
-                "customer_name": stg_values.get("customer_name") or "",
-                "mobile_number": stg_values.get("mobile_number") or "",
-                "customer_gstin": stg_values.get("customer_gstin"),
-                "customer_source": stg_values.get("registration_source"),
-                "package_flag": package_flag,
-                "service_type": stg_values.get("primary_service"),
-                "customer_address": stg_values.get("customer_address"),
-                "pieces": stg_values.get("pieces"),
-                "weight": stg_values.get("weight"),
-                "due_date": due_date or default_due_date,
-                "default_due_date": default_due_date,
-                "due_days_delta": due_days_delta,
-                "due_date_flag": due_flag,
-                "complete_processing_by": complete_processing_by,
-                "gross_amount": stg_values.get("gross_amount"),
-                "discount_amount": stg_values.get("discount"),
-                "tax_amount": stg_values.get("tax_amount"),
-                "net_amount": stg_values.get("net_amount"),
-                "adjustment": stg_values.get("adjustment"),
-                "payment_status": "Pending",
-                "order_status": "Pending",
-                "payment_mode": None,
-                "payment_date": None,
-                "payment_amount": None,
-                "order_edited_flag": False,
-                "system_order_status": "Active",
-                "ingest_remarks": stg_values["ingest_remarks"],
-                "google_maps_url": None,
-                "latitude": None,
-                "longitude": None,
-                "created_by": 1,
-                "created_at": run_date,
-                "updated_by": None,
-                "updated_at": None,
-                "run_id": run_id,
-                "run_date": run_date,
-            }
-            final_stmt = _make_insert(final_table, final_values, use_sqlite=use_sqlite)
-            await session.execute(final_stmt)
-            final_count += 1
+            final_batch.append(
+                {
+                    "cost_center": cost_center,
+                    "store_code": store_code,
+                    "source_system": "TumbleDry",
+                    "order_number": stg_values["order_number"],
+                    "invoice_number": None,
+                    "order_date": order_date,
+                    "customer_code": stg_values.get("customer_code"),
+                    "customer_name": stg_values.get("customer_name") or "",
+                    "mobile_number": stg_values.get("mobile_number") or "",
+                    "customer_gstin": stg_values.get("customer_gstin"),
+                    "customer_source": stg_values.get("registration_source"),
+                    "package_flag": package_flag,
+                    "service_type": stg_values.get("primary_service"),
+                    "customer_address": stg_values.get("customer_address"),
+                    "pieces": stg_values.get("pieces"),
+                    "weight": stg_values.get("weight"),
+                    "due_date": due_date or default_due_date,
+                    "default_due_date": default_due_date,
+                    "due_days_delta": due_days_delta,
+                    "due_date_flag": due_flag,
+                    "complete_processing_by": complete_processing_by,
+                    "gross_amount": stg_values.get("gross_amount"),
+                    "discount_amount": stg_values.get("discount"),
+                    "tax_amount": stg_values.get("tax_amount"),
+                    "net_amount": stg_values.get("net_amount"),
+                    "adjustment": stg_values.get("adjustment"),
+                    "payment_status": "Pending",
+                    "order_status": "Pending",
+                    "payment_mode": None,
+                    "payment_date": None,
+                    "payment_amount": None,
+                    "order_edited_flag": False,
+                    "system_order_status": "Active",
+                    "ingest_remarks": stg_values["ingest_remarks"],
+                    "google_maps_url": None,
+                    "latitude": None,
+                    "longitude": None,
+                    "created_by": 1,
+                    "created_at": run_date,
+                    "updated_by": None,
+                    "updated_at": None,
+                    "run_id": run_id,
+                    "run_date": run_date,
+                }
+            )
+
+        staging_inserted, staging_updated = await bulk_upsert(
+            session, stg_table, staging_batch, use_sqlite=use_sqlite
+        )
+        final_inserted, final_updated = await bulk_upsert(
+            session, final_table, final_batch, use_sqlite=use_sqlite
+        )
+        staging_count = len(staging_batch)
+        final_count = len(final_batch)
 
         await session.commit()
 
@@ -661,8 +661,13 @@ async def main(
     run_orders: bool = True,
     run_sales: bool = True,
     source_mode: str = "api_only",
+    shared_browser: Browser | None = None,
 ) -> None:
-    """Run the TD Orders sync flow (login + iframe historical orders download)."""
+    """Run the TD Orders sync flow (login + iframe historical orders download).
+
+    ``shared_browser`` lets a caller that owns a browser pool lend one for this run;
+    it is used as-is and left open.
+    """
 
     resolved_run_id = run_id or new_run_id()
     resolved_run_date = aware_now()
@@ -801,8 +806,12 @@ async def main(
             allow_non_api_only_concurrency=_bool_env("TD_ENABLE_NON_API_ONLY_STORE_CONCURRENCY", default=True),
         )
 
-        async with async_playwright() as p:
-            browser = await launch_browser(playwright=p, logger=logger)
+        async with contextlib.AsyncExitStack() as browser_stack:
+            if shared_browser is None:
+                p = await browser_stack.enter_async_context(async_playwright())
+                browser = await launch_browser(playwright=p, logger=logger)
+            else:
+                browser = shared_browser
             try:
                 if store_concurrency_enabled:
                     semaphore = asyncio.Semaphore(store_concurrency)
@@ -877,7 +886,8 @@ async def main(
                         sales_result=payload.sales_report,
                     )
             finally:
-                await browser.close()
+                if browser is not shared_browser:
+                    await browser.close()
 
         log_event(
             logger=logger,
@@ -919,7 +929,7 @@ async def main(
             run_id=resolved_run_id,
         )
         with contextlib.suppress(Exception):
-            if browser:
+            if browser and browser is not shared_browser:
                 await browser.close()
         if not persist_attempted:
             persist_attempted = True
@@ -937,7 +947,7 @@ async def main(
             run_id=resolved_run_id,
         )
         with contextlib.suppress(Exception):
-            if browser:
+            if browser and browser is not shared_browser:
                 await browser.close()
         if not persist_attempted:
             persist_attempted = True
@@ -7,6 +7,7 @@ import math
 import os
 import random
 import time
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import date, datetime, timezone
 from pathlib import Path
@@ -224,6 +225,17 @@ class TdApiClientConfig:
     garments_api_only_max_backoff_seconds: float = float(os.environ.get("TD_API_GARMENTS_API_ONLY_MAX_BACKOFF_SECONDS", "2.5"))
     garments_adaptive_throttle_max_ms: int = int(os.environ.get("TD_API_GARMENTS_ADAPTIVE_THROTTLE_MAX_MS", "1200"))
     garments_resume_page: int = int(os.environ.get("TD_API_GARMENTS_RESUME_PAGE", "1"))
+    # Max page requests in flight once the first page reports the total; 0/1 keeps serial paging.
+    page_prefetch_concurrency: int = max(0, int(os.environ.get("TD_API_PAGE_PREFETCH_CONCURRENCY", "0")))
+    # Process-wide request scheduler shared by every store client; a rate of 0 disables that bucket.
+    global_requests_per_second: float = float(os.environ.get("TD_API_GLOBAL_RPS", "0"))
+    global_burst: int = max(1, int(os.environ.get("TD_API_GLOBAL_BURST", "4")))
+    orders_requests_per_second: float = float(os.environ.get("TD_API_ORDERS_RPS", "0"))
+    sales_requests_per_second: float = float(os.environ.get("TD_API_SALES_RPS", "0"))
+    garments_requests_per_second: float = float(os.environ.get("TD_API_GARMENTS_RPS", "0"))
+    endpoint_burst: int = max(1, int(os.environ.get("TD_API_ENDPOINT_BURST", "2")))
+    adaptive_backoff_error_rate: float = float(os.environ.get("TD_API_ADAPTIVE_BACKOFF_ERROR_RATE", "0.2"))
+    adaptive_backoff_max_factor: float = max(1.0, float(os.environ.get("TD_API_ADAPTIVE_BACKOFF_MAX_FACTOR", "8")))
     try_orders_cookie_shape: bool = os.environ.get("TD_API_TRY_ORDERS_COOKIE_SHAPE", "false").strip().lower() in {"1", "true", "yes", "on"}
     debug_logging: bool = os.environ.get("TD_API_DEBUG_LOGGING", "false").strip().lower() in {"1", "true", "yes", "on"}
 
@@ -338,6 +350,162 @@ class _StoreRateLimiter:
             cls._next_allowed_at[normalized_store] = time.monotonic() + max(min_interval_seconds, 0.0)
 
 
+class _TokenBucket:
+    """GCRA token bucket: ``rate`` requests per second with ``burst`` allowed back to back.
+
+    Reservations are computed synchronously, so concurrent tasks on one event loop
+    never need a lock and the bucket can be shared across loops.
+    """
+
+    def __init__(self, *, rate: float, burst: int) -> None:
+        self.rate = max(float(rate), 0.0)
+        self.burst = max(int(burst), 1)
+        self._theoretical_arrival = 0.0
+
+    @property
+    def enabled(self) -> bool:
+        return self.rate > 0
+
+    def reserve(self, *, now: float, slowdown: float = 1.0) -> float:
+        """Reserve the next slot and return how long the caller must wait."""
+
+        if not self.enabled:
+            return 0.0
+        interval = max(slowdown, 1.0) / self.rate
+        arrival = max(self._theoretical_arrival, now)
+        allowed_at = arrival - (self.burst - 1) * interval
+        self._theoretical_arrival = arrival + interval
+        return max(0.0, allowed_at - now)
+
+
+class _TdApiRequestScheduler:
+    """Pace TD reporting-API requests across every store client in the process.
+
+    Each request reserves a slot in a global bucket and in its endpoint's bucket.
+    Observed 429/5xx/timeout outcomes feed an adaptive slowdown factor that
+    stretches both buckets' intervals until the error rate recovers.
+    """
+
+    OUTCOME_WINDOW = 20
+    RPS_WINDOW_SECONDS = 10.0
+
+    def __init__(
+        self,
+        *,
+        global_rate: float,
+        global_burst: int,
+        endpoint_rates: Mapping[str, float],
+        endpoint_burst: int,
+        error_rate_threshold: float,
+        max_slowdown: float,
+    ) -> None:
+        self._global_bucket = _TokenBucket(rate=global_rate, burst=global_burst)
+        self._endpoint_buckets = {
+            endpoint: _TokenBucket(rate=rate, burst=endpoint_burst)
+            for endpoint, rate in endpoint_rates.items()
+        }
+        self.error_rate_threshold = max(float(error_rate_threshold), 0.0)
+        self.max_slowdown = max(float(max_slowdown), 1.0)
+        self.slowdown = 1.0
+        self._outcomes: deque[bool] = deque(maxlen=self.OUTCOME_WINDOW)
+        self._grant_times: deque[float] = deque()
+        self.queue_depth = 0
+        self.max_queue_depth = 0
+        self.requests_granted = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    @property
+    def enabled(self) -> bool:
+        return self._global_bucket.enabled or any(bucket.enabled for bucket in self._endpoint_buckets.values())
+
+    async def acquire(self, endpoint: str) -> float:
+        """Wait for a request slot on ``endpoint`` and return the seconds waited."""
+
+        now = time.monotonic()
+        delay = self._global_bucket.reserve(now=now, slowdown=self.slowdown)
+        endpoint_bucket = self._endpoint_buckets.get(endpoint)
+        if endpoint_bucket is not None:
+            delay = max(delay, endpoint_bucket.reserve(now=now, slowdown=self.slowdown))
+        if delay > 0:
+            self.queue_depth += 1
+            self.max_queue_depth = max(self.max_queue_depth, self.queue_depth)
+            try:
+                await asyncio.sleep(delay)
+            finally:
+                self.queue_depth -= 1
+        self.requests_granted += 1
+        self.total_wait_seconds += delay
+        self.max_wait_seconds = max(self.max_wait_seconds, delay)
+        granted_at = time.monotonic()
+        self._grant_times.append(granted_at)
+        while self._grant_times and granted_at - self._grant_times[0] > self.RPS_WINDOW_SECONDS:
+            self._grant_times.popleft()
+        return delay
+
+    def record_outcome(self, *, status: int | None, error_class: str | None) -> bool:
+        """Record one attempt's outcome; return True when the slowdown factor changed."""
+
+        throttled = status == 429 or (status is not None and status >= 500) or error_class in _TIMEOUT_ERROR_CLASSES
+        self._outcomes.append(throttled)
+        error_rate = sum(self._outcomes) / len(self._outcomes)
+        previous = self.slowdown
+        if throttled and error_rate >= self.error_rate_threshold:
+            self.slowdown = min(self.max_slowdown, self.slowdown * 2)
+        elif not throttled and error_rate < self.error_rate_threshold / 2:
+            self.slowdown = max(1.0, self.slowdown - 0.25)
+        return self.slowdown != previous
+
+    def metrics(self) -> dict[str, Any]:
+        now = time.monotonic()
+        recent = [stamp for stamp in self._grant_times if now - stamp <= self.RPS_WINDOW_SECONDS]
+        return {
+            "scheduler_queue_depth": self.queue_depth,
+            "scheduler_max_queue_depth": self.max_queue_depth,
+            "scheduler_requests_granted": self.requests_granted,
+            "scheduler_total_wait_ms": int(self.total_wait_seconds * 1000),
+            "scheduler_max_wait_ms": int(self.max_wait_seconds * 1000),
+            "scheduler_avg_wait_ms": (
+                int(self.total_wait_seconds * 1000 / self.requests_granted) if self.requests_granted else 0
+            ),
+            "scheduler_effective_rps": round(len(recent) / self.RPS_WINDOW_SECONDS, 3),
+            "scheduler_error_rate": round(sum(self._outcomes) / len(self._outcomes), 4) if self._outcomes else 0.0,
+            "scheduler_slowdown_factor": self.slowdown,
+        }
+
+
+_REQUEST_SCHEDULERS: dict[tuple[Any, ...], _TdApiRequestScheduler] = {}
+
+
+def _shared_request_scheduler(config: TdApiClientConfig) -> _TdApiRequestScheduler:
+    """Return the process-wide scheduler for ``config``'s rate settings."""
+
+    endpoint_rates = {
+        ORDERS_ENDPOINT: config.orders_requests_per_second,
+        SALES_ENDPOINT: config.sales_requests_per_second,
+        GARMENTS_ENDPOINT: config.garments_requests_per_second,
+    }
+    key = (
+        config.global_requests_per_second,
+        config.global_burst,
+        tuple(sorted(endpoint_rates.items())),
+        config.endpoint_burst,
+        config.adaptive_backoff_error_rate,
+        config.adaptive_backoff_max_factor,
+    )
+    scheduler = _REQUEST_SCHEDULERS.get(key)
+    if scheduler is None:
+        scheduler = _TdApiRequestScheduler(
+            global_rate=config.global_requests_per_second,
+            global_burst=config.global_burst,
+            endpoint_rates=endpoint_rates,
+            endpoint_burst=config.endpoint_burst,
+            error_rate_threshold=config.adaptive_backoff_error_rate,
+            max_slowdown=config.adaptive_backoff_max_factor,
+        )
+        _REQUEST_SCHEDULERS[key] = scheduler
+    return scheduler
+
 
 def td_api_fetch_auth_failure_endpoints(result: Any) -> list[str]:
     """Return endpoints whose result proves the TD API session is unauthorized.
@@ -421,6 +589,7 @@ class TdApiClient:
         self._orders_cookie_shape_gate_state_metadata_added = False
         self.run_id = (run_id or "").strip() or None
         self.structured_logger = structured_logger
+        self._request_scheduler = _shared_request_scheduler(self.config)
 
     def _emit_source_fetch_event(
         self,
@@ -848,6 +1017,11 @@ class TdApiClient:
         garments_stop_reason: str | None = None
         requested_page_size = active_page_size
         last_successful_page = page - 1
+        prefetch_concurrency = max(0, int(self.config.page_prefetch_concurrency))
+        prefetched_pages: dict[int, asyncio.Task[_JsonFetchResult]] = {}
+        prefetch_page_size: int | None = None
+        prefetch_hits = 0
+        prefetch_discarded = 0
 
         logger.info(
             "TD API endpoint pagination configuration",
@@ -869,444 +1043,473 @@ class TdApiClient:
         window_end = str(params.get("endDate") or "")
         self._log_auth_context_ready_once(endpoint=endpoint)
 
-        while True:
-            if is_garments_endpoint and self.config.garments_max_wall_time_ms > 0:
-                elapsed_wall_time_ms = int((time.perf_counter() - endpoint_started_at) * 1000)
-                budget_ms = int(self.config.garments_max_wall_time_ms)
-                if elapsed_wall_time_ms >= budget_ms:
-                    garments_degraded_reason = "garments_wall_time_budget_cutoff"
-                    garments_pagination_budget_exhausted = True
-                    garments_budget_state = "cutoff"
-                    errors[endpoint] = garments_degraded_reason
-                    remaining_pages_estimate = _estimate_remaining_pages(
-                        page_number=page,
-                        cumulative_rows=cumulative_rows,
-                        reported_total_rows=total_rows_hint,
-                        reported_total_pages=total_pages_hint,
-                    )
-                    garments_stop_reason = "wall_time_budget"
-                    logger.warning(
-                        "garments_wall_time_budget_cutoff",
-                        extra={
-                            "store_code": self.store_code,
-                            "window_start": window_start,
-                            "window_end": window_end,
-                            "endpoint": endpoint,
-                            "degraded_reason": garments_degraded_reason,
-                            "elapsed_ms": elapsed_wall_time_ms,
-                            "budget_ms": budget_ms,
-                            "remaining_pages_estimate": remaining_pages_estimate,
-                            "expected_total_rows": total_rows_hint,
-                            "fetched_unique_row_ids": len(garments_unique_row_ids),
-                            "garments_last_successful_page": last_successful_page,
-                            "garments_resume_from_page": max(last_successful_page + 1, page),
-                            **({"page_number": page, "rows_in_page": 0, "cumulative_rows": cumulative_rows} if self.config.debug_logging else {}),
-                        },
+        try:
+            while True:
+                if is_garments_endpoint and self.config.garments_max_wall_time_ms > 0:
+                    elapsed_wall_time_ms = int((time.perf_counter() - endpoint_started_at) * 1000)
+                    budget_ms = int(self.config.garments_max_wall_time_ms)
+                    if elapsed_wall_time_ms >= budget_ms:
+                        garments_degraded_reason = "garments_wall_time_budget_cutoff"
+                        garments_pagination_budget_exhausted = True
+                        garments_budget_state = "cutoff"
+                        errors[endpoint] = garments_degraded_reason
+                        remaining_pages_estimate = _estimate_remaining_pages(
+                            page_number=page,
+                            cumulative_rows=cumulative_rows,
+                            reported_total_rows=total_rows_hint,
+                            reported_total_pages=total_pages_hint,
+                        )
+                        garments_stop_reason = "wall_time_budget"
+                        logger.warning(
+                            "garments_wall_time_budget_cutoff",
+                            extra={
+                                "store_code": self.store_code,
+                                "window_start": window_start,
+                                "window_end": window_end,
+                                "endpoint": endpoint,
+                                "degraded_reason": garments_degraded_reason,
+                                "elapsed_ms": elapsed_wall_time_ms,
+                                "budget_ms": budget_ms,
+                                "remaining_pages_estimate": remaining_pages_estimate,
+                                "expected_total_rows": total_rows_hint,
+                                "fetched_unique_row_ids": len(garments_unique_row_ids),
+                                "garments_last_successful_page": last_successful_page,
+                                "garments_resume_from_page": max(last_successful_page + 1, page),
+                                **({"page_number": page, "rows_in_page": 0, "cumulative_rows": cumulative_rows} if self.config.debug_logging else {}),
+                            },
+                        )
+                        break
+
+                active_page_size = available_page_sizes[page_size_index]
+                if prefetched_pages and prefetch_page_size != active_page_size:
+                    # Page numbers shift with the page size, so earlier prefetches are unusable.
+                    prefetch_discarded += _cancel_prefetched_pages(prefetched_pages)
+                prefetched_task = prefetched_pages.pop(page, None)
+                if prefetched_task is not None:
+                    prefetch_hits += 1
+                    page_result = await prefetched_task
+                else:
+                    page_result = await self._get_endpoint_page(
+                        endpoint=endpoint,
+                        params=params,
+                        page=page,
+                        page_size=active_page_size,
+                        metadata=metadata,
+                        retry_profile=retry_profile,
                     )
-                    break
 
-            active_page_size = available_page_sizes[page_size_index]
-            page_params = self._merge_query_params(
-                base_params=params,
-                overrides={"page": page, "pageSize": active_page_size},
-            )
-            page_result = await self._get_json(
-                endpoint=endpoint,
-                params=page_params,
-                metadata=metadata,
-                connect_timeout_ms=self.config.connect_timeout_ms,
-                read_timeout_ms=self._read_timeout_ms_for_endpoint(endpoint, page_size=active_page_size),
-                max_retries=retry_profile["max_retries"],
-                backoff_base_seconds=retry_profile["backoff_base_seconds"],
-                max_backoff_seconds=retry_profile["max_backoff_seconds"],
-                timeout_retry_limit=retry_profile["timeout_retry_limit"],
-            )
-
-            endpoint_attempts += max(int(page_result.attempts or 0), 0)
-            endpoint_pages_attempted += 1
-            endpoint_retry_count += max(int(page_result.attempts or 0) - 1, 0)
-            endpoint_timeout_count += max(int(getattr(page_result, "timeout_failures", 0) or 0), 0)
-            if page_result.error in _TIMEOUT_ERROR_CLASSES and not getattr(page_result, "timeout_failures", 0):
-                endpoint_timeout_count += 1
-            if is_garments_endpoint:
-                garments_pages_attempted += 1
-                garments_retry_count += max(int(page_result.attempts or 0) - 1, 0)
-                garments_timeout_count += max(int(getattr(page_result, "timeout_failures", 0) or 0), 0)
+                endpoint_attempts += max(int(page_result.attempts or 0), 0)
+                endpoint_pages_attempted += 1
+                endpoint_retry_count += max(int(page_result.attempts or 0) - 1, 0)
+                endpoint_timeout_count += max(int(getattr(page_result, "timeout_failures", 0) or 0), 0)
                 if page_result.error in _TIMEOUT_ERROR_CLASSES and not getattr(page_result, "timeout_failures", 0):
-                    garments_timeout_count += 1
-                if page_result.ok:
-                    garments_pages_succeeded += 1
-                    if int(page_result.attempts or 0) > 1:
-                        garments_retry_success_count += 1
-
-            garments_page_success_rate = (
-                round((garments_pages_succeeded / garments_pages_attempted), 4)
-                if garments_pages_attempted > 0
-                else 0.0
-            )
+                    endpoint_timeout_count += 1
+                if is_garments_endpoint:
+                    garments_pages_attempted += 1
+                    garments_retry_count += max(int(page_result.attempts or 0) - 1, 0)
+                    garments_timeout_count += max(int(getattr(page_result, "timeout_failures", 0) or 0), 0)
+                    if page_result.error in _TIMEOUT_ERROR_CLASSES and not getattr(page_result, "timeout_failures", 0):
+                        garments_timeout_count += 1
+                    if page_result.ok:
+                        garments_pages_succeeded += 1
+                        if int(page_result.attempts or 0) > 1:
+                            garments_retry_success_count += 1
 
-            if not page_result.ok:
-                timeout_degradation_reached = (
-                    is_garments_endpoint
-                    and page_result.error in _TIMEOUT_ERROR_CLASSES
-                    and self.config.garments_max_timeout_pages > 0
-                    and garments_timeout_count >= self.config.garments_max_timeout_pages
+                garments_page_success_rate = (
+                    round((garments_pages_succeeded / garments_pages_attempted), 4)
+                    if garments_pages_attempted > 0
+                    else 0.0
                 )
-                if page_result.error in _TIMEOUT_ERROR_CLASSES and page_size_index < len(available_page_sizes) - 1:
-                    previous_page_size = active_page_size
-                    fallback_attempts += 1
-                    page_size_index += 1
-                    next_page_size = available_page_sizes[page_size_index]
-                    fallback_used = True
-                    if is_garments_endpoint:
-                        garments_fallback_count += 1
-                    metadata.append(
-                        {
-                            "endpoint": endpoint,
-                            "method": "GET",
-                            "query_params": self._metadata_query_map(
-                                self._merge_query_params(
-                                    base_params=params,
-                                    overrides={"page": page, "pageSize": previous_page_size},
-                                )
-                            ),
-                            "status": page_result.status,
-                            "latency_ms": None,
-                            "retry_count": retry_profile["max_retries"],
-                            "token_refresh_attempted": self._auth_state.refresh_attempted,
-                            "retry_reason": "page_size_fallback",
-                            "fallback_page_size_from": previous_page_size,
-                            "fallback_page_size_to": next_page_size,
-                        }
-                    )
-                    logger.warning(
-                        "TD API page-size fallback triggered",
-                        extra={
-                            "store_code": self.store_code,
-                            "endpoint": endpoint,
-                            "page": page,
-                            "fallback_page_size_from": previous_page_size,
-                            "fallback_page_size_to": next_page_size,
-                            "retry_profile": retry_profile,
-                            "error_class": page_result.error,
-                        },
-                    )
-                    continue
 
-                final_error = page_result.error or "unknown_error"
-                if is_garments_endpoint and garments_stop_reason is None:
-                    garments_stop_reason = "timeout_budget" if final_error in _TIMEOUT_ERROR_CLASSES else "payload_error"
-                if timeout_degradation_reached:
-                    garments_degraded_reason = "garments_timeout_budget_exhausted"
-                    final_error = garments_degraded_reason
-                    garments_stop_reason = "timeout_budget"
-                    logger.warning(
-                        "TD API garments fetch degraded due to timeout budget",
-                        extra={
-                            "store_code": self.store_code,
-                            "endpoint": endpoint,
-                            "degraded_reason": garments_degraded_reason,
-                            "garments_timeout_count": garments_timeout_count,
-                            "garments_timeout_budget": self.config.garments_max_timeout_pages,
-                            "page": page,
-                        },
+                if not page_result.ok:
+                    timeout_degradation_reached = (
+                        is_garments_endpoint
+                        and page_result.error in _TIMEOUT_ERROR_CLASSES
+                        and self.config.garments_max_timeout_pages > 0
+                        and garments_timeout_count >= self.config.garments_max_timeout_pages
                     )
+                    if page_result.error in _TIMEOUT_ERROR_CLASSES and page_size_index < len(available_page_sizes) - 1:
+                        previous_page_size = active_page_size
+                        fallback_attempts += 1
+                        page_size_index += 1
+                        next_page_size = available_page_sizes[page_size_index]
+                        fallback_used = True
+                        if is_garments_endpoint:
+                            garments_fallback_count += 1
+                        metadata.append(
+                            {
+                                "endpoint": endpoint,
+                                "method": "GET",
+                                "query_params": self._metadata_query_map(
+                                    self._merge_query_params(
+                                        base_params=params,
+                                        overrides={"page": page, "pageSize": previous_page_size},
+                                    )
+                                ),
+                                "status": page_result.status,
+                                "latency_ms": None,
+                                "retry_count": retry_profile["max_retries"],
+                                "token_refresh_attempted": self._auth_state.refresh_attempted,
+                                "retry_reason": "page_size_fallback",
+                                "fallback_page_size_from": previous_page_size,
+                                "fallback_page_size_to": next_page_size,
+                            }
+                        )
+                        logger.warning(
+                            "TD API page-size fallback triggered",
+                            extra={
+                                "store_code": self.store_code,
+                                "endpoint": endpoint,
+                                "page": page,
+                                "fallback_page_size_from": previous_page_size,
+                                "fallback_page_size_to": next_page_size,
+                                "retry_profile": retry_profile,
+                                "error_class": page_result.error,
+                            },
+                        )
+                        continue
 
-                errors[endpoint] = final_error
-                diagnostics = self._build_auth_diagnostics_payload()
-                error_diagnostics[endpoint] = diagnostics
-                endpoint_health[endpoint] = {
-                    "success": False,
-                    "final_error_class": final_error,
-                    "attempts": endpoint_attempts,
-                    "last_successful_page": last_successful_page,
-                    "resume_from_page": max(last_successful_page + 1, page),
-                    "pages_attempted": garments_pages_attempted if is_garments_endpoint else None,
-                    "timeout_count": garments_timeout_count if is_garments_endpoint else None,
-                    "retry_count": garments_retry_count if is_garments_endpoint else None,
-                    "retry_success_count": garments_retry_success_count if is_garments_endpoint else None,
-                    "page_success_rate": garments_page_success_rate if is_garments_endpoint else None,
-                }
-                if is_garments_endpoint:
-                    endpoint_health[endpoint].update(
-                        {
-                            "garments_budget_state": garments_budget_state,
-                            "garments_fetch_completeness": "incomplete",
-                            "garments_expected_total_rows": total_rows_hint,
-                            "garments_fetched_unique_row_ids": len(garments_unique_row_ids),
-                            "garments_duplicate_row_id_count": garments_duplicate_row_id_count,
-                            "garments_completeness_basis": garments_completeness_basis,
-                            "garments_final_row_count": cumulative_rows,
-                        }
-                    )
-                if page == 1 and page_result.status == 401:
-                    self._emit_source_fetch_event(
-                        status="error",
-                        message="TD API endpoint unauthorized on first page",
-                        endpoint=endpoint,
-                        window_start=window_start,
-                        window_end=window_end,
-                        http_status=page_result.status,
-                        failure_class=final_error,
-                        **diagnostics,
-                    )
-                break
+                    final_error = page_result.error or "unknown_error"
+                    if is_garments_endpoint and garments_stop_reason is None:
+                        garments_stop_reason = "timeout_budget" if final_error in _TIMEOUT_ERROR_CLASSES else "payload_error"
+                    if timeout_degradation_reached:
+                        garments_degraded_reason = "garments_timeout_budget_exhausted"
+                        final_error = garments_degraded_reason
+                        garments_stop_reason = "timeout_budget"
+                        logger.warning(
+                            "TD API garments fetch degraded due to timeout budget",
+                            extra={
+                                "store_code": self.store_code,
+                                "endpoint": endpoint,
+                                "degraded_reason": garments_degraded_reason,
+                                "garments_timeout_count": garments_timeout_count,
+                                "garments_timeout_budget": self.config.garments_max_timeout_pages,
+                                "page": page,
+                            },
+                        )
 
-            page_payload = page_result.payload
-            page_payloads.append(page_payload)
-            if endpoint_attempts > 1 and not eventual_success_recorded:
-                self._increment_metric(name="eventual_success_after_retry", endpoint=endpoint)
-                eventual_success_recorded = True
+                    errors[endpoint] = final_error
+                    diagnostics = self._build_auth_diagnostics_payload()
+                    error_diagnostics[endpoint] = diagnostics
+                    endpoint_health[endpoint] = {
+                        "success": False,
+                        "final_error_class": final_error,
+                        "attempts": endpoint_attempts,
+                        "last_successful_page": last_successful_page,
+                        "resume_from_page": max(last_successful_page + 1, page),
+                        "pages_attempted": garments_pages_attempted if is_garments_endpoint else None,
+                        "timeout_count": garments_timeout_count if is_garments_endpoint else None,
+                        "retry_count": garments_retry_count if is_garments_endpoint else None,
+                        "retry_success_count": garments_retry_success_count if is_garments_endpoint else None,
+                        "page_success_rate": garments_page_success_rate if is_garments_endpoint else None,
+                    }
+                    if is_garments_endpoint:
+                        endpoint_health[endpoint].update(
+                            {
+                                "garments_budget_state": garments_budget_state,
+                                "garments_fetch_completeness": "incomplete",
+                                "garments_expected_total_rows": total_rows_hint,
+                                "garments_fetched_unique_row_ids": len(garments_unique_row_ids),
+                                "garments_duplicate_row_id_count": garments_duplicate_row_id_count,
+                                "garments_completeness_basis": garments_completeness_basis,
+                                "garments_final_row_count": cumulative_rows,
+                            }
+                        )
+                    if page == 1 and page_result.status == 401:
+                        self._emit_source_fetch_event(
+                            status="error",
+                            message="TD API endpoint unauthorized on first page",
+                            endpoint=endpoint,
+                            window_start=window_start,
+                            window_end=window_end,
+                            http_status=page_result.status,
+                            failure_class=final_error,
+                            **diagnostics,
+                        )
+                    break
 
-            payload_error = self._extract_payload_error_class(
-                page_payload,
-                content_type=getattr(page_result, "content_type", None),
-                status=page_result.status,
-            )
-            if payload_error:
-                if is_garments_endpoint:
-                    garments_stop_reason = "payload_error"
-                errors[endpoint] = payload_error
-                diagnostics = self._build_auth_diagnostics_payload()
-                error_diagnostics[endpoint] = diagnostics
-                endpoint_health[endpoint] = {
-                    "success": False,
-                    "final_error_class": payload_error,
-                    "attempts": endpoint_attempts,
-                }
-                if is_garments_endpoint:
-                    endpoint_health[endpoint].update(
-                        {
-                            "garments_budget_state": garments_budget_state,
-                            "garments_fetch_completeness": "incomplete",
-                            "garments_expected_total_rows": total_rows_hint,
-                            "garments_fetched_unique_row_ids": len(garments_unique_row_ids),
-                            "garments_duplicate_row_id_count": garments_duplicate_row_id_count,
-                            "garments_completeness_basis": garments_completeness_basis,
-                            "garments_final_row_count": cumulative_rows,
-                        }
-                    )
-                logger.error(
-                    "TD API endpoint payload reported error",
-                    extra={
-                        "store_code": self.store_code,
-                        "endpoint": endpoint,
-                        "page": page,
-                        "error_class": payload_error,
-                        **diagnostics,
-                    },
-                )
-                break
+                page_payload = page_result.payload
+                page_payloads.append(page_payload)
+                if endpoint_attempts > 1 and not eventual_success_recorded:
+                    self._increment_metric(name="eventual_success_after_retry", endpoint=endpoint)
+                    eventual_success_recorded = True
 
-            extracted_total_rows_hint = _extract_total_rows_hint(page_payload)
-            if extracted_total_rows_hint is not None:
-                total_rows_hint = extracted_total_rows_hint
-            extracted_total_pages_hint = _extract_total_pages_hint(page_payload)
-            if extracted_total_pages_hint is not None:
-                total_pages_hint = extracted_total_pages_hint
-
-            rows = _extract_rows(page_payload)
-            if is_garments_endpoint and _has_unparseable_rows_payload(page_payload, rows):
-                garments_response_parsing_failure = True
-                garments_stop_reason = "parsing_failure"
-                garments_pages_succeeded = max(0, garments_pages_succeeded - 1)
-                garments_page_success_rate = (
-                    round((garments_pages_succeeded / garments_pages_attempted), 4)
-                    if garments_pages_attempted > 0
-                    else 0.0
-                )
-                errors[endpoint] = "garments_response_parsing_failure"
-                payload_shape_diagnostic = _payload_shape_diagnostic(
+                payload_error = self._extract_payload_error_class(
                     page_payload,
                     content_type=getattr(page_result, "content_type", None),
                     status=page_result.status,
                 )
-                endpoint_health[endpoint] = {
-                    "success": False,
-                    "final_error_class": "garments_response_parsing_failure",
-                    "attempts": endpoint_attempts,
-                    "last_successful_page": last_successful_page,
-                    "resume_from_page": max(last_successful_page + 1, page),
-                    "pages_attempted": garments_pages_attempted,
-                    "timeout_count": garments_timeout_count,
-                    "retry_count": garments_retry_count,
-                    "retry_success_count": garments_retry_success_count,
-                    "page_success_rate": garments_page_success_rate,
-                    "payload_shape_diagnostic": payload_shape_diagnostic,
-                }
-                logger.error(
-                    "garments_response_parsing_failure",
-                    extra={
-                        "store_code": self.store_code,
-                        "window_start": window_start,
-                        "window_end": window_end,
-                        "endpoint": endpoint,
-                        "page": page,
-                        "payload_shape_diagnostic": payload_shape_diagnostic,
-                    },
-                )
-                break
-            last_successful_page = page
-            if fallback_used:
-                fallback_successes += 1
-            aggregated_rows.extend(rows)
-            cumulative_rows += len(rows)
-            rows_in_page = len(rows)
-
-            if is_garments_endpoint:
-                garments_page_row_counts.append(rows_in_page)
-                previous_unique_row_ids = len(garments_unique_row_ids)
-                page_row_ids: list[str] = []
-                for row in rows:
-                    identity = _extract_row_identity(row)
-                    if identity is None:
-                        garments_rows_without_identity_count += 1
-                        continue
-                    row_id, strategy = identity
-                    page_row_ids.append(row_id)
-                    if strategy in garments_identity_strategy_counts:
-                        garments_identity_strategy_counts[strategy] += 1
-                garments_unique_row_ids.update(page_row_ids)
-                new_unique_row_ids = len(garments_unique_row_ids) - previous_unique_row_ids
-                garments_duplicate_row_id_count += max(0, len(page_row_ids) - new_unique_row_ids)
-
-            if self.config.debug_logging:
-                logger.debug(
-                    "TD API endpoint page fetched",
-                    extra={
-                        "store_code": self.store_code,
-                        "endpoint": endpoint,
-                        "page_number": page,
-                        "rows_in_page": rows_in_page,
-                        "cumulative_rows": cumulative_rows,
-                        "latency_ms": page_result.latency_ms,
-                        "attempts": page_result.attempts,
-                    },
-                )
-
-            if is_garments_endpoint and page_result.latency_ms is not None:
-                garments_latency_distribution_ms.append(max(int(page_result.latency_ms), 0))
-                latency_threshold_ms = max(int(self.config.garments_latency_threshold_ms), 0)
-                if (
-                    latency_threshold_ms > 0
-                    and int(page_result.latency_ms) >= latency_threshold_ms
-                    and page_size_index < len(available_page_sizes) - 1
-                ):
-                    previous_page_size = active_page_size
-                    page_size_index += 1
-                    fallback_used = True
-                    fallback_attempts += 1
-                    garments_fallback_count += 1
-                    garments_adaptive_downgrades += 1
-                    logger.info(
-                        "TD API garments adaptive page-size downgrade applied",
+                if payload_error:
+                    if is_garments_endpoint:
+                        garments_stop_reason = "payload_error"
+                    errors[endpoint] = payload_error
+                    diagnostics = self._build_auth_diagnostics_payload()
+                    error_diagnostics[endpoint] = diagnostics
+                    endpoint_health[endpoint] = {
+                        "success": False,
+                        "final_error_class": payload_error,
+                        "attempts": endpoint_attempts,
+                    }
+                    if is_garments_endpoint:
+                        endpoint_health[endpoint].update(
+                            {
+                                "garments_budget_state": garments_budget_state,
+                                "garments_fetch_completeness": "incomplete",
+                                "garments_expected_total_rows": total_rows_hint,
+                                "garments_fetched_unique_row_ids": len(garments_unique_row_ids),
+                                "garments_duplicate_row_id_count": garments_duplicate_row_id_count,
+                                "garments_completeness_basis": garments_completeness_basis,
+                                "garments_final_row_count": cumulative_rows,
+                            }
+                        )
+                    logger.error(
+                        "TD API endpoint payload reported error",
                         extra={
                             "store_code": self.store_code,
                             "endpoint": endpoint,
                             "page": page,
-                            "latency_ms": page_result.latency_ms,
-                            "latency_threshold_ms": latency_threshold_ms,
-                            "adaptive_page_size_from": previous_page_size,
-                            "adaptive_page_size_to": available_page_sizes[page_size_index],
+                            "error_class": payload_error,
+                            **diagnostics,
                         },
                     )
+                    break
 
-                throttle_cap_ms = max(0, int(self.config.garments_adaptive_throttle_max_ms))
-                if latency_threshold_ms > 0 and throttle_cap_ms > 0 and int(page_result.latency_ms) >= latency_threshold_ms:
-                    latency_overage_ms = max(0, int(page_result.latency_ms) - latency_threshold_ms)
-                    throttle_delay_ms = min(throttle_cap_ms, max(100, latency_overage_ms // 2))
-                    garments_dynamic_throttle_events += 1
-                    garments_dynamic_throttle_total_ms += throttle_delay_ms
-                    logger.info(
-                        "TD API garments adaptive throttling applied",
+                extracted_total_rows_hint = _extract_total_rows_hint(page_payload)
+                if extracted_total_rows_hint is not None:
+                    total_rows_hint = extracted_total_rows_hint
+                extracted_total_pages_hint = _extract_total_pages_hint(page_payload)
+                if extracted_total_pages_hint is not None:
+                    total_pages_hint = extracted_total_pages_hint
+
+                rows = _extract_rows(page_payload)
+                if is_garments_endpoint and _has_unparseable_rows_payload(page_payload, rows):
+                    garments_response_parsing_failure = True
+                    garments_stop_reason = "parsing_failure"
+                    garments_pages_succeeded = max(0, garments_pages_succeeded - 1)
+                    garments_page_success_rate = (
+                        round((garments_pages_succeeded / garments_pages_attempted), 4)
+                        if garments_pages_attempted > 0
+                        else 0.0
+                    )
+                    errors[endpoint] = "garments_response_parsing_failure"
+                    payload_shape_diagnostic = _payload_shape_diagnostic(
+                        page_payload,
+                        content_type=getattr(page_result, "content_type", None),
+                        status=page_result.status,
+                    )
+                    endpoint_health[endpoint] = {
+                        "success": False,
+                        "final_error_class": "garments_response_parsing_failure",
+                        "attempts": endpoint_attempts,
+                        "last_successful_page": last_successful_page,
+                        "resume_from_page": max(last_successful_page + 1, page),
+                        "pages_attempted": garments_pages_attempted,
+                        "timeout_count": garments_timeout_count,
+                        "retry_count": garments_retry_count,
+                        "retry_success_count": garments_retry_success_count,
+                        "page_success_rate": garments_page_success_rate,
+                        "payload_shape_diagnostic": payload_shape_diagnostic,
+                    }
+                    logger.error(
+                        "garments_response_parsing_failure",
                         extra={
                             "store_code": self.store_code,
+                            "window_start": window_start,
+                            "window_end": window_end,
                             "endpoint": endpoint,
                             "page": page,
-                            "latency_ms": page_result.latency_ms,
-                            "latency_threshold_ms": latency_threshold_ms,
-                            "throttle_delay_ms": throttle_delay_ms,
-                            "throttle_cap_ms": throttle_cap_ms,
+                            "payload_shape_diagnostic": payload_shape_diagnostic,
                         },
                     )
-                    await asyncio.sleep(throttle_delay_ms / 1000)
-
-            if is_garments_endpoint and self.config.garments_max_wall_time_ms > 0:
-                elapsed_wall_time_ms = int((time.perf_counter() - endpoint_started_at) * 1000)
-                budget_ms = int(self.config.garments_max_wall_time_ms)
-                if not garments_near_limit_emitted and elapsed_wall_time_ms >= int(budget_ms * _GARMENTS_WALL_TIME_SOFT_THRESHOLD_RATIO):
-                    garments_near_limit_emitted = True
-                    if garments_budget_state != "cutoff":
-                        garments_budget_state = "near_limit"
-                    remaining_pages_estimate = _estimate_remaining_pages(
-                        page_number=page,
-                        cumulative_rows=cumulative_rows,
-                        reported_total_rows=total_rows_hint,
-                        reported_total_pages=total_pages_hint,
-                    )
-                    logger.info(
-                        "garments_wall_time_budget_near_limit",
+                    break
+                last_successful_page = page
+                if fallback_used:
+                    fallback_successes += 1
+                aggregated_rows.extend(rows)
+                cumulative_rows += len(rows)
+                rows_in_page = len(rows)
+
+                if is_garments_endpoint:
+                    garments_page_row_counts.append(rows_in_page)
+                    previous_unique_row_ids = len(garments_unique_row_ids)
+                    page_row_ids: list[str] = []
+                    for row in rows:
+                        identity = _extract_row_identity(row)
+                        if identity is None:
+                            garments_rows_without_identity_count += 1
+                            continue
+                        row_id, strategy = identity
+                        page_row_ids.append(row_id)
+                        if strategy in garments_identity_strategy_counts:
+                            garments_identity_strategy_counts[strategy] += 1
+                    garments_unique_row_ids.update(page_row_ids)
+                    new_unique_row_ids = len(garments_unique_row_ids) - previous_unique_row_ids
+                    garments_duplicate_row_id_count += max(0, len(page_row_ids) - new_unique_row_ids)
+
+                if self.config.debug_logging:
+                    logger.debug(
+                        "TD API endpoint page fetched",
                         extra={
                             "store_code": self.store_code,
-                            "window_start": window_start,
-                            "window_end": window_end,
                             "endpoint": endpoint,
-                            "elapsed_ms": elapsed_wall_time_ms,
-                            "budget_ms": budget_ms,
-                            "remaining_pages_estimate": remaining_pages_estimate,
-                            "expected_total_rows": total_rows_hint,
-                            "fetched_unique_row_ids": len(garments_unique_row_ids),
-                            "details_message": "near limit, fetch still in progress",
-                            **({"page_number": page, "rows_in_page": rows_in_page, "cumulative_rows": cumulative_rows} if self.config.debug_logging else {}),
+                            "page_number": page,
+                            "rows_in_page": rows_in_page,
+                            "cumulative_rows": cumulative_rows,
+                            "latency_ms": page_result.latency_ms,
+                            "attempts": page_result.attempts,
                         },
                     )
 
-            for item in metadata:
-                query_params = item.get("query_params")
-                if item.get("endpoint") != endpoint or not isinstance(query_params, dict):
-                    continue
-                page_values = query_params.get("page")
-                if page_values != [str(page)]:
-                    continue
-                item["page_number"] = page
-                item["rows_in_page"] = len(rows)
-                item["rows_per_page"] = active_page_size
-                item["cumulative_rows"] = cumulative_rows
+                if is_garments_endpoint and page_result.latency_ms is not None:
+                    garments_latency_distribution_ms.append(max(int(page_result.latency_ms), 0))
+                    latency_threshold_ms = max(int(self.config.garments_latency_threshold_ms), 0)
+                    if (
+                        latency_threshold_ms > 0
+                        and int(page_result.latency_ms) >= latency_threshold_ms
+                        and page_size_index < len(available_page_sizes) - 1
+                    ):
+                        previous_page_size = active_page_size
+                        page_size_index += 1
+                        fallback_used = True
+                        fallback_attempts += 1
+                        garments_fallback_count += 1
+                        garments_adaptive_downgrades += 1
+                        logger.info(
+                            "TD API garments adaptive page-size downgrade applied",
+                            extra={
+                                "store_code": self.store_code,
+                                "endpoint": endpoint,
+                                "page": page,
+                                "latency_ms": page_result.latency_ms,
+                                "latency_threshold_ms": latency_threshold_ms,
+                                "adaptive_page_size_from": previous_page_size,
+                                "adaptive_page_size_to": available_page_sizes[page_size_index],
+                            },
+                        )
 
-            if not rows:
-                if is_garments_endpoint:
-                    garments_stop_reason = "empty_page"
-                break
-            if total_rows_hint is not None and cumulative_rows >= total_rows_hint:
-                if is_garments_endpoint:
-                    garments_stop_reason = "reached_total_rows"
-                break
-            if total_pages_hint and page >= total_pages_hint:
-                if is_garments_endpoint:
-                    garments_stop_reason = "reached_total_pages"
-                break
-            if page >= self.config.max_pages:
-                if is_garments_endpoint:
-                    garments_pagination_budget_exhausted = True
-                    garments_degraded_reason = "garments_pagination_budget_exhausted"
-                    garments_budget_state = "cutoff"
-                    garments_stop_reason = "max_pages"
-                    errors[endpoint] = garments_degraded_reason
-                logger.warning(
-                    "TD API max page cap reached before dataset completion",
-                    extra={
-                        "store_code": self.store_code,
-                        "endpoint": endpoint,
-                        "max_pages": self.config.max_pages,
-                        "cumulative_rows": cumulative_rows,
-                        "reported_total_rows": total_rows_hint,
-                        "reported_total_pages": total_pages_hint,
-                    },
-                )
-                break
+                    throttle_cap_ms = max(0, int(self.config.garments_adaptive_throttle_max_ms))
+                    if latency_threshold_ms > 0 and throttle_cap_ms > 0 and int(page_result.latency_ms) >= latency_threshold_ms:
+                        latency_overage_ms = max(0, int(page_result.latency_ms) - latency_threshold_ms)
+                        throttle_delay_ms = min(throttle_cap_ms, max(100, latency_overage_ms // 2))
+                        garments_dynamic_throttle_events += 1
+                        garments_dynamic_throttle_total_ms += throttle_delay_ms
+                        logger.info(
+                            "TD API garments adaptive throttling applied",
+                            extra={
+                                "store_code": self.store_code,
+                                "endpoint": endpoint,
+                                "page": page,
+                                "latency_ms": page_result.latency_ms,
+                                "latency_threshold_ms": latency_threshold_ms,
+                                "throttle_delay_ms": throttle_delay_ms,
+                                "throttle_cap_ms": throttle_cap_ms,
+                            },
+                        )
+                        await asyncio.sleep(throttle_delay_ms / 1000)
+
+                if is_garments_endpoint and self.config.garments_max_wall_time_ms > 0:
+                    elapsed_wall_time_ms = int((time.perf_counter() - endpoint_started_at) * 1000)
+                    budget_ms = int(self.config.garments_max_wall_time_ms)
+                    if not garments_near_limit_emitted and elapsed_wall_time_ms >= int(budget_ms * _GARMENTS_WALL_TIME_SOFT_THRESHOLD_RATIO):
+                        garments_near_limit_emitted = True
+                        if garments_budget_state != "cutoff":
+                            garments_budget_state = "near_limit"
+                        remaining_pages_estimate = _estimate_remaining_pages(
+                            page_number=page,
+                            cumulative_rows=cumulative_rows,
+                            reported_total_rows=total_rows_hint,
+                            reported_total_pages=total_pages_hint,
+                        )
+                        logger.info(
+                            "garments_wall_time_budget_near_limit",
+                            extra={
+                                "store_code": self.store_code,
+                                "window_start": window_start,
+                                "window_end": window_end,
+                                "endpoint": endpoint,
+                                "elapsed_ms": elapsed_wall_time_ms,
+                                "budget_ms": budget_ms,
+                                "remaining_pages_estimate": remaining_pages_estimate,
+                                "expected_total_rows": total_rows_hint,
+                                "fetched_unique_row_ids": len(garments_unique_row_ids),
+                                "details_message": "near limit, fetch still in progress",
+                                **({"page_number": page, "rows_in_page": rows_in_page, "cumulative_rows": cumulative_rows} if self.config.debug_logging else {}),
+                            },
+                        )
 
-            page += 1
+                for item in metadata:
+                    query_params = item.get("query_params")
+                    if item.get("endpoint") != endpoint or not isinstance(query_params, dict):
+                        continue
+                    page_values = query_params.get("page")
+                    if page_values != [str(page)]:
+                        continue
+                    item["page_number"] = page
+                    item["rows_in_page"] = len(rows)
+                    item["rows_per_page"] = active_page_size
+                    item["cumulative_rows"] = cumulative_rows
 
+                if not rows:
+                    if is_garments_endpoint:
+                        garments_stop_reason = "empty_page"
+                    break
+                if total_rows_hint is not None and cumulative_rows >= total_rows_hint:
+                    if is_garments_endpoint:
+                        garments_stop_reason = "reached_total_rows"
+                    break
+                if total_pages_hint and page >= total_pages_hint:
+                    if is_garments_endpoint:
+                        garments_stop_reason = "reached_total_pages"
+                    break
+                if page >= self.config.max_pages:
+                    if is_garments_endpoint:
+                        garments_pagination_budget_exhausted = True
+                        garments_degraded_reason = "garments_pagination_budget_exhausted"
+                        garments_budget_state = "cutoff"
+                        garments_stop_reason = "max_pages"
+                        errors[endpoint] = garments_degraded_reason
+                    logger.warning(
+                        "TD API max page cap reached before dataset completion",
+                        extra={
+                            "store_code": self.store_code,
+                            "endpoint": endpoint,
+                            "max_pages": self.config.max_pages,
+                            "cumulative_rows": cumulative_rows,
+                            "reported_total_rows": total_rows_hint,
+                            "reported_total_pages": total_pages_hint,
+                        },
+                    )
+                    break
+
+                page += 1
+
+                next_page_size = available_page_sizes[page_size_index]
+                if prefetch_concurrency > 1 and next_page_size == active_page_size:
+                    # Totals describe the page size just used; after a downgrade wait
+                    # for a page at the new size before prefetching again.
+                    last_known_page = total_pages_hint
+                    if not last_known_page and total_rows_hint:
+                        last_known_page = -(-total_rows_hint // active_page_size)
+                    if last_known_page:
+                        if prefetch_page_size != active_page_size:
+                            prefetch_discarded += _cancel_prefetched_pages(prefetched_pages)
+                            prefetch_page_size = active_page_size
+                        prefetch_last_page = min(last_known_page, self.config.max_pages, page + prefetch_concurrency - 1)
+                        for ahead_page in range(page, prefetch_last_page + 1):
+                            if ahead_page not in prefetched_pages:
+                                prefetched_pages[ahead_page] = asyncio.create_task(
+                                    self._get_endpoint_page(
+                                        endpoint=endpoint,
+                                        params=params,
+                                        page=ahead_page,
+                                        page_size=active_page_size,
+                                        metadata=metadata,
+                                        retry_profile=retry_profile,
+                                    )
+                                )
+        finally:
+            # Runs on errors and cancellation too, so no prefetch task outlives the loop.
+            prefetch_discarded += _cancel_prefetched_pages(prefetched_pages)
 
         if is_garments_endpoint:
             garments_expected_total_rows = total_rows_hint
@@ -1558,8 +1761,12 @@ class TdApiClient:
                 "duration_ms": total_wall_time_ms,
                 "timeout_count": endpoint_timeout_count,
                 "retry_count": endpoint_retry_count,
+                "prefetch_concurrency": prefetch_concurrency,
+                "prefetched_pages_used": prefetch_hits,
+                "prefetched_pages_discarded": prefetch_discarded,
             },
         )
+        self._emit_scheduler_metrics(endpoint=endpoint)
 
         if fallback_attempts > 0:
             self._increment_metric(
@@ -1588,6 +1795,32 @@ class TdApiClient:
             },
         }
 
+    async def _get_endpoint_page(
+        self,
+        *,
+        endpoint: str,
+        params: Mapping[str, Any],
+        page: int,
+        page_size: int,
+        metadata: list[dict[str, Any]],
+        retry_profile: Mapping[str, float | int],
+    ) -> _JsonFetchResult:
+        page_params = self._merge_query_params(
+            base_params=params,
+            overrides={"page": page, "pageSize": page_size},
+        )
+        return await self._get_json(
+            endpoint=endpoint,
+            params=page_params,
+            metadata=metadata,
+            connect_timeout_ms=self.config.connect_timeout_ms,
+            read_timeout_ms=self._read_timeout_ms_for_endpoint(endpoint, page_size=page_size),
+            max_retries=retry_profile["max_retries"],
+            backoff_base_seconds=retry_profile["backoff_base_seconds"],
+            max_backoff_seconds=retry_profile["max_backoff_seconds"],
+            timeout_retry_limit=retry_profile["timeout_retry_limit"],
+        )
+
     @staticmethod
     def _extract_payload_error_class(payload: Any, *, content_type: str | None = None, status: int | None = None) -> str | None:
         if _looks_like_html_payload(payload, content_type=content_type):
@@ -2116,6 +2349,8 @@ class TdApiClient:
             )
             self._record_effective_token_discovery(token_discovery=token_discovery, headers=headers, request_params=request_params)
             await _StoreRateLimiter.wait_turn(self.store_code, self.config.min_interval_seconds)
+            if self._request_scheduler.enabled:
+                await self._request_scheduler.acquire(endpoint)
             started = time.perf_counter()
             retry_reason: str | None = None
             timed_out_during_response_read = False
@@ -2226,6 +2461,7 @@ class TdApiClient:
                             timeout_failures=timeout_failures,
                             content_type=content_type,
                         )
+                    self._record_scheduler_outcome(endpoint=endpoint, status=status_code, error_class=None)
                     logger.info(
                         "TD API request attempt succeeded",
                         extra={
@@ -2238,6 +2474,7 @@ class TdApiClient:
                     )
                     return _JsonFetchResult(ok=True, payload=payload, status=status_code, attempts=attempts, auth_shape=auth_shape.name, latency_ms=latency_ms, timeout_failures=timeout_failures, content_type=content_type)
                 if status_code not in {408, 429, 500, 502, 503, 504}:
+                    self._record_scheduler_outcome(endpoint=endpoint, status=status_code, error_class=None)
                     return _JsonFetchResult(ok=False, payload=None, error=f"http_{status_code}", status=status_code, attempts=attempts, auth_shape=auth_shape.name, latency_ms=latency_ms, content_type=content_type)
                 last_error = RuntimeError(f"HTTP {status_code} from {endpoint}")
                 retry_reason = f"http_{status_code}"
@@ -2305,6 +2542,7 @@ class TdApiClient:
                 last_error = exc
 
             final_error_class = retry_reason or (str(last_error) if last_error else "unknown_error")
+            self._record_scheduler_outcome(endpoint=endpoint, status=status_code, error_class=retry_reason)
             logger.warning(
                 "TD API request attempt failed",
                 extra={
@@ -2342,6 +2580,32 @@ class TdApiClient:
             return _JsonFetchResult(ok=False, payload=None, error=type(last_error).__name__, status=None, attempts=attempts, auth_shape=auth_shape.name, timeout_failures=timeout_failures)
         return _JsonFetchResult(ok=False, payload=None, error="unknown_error", status=None, attempts=attempts, auth_shape=auth_shape.name, timeout_failures=timeout_failures)
 
+    def _record_scheduler_outcome(self, *, endpoint: str, status: int | None, error_class: str | None) -> None:
+        scheduler = self._request_scheduler
+        if not scheduler.enabled:
+            return
+        if scheduler.record_outcome(status=status, error_class=error_class):
+            self._emit_source_fetch_event(
+                phase="td_api_request_scheduler",
+                status="warning" if scheduler.slowdown > 1 else "info",
+                message="TD API request scheduler backoff adjusted",
+                endpoint=endpoint,
+                http_status=status,
+                failure_class=error_class,
+                **scheduler.metrics(),
+            )
+
+    def _emit_scheduler_metrics(self, *, endpoint: str) -> None:
+        if not self._request_scheduler.enabled:
+            return
+        self._emit_source_fetch_event(
+            phase="td_api_request_scheduler",
+            status="info",
+            message="TD API request scheduler metrics",
+            endpoint=endpoint,
+            **self._request_scheduler.metrics(),
+        )
+
     async def _attempt_auth_refresh_once(self) -> bool:
         if self._auth_state.refresh_attempted:
             return False
@@ -2892,6 +3156,20 @@ def _summarize_identity_strategy(strategy_counts: Mapping[str, int]) -> str | No
     return "mixed"
 
 
+def _cancel_prefetched_pages(prefetched_pages: dict[int, asyncio.Task[Any]]) -> int:
+    """Cancel outstanding prefetch tasks and return how many were dropped."""
+
+    dropped = len(prefetched_pages)
+    for task in prefetched_pages.values():
+        if task.done():
+            if not task.cancelled():
+                task.exception()
+        else:
+            task.cancel()
+    prefetched_pages.clear()
+    return dropped
+
+
 def _estimate_remaining_pages(
     *,
     page_number: int,
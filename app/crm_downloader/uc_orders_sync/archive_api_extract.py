@@ -24,6 +24,8 @@ ARCHIVE_API_MAX_PAGES = 250
 ARCHIVE_API_DATE_TYPE = "pickup"
 ARCHIVE_API_MAX_RETRIES = 3
 ARCHIVE_API_RETRY_BASE_SECONDS = 1.0
+ARCHIVE_INVOICE_CONCURRENCY = 4
+ARCHIVE_INVOICE_MIN_INTERVAL_SECONDS = 0.1
 ARCHIVE_REQUESTED_WITH_HEADER = "XMLHttpRequest"
 ARCHIVE_REFERER = "https://store.ucleanlaundry.com/archive"
 ARCHIVE_ACCEPT_HEADER = "application/json, text/plain, */*"
@@ -123,6 +125,56 @@ class ArchiveApiExtract:
     extractor_reason_codes: list[str] = field(default_factory=list)
 
 
+class _ArchiveTokenCache:
+    """Bearer token for one page, resolved once and re-read only after a 401."""
+
+    def __init__(self, *, page: Page, logger: JsonLogger, store_code: str) -> None:
+        self.page = page
+        self.logger = logger
+        self.store_code = store_code
+        self.resolve_count = 0
+        self._lock = asyncio.Lock()
+        self._resolved = False
+        self._token: str | None = None
+
+    async def _resolve(self) -> str | None:
+        self._token = await _resolve_archive_bearer_token(
+            page=self.page, logger=self.logger, store_code=self.store_code
+        )
+        self._resolved = True
+        self.resolve_count += 1
+        return self._token
+
+    async def get(self) -> str | None:
+        async with self._lock:
+            if self._resolved:
+                return self._token
+            return await self._resolve()
+
+    async def refresh(self, stale_token: str | None) -> str | None:
+        async with self._lock:
+            # Concurrent requests that hit 401 with the same token refresh it once.
+            if self._resolved and self._token != stale_token:
+                return self._token
+            return await self._resolve()
+
+
+class _ArchiveRequestRateLimiter:
+    """Space out archive requests issued by concurrent invoice fetches."""
+
+    def __init__(self, min_interval_seconds: float) -> None:
+        self.min_interval_seconds = max(min_interval_seconds, 0.0)
+        self._lock = asyncio.Lock()
+        self._next_allowed_at = 0.0
+
+    async def wait_turn(self) -> None:
+        async with self._lock:
+            delay = self._next_allowed_at - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._next_allowed_at = time.monotonic() + self.min_interval_seconds
+
+
 def _record_extractor_error(extract: ArchiveApiExtract, *, reason: str) -> None:
     extract.extractor_error_counters[reason] = (
         extract.extractor_error_counters.get(reason, 0) + 1
@@ -328,8 +380,12 @@ async def _api_get_json_with_retries(
     logger: JsonLogger,
     store_code: str,
     context: str,
+    token_cache: _ArchiveTokenCache | None = None,
 ) -> tuple[Mapping[str, Any] | None, str | None]:
-    bearer_token = await _resolve_archive_bearer_token(page=page, logger=logger, store_code=store_code)
+    if token_cache is not None:
+        bearer_token = await token_cache.get()
+    else:
+        bearer_token = await _resolve_archive_bearer_token(page=page, logger=logger, store_code=store_code)
     request_headers = _build_archive_request_headers(bearer_token=bearer_token)
     auth_header_present = "Authorization" in request_headers
     referer_set = request_headers.get("Referer") == ARCHIVE_REFERER
@@ -356,6 +412,10 @@ async def _api_get_json_with_retries(
                     referer_set=referer_set,
                     url=url,
                 )
+                if token_cache is not None:
+                    bearer_token = await token_cache.refresh(bearer_token)
+                    request_headers = _build_archive_request_headers(bearer_token=bearer_token)
+                    auth_header_present = "Authorization" in request_headers
                 payload, fallback_status = await _browser_fetch_json_with_credentials(
                     page=page,
                     url=url,
@@ -693,9 +753,13 @@ async def _fetch_invoice_html_with_retries(
     logger: JsonLogger,
     trace_invoice_success: bool,
     invoice_call_stats: InvoiceApiCallStats,
+    token_cache: _ArchiveTokenCache | None = None,
 ) -> tuple[str | None, int]:
     url = ARCHIVE_INVOICE_URL_TEMPLATE.format(booking_id=booking_id)
-    bearer_token = await _resolve_archive_bearer_token(page=page, logger=logger, store_code=store_code)
+    if token_cache is not None:
+        bearer_token = await token_cache.get()
+    else:
+        bearer_token = await _resolve_archive_bearer_token(page=page, logger=logger, store_code=store_code)
     request_headers = _build_archive_request_headers(bearer_token=bearer_token)
     auth_header_present = "Authorization" in request_headers
     referer_set = request_headers.get("Referer") == ARCHIVE_REFERER
@@ -727,6 +791,10 @@ async def _fetch_invoice_html_with_retries(
                     referer_set=referer_set,
                     url=url,
                 )
+                if token_cache is not None:
+                    bearer_token = await token_cache.refresh(bearer_token)
+                    request_headers = _build_archive_request_headers(bearer_token=bearer_token)
+                    auth_header_present = "Authorization" in request_headers
                 invoice_payload, fallback_status = await _browser_fetch_text_with_credentials(
                     page=page,
                     url=url,
@@ -892,8 +960,25 @@ async def collect_archive_orders_via_api(
     sample_success_order_codes: list[str] = []
     trace_invoice_success = _env_flag("PIPELINE_TRACE_INVOICE", default=False)
     invoice_call_stats = InvoiceApiCallStats()
+    token_cache = _ArchiveTokenCache(page=page, logger=logger, store_code=store_code)
+    invoice_semaphore = asyncio.Semaphore(ARCHIVE_INVOICE_CONCURRENCY)
+    rate_limiter = _ArchiveRequestRateLimiter(ARCHIVE_INVOICE_MIN_INTERVAL_SECONDS)
     started_at = time.perf_counter()
 
+    async def fetch_invoice(booking_id: Any, order_code: str) -> tuple[str | None, int]:
+        async with invoice_semaphore:
+            await rate_limiter.wait_turn()
+            return await _fetch_invoice_html_with_retries(
+                page=page,
+                booking_id=booking_id,
+                store_code=store_code,
+                order_code=order_code,
+                logger=logger,
+                trace_invoice_success=trace_invoice_success,
+                invoice_call_stats=invoice_call_stats,
+                token_cache=token_cache,
+            )
+
     page_number = 1
     while page_number <= ARCHIVE_API_MAX_PAGES:
         query = build_delivered_orders_query(
@@ -909,6 +994,7 @@ async def collect_archive_orders_via_api(
             logger=logger,
             store_code=store_code,
             context="getDeliveredOrders",
+            token_cache=token_cache,
         )
         if payload is None:
             _record_skip(extract, order_code=f"page:{page_number}", reason="archive_api_page_failed")
@@ -955,6 +1041,9 @@ async def collect_archive_orders_via_api(
         new_booking_ids = page_booking_ids - seen_booking_ids
         seen_booking_ids.update(page_booking_ids)
 
+        # Rows are built in booking order first; invoices for the page are then
+        # fetched concurrently and applied back in that same order.
+        invoice_jobs: list[tuple[str, Any, dict[str, Any]]] = []
         for booking in data:
             if not isinstance(booking, Mapping):
                 continue
@@ -1002,16 +1091,13 @@ async def collect_archive_orders_via_api(
                 _record_skip(extract, order_code=order_code, reason="missing_booking_id_for_invoice")
                 continue
 
+            invoice_jobs.append((order_code, booking_id, base_row))
+
+        invoice_results = await asyncio.gather(
+            *(fetch_invoice(booking_id, order_code) for order_code, booking_id, _ in invoice_jobs)
+        )
+        for (order_code, _, base_row), (invoice_html, invoice_retries) in zip(invoice_jobs, invoice_results):
             invoice_attempted += 1
-            invoice_html, invoice_retries = await _fetch_invoice_html_with_retries(
-                page=page,
-                booking_id=booking_id,
-                store_code=store_code,
-                order_code=order_code,
-                logger=logger,
-                trace_invoice_success=trace_invoice_success,
-                invoice_call_stats=invoice_call_stats,
-            )
             invoice_retry_count += invoice_retries
             if not invoice_html:
                 invoice_failed += 1
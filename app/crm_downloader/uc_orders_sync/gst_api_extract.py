@@ -22,6 +22,7 @@ from app.crm_downloader.uc_orders_sync.archive_api_extract import (
     _parse_invoice_order_details,
     _resolve_archive_bearer_token,
 )
+from app.crm_downloader.uc_orders_sync.gst_invoice_cache import GstInvoiceCache
 from app.dashboard_downloader.json_logger import JsonLogger, log_event
 
 GST_API_URL = "https://store.ucleanlaundry.com/api/v1/stores/report/tax-report"
@@ -110,6 +111,8 @@ class GstApiExtract:
     skipped_order_counters: dict[str, int] = field(default_factory=dict)
     booking_lookup_hits: int = 0
     booking_lookup_misses: int = 0
+    invoice_cache_hits: int = 0
+    invoice_cache_misses: int = 0
     delivered_rows_scanned: int = 0
     delivered_rows_matched_gst: int = 0
     delivered_payment_rows_produced: int = 0
@@ -140,6 +143,8 @@ def _log_gst_api_extract_complete(
         order_detail_snapshot_rows=len(extract.order_detail_snapshot_rows),
         booking_lookup_hits=extract.booking_lookup_hits,
         booking_lookup_misses=extract.booking_lookup_misses,
+        invoice_cache_hits=extract.invoice_cache_hits,
+        invoice_cache_misses=extract.invoice_cache_misses,
         delivered_rows_scanned=extract.delivered_rows_scanned,
         delivered_rows_matched_gst=extract.delivered_rows_matched_gst,
         delivered_payment_rows_produced=extract.delivered_payment_rows_produced,
@@ -567,6 +572,7 @@ async def collect_gst_orders_via_api(
     logger: JsonLogger,
     from_date: date,
     to_date: date,
+    invoice_cache: GstInvoiceCache | None = None,
 ) -> GstApiExtract:
     extract = GstApiExtract()
     token = await _resolve_archive_bearer_token(page=page, logger=logger, store_code=store_code)
@@ -683,6 +689,36 @@ async def collect_gst_orders_via_api(
             "status_date": row.get("invoice_date"),
         }
 
+        cached = (
+            invoice_cache.get(store_code=store_code, order_code=order_code, gst_row=gst_row)
+            if invoice_cache is not None
+            else None
+        )
+        if cached is not None:
+            # Final-status invoices do not change; skip the booking search and
+            # invoice fetch and replay the parsed result.
+            extract.invoice_cache_hits += 1
+            if cached.instructions:
+                base_row["instructions"] = cached.instructions
+            if cached.customer_source:
+                base_row["customer_source"] = cached.customer_source
+                gst_row["customer_source"] = cached.customer_source
+            if cached.address:
+                base_row["address"] = cached.address
+                gst_row["address"] = cached.address
+            extract.order_detail_rows.extend(dict(detail_row) for detail_row in cached.detail_rows)
+            _record_invoice_snapshot(
+                extract,
+                store_code=store_code,
+                order_code=order_code,
+                snapshot_outcome="complete_with_rows" if cached.detail_rows else "complete_empty",
+                detail_row_count=len(cached.detail_rows),
+            )
+            extract.base_rows.append(base_row)
+            continue
+        if invoice_cache is not None:
+            extract.invoice_cache_misses += 1
+
         booking_id, booking_row = await _resolve_booking_id_for_order(
             page=page,
             order_code=order_code,
@@ -759,6 +795,18 @@ async def collect_gst_orders_via_api(
             continue
 
         extract.order_detail_rows.extend(detail_rows)
+        if invoice_cache is not None:
+            invoice_cache.put(
+                store_code=store_code,
+                order_code=order_code,
+                gst_row=gst_row,
+                booking_id=booking_id,
+                instructions=base_row["instructions"],
+                invoice_html=invoice_html,
+                customer_source=order_mode,
+                address=invoice_address,
+                detail_rows=detail_rows,
+            )
         _record_invoice_snapshot(
             extract,
             store_code=store_code,
@@ -0,0 +1,155 @@
+"""On-disk cache of UC booking lookups and parsed GST invoices.
+
+Orders sync windows overlap, so the GST API extraction sees the same delivered
+orders night after night. Once an order's GST row reports a final payment
+status its invoice no longer changes, so the resolved booking id and the parsed
+invoice are kept per (store, order_code) and later runs skip both network
+calls. Entries expire after a TTL and are dropped as soon as the GST row's
+invoice fingerprint changes or its payment status is no longer final.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import tempfile
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Mapping
+
+GST_INVOICE_CACHE_VERSION = 1
+GST_INVOICE_FINAL_PAYMENT_STATUSES = frozenset({"paid"})
+GST_INVOICE_FINGERPRINT_FIELDS = ("invoice_number", "invoice_date", "final_amount", "payment_status")
+DEFAULT_GST_INVOICE_CACHE_TTL_DAYS = 30
+
+
+@dataclass(frozen=True)
+class GstInvoiceCacheEntry:
+    booking_id: int
+    instructions: Any
+    invoice_sha256: str
+    customer_source: str | None
+    address: str | None
+    detail_rows: list[dict[str, Any]] = field(default_factory=list)
+
+
+def is_final_payment_status(gst_row: Mapping[str, Any]) -> bool:
+    return str(gst_row.get("payment_status") or "").strip().lower() in GST_INVOICE_FINAL_PAYMENT_STATUSES
+
+
+def _fingerprint(gst_row: Mapping[str, Any]) -> dict[str, str | None]:
+    return {
+        name: None if gst_row.get(name) is None else str(gst_row.get(name))
+        for name in GST_INVOICE_FINGERPRINT_FIELDS
+    }
+
+
+class GstInvoiceCache:
+    """JSON files under ``root/<STORE>/<sha256(order_code)>.json``, one per order."""
+
+    def __init__(
+        self,
+        root: Path | str,
+        *,
+        ttl_days: int = DEFAULT_GST_INVOICE_CACHE_TTL_DAYS,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.root = Path(root)
+        self.ttl_seconds = ttl_days * 86_400
+        self._clock = clock
+
+    def _path(self, *, store_code: str, order_code: str) -> Path:
+        key = hashlib.sha256(order_code.encode("utf-8")).hexdigest()
+        return self.root / store_code.upper() / f"{key}.json"
+
+    def invalidate(self, *, store_code: str, order_code: str) -> None:
+        self._path(store_code=store_code, order_code=order_code).unlink(missing_ok=True)
+
+    def get(
+        self, *, store_code: str, order_code: str, gst_row: Mapping[str, Any]
+    ) -> GstInvoiceCacheEntry | None:
+        path = self._path(store_code=store_code, order_code=order_code)
+        if not is_final_payment_status(gst_row):
+            path.unlink(missing_ok=True)
+            return None
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+            cached_at = float(payload.get("cached_at") or 0)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, TypeError, AttributeError):
+            path.unlink(missing_ok=True)
+            return None
+        if (
+            payload.get("version") != GST_INVOICE_CACHE_VERSION
+            or payload.get("order_code") != order_code
+            or payload.get("fingerprint") != _fingerprint(gst_row)
+            or self._clock() - cached_at > self.ttl_seconds
+        ):
+            path.unlink(missing_ok=True)
+            return None
+        try:
+            return GstInvoiceCacheEntry(**payload["entry"])
+        except (KeyError, TypeError):
+            path.unlink(missing_ok=True)
+            return None
+
+    def put(
+        self,
+        *,
+        store_code: str,
+        order_code: str,
+        gst_row: Mapping[str, Any],
+        booking_id: int,
+        instructions: Any,
+        invoice_html: str,
+        customer_source: str | None,
+        address: str | None,
+        detail_rows: list[dict[str, Any]],
+    ) -> bool:
+        if not is_final_payment_status(gst_row):
+            return False
+        path = self._path(store_code=store_code, order_code=order_code)
+        payload = {
+            "version": GST_INVOICE_CACHE_VERSION,
+            "order_code": order_code,
+            "cached_at": self._clock(),
+            "fingerprint": _fingerprint(gst_row),
+            "entry": {
+                "booking_id": booking_id,
+                "instructions": instructions,
+                "invoice_sha256": hashlib.sha256(invoice_html.encode("utf-8")).hexdigest(),
+                "customer_source": customer_source,
+                "address": address,
+                "detail_rows": detail_rows,
+            },
+        }
+        # A failed write only costs a refetch next run, never the extraction.
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                mode="w",
+                encoding="utf-8",
+                suffix=f".{path.name}.tmp",
+                dir=path.parent,
+                delete=False,
+            ) as temp_handle:
+                temp_path = Path(temp_handle.name)
+                json.dump(payload, temp_handle, default=str)
+        except OSError:
+            return False
+        try:
+            temp_path.replace(path)
+        except OSError:
+            temp_path.unlink(missing_ok=True)
+            return False
+        return True
+
+
+__all__ = [
+    "DEFAULT_GST_INVOICE_CACHE_TTL_DAYS",
+    "GstInvoiceCache",
+    "GstInvoiceCacheEntry",
+    "is_final_payment_status",
+]
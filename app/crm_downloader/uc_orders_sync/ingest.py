@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+from contextlib import closing
 import re
 from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta
@@ -9,6 +10,7 @@ from pathlib import Path
 from typing import Any, Dict, Mapping, Sequence
 
 import openpyxl
+from openpyxl.cell.read_only import ReadOnlyCell
 import sqlalchemy as sa
 from dateutil import parser
 from sqlalchemy.dialects.postgresql import insert as pg_insert
@@ -16,6 +18,7 @@ from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 
 from app.common.date_utils import get_timezone
 from app.common.db import session_scope
+from app.common.workbook_ingest import iter_sheet_rows
 from app.dashboard_downloader.json_logger import JsonLogger, log_event
 
 STG_UC_ORDERS_COLUMNS = [
@@ -445,7 +448,7 @@ def _parse_invoice_date_strict(
         return None
 
 
-def _invoice_date_display_value(cell: openpyxl.cell.cell.Cell | None) -> str | None:
+def _invoice_date_display_value(cell: ReadOnlyCell | None) -> str | None:
     if cell is None:
         return None
     value = cell.value
@@ -576,111 +579,109 @@ def _read_workbook_rows(
     dict[str, int],
     str | None,
 ]:
-    wb = openpyxl.load_workbook(workbook_path, data_only=True)
-    sheet = wb.active
-    header_cells = list(next(sheet.iter_rows(min_row=1, max_row=1, values_only=False)))
-    header_values = [cell.value for cell in header_cells]
-    headers = [cell for cell in header_values if cell]
-    selected_header_map: Mapping[str, str] | None = None
-    selected_missing: set[str] = set()
-    for _, header_map in SUPPORTED_HEADER_MAPS:
-        missing = set(header_map.keys()) - set(headers)
-        amount_headers = {header for header, field in header_map.items() if field in SOURCE_AMOUNT_FIELDS}
-        required_missing = missing - amount_headers
-        if not required_missing:
-            selected_header_map = header_map
-            selected_missing = set()
-            break
-        if not selected_header_map:
-            selected_header_map = header_map
-            selected_missing = missing
-
-    data_rows = list(sheet.iter_rows(min_row=2, values_only=False))
-    rows_downloaded = len(data_rows)
-    has_non_blank_data_rows = any(
-        any(cell.value not in (None, "") for cell in row_cells)
-        for row_cells in data_rows
-    )
-    if selected_header_map is None:
-        raise ValueError("UC GST workbook has no supported header schema")
-    if selected_missing:
-        message = f"UC GST workbook missing expected columns: {sorted(selected_missing)}"
-        # Header-only malformed exports are operational warnings, not successful empties.
-        # Keep rejecting malformed workbooks with data so bad source rows are never hidden.
-        if not has_non_blank_data_rows:
+    with closing(iter_sheet_rows(workbook_path, values_only=False)) as sheet_rows:
+        header_cells = list(next(sheet_rows, ()))
+        header_values = [cell.value for cell in header_cells]
+        headers = [cell for cell in header_values if cell]
+        selected_header_map: Mapping[str, str] | None = None
+        selected_missing: set[str] = set()
+        for _, header_map in SUPPORTED_HEADER_MAPS:
+            missing = set(header_map.keys()) - set(headers)
+            amount_headers = {header for header, field in header_map.items() if field in SOURCE_AMOUNT_FIELDS}
+            required_missing = missing - amount_headers
+            if not required_missing:
+                selected_header_map = header_map
+                selected_missing = set()
+                break
+            if not selected_header_map:
+                selected_header_map = header_map
+                selected_missing = missing
+
+        if selected_header_map is None:
+            raise ValueError("UC GST workbook has no supported header schema")
+        if selected_missing:
+            message = f"UC GST workbook missing expected columns: {sorted(selected_missing)}"
+            # Header-only malformed exports are operational warnings, not successful empties.
+            # Keep rejecting malformed workbooks with data so bad source rows are never hidden.
+            rows_downloaded = 0
+            for row_cells in sheet_rows:
+                if any(cell.value not in (None, "") for cell in row_cells):
+                    raise ValueError(message)
+                rows_downloaded += 1
             warnings.append(message)
             return [], [], [], rows_downloaded, {}, ZERO_ROW_EXPORT_MALFORMED
-        raise ValueError(message)
 
-    header_indices = {header: idx for idx, header in enumerate(header_values) if header}
-    invoice_date_header = next(
-        (header for header, field in selected_header_map.items() if field == "invoice_date"),
-        None,
-    )
-    order_number_header = next(
-        (header for header, field in selected_header_map.items() if field == "order_number"),
-        None,
-    )
-    invoice_date_index = header_indices.get(invoice_date_header) if invoice_date_header else None
-
-    rows: list[Dict[str, Any]] = []
-    warning_rows: list[dict[str, Any]] = []
-    dropped_rows: list[dict[str, Any]] = []
-    skip_reason_counts: dict[str, int] = {}
-    invalid_phone_numbers: set[str] = set()
-
-    for row_cells in data_rows:
-        values = [cell.value for cell in row_cells]
-        if not any(value not in (None, "") for value in values):
-            _increment_skip_reason(skip_reason_counts, "blank_row")
-            continue
-        if _is_totals_row(values):
-            _increment_skip_reason(skip_reason_counts, "totals_row")
-            continue
-        raw_row = {
-            header: row_cells[idx].value if idx < len(row_cells) else None
-            for header, idx in header_indices.items()
-        }
-        if invoice_date_header and invoice_date_index is not None and invoice_date_index < len(row_cells):
-            raw_row[invoice_date_header] = _invoice_date_display_value(row_cells[invoice_date_index])
-        normalized, row_remarks, drop_reason = _coerce_row(
-            raw_row,
-            header_map=selected_header_map,
-            warnings=warnings,
-            invalid_phone_numbers=invalid_phone_numbers,
+        header_indices = {header: idx for idx, header in enumerate(header_values) if header}
+        invoice_date_header = next(
+            (header for header, field in selected_header_map.items() if field == "invoice_date"),
+            None,
+        )
+        order_number_header = next(
+            (header for header, field in selected_header_map.items() if field == "order_number"),
+            None,
         )
-        order_number = _stringify_value(raw_row.get(order_number_header or "Booking ID"))
-        if normalized:
-            if normalized.get("_has_ingest_warning"):
-                warning_rows.append(
+        invoice_date_index = header_indices.get(invoice_date_header) if invoice_date_header else None
+
+        rows: list[Dict[str, Any]] = []
+        warning_rows: list[dict[str, Any]] = []
+        dropped_rows: list[dict[str, Any]] = []
+        skip_reason_counts: dict[str, int] = {}
+        invalid_phone_numbers: set[str] = set()
+        rows_downloaded = 0
+
+        for row_cells in sheet_rows:
+            rows_downloaded += 1
+            values = [cell.value for cell in row_cells]
+            if not any(value not in (None, "") for value in values):
+                _increment_skip_reason(skip_reason_counts, "blank_row")
+                continue
+            if _is_totals_row(values):
+                _increment_skip_reason(skip_reason_counts, "totals_row")
+                continue
+            raw_row = {
+                header: values[idx] if idx < len(values) else None
+                for header, idx in header_indices.items()
+            }
+            if invoice_date_header and invoice_date_index is not None and invoice_date_index < len(row_cells):
+                raw_row[invoice_date_header] = _invoice_date_display_value(row_cells[invoice_date_index])
+            normalized, row_remarks, drop_reason = _coerce_row(
+                raw_row,
+                header_map=selected_header_map,
+                warnings=warnings,
+                invalid_phone_numbers=invalid_phone_numbers,
+            )
+            order_number = _stringify_value(raw_row.get(order_number_header or "Booking ID"))
+            if normalized:
+                if normalized.get("_has_ingest_warning"):
+                    warning_rows.append(
+                        {
+                            "store_code": store_code,
+                            "order_number": order_number,
+                            "headers": headers,
+                            "values": {header: _stringify_value(raw_row.get(header)) for header in headers},
+                            "remarks": "; ".join(row_remarks) if row_remarks else None,
+                            "ingest_remarks": normalized.get("ingest_remarks"),
+                        }
+                    )
+                rows.append(normalized)
+            else:
+                _increment_skip_reason(skip_reason_counts, _normalize_drop_reason(drop_reason))
+                dropped_rows.append(
                     {
                         "store_code": store_code,
                         "order_number": order_number,
                         "headers": headers,
                         "values": {header: _stringify_value(raw_row.get(header)) for header in headers},
-                        "remarks": "; ".join(row_remarks) if row_remarks else None,
-                        "ingest_remarks": normalized.get("ingest_remarks"),
+                        "remarks": drop_reason or "; ".join(row_remarks) or "Row dropped due to missing required values",
+                        "ingest_remarks": _build_ingest_remarks_payload(
+                            warnings=row_remarks,
+                            failures=[drop_reason] if drop_reason else None,
+                        )
+                        or drop_reason
+                        or "; ".join(row_remarks)
+                        or "Row dropped due to missing required values",
                     }
-            )
-            rows.append(normalized)
-        else:
-            _increment_skip_reason(skip_reason_counts, _normalize_drop_reason(drop_reason))
-            dropped_rows.append(
-                {
-                    "store_code": store_code,
-                    "order_number": order_number,
-                    "headers": headers,
-                    "values": {header: _stringify_value(raw_row.get(header)) for header in headers},
-                    "remarks": drop_reason or "; ".join(row_remarks) or "Row dropped due to missing required values",
-                    "ingest_remarks": _build_ingest_remarks_payload(
-                        warnings=row_remarks,
-                        failures=[drop_reason] if drop_reason else None,
-                    )
-                    or drop_reason
-                    or "; ".join(row_remarks)
-                    or "Row dropped due to missing required values",
-                }
-            )
+                )
     zero_row_export_classification = None
     if not rows:
         zero_row_export_classification = (
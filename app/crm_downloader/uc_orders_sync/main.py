@@ -39,6 +39,10 @@ from app.crm_downloader.uc_orders_sync.gst_api_extract import (
     GstApiExtract,
     collect_gst_orders_via_api,
 )
+from app.crm_downloader.uc_orders_sync.gst_invoice_cache import (
+    DEFAULT_GST_INVOICE_CACHE_TTL_DAYS,
+    GstInvoiceCache,
+)
 from app.crm_downloader.uc_orders_sync.ingest import (
     ZERO_ROW_EXPORT_UNCONFIRMED,
     ZERO_ROW_EXPORT_VALID_EMPTY_WORKBOOK,
@@ -1366,8 +1370,13 @@ async def main(
     store_codes: Sequence[str] | None = None,
     run_orders: bool = True,
     run_sales: bool = True,
+    shared_browser: Browser | None = None,
 ) -> None:
-    """Run the UC Archive Orders download flow."""
+    """Run the UC Archive Orders download flow.
+
+    ``shared_browser`` lets a caller that owns a browser pool lend one for this run;
+    it is used as-is and left open.
+    """
 
     _ = run_orders, run_sales
     resolved_run_id = run_id or new_run_id()
@@ -1465,8 +1474,12 @@ async def main(
             return
 
         download_timeout_ms = await _fetch_dashboard_nav_timeout_ms(config.database_url)
-        async with async_playwright() as playwright:
-            browser = await launch_browser(playwright=playwright, logger=logger)
+        async with contextlib.AsyncExitStack() as browser_stack:
+            if shared_browser is None:
+                playwright = await browser_stack.enter_async_context(async_playwright())
+                browser = await launch_browser(playwright=playwright, logger=logger)
+            else:
+                browser = shared_browser
             semaphore = asyncio.Semaphore(_resolve_uc_max_workers())
 
             async def _guarded(store: UcStore) -> None:
@@ -1488,7 +1501,8 @@ async def main(
                     )
 
             await asyncio.gather(*[_guarded(store) for store in stores])
-            await browser.close()
+            if browser is not shared_browser:
+                await browser.close()
 
         log_event(
             logger=logger,
@@ -1538,7 +1552,7 @@ async def main(
         if not persist_attempted:
             await _persist_summary(summary=summary, logger=logger)
         with contextlib.suppress(Exception):
-            if browser is not None:
+            if browser is not None and browser is not shared_browser:
                 await browser.close()
         with contextlib.suppress(Exception):
             logger.close()
@@ -1706,6 +1720,18 @@ def _resolve_uc_download_dir(
     return default_download_dir()
 
 
+def _resolve_gst_invoice_cache() -> GstInvoiceCache | None:
+    cache_dir = getattr(config, "uc_gst_invoice_cache_dir", None)
+    if not cache_dir:
+        return None
+    return GstInvoiceCache(
+        cache_dir,
+        ttl_days=getattr(
+            config, "uc_gst_invoice_cache_ttl_days", DEFAULT_GST_INVOICE_CACHE_TTL_DAYS
+        ),
+    )
+
+
 async def _load_uc_order_stores(
     *, logger: JsonLogger, store_codes: Sequence[str] | None = None
 ) -> list[UcStore]:
@@ -4121,6 +4147,7 @@ async def _run_store_discovery(
                 logger=logger,
                 from_date=from_date,
                 to_date=to_date,
+                invoice_cache=_resolve_gst_invoice_cache(),
             )
             gst_api_gst_path = download_dir / _format_gst_filename(
                 store.store_code, from_date, to_date
@@ -9,7 +9,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from datetime import date, datetime, timezone
 from decimal import Decimal
-from typing import Any
+from typing import Any, Mapping
 
 import sqlalchemy as sa
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -199,8 +199,12 @@ async def apply_lifecycle_transition(
     event_key: str | None = None,
     suppression_start_date: date,
     target_cost_center: str | None = None,
+    lead: Mapping[str, Any] | None = None,
 ) -> LifecycleTransitionResult:
-    lead = (await session.execute(sa.select(trx_customer_followup_leads).where(trx_customer_followup_leads.c.lead_id == lead_id))).mappings().first()
+    # Callers that already hold the current lead row (bulk workbook ingest)
+    # pass it in to skip the lookup.
+    if lead is None:
+        lead = (await session.execute(sa.select(trx_customer_followup_leads).where(trx_customer_followup_leads.c.lead_id == lead_id))).mappings().first()
     if lead is None:
         raise ValueError(f"Unknown customer follow-up lead_id={lead_id}")
     previous_status = str(lead["lead_status"])
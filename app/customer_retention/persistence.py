@@ -167,8 +167,7 @@ async def get_or_create_followup_lead(
     return int(next_id or result.inserted_primary_key[0]), True
 
 
-async def insert_history_once(
-    session: AsyncSession,
+def history_values(
     *,
     lead_id: int,
     pipeline_run_id: str | None,
@@ -187,16 +186,8 @@ async def insert_history_once(
     do_not_contact_flag: bool | None = None,
     staff_remarks: str | None = None,
     target_cost_center: str | None = None,
-) -> bool:
-    existing = await session.execute(
-        sa.select(trx_customer_followup_history.c.history_id).where(
-            trx_customer_followup_history.c.lead_id == lead_id,
-            trx_customer_followup_history.c.event_type == event_type,
-        )
-    )
-    if existing.scalar_one_or_none() is not None:
-        return False
-    values: dict[str, Any] = {
+) -> dict[str, Any]:
+    return {
         "lead_id": lead_id,
         "pipeline_run_id": pipeline_run_id,
         "event_type": event_type,
@@ -216,6 +207,72 @@ async def insert_history_once(
         "normalized_value_json": normalized_value_json,
         "created_at": datetime.now(timezone.utc),
     }
+
+
+async def insert_history_rows(session: AsyncSession, rows: list[dict[str, Any]]) -> None:
+    """Insert rows built by ``history_values`` in one executemany statement.
+
+    Callers are responsible for the ``(lead_id, event_type)`` de-dupe that
+    ``insert_history_once`` performs per row.
+    """
+
+    if not rows:
+        return
+    next_id = await sqlite_next_id(session, trx_customer_followup_history, "history_id")
+    if next_id is not None:
+        for offset, row in enumerate(rows):
+            row["history_id"] = next_id + offset
+    await session.execute(trx_customer_followup_history.insert(), rows)
+
+
+async def insert_history_once(
+    session: AsyncSession,
+    *,
+    lead_id: int,
+    pipeline_run_id: str | None,
+    event_type: str,
+    raw_excel_value_json: dict[str, Any] | None,
+    normalized_value_json: dict[str, Any] | None,
+    previous_status: str | None = None,
+    new_status: str | None = None,
+    handled_by: str | None = None,
+    contact_attempted: bool | None = None,
+    contact_mode: str | None = None,
+    customer_response: str | None = None,
+    order_expected: str | None = None,
+    next_followup_date: date | None = None,
+    complaint_flag: bool | None = None,
+    do_not_contact_flag: bool | None = None,
+    staff_remarks: str | None = None,
+    target_cost_center: str | None = None,
+) -> bool:
+    existing = await session.execute(
+        sa.select(trx_customer_followup_history.c.history_id).where(
+            trx_customer_followup_history.c.lead_id == lead_id,
+            trx_customer_followup_history.c.event_type == event_type,
+        )
+    )
+    if existing.scalar_one_or_none() is not None:
+        return False
+    values = history_values(
+        lead_id=lead_id,
+        pipeline_run_id=pipeline_run_id,
+        event_type=event_type,
+        raw_excel_value_json=raw_excel_value_json,
+        normalized_value_json=normalized_value_json,
+        previous_status=previous_status,
+        new_status=new_status,
+        handled_by=handled_by,
+        contact_attempted=contact_attempted,
+        contact_mode=contact_mode,
+        customer_response=customer_response,
+        order_expected=order_expected,
+        next_followup_date=next_followup_date,
+        complaint_flag=complaint_flag,
+        do_not_contact_flag=do_not_contact_flag,
+        staff_remarks=staff_remarks,
+        target_cost_center=target_cost_center,
+    )
     next_id = await sqlite_next_id(session, trx_customer_followup_history, "history_id")
     if next_id is not None:
         values["history_id"] = next_id
@@ -7,19 +7,20 @@ project's mobile-normalization contract is richer than database string cleanup.
 
 from __future__ import annotations
 
+from bisect import bisect_left
 from dataclasses import dataclass, field
 from datetime import date, datetime, timezone
 from decimal import Decimal
-from typing import Any
+from typing import Any, Sequence
 
 import sqlalchemy as sa
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from .constants import LEAD_STATUS_CLOSED, LEAD_STATUS_DUE_FOLLOWUP, LEAD_STATUS_OPEN, LEAD_STATUS_PENDING, LEAD_STATUS_RECOVERED, LEAD_STATUS_WORKED
-from .db_tables import trx_customer_followup_leads
+from .db_tables import trx_customer_followup_history, trx_customer_followup_leads
 from .lifecycle import OPEN_LEAD_STATUSES
 from .mobile import normalize_mobile
-from .persistence import insert_history_once
+from .persistence import history_values, insert_history_rows
 
 
 @dataclass(frozen=True)
@@ -58,30 +59,30 @@ async def detect_recoveries(
     pipeline_run_id: str | None,
     cost_center: str | None = None,
 ) -> RecoveryDetectionResult:
-    leads = (
-        await session.execute(
-            sa.select(trx_customer_followup_leads)
-            .where(
-                trx_customer_followup_leads.c.is_closed.is_(False),
-                trx_customer_followup_leads.c.is_recovered.is_(False),
-                trx_customer_followup_leads.c.lead_status.in_(tuple(OPEN_LEAD_STATUSES)),
-                trx_customer_followup_leads.c.normalized_mobile_number.is_not(None),
-            )
-            .where(trx_customer_followup_leads.c.cost_center == cost_center if cost_center else sa.true())
-            .order_by(trx_customer_followup_leads.c.cost_center.asc(), trx_customer_followup_leads.c.normalized_mobile_number.asc(), trx_customer_followup_leads.c.lead_date.desc(), trx_customer_followup_leads.c.lead_id.desc())
+    open_leads = (
+        sa.select(trx_customer_followup_leads)
+        .where(
+            trx_customer_followup_leads.c.is_closed.is_(False),
+            trx_customer_followup_leads.c.is_recovered.is_(False),
+            trx_customer_followup_leads.c.lead_status.in_(tuple(OPEN_LEAD_STATUSES)),
+            trx_customer_followup_leads.c.normalized_mobile_number.is_not(None),
         )
-    ).mappings().all()
+        .where(trx_customer_followup_leads.c.cost_center == cost_center if cost_center else sa.true())
+        .order_by(trx_customer_followup_leads.c.cost_center.asc(), trx_customer_followup_leads.c.normalized_mobile_number.asc(), trx_customer_followup_leads.c.lead_date.desc(), trx_customer_followup_leads.c.lead_id.desc())
+    )
+    leads = (await session.execute(open_leads)).mappings().all()
     if not leads:
         return RecoveryDetectionResult()
 
-    identities = {(str(lead["cost_center"]), str(lead["normalized_mobile_number"])) for lead in leads if normalize_mobile(lead["normalized_mobile_number"]).is_valid}
+    lead_index = _index_leads_by_identity(leads)
     order_rows = await _fetch_candidate_orders(session, as_of_date=as_of_date, cost_center=cost_center)
+    recorded_events = await _fetch_recovery_history_keys(session, open_leads=open_leads)
     orders_seen = 0
     matches: list[RecoveryMatch] = []
-    recovered = 0
-    closed = 0
-    history_count = 0
-    changed_lead_ids: set[int] = set()
+    recovered_updates: list[dict[str, Any]] = []
+    closed_updates: list[dict[str, Any]] = []
+    history_rows: list[dict[str, Any]] = []
+    updated_at = datetime.now(timezone.utc)
     # Candidate orders are already sorted by order date then order number. When
     # multiple orders qualify for the same lead in one run, the first ordered
     # order wins and the lead is excluded from later order matches below.
@@ -90,88 +91,119 @@ async def detect_recoveries(
         if not mobile_result.is_valid:
             continue
         identity = (str(raw_order["cost_center"]), mobile_result.normalized_mobile or "")
-        if identity not in identities:
+        identity_leads = lead_index.get(identity)
+        if identity_leads is None:
             continue
         orders_seen += 1
         order_date = _as_date(raw_order["order_date"])
         order_datetime = _as_datetime(raw_order["order_date"])
-        candidates = [
-            lead
-            for lead in leads
-            if int(lead["lead_id"]) not in changed_lead_ids
-            and (str(lead["cost_center"]), str(lead["normalized_mobile_number"])) == identity
-            and _trigger_date(lead) < order_date
-        ]
-        candidates = [lead for lead in candidates if not bool(lead["is_closed"]) and not bool(lead["is_recovered"])]
-        if not candidates:
+        # Each identity's open leads are sorted by (trigger date, lead id), so
+        # the leads triggered before this order are a prefix of the list.
+        cutoff = bisect_left(identity_leads, order_date, key=lambda entry: entry[0])
+        if not cutoff:
             continue
         # Deterministic conflict rule: the most recently triggered active lead
         # owns the recovery; older open leads for the same store/customer close.
-        candidates.sort(key=lambda lead: (_trigger_date(lead), int(lead["lead_id"])), reverse=True)
+        candidates = [lead for _, _, lead in reversed(identity_leads[:cutoff])]
         winner = candidates[0]
+        winner_id = int(winner["lead_id"])
         order_id = str(raw_order.get("order_number") or "")
         event_type = f"RECOVERY_DETECTED:{order_id}"
-        history_inserted = await insert_history_once(
-            session,
-            lead_id=int(winner["lead_id"]),
-            pipeline_run_id=pipeline_run_id,
-            event_type=event_type,
-            previous_status=str(winner["lead_status"]),
-            new_status=LEAD_STATUS_RECOVERED,
-            raw_excel_value_json=None,
-            normalized_value_json={"recovered_order_id": order_id, "cost_center": identity[0], "order_amount": str(raw_order.get("order_amount"))},
-        )
-        if not history_inserted:
+        if (winner_id, event_type) in recorded_events:
             continue
-        await session.execute(
-            trx_customer_followup_leads.update()
-            .where(trx_customer_followup_leads.c.lead_id == int(winner["lead_id"]))
-            .values(
-                lead_status=LEAD_STATUS_RECOVERED,
-                is_closed=True,
-                closed_at=order_datetime,
-                closed_reason="RECOVERED",
-                is_recovered=True,
-                recovered_at=order_datetime,
-                recovered_order_id=order_id,
-                updated_at=datetime.now(timezone.utc),
-                updated_by_pipeline_run_id=pipeline_run_id,
+        recorded_events.add((winner_id, event_type))
+        history_rows.append(
+            history_values(
+                lead_id=winner_id,
+                pipeline_run_id=pipeline_run_id,
+                event_type=event_type,
+                previous_status=str(winner["lead_status"]),
+                new_status=LEAD_STATUS_RECOVERED,
+                raw_excel_value_json=None,
+                normalized_value_json={"recovered_order_id": order_id, "cost_center": identity[0], "order_amount": str(raw_order.get("order_amount"))},
             )
         )
-        recovered += 1
-        history_count += 1
-        changed_lead_ids.add(int(winner["lead_id"]))
+        recovered_updates.append({"b_lead_id": winner_id, "b_at": order_datetime, "b_order_id": order_id})
         amount = Decimal(str(raw_order.get("order_amount") or "0"))
-        matches.append(RecoveryMatch(int(winner["lead_id"]), order_id, order_datetime, amount))
-        other_ids = [int(lead["lead_id"]) for lead in candidates[1:]]
-        if other_ids:
-            await session.execute(
-                trx_customer_followup_leads.update()
-                .where(trx_customer_followup_leads.c.lead_id.in_(other_ids))
-                .values(
-                    lead_status=LEAD_STATUS_CLOSED,
-                    is_closed=True,
-                    closed_at=order_datetime,
-                    closed_reason="RECOVERED_BY_SAME_CUSTOMER_STORE",
-                    updated_at=datetime.now(timezone.utc),
-                    updated_by_pipeline_run_id=pipeline_run_id,
-                )
-            )
-            for other_id in other_ids:
-                inserted = await insert_history_once(
-                    session,
+        matches.append(RecoveryMatch(winner_id, order_id, order_datetime, amount))
+        for lead in candidates[1:]:
+            other_id = int(lead["lead_id"])
+            closed_updates.append({"b_lead_id": other_id, "b_at": order_datetime})
+            closed_event_type = f"RECOVERY_CLOSED_BY_IDENTITY:{order_id}"
+            if (other_id, closed_event_type) in recorded_events:
+                continue
+            recorded_events.add((other_id, closed_event_type))
+            history_rows.append(
+                history_values(
                     lead_id=other_id,
                     pipeline_run_id=pipeline_run_id,
-                    event_type=f"RECOVERY_CLOSED_BY_IDENTITY:{order_id}",
+                    event_type=closed_event_type,
                     previous_status=None,
                     new_status=LEAD_STATUS_CLOSED,
                     raw_excel_value_json=None,
-                    normalized_value_json={"recovered_by_lead_id": int(winner["lead_id"]), "recovered_order_id": order_id},
+                    normalized_value_json={"recovered_by_lead_id": winner_id, "recovered_order_id": order_id},
                 )
-                history_count += int(inserted)
-            changed_lead_ids.update(other_ids)
-            closed += len(other_ids)
-    return RecoveryDetectionResult(recovered, closed, orders_seen, history_count, matches=tuple(matches))
+            )
+        del identity_leads[:cutoff]
+
+    if recovered_updates:
+        await session.execute(
+            trx_customer_followup_leads.update()
+            .where(trx_customer_followup_leads.c.lead_id == sa.bindparam("b_lead_id"))
+            .values(
+                lead_status=LEAD_STATUS_RECOVERED,
+                is_closed=True,
+                closed_at=sa.bindparam("b_at"),
+                closed_reason="RECOVERED",
+                is_recovered=True,
+                recovered_at=sa.bindparam("b_at"),
+                recovered_order_id=sa.bindparam("b_order_id"),
+                updated_at=updated_at,
+                updated_by_pipeline_run_id=pipeline_run_id,
+            ),
+            recovered_updates,
+        )
+    if closed_updates:
+        await session.execute(
+            trx_customer_followup_leads.update()
+            .where(trx_customer_followup_leads.c.lead_id == sa.bindparam("b_lead_id"))
+            .values(
+                lead_status=LEAD_STATUS_CLOSED,
+                is_closed=True,
+                closed_at=sa.bindparam("b_at"),
+                closed_reason="RECOVERED_BY_SAME_CUSTOMER_STORE",
+                updated_at=updated_at,
+                updated_by_pipeline_run_id=pipeline_run_id,
+            ),
+            closed_updates,
+        )
+    await insert_history_rows(session, history_rows)
+    return RecoveryDetectionResult(len(recovered_updates), len(closed_updates), orders_seen, len(history_rows), matches=tuple(matches))
+
+
+def _index_leads_by_identity(leads: Sequence[sa.RowMapping]) -> dict[tuple[str, str], list[tuple[date, int, sa.RowMapping]]]:
+    index: dict[tuple[str, str], list[tuple[date, int, sa.RowMapping]]] = {}
+    for lead in leads:
+        if not normalize_mobile(lead["normalized_mobile_number"]).is_valid:
+            continue
+        identity = (str(lead["cost_center"]), str(lead["normalized_mobile_number"]))
+        index.setdefault(identity, []).append((_trigger_date(lead), int(lead["lead_id"]), lead))
+    for entries in index.values():
+        entries.sort(key=lambda entry: entry[:2])
+    return index
+
+
+async def _fetch_recovery_history_keys(session: AsyncSession, *, open_leads: sa.Select) -> set[tuple[int, str]]:
+    """Return recovery history already written for the open leads, in one query."""
+
+    history = trx_customer_followup_history
+    rows = await session.execute(
+        sa.select(history.c.lead_id, history.c.event_type).where(
+            history.c.lead_id.in_(open_leads.with_only_columns(trx_customer_followup_leads.c.lead_id).order_by(None)),
+            sa.or_(history.c.event_type.like("RECOVERY_DETECTED:%"), history.c.event_type.like("RECOVERY_CLOSED_BY_IDENTITY:%")),
+        )
+    )
+    return {(int(lead_id), str(event_type)) for lead_id, event_type in rows.all()}
 
 
 async def _fetch_candidate_orders(session: AsyncSession, *, as_of_date: date, cost_center: str | None) -> list[dict[str, Any]]:
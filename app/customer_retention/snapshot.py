@@ -17,7 +17,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from .db_tables import trx_customer_followup_leads
 from .lifecycle import OPEN_LEAD_STATUSES, classify_lifecycle, compute_priority_decision
 from .mobile import normalize_mobile
-from .suppression import check_active_suppression
+from .suppression import SuppressionDecision, load_active_suppressions
 
 VW_ORDERS = sa.table(
     "vw_orders",
@@ -28,6 +28,7 @@ VW_ORDERS = sa.table(
     sa.column("mobile_number"),
     sa.column("order_amount"),
 )
+ORDER_STREAM_BATCH_SIZE = 5000
 
 
 @dataclass(frozen=True)
@@ -69,45 +70,25 @@ async def build_customer_retention_snapshot(
     snapshot_date: date,
     cost_center: str | None = None,
 ) -> SnapshotResult:
-    order_rows = await _fetch_orders(session, cost_center=cost_center)
-    grouped: dict[tuple[str, str], dict[str, Any]] = {}
-    invalid_mobile = 0
-    for order in order_rows:
-        mobile_result = normalize_mobile(order.get("mobile_number"))
-        if not mobile_result.is_valid:
-            invalid_mobile += 1
-            continue
-        identity = (str(order["cost_center"]), mobile_result.normalized_mobile or "")
-        order_date = _as_date(order["order_date"])
-        amount = Decimal(str(order.get("order_amount") or "0"))
-        entry = grouped.setdefault(
-            identity,
-            {
-                "cost_center": identity[0],
-                "normalized_mobile_number": identity[1],
-                "customer_name": order.get("customer_name"),
-                "mobile_number": order.get("mobile_number"),
-                "last_order_date": order_date,
-                "total_orders": 0,
-                "lifetime_spend": Decimal("0"),
-                "last_order_amount": amount,
-                "last_order_key": (order_date, str(order.get("order_number") or "")),
-            },
-        )
-        entry["total_orders"] += 1
-        entry["lifetime_spend"] += amount
-        if (order_date, str(order.get("order_number") or "")) >= entry["last_order_key"]:
-            entry.update({"last_order_date": order_date, "last_order_amount": amount, "customer_name": order.get("customer_name"), "mobile_number": order.get("mobile_number"), "last_order_key": (order_date, str(order.get("order_number") or ""))})
-    rows: list[CustomerRetentionSnapshotRow] = []
-    suppressed = 0
-    existing_open = 0
+    grouped, rows_seen, invalid_mobile = await _aggregate_orders(session, cost_center=cost_center)
+    candidates: list[tuple[dict[str, Any], Any]] = []
     for entry in grouped.values():
         classification = classify_lifecycle(last_order_date=entry["last_order_date"], snapshot_date=snapshot_date, normalized_mobile_number=entry["normalized_mobile_number"])
         if not classification.lifecycle_bucket or classification.days_since_last_order is None:
             continue
-        followup = await _fetch_last_followup(session, cost_center=entry["cost_center"], normalized_mobile_number=entry["normalized_mobile_number"])
-        has_open = await _has_open_lead(session, cost_center=entry["cost_center"], normalized_mobile_number=entry["normalized_mobile_number"])
-        suppression = await check_active_suppression(session, cost_center=entry["cost_center"], normalized_mobile_number=entry["normalized_mobile_number"], as_of_date=snapshot_date)
+        candidates.append((entry, classification))
+    lookups: dict[str, _CostCenterLookups] = {}
+    for center in sorted({entry["cost_center"] for entry, _ in candidates}):
+        lookups[center] = await _load_cost_center_lookups(session, cost_center=center, as_of_date=snapshot_date)
+    rows: list[CustomerRetentionSnapshotRow] = []
+    suppressed = 0
+    existing_open = 0
+    for entry, classification in candidates:
+        center_lookups = lookups[entry["cost_center"]]
+        mobile = entry["normalized_mobile_number"]
+        followup = center_lookups.last_followups.get(mobile)
+        has_open = mobile in center_lookups.open_lead_mobiles
+        suppression = center_lookups.suppressions.get(mobile, _NOT_SUPPRESSED)
         eligible = classification.eligible_for_retention and not suppression.is_suppressed and not has_open
         suppressed += int(suppression.is_suppressed)
         existing_open += int(has_open)
@@ -147,29 +128,92 @@ async def build_customer_retention_snapshot(
             )
         )
     rows.sort(key=lambda row: (row.cost_center, -row.priority_score, row.normalized_mobile_number))
-    return SnapshotResult(snapshot_date, tuple(rows), len(order_rows), invalid_mobile, suppressed, existing_open)
+    return SnapshotResult(snapshot_date, tuple(rows), rows_seen, invalid_mobile, suppressed, existing_open)
+
 
+@dataclass(frozen=True)
+class _CostCenterLookups:
+    last_followups: dict[str, dict[str, Any]]
+    open_lead_mobiles: frozenset[str]
+    suppressions: dict[str, SuppressionDecision]
+
+
+_NOT_SUPPRESSED = SuppressionDecision(False)
+
+
+async def _aggregate_orders(
+    session: AsyncSession, *, cost_center: str | None
+) -> tuple[dict[tuple[str, str], dict[str, Any]], int, int]:
+    """Fold ``vw_orders`` into per-(cost_center, normalized mobile) aggregates in one streamed pass."""
 
-async def _fetch_orders(session: AsyncSession, *, cost_center: str | None) -> list[dict[str, Any]]:
     stmt = sa.select(VW_ORDERS.c.cost_center, VW_ORDERS.c.order_number, VW_ORDERS.c.order_date, VW_ORDERS.c.customer_name, VW_ORDERS.c.mobile_number, VW_ORDERS.c.order_amount)
     if cost_center:
         stmt = stmt.where(VW_ORDERS.c.cost_center == cost_center)
-    return [dict(row) for row in (await session.execute(stmt)).mappings().all()]
+    grouped: dict[tuple[str, str], dict[str, Any]] = {}
+    normalized_by_raw: dict[Any, str | None] = {}
+    rows_seen = 0
+    invalid_mobile = 0
+    result = await session.stream(stmt.execution_options(yield_per=ORDER_STREAM_BATCH_SIZE))
+    async for center, order_number, raw_order_date, customer_name, mobile_number, order_amount in result:
+        rows_seen += 1
+        if mobile_number in normalized_by_raw:
+            normalized = normalized_by_raw[mobile_number]
+        else:
+            mobile_result = normalize_mobile(mobile_number)
+            normalized = (mobile_result.normalized_mobile or "") if mobile_result.is_valid else None
+            normalized_by_raw[mobile_number] = normalized
+        if normalized is None:
+            invalid_mobile += 1
+            continue
+        identity = (str(center), normalized)
+        order_date = _as_date(raw_order_date)
+        amount = Decimal(str(order_amount or "0"))
+        order_key = (order_date, str(order_number or ""))
+        entry = grouped.get(identity)
+        if entry is None:
+            entry = grouped[identity] = {
+                "cost_center": identity[0],
+                "normalized_mobile_number": identity[1],
+                "customer_name": customer_name,
+                "mobile_number": mobile_number,
+                "last_order_date": order_date,
+                "total_orders": 0,
+                "lifetime_spend": Decimal("0"),
+                "last_order_amount": amount,
+                "last_order_key": order_key,
+            }
+        entry["total_orders"] += 1
+        entry["lifetime_spend"] += amount
+        if order_key >= entry["last_order_key"]:
+            entry.update({"last_order_date": order_date, "last_order_amount": amount, "customer_name": customer_name, "mobile_number": mobile_number, "last_order_key": order_key})
+    return grouped, rows_seen, invalid_mobile
+
+
+async def _load_cost_center_lookups(session: AsyncSession, *, cost_center: str, as_of_date: date) -> _CostCenterLookups:
+    return _CostCenterLookups(
+        last_followups=await _load_last_followups(session, cost_center=cost_center),
+        open_lead_mobiles=await _load_open_lead_mobiles(session, cost_center=cost_center),
+        suppressions=await load_active_suppressions(session, cost_center=cost_center, as_of_date=as_of_date),
+    )
 
 
-async def _fetch_last_followup(session: AsyncSession, *, cost_center: str, normalized_mobile_number: str) -> dict[str, Any] | None:
-    row = (
+async def _load_last_followups(session: AsyncSession, *, cost_center: str) -> dict[str, dict[str, Any]]:
+    rows = (
         await session.execute(
-            sa.select(trx_customer_followup_leads)
-            .where(
-                trx_customer_followup_leads.c.cost_center == cost_center,
-                trx_customer_followup_leads.c.normalized_mobile_number == normalized_mobile_number,
+            sa.select(
+                trx_customer_followup_leads.c.normalized_mobile_number,
+                trx_customer_followup_leads.c.lead_date,
+                trx_customer_followup_leads.c.lead_status,
+                trx_customer_followup_leads.c.customer_response,
             )
+            .where(trx_customer_followup_leads.c.cost_center == cost_center)
             .order_by(trx_customer_followup_leads.c.lead_date.desc(), trx_customer_followup_leads.c.lead_id.desc())
-            .limit(1)
         )
-    ).mappings().first()
-    return dict(row) if row else None
+    ).mappings()
+    latest: dict[str, dict[str, Any]] = {}
+    for row in rows:
+        latest.setdefault(row["normalized_mobile_number"], dict(row))
+    return latest
 
 
 def _as_date(value: Any) -> date:
@@ -180,15 +224,14 @@ def _as_date(value: Any) -> date:
     return datetime.fromisoformat(str(value)).date()
 
 
-async def _has_open_lead(session: AsyncSession, *, cost_center: str, normalized_mobile_number: str) -> bool:
-    existing = await session.execute(
-        sa.select(trx_customer_followup_leads.c.lead_id)
+async def _load_open_lead_mobiles(session: AsyncSession, *, cost_center: str) -> frozenset[str]:
+    result = await session.execute(
+        sa.select(trx_customer_followup_leads.c.normalized_mobile_number)
         .where(
             trx_customer_followup_leads.c.cost_center == cost_center,
-            trx_customer_followup_leads.c.normalized_mobile_number == normalized_mobile_number,
             trx_customer_followup_leads.c.lead_status.in_(tuple(OPEN_LEAD_STATUSES)),
             trx_customer_followup_leads.c.is_closed.is_(False),
         )
-        .limit(1)
+        .distinct()
     )
-    return existing.scalar_one_or_none() is not None
+    return frozenset(result.scalars().all())
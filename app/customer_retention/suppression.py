@@ -85,6 +85,32 @@ async def check_active_suppression(
     return SuppressionDecision(False)
 
 
+async def load_active_suppressions(
+    session: AsyncSession,
+    *,
+    cost_center: str,
+    as_of_date: date,
+) -> dict[str, SuppressionDecision]:
+    """Active suppressions for every mobile in ``cost_center``, keyed by normalized mobile.
+
+    Matches ``check_active_suppression`` per mobile: the newest active row wins.
+    """
+    rows = (
+        await session.execute(
+            sa.select(trx_customer_suppression)
+            .where(trx_customer_suppression.c.cost_center == cost_center)
+            .order_by(trx_customer_suppression.c.suppression_id.desc())
+        )
+    ).mappings()
+    decisions: dict[str, SuppressionDecision] = {}
+    for row in rows:
+        mobile = row["normalized_mobile_number"]
+        if mobile in decisions or not mobile or not is_active_suppression_row(row, as_of_date=as_of_date):
+            continue
+        decisions[mobile] = SuppressionDecision(True, int(row["suppression_id"]), row["suppression_state"], row["suppression_reason"], row["suppression_until"], bool(row["is_permanent"]))
+    return decisions
+
+
 async def create_time_bound_suppression(
     session: AsyncSession,
     *,
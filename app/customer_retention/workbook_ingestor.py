@@ -5,7 +5,7 @@ from __future__ import annotations
 import hashlib
 from datetime import date, datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, Mapping
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -16,11 +16,11 @@ from app.common.db import session_scope
 from app.dashboard_downloader.json_logger import JsonLogger, log_event
 
 from .constants import WORKBOOK_OUTCOME_LABELS, WORKBOOK_OUTCOME_SHIFTED_LOCATION
-from .db_tables import trx_customer_followup_leads
+from .db_tables import trx_customer_followup_history, trx_customer_followup_leads
 from .lifecycle import apply_lifecycle_transition
-from .mobile import normalize_mobile
+from .mobile import MobileNormalizationResult, normalize_mobile
 from .normalization import ValueNormalizer
-from .persistence import fetch_active_cost_centers, insert_history_once
+from .persistence import fetch_active_cost_centers, history_values, insert_history_rows
 from .types import RowWarning, WorkbookIngestionResult
 
 FOLLOWUP_SHEET = "FOLLOWUP_LEADS"
@@ -57,6 +57,7 @@ EDITABLE_COLUMNS = {
     "target_cost_center": "Target Cost Center",
 }
 REQUIRED_EDITABLE = ("contact_attempted", "customer_response", "complaint", "do_not_contact")
+LEAD_LOOKUP_CHUNK_SIZE = 500
 
 
 def _key(value: Any) -> str:
@@ -128,6 +129,103 @@ def _suppression_start_date_from_row(
     raise ValueError("Suppression start date requires run_date, workbook generated_at, or lead lead_date")
 
 
+def _row_lead_id(row: dict[str, Any]) -> int | None:
+    lead_id_raw = row.get("lead_id")
+    if lead_id_raw in (None, ""):
+        return None
+    try:
+        return int(lead_id_raw)
+    except (TypeError, ValueError):
+        return None
+
+
+def _row_identity(row: dict[str, Any], mobile_result: MobileNormalizationResult) -> tuple[str, str]:
+    return str(row.get("cost_center") or "").strip().upper(), mobile_result.normalized_mobile or ""
+
+
+class _WorkbookLeadIndex:
+    """Leads referenced by one returned workbook, loaded with bulk ``IN`` queries.
+
+    Rows are matched by ``lead_id`` first and by (cost_center, normalized
+    mobile) second, as before. Leads a row has already transitioned, and
+    identities a Shifted Location row may have created a destination lead
+    for, are re-read from the database so later rows see current state.
+    """
+
+    def __init__(self) -> None:
+        self.by_id: dict[int, Mapping[str, Any]] = {}
+        self.by_identity: dict[tuple[str, str], Mapping[str, Any]] = {}
+        self.stale_lead_ids: set[int] = set()
+        self.stale_identities: set[tuple[str, str]] = set()
+
+    @classmethod
+    async def load(cls, session: AsyncSession, rows: list[tuple[int, dict[str, Any]]]) -> "_WorkbookLeadIndex":
+        index = cls()
+        leads = trx_customer_followup_leads
+        lead_ids = {lead_id for _, row in rows if (lead_id := _row_lead_id(row)) is not None}
+        for chunk in _chunks(sorted(lead_ids)):
+            result = await session.execute(sa.select(leads).where(leads.c.lead_id.in_(chunk)))
+            index.by_id.update((int(lead["lead_id"]), lead) for lead in result.mappings().all())
+
+        identities: set[tuple[str, str]] = set()
+        for _, row in rows:
+            if _row_lead_id(row) in index.by_id:
+                continue
+            mobile_result = normalize_mobile(row.get("mobile_number"))
+            if mobile_result.is_valid:
+                identities.add(_row_identity(row, mobile_result))
+        mobiles = sorted({mobile for _, mobile in identities})
+        cost_centers = sorted({cost_center for cost_center, _ in identities})
+        for chunk in _chunks(mobiles):
+            result = await session.execute(
+                sa.select(leads)
+                .where(leads.c.cost_center.in_(cost_centers), leads.c.normalized_mobile_number.in_(chunk))
+                .order_by(leads.c.lead_id.asc())
+            )
+            for lead in result.mappings().all():
+                identity = (str(lead["cost_center"]), str(lead["normalized_mobile_number"]))
+                if identity in identities:
+                    index.by_identity.setdefault(identity, lead)
+        return index
+
+    async def _lead_by_id(self, session: AsyncSession, lead_id: int) -> Mapping[str, Any] | None:
+        if lead_id not in self.stale_lead_ids:
+            return self.by_id.get(lead_id)
+        leads = trx_customer_followup_leads
+        return (await session.execute(sa.select(leads).where(leads.c.lead_id == lead_id))).mappings().first()
+
+    async def resolve(self, session: AsyncSession, row: dict[str, Any], mobile_result: MobileNormalizationResult) -> Mapping[str, Any] | None:
+        lead_id = _row_lead_id(row)
+        lead = await self._lead_by_id(session, lead_id) if lead_id is not None else None
+        if lead is not None or not mobile_result.is_valid:
+            return lead
+        identity = _row_identity(row, mobile_result)
+        if identity in self.stale_identities:
+            leads = trx_customer_followup_leads
+            return (await session.execute(sa.select(leads).where(leads.c.cost_center == identity[0], leads.c.normalized_mobile_number == identity[1]))).mappings().first()
+        lead = self.by_identity.get(identity)
+        if lead is not None and int(lead["lead_id"]) in self.stale_lead_ids:
+            return await self._lead_by_id(session, int(lead["lead_id"]))
+        return lead
+
+    def mark_transitioned(self, lead: Mapping[str, Any], *, shift_target: str | None) -> None:
+        self.stale_lead_ids.add(int(lead["lead_id"]))
+        if shift_target is not None:
+            self.stale_identities.add((shift_target, str(lead.get("normalized_mobile_number") or "")))
+
+
+def _chunks(values: list[Any], size: int = LEAD_LOOKUP_CHUNK_SIZE) -> list[list[Any]]:
+    return [values[start : start + size] for start in range(0, len(values), size)]
+
+
+async def _fetch_pending_history_keys(session: AsyncSession, *, file_digest: str) -> set[tuple[int, str]]:
+    history = trx_customer_followup_history
+    rows = await session.execute(
+        sa.select(history.c.lead_id, history.c.event_type).where(history.c.event_type.like(f"Pending_Not_Updated:{file_digest[:16]}:%"))
+    )
+    return {(int(lead_id), str(event_type)) for lead_id, event_type in rows.all()}
+
+
 async def _ingest_returned_workbook(
     session: AsyncSession,
     path: Path,
@@ -150,26 +248,23 @@ async def _ingest_returned_workbook(
         return result
     value_normalizer = normalizer or ValueNormalizer()
     active_cost_centers = await fetch_active_cost_centers(session)
+    # Phase one reads the sheet and resolves every referenced lead in bulk;
+    # phase two validates rows and applies outcomes in sheet order.
+    workbook_rows: list[tuple[int, dict[str, Any]]] = []
     for row_number, values in enumerate(rows_iter, start=2):
         row = _row_dict(headers, values)
         if "next_follow_up_date" in row and "next_followup_date" not in row:
             row["next_followup_date"] = row["next_follow_up_date"]
         if not any(value is not None and str(value).strip() for value in row.values()):
             continue
+        workbook_rows.append((row_number, row))
+    lead_index = await _WorkbookLeadIndex.load(session, workbook_rows)
+    recorded_pending = await _fetch_pending_history_keys(session, file_digest=file_digest)
+    pending_history_rows: list[dict[str, Any]] = []
+    for row_number, row in workbook_rows:
         result.rows_seen += 1
-        lead = None
-        lead_id_raw = row.get("lead_id")
-        if lead_id_raw not in (None, ""):
-            try:
-                lead_id = int(lead_id_raw)
-            except (TypeError, ValueError):
-                lead_id = None
-            if lead_id is not None:
-                lead = (await session.execute(sa.select(trx_customer_followup_leads).where(trx_customer_followup_leads.c.lead_id == lead_id))).mappings().first()
         mobile_result = normalize_mobile(row.get("mobile_number"))
-        if lead is None and mobile_result.is_valid:
-            cost_center = str(row.get("cost_center") or "").strip().upper()
-            lead = (await session.execute(sa.select(trx_customer_followup_leads).where(trx_customer_followup_leads.c.cost_center == cost_center, trx_customer_followup_leads.c.normalized_mobile_number == mobile_result.normalized_mobile))).mappings().first()
+        lead = await lead_index.resolve(session, row, mobile_result)
         if lead is None:
             result.rows_skipped += 1
             result.warnings.append(RowWarning("lead_not_found", "Workbook row could not be matched to an existing lead", row_number, path.name))
@@ -227,16 +322,22 @@ async def _ingest_returned_workbook(
         lead_id = int(lead_map["lead_id"])
         if row_has_required_blank:
             result.rows_pending_not_updated += 1
-            inserted = await insert_history_once(
-                session,
-                lead_id=lead_id,
-                pipeline_run_id=pipeline_run_id,
-                event_type=f"Pending_Not_Updated:{event_suffix}",
-                previous_status=str(lead_map.get("lead_status")) if lead_map.get("lead_status") is not None else None,
-                new_status=str(lead_map.get("lead_status")) if lead_map.get("lead_status") is not None else None,
-                raw_excel_value_json={key: (str(value) if value is not None else None) for key, value in row.items() if key in EDITABLE_COLUMNS or key in PROTECTED_COLUMNS},
-                normalized_value_json=normalized_values,
-            )
+            event_type = f"Pending_Not_Updated:{event_suffix}"
+            inserted = (lead_id, event_type) not in recorded_pending
+            if inserted:
+                recorded_pending.add((lead_id, event_type))
+                lead_status = str(lead_map.get("lead_status")) if lead_map.get("lead_status") is not None else None
+                pending_history_rows.append(
+                    history_values(
+                        lead_id=lead_id,
+                        pipeline_run_id=pipeline_run_id,
+                        event_type=event_type,
+                        previous_status=lead_status,
+                        new_status=lead_status,
+                        raw_excel_value_json={key: (str(value) if value is not None else None) for key, value in row.items() if key in EDITABLE_COLUMNS or key in PROTECTED_COLUMNS},
+                        normalized_value_json=normalized_values,
+                    )
+                )
         else:
             # Successful rows must pass through the lifecycle engine so status,
             # closure, suppression, and history contracts stay centralized.
@@ -258,12 +359,15 @@ async def _ingest_returned_workbook(
                     row, run_date=run_date, lead_date=lead_map.get("lead_date")
                 ),
                 target_cost_center=valid_shift_target,
+                lead=lead,
             )
             inserted = transition.history_inserted
+            lead_index.mark_transitioned(lead, shift_target=valid_shift_target)
         if inserted:
             result.history_inserted += 1
         else:
             result.history_existing += 1
+    await insert_history_rows(session, pending_history_rows)
     if logger:
         log_event(logger=logger, phase="history_update", message="workbook_ingestion_complete", source_file=path.name, rows_seen=result.rows_seen, history_inserted=result.history_inserted, warnings=result.warning_count)
     return result
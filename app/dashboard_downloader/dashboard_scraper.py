@@ -340,6 +340,128 @@ METRIC_SECTIONS: Dict[str, str] = {
 }
 
 
+# Serializes every table (header text, column headers, body rows) and every h3
+# with the tables reachable from it, so section lookup and parsing run on one
+# snapshot instead of a CDP round trip per row and cell. The row/header rules
+# mirror _get_table_header_text, _get_column_headers and _extract_table_rows.
+_DASHBOARD_TABLES_SNAPSHOT_JS = """
+() => {
+  const text = (el) => (el && el.innerText) || "";
+  const tables = Array.from(document.querySelectorAll("table"));
+  const tableIndex = new Map(tables.map((table, index) => [table, index]));
+  const indices = (nodes) =>
+    Array.from(nodes, (node) => tableIndex.get(node)).filter((index) => index !== undefined);
+  const serializeTable = (table) => {
+    const allRows = Array.from(table.querySelectorAll("tr"));
+    const headRows = Array.from(table.querySelectorAll("thead tr"));
+    const thead = table.querySelector("thead");
+    const headerRow = headRows.length ? headRows[headRows.length - 1] : allRows[0];
+    let bodyRows = Array.from(table.querySelectorAll("tbody tr"));
+    let skipHeader = false;
+    if (!bodyRows.length) {
+      bodyRows = allRows;
+      skipHeader = headRows.length > 0;
+    }
+    const rows = [];
+    bodyRows.forEach((row, index) => {
+      if ((skipHeader && index === 0) || !row.querySelector("td")) {
+        return;
+      }
+      const cells = Array.from(row.querySelectorAll("th,td"), (cell) => text(cell).trim());
+      if (cells.some((value) => value)) {
+        rows.push(cells);
+      }
+    });
+    return {
+      header_text: thead ? text(thead) : allRows.length ? text(allRows[0]) : "",
+      headers: headerRow
+        ? Array.from(headerRow.querySelectorAll("th,td"), (cell) => text(cell).trim())
+        : [],
+      rows,
+      bordered: table.classList.contains("table-bordered"),
+    };
+  };
+  const headings = Array.from(document.querySelectorAll("h3"), (heading) => {
+    const followingTables = [];
+    for (let sibling = heading.nextElementSibling; sibling; sibling = sibling.nextElementSibling) {
+      if (sibling.tagName === "TABLE") {
+        followingTables.push(sibling);
+      }
+    }
+    const parent = heading.parentElement;
+    const container = parent ? parent.closest("section, .card") : null;
+    return {
+      text: (heading.textContent || "").replace(/\\s+/g, " ").trim().toLowerCase(),
+      inner_text: text(heading),
+      section_title: heading.classList.contains("section-title"),
+      following_tables: indices(followingTables),
+      container_tables: container ? indices(container.querySelectorAll("table")) : [],
+      parent_tables: parent ? indices(parent.querySelectorAll("table")) : [],
+    };
+  });
+  return { tables: tables.map(serializeTable), headings };
+}
+"""
+
+
+async def _snapshot_dashboard_tables(page: Page) -> Optional[Dict[str, Any]]:
+    """Return the serialized dashboard tables, or ``None`` to fall back to locators."""
+
+    try:
+        snapshot = await page.evaluate(_DASHBOARD_TABLES_SNAPSHOT_JS)
+    except Exception:
+        return None
+    if not isinstance(snapshot, dict) or not isinstance(snapshot.get("tables"), list):
+        return None
+    return snapshot
+
+
+def _select_snapshot_table(
+    snapshot: Dict[str, Any],
+    section_name: str,
+    *,
+    table_after_heading: bool,
+) -> Tuple[Optional[Dict[str, Any]], bool]:
+    tables: List[Dict[str, Any]] = snapshot["tables"]
+    headings: List[Dict[str, Any]] = snapshot.get("headings") or []
+    normalized_target = section_name.strip().lower()
+
+    if table_after_heading:
+        heading_present = False
+        for heading in headings:
+            if not heading.get("section_title"):
+                continue
+            if re.sub(r"\s+", " ", (heading.get("inner_text") or "").strip()).lower() != normalized_target:
+                continue
+            heading_present = True
+            for index in heading.get("following_tables") or []:
+                if tables[index].get("bordered"):
+                    return tables[index], True
+        return None, heading_present
+
+    matching = [heading for heading in headings if normalized_target in (heading.get("text") or "")]
+    candidates: List[int] = []
+    for heading in matching:
+        candidates.extend(heading.get("following_tables") or [])
+        candidates.extend(heading.get("container_tables") or [])
+        candidates.extend(heading.get("parent_tables") or [])
+    candidates.extend(range(len(tables)))
+
+    config = SECTION_CONFIGS[section_name]
+    seen: set[int] = set()
+    for index in candidates:
+        if index in seen:
+            continue
+        seen.add(index)
+        header_text = _normalize_space(tables[index].get("header_text"))
+        if not header_text:
+            continue
+        matches = sum(1 for keyword in config.keywords if keyword in header_text)
+        if matches >= config.min_matches:
+            return tables[index], bool(matching)
+    return None, bool(matching)
+
+
 async def extract_dashboard_summary(
     page: Page,
     store_cfg: Dict[str, Any],
@@ -523,11 +645,32 @@ async def extract_dashboard_summary(
             extras={"error": str(exc)},
         )
 
+    # One evaluate serializes every table; the locator walk below only runs when
+    # the page cannot be evaluated.
+    tables_snapshot = await _snapshot_dashboard_tables(page)
+
     async def _collect_section(
         section_name: str,
         *,
         table_after_heading: bool = False,
     ) -> Tuple[List[List[str]], List[str], bool]:
+        if tables_snapshot is not None:
+            table, heading_present = _select_snapshot_table(
+                tables_snapshot, section_name, table_after_heading=table_after_heading
+            )
+            if table is None:
+                if not heading_present:
+                    _log("warning", "section heading missing", extras={"section": section_name})
+                _log("warning", "table not found for section", extras={"section": section_name})
+                return [], [], False
+            headers = list(table.get("headers") or [])
+            rows = [list(row) for row in table.get("rows") or []]
+            if not rows:
+                _log("warning", "section table empty", extras={"section": section_name})
+                return [], headers, False
+            sections_with_data.add(section_name)
+            return rows, headers, True
+
         config = SECTION_CONFIGS[section_name]
         if table_after_heading:
             table_locator, heading_present = await _table_after_heading_locator(page, section_name)
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import json
 import os
 import logging
@@ -331,6 +333,7 @@ class EmailSendFailure:
 class EmailSendResult:
     sent: bool
     failure: EmailSendFailure | None = None
+    attempt_count: int = 1
 
     def __bool__(self) -> bool:
         return self.sent
@@ -1914,8 +1917,69 @@ def probe_smtp_tcp_connectivity(
         }
 
 
-def _send_email(config: SmtpConfig, plan: EmailPlan) -> EmailSendResult:
-    stage = "build_message"
+class _SmtpSession:
+    """One connected, authenticated SMTP client reused across messages.
+
+    The connection is opened on first send and dropped after any failure so the
+    next attempt reconnects from scratch.
+    """
+
+    def __init__(self, config: SmtpConfig) -> None:
+        self._config = config
+        self._client: Any = None
+        self._exit_stack: contextlib.ExitStack | None = None
+        self.stage = "connect"
+        self.connections_opened = 0
+
+    def __enter__(self) -> "_SmtpSession":
+        return self
+
+    def __exit__(self, *_exc_info: Any) -> None:
+        self.close()
+
+    def _connect(self) -> Any:
+        exit_stack = contextlib.ExitStack()
+        try:
+            self.stage = "connect"
+            client = exit_stack.enter_context(
+                smtplib.SMTP(
+                    self._config.host,
+                    self._config.port,
+                    timeout=SMTP_CONNECT_TIMEOUT_SECONDS,
+                )
+            )
+            self.connections_opened += 1
+            if self._config.use_tls:
+                self.stage = "starttls"
+                client.starttls()
+            if self._config.username and self._config.password:
+                self.stage = "login"
+                client.login(self._config.username, self._config.password)
+        except BaseException:
+            with contextlib.suppress(Exception):
+                exit_stack.close()
+            raise
+        self._client = client
+        self._exit_stack = exit_stack
+        return client
+
+    def send(self, message: EmailMessage, recipients: Sequence[str]) -> None:
+        try:
+            client = self._client or self._connect()
+            self.stage = "send_message"
+            client.send_message(message, to_addrs=list(recipients))
+        except BaseException:
+            self.close()
+            raise
+
+    def close(self) -> None:
+        exit_stack, self._exit_stack, self._client = self._exit_stack, None, None
+        if exit_stack is not None:
+            with contextlib.suppress(Exception):
+                exit_stack.close()
+
+
+def _build_email_message(config: SmtpConfig, plan: EmailPlan) -> EmailMessage:
     message = EmailMessage()
     message["Subject"] = plan.subject
     message["From"] = config.sender
@@ -1937,6 +2001,16 @@ def _send_email(config: SmtpConfig, plan: EmailPlan) -> EmailSendResult:
             subtype="pdf",
             filename=attachment.name,
         )
+    return message
+
+
+def _send_email(
+    config: SmtpConfig, plan: EmailPlan, *, session: _SmtpSession | None = None
+) -> EmailSendResult:
+    """Send ``plan`` with retries, over ``session`` when given or a one-off connection."""
+
+    stage = "build_message"
+    message = _build_email_message(config, plan)
     recipients = _unique(plan.to + plan.cc + plan.bcc)
     if not recipients:
         failure = EmailSendFailure(
@@ -1956,6 +2030,19 @@ def _send_email(config: SmtpConfig, plan: EmailPlan) -> EmailSendResult:
             connect_timeout_seconds=SMTP_CONNECT_TIMEOUT_SECONDS,
         )
         return EmailSendResult(sent=False, failure=failure)
+    if session is None:
+        with _SmtpSession(config) as own_session:
+            return _send_message_with_retries(config, plan, message, recipients, own_session)
+    return _send_message_with_retries(config, plan, message, recipients, session)
+
+
+def _send_message_with_retries(
+    config: SmtpConfig,
+    plan: EmailPlan,
+    message: EmailMessage,
+    recipients: Sequence[str],
+    session: _SmtpSession,
+) -> EmailSendResult:
     retry_config = _load_notification_send_retry_config()
     delay_seconds = min(
         retry_config.initial_delay_seconds, retry_config.max_delay_seconds
@@ -1966,18 +2053,10 @@ def _send_email(config: SmtpConfig, plan: EmailPlan) -> EmailSendResult:
         attempt += 1
         attempt_started = time.monotonic()
         try:
-            stage = "connect"
-            with smtplib.SMTP(config.host, config.port, timeout=SMTP_CONNECT_TIMEOUT_SECONDS) as client:
-                if config.use_tls:
-                    stage = "starttls"
-                    client.starttls()
-                if config.username and config.password:
-                    stage = "login"
-                    client.login(config.username, config.password)
-                stage = "send_message"
-                client.send_message(message, to_addrs=recipients)
-            return EmailSendResult(sent=True)
+            session.send(message, recipients)
+            return EmailSendResult(sent=True, attempt_count=attempt)
         except Exception as exc:
+            stage = session.stage
             elapsed_ms = int((time.monotonic() - attempt_started) * 1000)
             attempt_diagnostics.append(
                 {
@@ -2007,6 +2086,7 @@ def _send_email(config: SmtpConfig, plan: EmailPlan) -> EmailSendResult:
                 )
                 return EmailSendResult(
                     sent=False,
+                    attempt_count=attempt,
                     failure=_email_send_failure(
                         config,
                         plan,
@@ -2036,6 +2116,36 @@ def _send_email(config: SmtpConfig, plan: EmailPlan) -> EmailSendResult:
             )
 
 
+class EmailOutbox:
+    """Queue of planned notification emails delivered over one SMTP session.
+
+    ``flush`` sends every queued plan from a worker thread, so SMTP round trips,
+    attachment reads and retry back-off never block the event loop. Plans go
+    out in order on a single connection that is reopened only after a failure,
+    and each plan's outcome is kept alongside it.
+    """
+
+    def __init__(self, config: SmtpConfig) -> None:
+        self.config = config
+        self.plans: list[EmailPlan] = []
+        self.results: list[EmailSendResult | bool] = []
+        self.connections_opened = 0
+
+    def add(self, plan: EmailPlan) -> None:
+        self.plans.append(plan)
+
+    def _drain(self) -> list[EmailSendResult | bool]:
+        pending = self.plans[len(self.results):]
+        with _SmtpSession(self.config) as session:
+            for plan in pending:
+                self.results.append(_send_email(self.config, plan, session=session))
+        self.connections_opened += session.connections_opened
+        return self.results
+
+    async def flush(self) -> list[EmailSendResult | bool]:
+        return await asyncio.to_thread(self._drain)
+
+
 def _build_email_plans(
     *,
     pipeline_code: str,
@@ -3678,6 +3788,20 @@ def _resolve_reporting_mode_suffix(*, pipeline_name: str, metrics_payload: Mappi
     return f" [{reporting_mode}]"
 
 
+def _delivery_record(plan: EmailPlan, send_result: EmailSendResult | bool) -> dict[str, Any]:
+    if isinstance(send_result, bool):
+        sent, attempt_count = send_result, 1
+    else:
+        sent, attempt_count = send_result.sent, send_result.attempt_count
+    return {
+        "profile_code": plan.profile_code,
+        "store_code": plan.store_code,
+        "subject": plan.subject,
+        "status": "sent" if sent else "failed",
+        "attempt_count": attempt_count,
+    }
+
+
 async def send_notifications_for_run(pipeline_name: str, run_id: str) -> dict[str, Any]:
     result: dict[str, Any] = {"emails_planned": 0, "emails_sent": 0, "errors": []}
     resources, errors = await _load_notification_resources(pipeline_name, run_id)
@@ -3781,9 +3905,15 @@ async def send_notifications_for_run(pipeline_name: str, run_id: str) -> dict[st
         result["errors"].append("SMTP configuration missing; skipping notifications")
         return result
 
-    sent = 0
+    outbox = EmailOutbox(smtp_config)
     for plan in plans:
-        send_result = _send_email(smtp_config, plan)
+        outbox.add(plan)
+    send_results = await outbox.flush()
+
+    sent = 0
+    deliveries: list[dict[str, Any]] = []
+    for plan, send_result in zip(plans, send_results):
+        deliveries.append(_delivery_record(plan, send_result))
         # Keep compatibility with tests or callers that monkeypatch _send_email to
         # the legacy bool contract while production returns structured details.
         if isinstance(send_result, bool):
@@ -3824,6 +3954,7 @@ async def send_notifications_for_run(pipeline_name: str, run_id: str) -> dict[st
         )
     result["emails_sent"] = sent
     result["emails_planned"] = len(plans)
+    result["deliveries"] = deliveries
     logger.info(
         "Notification dispatch complete",
         extra={"pipeline": pipeline_name, "run_id": run_id, "emails_sent": sent, "emails_planned": len(plans)},
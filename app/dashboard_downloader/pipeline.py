@@ -119,6 +119,7 @@ async def run_pipeline(
                 logger=logger,
                 run_id=settings.run_id,
                 run_date=run_date,
+                bulk_load=settings.ingest_bulk_load,
             )
             counts["ingested_rows"] = ingest_totals["rows"]
             if ingest_totals.get("ingested_by_store"):
@@ -222,7 +222,9 @@ async def _run(env: str | None = None) -> None:
 
 
 def run_pipeline(env: str | None = None) -> None:
-    asyncio.run(_run(env))
+    from app.dashboard_downloader.report_generator import run_then_close_pdf_renderer
+
+    asyncio.run(run_then_close_pdf_renderer(_run(env)))
 
 
 if __name__ == "__main__":
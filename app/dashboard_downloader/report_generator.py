@@ -1,14 +1,16 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import math
 import os
-from dataclasses import dataclass
+import weakref
+from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta, timezone
 from decimal import Decimal
 from math import inf
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Mapping
+from typing import TYPE_CHECKING, Any, Awaitable, Dict, Iterable, List, Mapping, Sequence, TypeVar
 
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import A4
@@ -17,7 +19,7 @@ from reportlab.lib.utils import ImageReader
 from reportlab.pdfgen import canvas
 from reportlab.platypus import Paragraph, Table, TableStyle
 
-from playwright.async_api import async_playwright
+from playwright.async_api import Browser, Page, async_playwright
 import sqlalchemy as sa
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -31,6 +33,7 @@ from app.common.ingest.models import MissedLead, RepeatCustomer, UndeliveredOrde
 __all__ = [
     "StoreReportDataNotFound",
     "build_store_context",
+    "build_store_contexts",
     "render_store_report_pdf",
 ]
 
@@ -138,35 +141,73 @@ def _as_int(value: Any) -> int | None:
         return None
 
 
-async def _fetch_dashboard_summary(
+async def _fetch_dashboard_summaries(
     session: AsyncSession,
-    store_code: str,
+    store_codes: Sequence[str],
     report_date: date,
-    *,
-    comparison: bool = False,
-) -> Mapping[str, Any] | None:
-    summary_cols = list(store_dashboard_summary.c)
-    stmt = (
+) -> tuple[Dict[str, Mapping[str, Any]], Dict[str, Mapping[str, Any]]]:
+    """Return the report-date and latest earlier summary rows keyed by store code.
+
+    One ranked query replaces a current/comparison lookup pair per store: rows
+    are partitioned by store and by whether they fall on ``report_date``, and
+    the newest row of each partition wins.
+    """
+
+    store_key = sa.func.upper(store_master.c.store_code)
+    is_current = store_dashboard_summary.c.dashboard_date == report_date
+    ranked = (
         sa.select(
-            *summary_cols,
+            *store_dashboard_summary.c,
             store_master.c.store_name.label("store_name"),
             store_master.c.store_code.label("store_code"),
+            store_key.label("summary_store_key"),
+            is_current.label("summary_is_current"),
+            sa.func.row_number()
+            .over(
+                partition_by=(store_key, is_current),
+                order_by=(
+                    store_dashboard_summary.c.dashboard_date.desc(),
+                    store_dashboard_summary.c.run_date_time.desc(),
+                ),
+            )
+            .label("summary_rank"),
         )
         .select_from(store_dashboard_summary)
         .join(store_master, store_master.c.id == store_dashboard_summary.c.store_id)
-        .where(sa.func.upper(store_master.c.store_code) == store_code.upper())
+        .where(store_key.in_(store_codes))
+        .where(store_dashboard_summary.c.dashboard_date <= report_date)
+        .subquery()
     )
-    if comparison:
-        stmt = stmt.where(store_dashboard_summary.c.dashboard_date < report_date)
-    else:
-        stmt = stmt.where(store_dashboard_summary.c.dashboard_date == report_date)
-    stmt = stmt.order_by(
-        store_dashboard_summary.c.dashboard_date.desc(),
-        store_dashboard_summary.c.run_date_time.desc(),
-    ).limit(1)
-    result = await session.execute(stmt)
-    row = result.mappings().first()
-    return row
+    helper_columns = {"summary_store_key", "summary_is_current", "summary_rank"}
+    stmt = sa.select(ranked).where(ranked.c.summary_rank == 1)
+    current: Dict[str, Mapping[str, Any]] = {}
+    comparison: Dict[str, Mapping[str, Any]] = {}
+    for row in (await session.execute(stmt)).mappings():
+        summary = {key: value for key, value in row.items() if key not in helper_columns}
+        target = current if row["summary_is_current"] else comparison
+        target[row["summary_store_key"]] = summary
+    return current, comparison
+
+
+async def _count_by_store(
+    session: AsyncSession,
+    store_column: Any,
+    store_codes: Sequence[str],
+    *conditions: Any,
+    group_by: Any | None = None,
+) -> Dict[Any, int]:
+    store_key = sa.func.upper(store_column)
+    keys = [store_key] if group_by is None else [store_key, group_by]
+    stmt = (
+        sa.select(*keys, sa.func.count())
+        .where(store_key.in_(store_codes), *conditions)
+        .group_by(*keys)
+    )
+    counts: Dict[Any, int] = {}
+    for row in await session.execute(stmt):
+        key = row[0] if group_by is None else (row[0], row[1])
+        counts[key] = row[-1]
+    return counts
 
 
 def _evaluate_metric(metric: str, value: float | int | None) -> MetricStatus:
@@ -325,30 +366,45 @@ def _combine_date_time(date_value: date | None, time_value: str | None) -> str:
     return time_value or ""
 
 
+@dataclass
+class _StoreReportData:
+    summary_row: Mapping[str, Any]
+    comparison_row: Mapping[str, Any] | None = None
+    missed_count: int = 0
+    previous_missed_count: int = 0
+    undelivered_count: int = 0
+    repeat_base_count: int = 0
+    undelivered_rows: List[Dict[str, Any]] = field(default_factory=list)
+    undelivered_total_amount: float = 0.0
+    missed_leads_rows: List[Dict[str, Any]] = field(default_factory=list)
+
+
 async def _fetch_undelivered_order_rows(
     session: AsyncSession,
-    store_code: str,
+    store_codes: Sequence[str],
     report_date: date,
-) -> tuple[List[Dict[str, Any]], float]:
+) -> Dict[str, tuple[List[Dict[str, Any]], float]]:
+    store_key = sa.func.upper(UndeliveredOrder.store_code)
     delivery_reference_date = sa.func.coalesce(
         UndeliveredOrder.expected_deliver_on, UndeliveredOrder.order_date
     )
     stmt = (
         sa.select(
+            store_key.label("store_key"),
             UndeliveredOrder.order_id,
             UndeliveredOrder.order_date,
             UndeliveredOrder.expected_deliver_on,
             UndeliveredOrder.net_amount.label("order_amount"),
             UndeliveredOrder.actual_deliver_on,
         )
-        .where(sa.func.upper(UndeliveredOrder.store_code) == store_code)
+        .where(store_key.in_(store_codes))
         .where(UndeliveredOrder.actual_deliver_on.is_(None))
         .where(sa.extract("year", delivery_reference_date) == report_date.year)
         .where(sa.extract("month", delivery_reference_date) == report_date.month)
     )
     result = await session.execute(stmt)
-    rows = []
-    total_amount = 0.0
+    rows_by_store: Dict[str, List[Dict[str, Any]]] = {}
+    totals: Dict[str, float] = {}
     for row in result:
         committed = row.expected_deliver_on
         if committed is None and row.order_date:
@@ -358,8 +414,8 @@ async def _fetch_undelivered_order_rows(
             age_days = (report_date - committed).days
         order_amount = _as_float(row.order_amount)
         if order_amount is not None:
-            total_amount += order_amount
-        rows.append(
+            totals[row.store_key] = totals.get(row.store_key, 0.0) + order_amount
+        rows_by_store.setdefault(row.store_key, []).append(
             {
                 "order_id": row.order_id,
                 "order_date": row.order_date,
@@ -368,15 +424,20 @@ async def _fetch_undelivered_order_rows(
                 "order_amount": order_amount,
             }
         )
-    rows.sort(key=lambda r: r["age_days"] if r["age_days"] is not None else -1, reverse=True)
-    return rows, total_amount
+    results: Dict[str, tuple[List[Dict[str, Any]], float]] = {}
+    for store_key, rows in rows_by_store.items():
+        rows.sort(key=lambda r: r["age_days"] if r["age_days"] is not None else -1, reverse=True)
+        results[store_key] = (rows, totals.get(store_key, 0.0))
+    return results
 
 
 async def _fetch_missed_leads_rows(
-    session: AsyncSession, store_code: str, report_date: date
-) -> List[Dict[str, Any]]:
+    session: AsyncSession, store_codes: Sequence[str], report_date: date
+) -> Dict[str, List[Dict[str, Any]]]:
+    store_key = sa.func.upper(MissedLead.store_code)
     stmt = (
         sa.select(
+            store_key.label("store_key"),
             MissedLead.mobile_number,
             MissedLead.customer_name,
             MissedLead.pickup_created_date,
@@ -386,16 +447,16 @@ async def _fetch_missed_leads_rows(
             MissedLead.source,
             MissedLead.customer_type,
         )
-        .where(sa.func.upper(MissedLead.store_code) == store_code)
+        .where(store_key.in_(store_codes))
         .where(MissedLead.is_order_placed.is_(False))
         .where(sa.extract("year", MissedLead.pickup_created_date) == report_date.year)
         .where(sa.extract("month", MissedLead.pickup_created_date) == report_date.month)
         .order_by(MissedLead.customer_type.asc(), MissedLead.pickup_created_date.asc(), MissedLead.pickup_created_time.asc())
     )
     result = await session.execute(stmt)
-    rows = []
+    rows_by_store: Dict[str, List[Dict[str, Any]]] = {}
     for row in result:
-        rows.append(
+        rows_by_store.setdefault(row.store_key, []).append(
             {
                 "phone": row.mobile_number,
                 "customer_name": row.customer_name,
@@ -405,65 +466,128 @@ async def _fetch_missed_leads_rows(
                 "customer_type": row.customer_type,
             }
         )
-    return rows
+    return rows_by_store
 
 
-async def build_store_context(
-    store_code: str,
+async def _fetch_store_report_data(
+    session: AsyncSession, store_codes: Sequence[str], report_date: date
+) -> Dict[str, _StoreReportData]:
+    """Load every dataset the store report needs with one query per dataset.
+
+    Stores without a dashboard summary on ``report_date`` are left out.
+    """
+
+    t_minus_one = report_date - timedelta(days=1)
+    summaries, comparisons = await _fetch_dashboard_summaries(session, store_codes, report_date)
+    codes = [code for code in store_codes if code in summaries]
+    if not codes:
+        return {}
+
+    missed_counts = await _count_by_store(
+        session,
+        MissedLead.store_code,
+        codes,
+        MissedLead.pickup_date.in_((report_date, t_minus_one)),
+        group_by=MissedLead.pickup_date,
+    )
+    undelivered_counts = await _count_by_store(
+        session, UndeliveredOrder.store_code, codes, UndeliveredOrder.order_date == report_date
+    )
+    repeat_counts = await _count_by_store(session, RepeatCustomer.store_code, codes)
+    undelivered_rows = await _fetch_undelivered_order_rows(session, codes, report_date)
+    missed_leads_rows = await _fetch_missed_leads_rows(session, codes, report_date)
+
+    data: Dict[str, _StoreReportData] = {}
+    for code in codes:
+        store_undelivered_rows, undelivered_total_amount = undelivered_rows.get(code, ([], 0.0))
+        data[code] = _StoreReportData(
+            summary_row=summaries[code],
+            comparison_row=comparisons.get(code),
+            missed_count=missed_counts.get((code, report_date), 0),
+            previous_missed_count=missed_counts.get((code, t_minus_one), 0),
+            undelivered_count=undelivered_counts.get(code, 0),
+            repeat_base_count=repeat_counts.get(code, 0),
+            undelivered_rows=store_undelivered_rows,
+            undelivered_total_amount=undelivered_total_amount,
+            missed_leads_rows=missed_leads_rows.get(code, []),
+        )
+    return data
+
+
+async def build_store_contexts(
+    store_codes: Sequence[str],
     report_date: date,
     run_id: str,
     *,
     database_url: str,
     logo_src: str | None = None,
-) -> Dict[str, Any]:
+) -> Dict[str, Dict[str, Any]]:
+    """Build report contexts for ``store_codes`` keyed by normalized store code.
+
+    Stores without a dashboard summary for ``report_date`` are omitted, so the
+    caller can report them the same way ``build_store_context`` raises
+    ``StoreReportDataNotFound``.
+    """
+
     if not database_url:
         raise ValueError("database_url is required to build store report context")
 
-    normalized_code = store_code.strip().upper()
-
-    t_minus_one = report_date - timedelta(days=1)
+    normalized_codes = list(dict.fromkeys(code.strip().upper() for code in store_codes))
+    if not normalized_codes:
+        return {}
 
     async with session_scope(database_url) as session:
-        summary_row = await _fetch_dashboard_summary(session, normalized_code, report_date)
-        if not summary_row:
-            raise StoreReportDataNotFound(
-                f"no dashboard summary for store {normalized_code} on {report_date.isoformat()}"
-            )
-        comparison_row = await _fetch_dashboard_summary(
-            session, normalized_code, report_date, comparison=True
-        )
+        data = await _fetch_store_report_data(session, normalized_codes, report_date)
 
-        missed_stmt = sa.select(sa.func.count()).select_from(MissedLead).where(
-            sa.func.upper(MissedLead.store_code) == normalized_code,
-            MissedLead.pickup_date == report_date,
+    return {
+        code: _assemble_store_context(
+            code, report_date, run_id, logo_src=logo_src, data=data[code]
         )
-        missed_count = (await session.execute(missed_stmt)).scalar_one()
+        for code in normalized_codes
+        if code in data
+    }
 
-        prev_leads_stmt = sa.select(sa.func.count()).select_from(MissedLead).where(
-            sa.func.upper(MissedLead.store_code) == normalized_code,
-            MissedLead.pickup_date == t_minus_one,
-        )
-        previous_missed_count = (await session.execute(prev_leads_stmt)).scalar_one()
 
-        undelivered_stmt = sa.select(sa.func.count()).select_from(UndeliveredOrder).where(
-            sa.func.upper(UndeliveredOrder.store_code) == normalized_code,
-            UndeliveredOrder.order_date == report_date,
+async def build_store_context(
+    store_code: str,
+    report_date: date,
+    run_id: str,
+    *,
+    database_url: str,
+    logo_src: str | None = None,
+) -> Dict[str, Any]:
+    normalized_code = store_code.strip().upper()
+    contexts = await build_store_contexts(
+        [normalized_code],
+        report_date,
+        run_id,
+        database_url=database_url,
+        logo_src=logo_src,
+    )
+    if normalized_code not in contexts:
+        raise StoreReportDataNotFound(
+            f"no dashboard summary for store {normalized_code} on {report_date.isoformat()}"
         )
-        undelivered_count_for_snapshot = (await session.execute(undelivered_stmt)).scalar_one()
+    return contexts[normalized_code]
 
-        repeat_stmt = sa.select(sa.func.count()).select_from(RepeatCustomer).where(
-            sa.func.upper(RepeatCustomer.store_code) == normalized_code,
-        )
-        repeat_base_count = (await session.execute(repeat_stmt)).scalar_one()
 
-        undelivered_rows, undelivered_total_amount = await _fetch_undelivered_order_rows(
-            session,
-            normalized_code,
-            report_date,
-        )
-        missed_leads_rows = await _fetch_missed_leads_rows(
-            session, normalized_code, report_date
-        )
+def _assemble_store_context(
+    normalized_code: str,
+    report_date: date,
+    run_id: str,
+    *,
+    logo_src: str | None,
+    data: _StoreReportData,
+) -> Dict[str, Any]:
+    summary_row = data.summary_row
+    comparison_row = data.comparison_row
+    missed_count = data.missed_count
+    previous_missed_count = data.previous_missed_count
+    undelivered_count_for_snapshot = data.undelivered_count
+    repeat_base_count = data.repeat_base_count
+    undelivered_rows = data.undelivered_rows
+    undelivered_total_amount = data.undelivered_total_amount
+    missed_leads_rows = data.missed_leads_rows
 
     pickup_total_pct = _as_float(summary_row.get("pickup_total_conv_pct"))
     pickup_new_pct = _as_float(summary_row.get("pickup_new_conv_pct"))
@@ -622,91 +746,267 @@ async def render_store_report_pdf(
     builder.build()
 
 
+PDF_RENDERER_IDLE_SECONDS = 30.0
+PDF_RENDERER_CLOSE_TIMEOUT_SECONDS = 10.0
+
+
+class _PdfRenderService:
+    """Warm browser plus a pool of reusable pages shared by PDF renders on one event loop.
+
+    Jobs beyond ``concurrency`` queue on a semaphore. A page that fails a job is
+    discarded, and a browser found disconnected is relaunched for the next job. The
+    browser is closed once no job has arrived for ``PDF_RENDERER_IDLE_SECONDS`` or when
+    the event loop cancels the idle watcher on shutdown.
+    """
+
+    def __init__(self, *, concurrency: int) -> None:
+        self.concurrency = max(1, concurrency)
+        self._slots = asyncio.Semaphore(self.concurrency)
+        self._launch_lock = asyncio.Lock()
+        self._playwright: Any = None
+        self._browser: Browser | None = None
+        self._idle_pages: List[Page] = []
+        self._active_jobs = 0
+        self._idle_task: asyncio.Task[None] | None = None
+        self.launches = 0
+        self.jobs = 0
+
+    async def render(
+        self,
+        html_content: str,
+        output_path: Path,
+        *,
+        logger: JsonLogger,
+        timeout_seconds: float,
+        pdf_options: Mapping[str, Any] | None,
+    ) -> None:
+        async with self._slots:
+            self._active_jobs += 1
+            self._cancel_idle_close()
+            page: Page | None = None
+            try:
+                page = await self._acquire_page(logger=logger, timeout_seconds=timeout_seconds)
+                await asyncio.wait_for(
+                    page.set_content(html_content, wait_until="networkidle"),
+                    timeout=timeout_seconds,
+                )
+                options = {"path": str(output_path), "print_background": True, "format": "A4"}
+                if pdf_options:
+                    options.update(pdf_options)
+                await asyncio.wait_for(page.pdf(**options), timeout=timeout_seconds)
+                self.jobs += 1
+            except BaseException:
+                if page is not None:
+                    await self._close_quietly(page)
+                    page = None
+                raise
+            finally:
+                if page is not None:
+                    self._idle_pages.append(page)
+                self._active_jobs -= 1
+                if not self._active_jobs:
+                    self._schedule_idle_close()
+
+    async def close(self) -> None:
+        self._cancel_idle_close()
+        await self._shutdown()
+
+    async def _acquire_page(self, *, logger: JsonLogger, timeout_seconds: float) -> Page:
+        browser = await self._ensure_browser(logger=logger, timeout_seconds=timeout_seconds)
+        while self._idle_pages:
+            page = self._idle_pages.pop()
+            if not page.is_closed():
+                return page
+        return await asyncio.wait_for(browser.new_page(), timeout=timeout_seconds)
+
+    async def _ensure_browser(self, *, logger: JsonLogger, timeout_seconds: float) -> Browser:
+        from app.dashboard_downloader.json_logger import log_event
+
+        async with self._launch_lock:
+            if self._browser is not None and self._browser.is_connected():
+                return self._browser
+            if self._browser is not None:
+                log_event(
+                    logger=logger,
+                    phase="render_pdf",
+                    status="warning",
+                    message="pdf render browser disconnected; relaunching",
+                    launches=self.launches,
+                )
+                await self._shutdown()
+            try:
+                self._playwright = await async_playwright().start()
+                self._browser = await _launch_pdf_browser(
+                    self._playwright, logger=logger, timeout_seconds=timeout_seconds
+                )
+            except BaseException:
+                await self._shutdown()
+                raise
+            self.launches += 1
+            return self._browser
+
+    def _schedule_idle_close(self) -> None:
+        self._idle_task = asyncio.get_running_loop().create_task(self._close_when_idle())
+
+    def _cancel_idle_close(self) -> None:
+        task, self._idle_task = self._idle_task, None
+        if task is not None:
+            task.cancel()
+
+    async def _close_when_idle(self) -> None:
+        try:
+            await asyncio.sleep(PDF_RENDERER_IDLE_SECONDS)
+        except asyncio.CancelledError:
+            # A new job clears ``_idle_task`` before cancelling; anything else is loop shutdown.
+            if self._idle_task is not asyncio.current_task():
+                raise
+        self._idle_task = None
+        await self._shutdown()
+
+    async def _shutdown(self) -> None:
+        pages, self._idle_pages = self._idle_pages, []
+        browser, self._browser = self._browser, None
+        playwright, self._playwright = self._playwright, None
+        for page in pages:
+            await self._close_quietly(page)
+        if browser is not None:
+            await self._close_quietly(browser)
+        if playwright is not None:
+            with contextlib.suppress(Exception):
+                await asyncio.wait_for(playwright.stop(), timeout=PDF_RENDERER_CLOSE_TIMEOUT_SECONDS)
+
+    @staticmethod
+    async def _close_quietly(target: Any) -> None:
+        with contextlib.suppress(Exception):
+            await asyncio.wait_for(target.close(), timeout=PDF_RENDERER_CLOSE_TIMEOUT_SECONDS)
+
+
+_PDF_RENDER_SERVICES: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _PdfRenderService]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _pdf_render_service() -> _PdfRenderService:
+    from app.config import config
+
+    loop = asyncio.get_running_loop()
+    service = _PDF_RENDER_SERVICES.get(loop)
+    if service is None:
+        service = _PdfRenderService(concurrency=getattr(config, "pdf_render_concurrency", 1))
+        _PDF_RENDER_SERVICES[loop] = service
+    return service
+
+
+async def close_pdf_renderer() -> None:
+    """Close the warm PDF browser for the running event loop, if one was started."""
+
+    service = _PDF_RENDER_SERVICES.pop(asyncio.get_running_loop(), None)
+    if service is not None:
+        await service.close()
+
+
+_T = TypeVar("_T")
+
+
+async def run_then_close_pdf_renderer(coro: Awaitable[_T]) -> _T:
+    """Await ``coro`` and then close the warm PDF browser it may have started.
+
+    Standalone pipeline entrypoints wrap their run in this before ``asyncio.run``
+    tears the loop down; closing inside the loop's cancel sweep would also cancel
+    Playwright's transport and leave each close waiting out its timeout.
+    """
+
+    try:
+        return await coro
+    finally:
+        await close_pdf_renderer()
+
+
+async def _launch_pdf_browser(playwright: Any, *, logger: JsonLogger, timeout_seconds: float) -> Browser:
+    from app.config import config
+    from app.dashboard_downloader.json_logger import log_event
+
+    backend = config.pdf_render_backend.lower()
+    headless = config.pdf_render_headless
+    chrome_exec = config.pdf_render_chrome_executable
+
+    if backend == "local_chrome":
+        if not chrome_exec:
+            raise RuntimeError(
+                "PDF_RENDER_CHROME_EXECUTABLE must be set when PDF_RENDER_BACKEND=local_chrome"
+            )
+        executable_path = chrome_exec
+        executable_source = "config.pdf_render_chrome_executable"
+        log_event(
+            logger=logger,
+            phase="render_pdf",
+            status="info",
+            message="rendering pdf with configured browser",
+            pdf_render_backend=backend,
+            pdf_render_headless=headless,
+            chrome_exec=Path(executable_path).name,
+            executable_source=executable_source,
+        )
+        return await asyncio.wait_for(
+            playwright.chromium.launch(
+                executable_path=executable_path,
+                headless=headless,
+            ),
+            timeout=timeout_seconds,
+        )
+    executable_path = playwright.chromium.executable_path
+    executable_source = "playwright.chromium.executable_path"
+    log_event(
+        logger=logger,
+        phase="render_pdf",
+        status="info",
+        message="rendering pdf with configured browser",
+        pdf_render_backend=backend,
+        pdf_render_headless=headless,
+        chrome_exec=Path(executable_path).name if executable_path else None,
+        executable_source=executable_source,
+    )
+    return await asyncio.wait_for(
+        playwright.chromium.launch(headless=headless),
+        timeout=timeout_seconds,
+    )
+
+
 async def render_pdf_with_configured_browser(
     html_content: str,
     output_path: str | Path,
     *,
     logger: JsonLogger,
     pdf_options: Mapping[str, Any] | None = None,
-) -> None:
+) -> Path:
+    """Render ``html_content`` to ``output_path`` on the shared warm PDF browser."""
+
     from app.config import config
     from app.dashboard_downloader.json_logger import log_event
 
-    backend = config.pdf_render_backend.lower()
-    headless = config.pdf_render_headless
-    chrome_exec = config.pdf_render_chrome_executable
     timeout_seconds = config.pdf_render_timeout_seconds
-
-    async with async_playwright() as p:
-        browser = None
-        try:
-            if backend == "local_chrome":
-                if not chrome_exec:
-                    raise RuntimeError(
-                        "PDF_RENDER_CHROME_EXECUTABLE must be set when PDF_RENDER_BACKEND=local_chrome"
-                    )
-                executable_path = chrome_exec
-                executable_source = "config.pdf_render_chrome_executable"
-                log_event(
-                    logger=logger,
-                    phase="render_pdf",
-                    status="info",
-                    message="rendering pdf with configured browser",
-                    pdf_render_backend=backend,
-                    pdf_render_headless=headless,
-                    chrome_exec=Path(executable_path).name,
-                    executable_source=executable_source,
-                )
-                browser = await asyncio.wait_for(
-                    p.chromium.launch(
-                        executable_path=executable_path,
-                        headless=headless,
-                    ),
-                    timeout=timeout_seconds,
-                )
-            else:
-                executable_path = p.chromium.executable_path
-                executable_source = "playwright.chromium.executable_path"
-                log_event(
-                    logger=logger,
-                    phase="render_pdf",
-                    status="info",
-                    message="rendering pdf with configured browser",
-                    pdf_render_backend=backend,
-                    pdf_render_headless=headless,
-                    chrome_exec=Path(executable_path).name if executable_path else None,
-                    executable_source=executable_source,
-                )
-                browser = await asyncio.wait_for(
-                    p.chromium.launch(headless=headless),
-                    timeout=timeout_seconds,
-                )
-
-            page = await asyncio.wait_for(browser.new_page(), timeout=timeout_seconds)
-            await asyncio.wait_for(
-                page.set_content(html_content, wait_until="networkidle"),
-                timeout=timeout_seconds,
-            )
-            options = {"path": str(output_path), "print_background": True, "format": "A4"}
-            if pdf_options:
-                options.update(pdf_options)
-            await asyncio.wait_for(page.pdf(**options), timeout=timeout_seconds)
-        except asyncio.TimeoutError as exc:
-            log_event(
-                logger=logger,
-                phase="render_pdf",
-                status="error",
-                message="pdf rendering timed out",
-                extras={
-                    "error": str(exc),
-                    "timeout_seconds": timeout_seconds,
-                    "pdf_render_backend": backend,
-                },
-            )
-            raise
-        finally:
-            if browser is not None:
-                await browser.close()
+    try:
+        await _pdf_render_service().render(
+            html_content,
+            Path(output_path),
+            logger=logger,
+            timeout_seconds=timeout_seconds,
+            pdf_options=pdf_options,
+        )
+    except asyncio.TimeoutError as exc:
+        log_event(
+            logger=logger,
+            phase="render_pdf",
+            status="error",
+            message="pdf rendering timed out",
+            extras={
+                "error": str(exc),
+                "timeout_seconds": timeout_seconds,
+                "pdf_render_backend": config.pdf_render_backend.lower(),
+            },
+        )
+        raise
+    return Path(output_path)
 
 
 class StoreReportPdfBuilder:
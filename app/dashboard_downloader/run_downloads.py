@@ -8,7 +8,8 @@ import random
 from pathlib import Path
 import re
 import subprocess
-from typing import Any, Awaitable, Dict, Iterable, List
+import time
+from typing import Any, Awaitable, BinaryIO, Dict, Iterable, Iterator, List
 from datetime import datetime
 from urllib.parse import urlparse
 import contextlib
@@ -26,7 +27,6 @@ from playwright.async_api import (
 from playwright._impl._errors import TimeoutError as PlaywrightTimeoutError
 from sqlalchemy import text
 
-from app.common.ingest.service import _looks_like_html
 from app.common.db import session_scope
 from app.config import config
 
@@ -56,6 +56,8 @@ DOWNLOAD_RETRY_MAX_ATTEMPTS = 3
 DOWNLOAD_RETRY_BASE_DELAY_S = 0.5
 DOWNLOAD_RETRY_MAX_DELAY_S = 5.0
 DOWNLOAD_RETRY_JITTER_S = 0.2
+MERGE_READ_BUFFER_BYTES = 1 << 20
+NO_DATA_SENTINEL = b"no data available to export"
 
 
 class LoginBootstrapError(RuntimeError):
@@ -84,6 +86,22 @@ class NavigationRetryExhaustedError(TimeoutError):
         self.retry = retry
 
 
+class _RequestRateLimiter:
+    """Space out dashboard requests issued by concurrent store workers."""
+
+    def __init__(self, min_interval_seconds: float) -> None:
+        self.min_interval_seconds = max(min_interval_seconds, 0.0)
+        self._lock = asyncio.Lock()
+        self._next_allowed_at = 0.0
+
+    async def wait_turn(self) -> None:
+        async with self._lock:
+            delay = self._next_allowed_at - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._next_allowed_at = time.monotonic() + self.min_interval_seconds
+
+
 def _chrome_process_running_for_profile(profile_dir: Path) -> bool:
     profile_dir = profile_dir.expanduser().resolve()
     try:
@@ -967,6 +985,7 @@ async def _download_one_spec(
     logger: JsonLogger,
     nav_timeout_ms: int,
     settings: PipelineSettings,
+    rate_limiter: _RequestRateLimiter | None = None,
 ) -> tuple[Path | None, Page]:
     sc = store_cfg["store_code"]
     url = _render(spec["url_template"], sc)
@@ -1034,6 +1053,8 @@ async def _download_one_spec(
         while True:
             attempt = retry_attempts + 1
             try:
+                if rate_limiter is not None:
+                    await rate_limiter.wait_turn()
                 response = await request.get(url)
                 break
             except Exception as exc:
@@ -1152,6 +1173,7 @@ async def _download_specs_for_store(
     merged_buckets: Dict[str, List[Path]],
     download_counts: Dict[str, Dict[str, Dict[str, object]]],
     settings: PipelineSettings,
+    rate_limiter: _RequestRateLimiter | None = None,
 ) -> None:
     sc = store_cfg["store_code"]
 
@@ -1166,12 +1188,14 @@ async def _download_specs_for_store(
             logger=logger,
             nav_timeout_ms=nav_timeout_ms,
             settings=settings,
+            rate_limiter=rate_limiter,
         )
         if saved and spec.get("merge_bucket"):
             bucket = spec["merge_bucket"]
             merged_buckets.setdefault(bucket, []).append(saved)
+            # Rows are counted by the merge pass in _finalize_merges.
             download_counts.setdefault(bucket, {})[sc] = {
-                "rows": _count_rows(saved),
+                "rows": 0,
                 "path": str(saved),
             }
 
@@ -1186,6 +1210,8 @@ def _finalize_merges(
         if not files:
             continue
 
+        bucket_downloads = download_counts.setdefault(bucket, {})
+
         if bucket not in MERGED_NAMES:
             log_event(
                 logger=logger,
@@ -1194,19 +1220,22 @@ def _finalize_merges(
                 message="no merged filename configured; skipping bucket",
                 status="warning",
             )
+            _record_file_rows(
+                bucket_downloads, {str(path): _count_rows(path) for path in files}
+            )
             continue
 
-        merged_path = _manual_merge_bucket(bucket, files)
+        merged_path, file_rows = _merge_bucket_files(bucket, files)
         if not merged_path:
             continue
 
-        bucket_downloads = download_counts.get(bucket, {})
+        _record_file_rows(bucket_downloads, file_rows)
         download_total = sum(
             entry.get("rows", 0)
             for key, entry in bucket_downloads.items()
             if key != "__merged__" and isinstance(entry, dict)
         )
-        merged_rows = _count_rows(merged_path)
+        merged_rows = sum(file_rows.values())
         log_event(
             logger=logger,
             phase="merge",
@@ -1218,77 +1247,99 @@ def _finalize_merges(
             },
             message="merge complete",
         )
-        download_counts.setdefault(bucket, {})["__merged__"] = {
+        bucket_downloads["__merged__"] = {
             "rows": merged_rows,
             "path": str(merged_path),
         }
 
 
+def _record_file_rows(
+    bucket_downloads: Dict[str, Dict[str, object]], file_rows: Dict[str, int]
+) -> None:
+    for key, entry in bucket_downloads.items():
+        if key == "__merged__" or not isinstance(entry, dict):
+            continue
+        path = entry.get("path")
+        if path in file_rows:
+            entry["rows"] = file_rows[path]
+
+
 def _manual_merge_bucket(bucket: str, files: List[Path]) -> Path | None:
+    merged_path, _ = _merge_bucket_files(bucket, files)
+    return merged_path
+
+
+def _merge_bucket_files(bucket: str, files: List[Path]) -> tuple[Path | None, Dict[str, int]]:
+    """Merge store exports for ``bucket`` in one streaming pass.
+
+    Returns the merged path and the data-row count of every input file (keyed by
+    ``str(path)``); the merged file holds exactly the sum of those rows.
+    """
+
     if not files:
-        return None
+        return None, {}
 
     merged_name = MERGED_NAMES.get(bucket)
     if not merged_name:
-        return None
+        return None, {}
 
     merged_path = DATA_DIR / merged_name
+    file_rows: Dict[str, int] = {}
 
     with merged_path.open("wb") as out_f:
-        first = True
+        header_written = False
         for file_path in files:
             if not file_path.exists():
+                file_rows[str(file_path)] = 0
                 continue
 
-            data = _prepare_csv_bytes_for_merge(file_path.read_bytes())
-            if data is None:
-                continue
-
-            if first:
-                out_f.write(data)
-                first = False
-                continue
-
-            try:
-                header_end = data.index(b"\n")
-            except ValueError:
-                continue
-
-            out_f.write(data[header_end + 1 :])
+            rows, has_header = _stream_csv_export(
+                file_path, out_f, write_header=not header_written
+            )
+            file_rows[str(file_path)] = rows
+            header_written = header_written or has_header
 
-    return merged_path
+    return merged_path, file_rows
 
 
-def _prepare_csv_bytes_for_merge(data: bytes) -> bytes | None:
-    """Normalize download content before merge.
+def _stream_csv_export(
+    csv_path: Path, out_f: BinaryIO | None = None, *, write_header: bool = True
+) -> tuple[int, bool]:
+    """Count the data rows of a dashboard export, optionally appending it to ``out_f``.
 
-    Some dashboard exports return a single-line sentinel (`No data available to export`)
-    instead of a CSV header. If that payload is merged as the first file, downstream
-    parsing treats it as the header and all subsequent rows fail coercion.
+    The file is read once through a buffered binary handle, so memory stays flat
+    regardless of export size. Blank leading lines and a `No data available to
+    export` sentinel are dropped; HTML payloads count as zero rows and are not
+    copied. Returns ``(data_rows, has_header)``.
     """
 
-    if not data or not data.strip():
-        return None
+    with csv_path.open("rb", buffering=MERGE_READ_BUFFER_BYTES) as handle:
+        prefix = handle.peek(512)[:512].lower()
+        if b"<html" in prefix or b"<!doctype html" in prefix:
+            return 0, False
 
-    try:
-        text = data.decode("utf-8", errors="ignore")
-    except Exception:
-        return data
+        lines: Iterator[bytes] = iter(handle)
+        header = next((line for line in lines if line.strip()), None)
+        if header is not None and NO_DATA_SENTINEL in header.strip().lower():
+            header = next((line for line in lines if line.strip()), None)
+        if header is None:
+            return 0, False
 
-    lines = text.splitlines(keepends=True)
-    if not lines:
-        return None
+        if out_f is not None and write_header:
+            out_f.write(header if header.endswith(b"\n") else header + b"\n")
 
-    first_line = lines[0].strip().lower()
-    if "no data available to export" not in first_line:
-        return data
+        def _copy_lines() -> Iterator[str]:
+            last = b"\n"
+            for line in lines:
+                if out_f is not None:
+                    out_f.write(line)
+                last = line
+                yield line.decode("utf-8", errors="ignore")
+            # Keep the next file's rows off this file's unterminated last line.
+            if out_f is not None and not last.endswith(b"\n"):
+                out_f.write(b"\n")
 
-    # Pure sentinel payload (no header / rows).
-    if len(lines) == 1:
-        return None
-
-    # Defensive: if a file contains sentinel preamble then CSV content, drop only preamble.
-    return "".join(lines[1:]).encode("utf-8")
+        return sum(1 for _ in csv.reader(_copy_lines())), True
 
 
 async def _bootstrap_session_via_home_and_tracker(
@@ -1586,6 +1637,7 @@ async def _switch_to_store_dashboard_and_download(
     settings: PipelineSettings,
     merged_buckets: Dict[str, List[Path]],
     download_counts: Dict[str, Dict[str, Dict[str, object]]],
+    rate_limiter: _RequestRateLimiter | None = None,
 ) -> Page:
     store_code = store_cfg.get("store_code")
 
@@ -1615,6 +1667,8 @@ async def _switch_to_store_dashboard_and_download(
         extras={"target_url": target_url, "timeout_ms": nav_timeout_ms},
     )
 
+    if rate_limiter is not None:
+        await rate_limiter.wait_turn()
     page, response = await navigate_with_retry(
         page,
         target_url,
@@ -1662,6 +1716,7 @@ async def _switch_to_store_dashboard_and_download(
             logger=logger,
             nav_timeout_ms=nav_timeout_ms,
             settings=settings,
+            rate_limiter=rate_limiter,
         )
         if not saved:
             continue
@@ -1669,8 +1724,9 @@ async def _switch_to_store_dashboard_and_download(
         bucket = spec.get("merge_bucket")
         if bucket:
             merged_buckets.setdefault(bucket, []).append(saved)
+            # Rows are counted by the merge pass in _finalize_merges.
             download_counts.setdefault(bucket, {})[store_code] = {
-                "rows": _count_rows(saved),
+                "rows": 0,
                 "path": str(saved),
             }
 
@@ -2333,16 +2389,8 @@ def _count_rows(csv_path: Path) -> int:
     if not csv_path.exists():
         return 0
 
-    if _looks_like_html(csv_path):
-        return 0
-
-    with csv_path.open("r", newline="", encoding="utf-8", errors="ignore") as handle:
-        reader = csv.reader(handle)
-        try:
-            next(reader)
-        except StopIteration:
-            return 0
-        return sum(1 for _ in reader)
+    rows, _ = _stream_csv_export(csv_path)
+    return rows
 
 def filter_merged_missed_leads(input_path: Path, output_path: Path) -> None:
     """
@@ -2409,6 +2457,109 @@ def filter_merged_missed_leads(input_path: Path, output_path: Path) -> None:
 
     print(f"[filter] {output_path.name} — kept {len(rows_out)} rows after filtering.")
 
+async def _run_store_download_worker(
+    page: Page,
+    store_queue: asyncio.Queue[tuple[int, Dict[str, Any]]],
+    *,
+    logger: JsonLogger,
+    nav_timeout_ms: int,
+    settings: PipelineSettings,
+    download_counts: Dict[str, Dict[str, Dict[str, object]]],
+    store_results: Dict[
+        int, tuple[Dict[str, List[Path]], Dict[str, Dict[str, Dict[str, object]]]]
+    ],
+    rate_limiter: _RequestRateLimiter | None = None,
+) -> Page:
+    """Download stores from ``store_queue`` on one tab until the queue is empty.
+
+    Per-store downloads are recorded in ``store_results`` keyed by the store's
+    position; skip counters go to the shared ``download_counts["_meta"]``.
+    Rate-limit backoff only pauses this worker.
+    """
+
+    while True:
+        try:
+            position, cfg = store_queue.get_nowait()
+        except asyncio.QueueEmpty:
+            return page
+
+        sc = cfg.get("store_code")
+        store_buckets: Dict[str, List[Path]] = {}
+        store_counts: Dict[str, Dict[str, Dict[str, object]]] = {}
+        store_results[position] = (store_buckets, store_counts)
+        try:
+            page = await asyncio.wait_for(
+                _switch_to_store_dashboard_and_download(
+                    page,
+                    cfg,
+                    logger=logger,
+                    nav_timeout_ms=nav_timeout_ms,
+                    settings=settings,
+                    merged_buckets=store_buckets,
+                    download_counts=store_counts,
+                    rate_limiter=rate_limiter,
+                ),
+                timeout=config.etl_step_timeout_seconds,
+            )
+        except NavigationTooManyRequestsError as exc:
+            backoff_seconds = 3
+            rate_limit_meta = download_counts.setdefault("_meta", {})
+            rate_limit_meta["rate_limited_skips"] = (
+                int(rate_limit_meta.get("rate_limited_skips", 0)) + 1
+            )
+            log_event(
+                logger=logger,
+                phase="download",
+                status="warning",
+                store_code=sc,
+                bucket=None,
+                message="dashboard navigation rate limited; skipping store",
+                extras={
+                    "error": str(exc),
+                    "backoff_seconds": backoff_seconds,
+                },
+            )
+            await asyncio.sleep(backoff_seconds)
+            continue
+        except asyncio.TimeoutError as exc:
+            timeout_meta = download_counts.setdefault("_meta", {})
+            timeout_meta["timeout_skips"] = (
+                int(timeout_meta.get("timeout_skips", 0)) + 1
+            )
+            log_event(
+                logger=logger,
+                phase="download",
+                status="error",
+                store_code=sc,
+                bucket=None,
+                message="dashboard navigation timed out; skipping store",
+                extras={
+                    "error": str(exc),
+                    "timeout_seconds": config.etl_step_timeout_seconds,
+                },
+            )
+            continue
+        except SkipStoreDashboardError as exc:
+            log_event(
+                logger=logger,
+                phase="download",
+                status="warning",
+                store_code=sc,
+                bucket=None,
+                message="skipping store due to dashboard unavailability",
+                extras={"reason": str(exc)},
+            )
+            continue
+
+        log_event(
+            logger=logger,
+            phase="download",
+            message="store download completed",
+            store_code=sc,
+            bucket=None,
+        )
+
+
 async def run_all_stores_single_session(
     *,
     settings: PipelineSettings,
@@ -2555,78 +2706,62 @@ async def run_all_stores_single_session(
                 _finalize_merges(merged_buckets, download_counts, logger=logger)
                 return {}
 
-            for _, cfg in store_items:
-                sc = cfg.get("store_code")
-                try:
-                    session_page = await asyncio.wait_for(
-                        _switch_to_store_dashboard_and_download(
-                            session_page,
-                            cfg,
-                            logger=logger,
-                            nav_timeout_ms=nav_timeout_ms,
-                            settings=settings,
-                            merged_buckets=merged_buckets,
-                            download_counts=download_counts,
-                        ),
-                        timeout=config.etl_step_timeout_seconds,
-                    )
-                except NavigationTooManyRequestsError as exc:
-                    backoff_seconds = 3
-                    rate_limit_meta = download_counts.setdefault("_meta", {})
-                    rate_limit_meta["rate_limited_skips"] = (
-                        int(rate_limit_meta.get("rate_limited_skips", 0)) + 1
-                    )
-                    log_event(
-                        logger=logger,
-                        phase="download",
-                        status="warning",
-                        store_code=sc,
-                        bucket=None,
-                        message="dashboard navigation rate limited; skipping store",
-                        extras={
-                            "error": str(exc),
-                            "backoff_seconds": backoff_seconds,
-                        },
-                    )
-                    await asyncio.sleep(backoff_seconds)
-                    continue
-                except asyncio.TimeoutError as exc:
-                    timeout_meta = download_counts.setdefault("_meta", {})
-                    timeout_meta["timeout_skips"] = (
-                        int(timeout_meta.get("timeout_skips", 0)) + 1
-                    )
-                    log_event(
-                        logger=logger,
-                        phase="download",
-                        status="error",
-                        store_code=sc,
-                        bucket=None,
-                        message="dashboard navigation timed out; skipping store",
-                        extras={
-                            "error": str(exc),
-                            "timeout_seconds": config.etl_step_timeout_seconds,
-                        },
-                    )
-                    continue
-                except SkipStoreDashboardError as exc:
-                    log_event(
+            worker_count = max(1, min(config.dashboard_download_concurrency, len(store_items)))
+            rate_limiter = _RequestRateLimiter(
+                config.dashboard_download_min_request_interval_seconds
+            )
+            store_queue: asyncio.Queue[tuple[int, Dict[str, Any]]] = asyncio.Queue()
+            for position, (_, cfg) in enumerate(store_items):
+                store_queue.put_nowait((position, cfg))
+            store_results: Dict[
+                int, tuple[Dict[str, List[Path]], Dict[str, Dict[str, Dict[str, object]]]]
+            ] = {}
+            worker_pages: List[Page] = [session_page]
+            for _ in range(worker_count - 1):
+                worker_pages.append(await ctx.new_page())
+            log_event(
+                logger=logger,
+                phase="download",
+                status="info",
+                store_code=None,
+                bucket=None,
+                message="starting store download workers",
+                extras={
+                    "worker_count": worker_count,
+                    "min_request_interval_seconds": rate_limiter.min_interval_seconds,
+                },
+            )
+
+            worker_tasks = [
+                asyncio.create_task(
+                    _run_store_download_worker(
+                        worker_page,
+                        store_queue,
                         logger=logger,
-                        phase="download",
-                        status="warning",
-                        store_code=sc,
-                        bucket=None,
-                        message="skipping store due to dashboard unavailability",
-                        extras={"reason": str(exc)},
+                        nav_timeout_ms=nav_timeout_ms,
+                        settings=settings,
+                        download_counts=download_counts,
+                        store_results=store_results,
+                        rate_limiter=rate_limiter,
                     )
-                    continue
-
-                log_event(
-                    logger=logger,
-                    phase="download",
-                    message="store download completed",
-                    store_code=sc,
-                    bucket=None,
                 )
+                for worker_page in worker_pages
+            ]
+            try:
+                await asyncio.gather(*worker_tasks)
+            except BaseException:
+                for task in worker_tasks:
+                    task.cancel()
+                await asyncio.gather(*worker_tasks, return_exceptions=True)
+                raise
+            finally:
+                # Merge in store order so merged CSVs do not depend on worker timing.
+                for position in sorted(store_results):
+                    store_buckets, store_counts = store_results[position]
+                    for bucket, files in store_buckets.items():
+                        merged_buckets.setdefault(bucket, []).extend(files)
+                    for bucket, entries in store_counts.items():
+                        download_counts.setdefault(bucket, {}).update(entries)
         except asyncio.TimeoutError as exc:
             failure_extras = {
                 "error": str(exc),
@@ -5,7 +5,7 @@ import asyncio
 import re
 from datetime import date, datetime, timedelta, timezone
 from pathlib import Path
-from typing import Iterable, List, Sequence, Tuple
+from typing import Any, Dict, Iterable, List, Sequence, Tuple
 
 import sqlalchemy as sa
 
@@ -15,8 +15,7 @@ from app.common.db import session_scope
 from app.dashboard_downloader.db_tables import documents
 from app.dashboard_downloader.json_logger import JsonLogger, get_logger, log_event, new_run_id
 from app.dashboard_downloader.report_generator import (
-    StoreReportDataNotFound,
-    build_store_context,
+    build_store_contexts,
     render_store_report_pdf,
 )
 from app.dashboard_downloader.run_summary import PIPELINE_NAME, RunAggregator
@@ -197,7 +196,6 @@ async def _generate_reports(
     reports_root: Path,
     aggregator: RunAggregator | None = None,
 ) -> List[Tuple[str, Path]]:
-    generated: List[Tuple[str, Path]] = []
     for code in store_codes:
         log_event(
             logger=logger,
@@ -207,24 +205,15 @@ async def _generate_reports(
             store_code=code,
             extras={"report_date": report_date.isoformat(), "run_id": run_id},
         )
-        try:
-            context = await build_store_context(
-                store_code=code,
-                report_date=report_date,
-                run_id=run_id,
-                database_url=database_url,
-            )
-        except StoreReportDataNotFound as exc:
-            log_event(
-                logger=logger,
-                phase="report",
-                status="warning",
-                message="no data available for report date",
-                store_code=code,
-                extras={"report_date": report_date.isoformat(), "error": str(exc)},
-            )
-            continue
-        except Exception as exc:  # pragma: no cover - safeguard
+    try:
+        contexts = await build_store_contexts(
+            store_codes,
+            report_date,
+            run_id,
+            database_url=database_url,
+        )
+    except Exception as exc:  # pragma: no cover - safeguard
+        for code in store_codes:
             log_event(
                 logger=logger,
                 phase="report",
@@ -235,91 +224,136 @@ async def _generate_reports(
             )
             if aggregator:
                 aggregator.register_pdf_failure(code, "context failure")
-            continue
+        return []
 
-        store_name = context.get("store_name") or code
-        safe_store_name = re.sub(r"\s+", "", store_name)
-        if not safe_store_name:
-            safe_store_name = code
-        summary_output_path = (
-            reports_root / f"{report_date.year}" / f"{safe_store_name}_{report_date:%m-%d}.pdf"
-        )
-        try:
-            await render_store_report_pdf(
-                store_context=context,
-                output_path=summary_output_path,
-                template_path=template_file,
-            )
-        except Exception as exc:  # pragma: no cover - pdf failures
+    # Contexts come from one batched load. The ReportLab build is synchronous, so
+    # stores render one after another on the event loop thread.
+    generated: List[Tuple[str, Path]] = []
+    for code in store_codes:
+        context = contexts.get(code.strip().upper())
+        if context is None:
             log_event(
                 logger=logger,
                 phase="report",
-                status="error",
-                message="failed to render pdf",
+                status="warning",
+                message="no data available for report date",
                 store_code=code,
                 extras={
                     "report_date": report_date.isoformat(),
-                    "error": str(exc),
-                    "output_path": str(summary_output_path),
+                    "error": f"no dashboard summary for store {code.strip().upper()} on {report_date.isoformat()}",
                 },
             )
-            await _persist_document_record(
-                database_url=database_url,
-                report_date=report_date,
-                store_code=code,
-                run_id=run_id,
-                file_name=summary_output_path.name,
-                file_path=None,
-                status="error",
-                error_message=str(exc),
-                logger=logger,
-            )
-            if aggregator:
-                aggregator.register_pdf_failure(code, "render failure")
             continue
+        result = await _generate_store_report(
+            code,
+            context,
+            report_date,
+            logger=logger,
+            run_id=run_id,
+            database_url=database_url,
+            template_file=template_file,
+            reports_root=reports_root,
+            aggregator=aggregator,
+        )
+        if result is not None:
+            generated.append(result)
+    return generated
+
 
-        generated.append((code, summary_output_path))
+async def _generate_store_report(
+    code: str,
+    context: Dict[str, Any],
+    report_date: date,
+    *,
+    logger: JsonLogger,
+    run_id: str,
+    database_url: str,
+    template_file: Path,
+    reports_root: Path,
+    aggregator: RunAggregator | None,
+) -> Tuple[str, Path] | None:
+    store_name = context.get("store_name") or code
+    safe_store_name = re.sub(r"\s+", "", store_name)
+    if not safe_store_name:
+        safe_store_name = code
+    summary_output_path = (
+        reports_root / f"{report_date.year}" / f"{safe_store_name}_{report_date:%m-%d}.pdf"
+    )
+    try:
+        await render_store_report_pdf(
+            store_context=context,
+            output_path=summary_output_path,
+            template_path=template_file,
+        )
+    except Exception as exc:  # pragma: no cover - pdf failures
         log_event(
             logger=logger,
             phase="report",
-            status="ok",
-            message="report pdf generated",
+            status="error",
+            message="failed to render pdf",
             store_code=code,
             extras={
                 "report_date": report_date.isoformat(),
+                "error": str(exc),
                 "output_path": str(summary_output_path),
             },
         )
+        await _persist_document_record(
+            database_url=database_url,
+            report_date=report_date,
+            store_code=code,
+            run_id=run_id,
+            file_name=summary_output_path.name,
+            file_path=None,
+            status="error",
+            error_message=str(exc),
+            logger=logger,
+        )
         if aggregator:
-            aggregator.record_pdf_file(code, str(summary_output_path))
+            aggregator.register_pdf_failure(code, "render failure")
+        return None
 
-        try:
-            await _persist_document_record(
-                database_url=database_url,
-                report_date=report_date,
-                store_code=code,
-                run_id=run_id,
-                file_name=summary_output_path.name,
-                file_path=summary_output_path,
-                status="ok",
-                error_message=None,
-                logger=logger,
-            )
-        except Exception as exc:  # pragma: no cover - defensive
-            log_event(
-                logger=logger,
-                phase="report",
-                status="warning",
-                message="unexpected error while recording document",
-                store_code=code,
-                extras={"error": str(exc), "file_name": summary_output_path.name},
-            )
+    log_event(
+        logger=logger,
+        phase="report",
+        status="ok",
+        message="report pdf generated",
+        store_code=code,
+        extras={
+            "report_date": report_date.isoformat(),
+            "output_path": str(summary_output_path),
+        },
+    )
+    if aggregator:
+        aggregator.record_pdf_file(code, str(summary_output_path))
 
-        if aggregator:
-            aggregator.register_pdf_success(
-                code, str(summary_output_path), record_file=False
-            )
-    return generated
+    try:
+        await _persist_document_record(
+            database_url=database_url,
+            report_date=report_date,
+            store_code=code,
+            run_id=run_id,
+            file_name=summary_output_path.name,
+            file_path=summary_output_path,
+            status="ok",
+            error_message=None,
+            logger=logger,
+        )
+    except Exception as exc:  # pragma: no cover - defensive
+        log_event(
+            logger=logger,
+            phase="report",
+            status="warning",
+            message="unexpected error while recording document",
+            store_code=code,
+            extras={"error": str(exc), "file_name": summary_output_path.name},
+        )
+
+    if aggregator:
+        aggregator.register_pdf_success(
+            code, str(summary_output_path), record_file=False
+        )
+    return code, summary_output_path
 
 
 async def run_store_reports_for_date(
@@ -38,6 +38,7 @@ class PipelineSettings:
     merge_bucket_specs: Dict[str, dict] = field(default_factory=lambda: MERGE_BUCKET_DB_SPECS)
     dry_run: bool = False
     ingest_batch_size: int = field(default_factory=lambda: config.ingest_batch_size)
+    ingest_bulk_load: bool = field(default_factory=lambda: config.ingest_bulk_load)
     database_url: Optional[str] = field(default_factory=lambda: config.database_url)
     global_username: str = field(default_factory=_default_global_username)
     global_password: str = field(default_factory=_default_global_password)
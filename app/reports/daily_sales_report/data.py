@@ -31,6 +31,7 @@ from app.reports.shared.short_payments import (
     ShortPaymentRow,
     fetch_missing_payment_rows_without_proof,
     fetch_short_payment_rows,
+    payment_reconciliation_cache,
 )
 
 logger = logging.getLogger(__name__)
@@ -1937,25 +1938,27 @@ async def fetch_daily_sales_report(
                     hours=hours,
                 )
             )
-        short_payment_rows = await fetch_short_payment_rows(
-            session=session,
-            orders=orders,
-            payment_collections=payment_collections,
-            sales=sales,
-            start_datetime=ranges["start_day"],
-            end_datetime=ranges["next_day"],
-        )
-        missing_payment_rows = await fetch_missing_payment_rows_without_proof(
-            session=session,
-            orders=orders,
-            payment_collections=payment_collections,
-            sales=sales,
-            # Kept for call compatibility; shared loader keeps this bucket
-            # current/open across all order dates.
-            start_datetime=ranges["start_day"],
-            end_datetime=ranges["next_day"],
-            row_factory=MissingPaymentRow,
-        )
+        # Both buckets read the same open-ended reconciliation; build it once.
+        with payment_reconciliation_cache():
+            short_payment_rows = await fetch_short_payment_rows(
+                session=session,
+                orders=orders,
+                payment_collections=payment_collections,
+                sales=sales,
+                start_datetime=ranges["start_day"],
+                end_datetime=ranges["next_day"],
+            )
+            missing_payment_rows = await fetch_missing_payment_rows_without_proof(
+                session=session,
+                orders=orders,
+                payment_collections=payment_collections,
+                sales=sales,
+                # Kept for call compatibility; shared loader keeps this bucket
+                # current/open across all order dates.
+                start_datetime=ranges["start_day"],
+                end_datetime=ranges["next_day"],
+                row_factory=MissingPaymentRow,
+            )
 
     totals = _totals_row(rows)
     totals.ttd = _calculate_ttd(
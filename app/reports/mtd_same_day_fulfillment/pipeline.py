@@ -16,7 +16,11 @@ from app.dashboard_downloader.pipelines.base import (
     resolve_run_env,
     update_summary_record,
 )
-from app.dashboard_downloader.report_generator import render_pdf_with_configured_browser
+from app.dashboard_downloader.report_generator import (
+    render_pdf_with_configured_browser,
+    run_then_close_pdf_renderer,
+)
+from app.reports.shared.short_payments import payment_reconciliation_cache
 
 from .data import fetch_mtd_same_day_fulfillment
 from .render import render_html
@@ -58,7 +62,7 @@ async def _persist_document(
         await session.commit()
 
 
-async def _run(report_date: date | None, env: str | None, force: bool) -> None:
+async def _run(report_date: date | None, env: str | None, force: bool) -> str:
     run_env = resolve_run_env(env)
     run_id = new_run_id()
     logger = get_logger(run_id=run_id)
@@ -76,7 +80,7 @@ async def _run(report_date: date | None, env: str | None, force: bool) -> None:
                 status="error",
                 message="Database URL is missing; cannot generate MTD same-day fulfillment report.",
             )
-            return
+            return tracker.overall
 
         tz = get_timezone()
         resolved_date = report_date or aware_now(tz).date()
@@ -144,7 +148,7 @@ async def _run(report_date: date | None, env: str | None, force: bool) -> None:
             finished_at = datetime.now(timezone.utc)
             record = tracker.build_record(finished_at)
             await persist_summary_record(database_url, record)
-            return
+            return tracker.overall
 
         tracker.mark_phase("render_pdf", "ok")
         log_event(
@@ -232,12 +236,20 @@ async def _run(report_date: date | None, env: str | None, force: bool) -> None:
             report_date=resolved_date.isoformat(),
             status=tracker.overall or "ok",
         )
+        return tracker.overall
     finally:
         logger.close()
 
 
+async def run_report(report_date: date | None = None, env: str | None = None, force: bool = False) -> str:
+    """Run the report on the current event loop and return its overall status."""
+
+    with payment_reconciliation_cache():
+        return await _run(report_date, env, force)
+
+
 def run_pipeline(report_date: date | None = None, env: str | None = None, force: bool = False) -> None:
-    asyncio.run(_run(report_date, env, force))
+    asyncio.run(run_then_close_pdf_renderer(run_report(report_date, env, force)))
 
 
-__all__ = ["PIPELINE_NAME", "run_pipeline"]
+__all__ = ["PIPELINE_NAME", "run_pipeline", "run_report"]
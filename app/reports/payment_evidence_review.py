@@ -29,6 +29,7 @@ from app.reports.shared.payment_reconciliation import (
     build_payment_evidence_audit_rows,
     split_payment_order_numbers,
 )
+from app.reports.shared.short_payments import payment_reconciliation_cache
 
 PAYMENT_EVIDENCE_REVIEW_COLUMNS = (
     "payment_id",
@@ -454,8 +455,9 @@ async def _run_report(args: argparse.Namespace) -> int:
     )
     from app.config import config
 
-    async with session_scope(config.database_url) as session:
-        rows = await fetch_payment_evidence_review_rows(session, filters)
+    with payment_reconciliation_cache():
+        async with session_scope(config.database_url) as session:
+            rows = await fetch_payment_evidence_review_rows(session, filters)
     write_payment_evidence_review_csv(rows, sys.stdout)
     return 0
 
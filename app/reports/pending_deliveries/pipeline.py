@@ -16,7 +16,9 @@ from app.dashboard_downloader.pipelines.base import (
     resolve_run_env,
     update_summary_record,
 )
+from app.dashboard_downloader.report_generator import run_then_close_pdf_renderer
 
+from app.reports.shared.short_payments import payment_reconciliation_cache
 from app.reports.upstream import (
     DEGRADED_ORDERS_SYNC_MESSAGE,
     OrdersSyncUpstreamContext,
@@ -102,7 +104,7 @@ async def _run(
     force: bool,
     orders_sync_upstream_status: str | None = None,
     orders_sync_upstream_run_id: str | None = None,
-) -> None:
+) -> str:
     run_env = resolve_run_env(env)
     run_id = new_run_id()
     logger = get_logger(run_id=run_id)
@@ -127,7 +129,7 @@ async def _run(
                 status="error",
                 message="Database URL is missing; cannot generate pending deliveries report.",
             )
-            return
+            return tracker.overall
 
         tz = get_timezone()
         resolved_date = report_date or aware_now(tz).date()
@@ -211,7 +213,7 @@ async def _run(
             finished_at = datetime.now(timezone.utc)
             record = tracker.build_record(finished_at)
             await persist_summary_record(database_url, record)
-            return
+            return tracker.overall
         tracker.mark_phase("render_pdf", "ok")
         log_event(
             logger=logger,
@@ -354,26 +356,48 @@ async def _run(
             report_date=resolved_date.isoformat(),
             status=tracker.overall or "ok",
         )
+        return tracker.overall
     finally:
         logger.close()
 
 
-def run_pipeline(
+async def run_report(
     report_date: date | None = None,
     env: str | None = None,
     force: bool = False,
     orders_sync_upstream_status: str | None = None,
     orders_sync_upstream_run_id: str | None = None,
-) -> None:
-    asyncio.run(
-        _run(
+) -> str:
+    """Run the report on the current event loop and return its overall status."""
+
+    with payment_reconciliation_cache():
+        return await _run(
             report_date=report_date,
             env=env,
             force=force,
             orders_sync_upstream_status=orders_sync_upstream_status,
             orders_sync_upstream_run_id=orders_sync_upstream_run_id,
         )
+
+
+def run_pipeline(
+    report_date: date | None = None,
+    env: str | None = None,
+    force: bool = False,
+    orders_sync_upstream_status: str | None = None,
+    orders_sync_upstream_run_id: str | None = None,
+) -> None:
+    asyncio.run(
+        run_then_close_pdf_renderer(
+            run_report(
+                report_date=report_date,
+                env=env,
+                force=force,
+                orders_sync_upstream_status=orders_sync_upstream_status,
+                orders_sync_upstream_run_id=orders_sync_upstream_run_id,
+            )
+        )
     )
 
 
-__all__ = ["run_pipeline"]
+__all__ = ["run_pipeline", "run_report"]
@@ -0,0 +1,192 @@
+"""Run the operational report pipelines as one dependency graph in one process.
+
+Each report pipeline can still be started on its own (``python -m app report
+daily-sales`` and friends). ``run-all`` runs them inside a single event loop
+instead, so config, DB engines, the warm PDF renderer and the payment
+reconciliation cache are shared. Reports run as soon as the reports they depend
+on have finished; independent reports run concurrently.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from datetime import date
+from time import perf_counter
+from typing import Any, Awaitable, Callable, Mapping
+
+from app.dashboard_downloader.json_logger import JsonLogger, get_logger, log_event, new_run_id
+from app.dashboard_downloader.report_generator import close_pdf_renderer
+from app.reports.daily_sales_report import pipeline as daily_sales_pipeline
+from app.reports.mtd_same_day_fulfillment import pipeline as mtd_same_day_fulfillment_pipeline
+from app.reports.pending_deliveries import pipeline as pending_deliveries_pipeline
+from app.reports.shared.short_payments import payment_reconciliation_cache
+
+
+@dataclass(frozen=True)
+class ReportStep:
+    name: str
+    run: Callable[..., Awaitable[str | None]]
+    depends_on: tuple[str, ...] = ()
+    accepts_orders_sync_upstream: bool = False
+
+
+# Pending Deliveries runs after Daily Sales, matching the cron and sequential
+# scripts; MTD same-day fulfillment has no ordering constraint.
+REPORT_STEPS: tuple[ReportStep, ...] = (
+    ReportStep(
+        name="daily_sales_report",
+        run=daily_sales_pipeline.run_report,
+        accepts_orders_sync_upstream=True,
+    ),
+    ReportStep(
+        name="pending_deliveries",
+        run=pending_deliveries_pipeline.run_report,
+        depends_on=("daily_sales_report",),
+        accepts_orders_sync_upstream=True,
+    ),
+    ReportStep(
+        name="mtd_same_day_fulfillment",
+        run=mtd_same_day_fulfillment_pipeline.run_report,
+    ),
+)
+
+
+def _validate_steps(steps: tuple[ReportStep, ...]) -> None:
+    names = [step.name for step in steps]
+    if len(set(names)) != len(names):
+        raise ValueError(f"Duplicate report step names: {names}")
+    known = set(names)
+    for step in steps:
+        missing = [dependency for dependency in step.depends_on if dependency not in known]
+        if missing:
+            raise ValueError(f"Report step {step.name!r} depends on unknown steps {missing}")
+
+    # Reject cycles up front; otherwise a step would wait on itself forever.
+    visiting: set[str] = set()
+    visited: set[str] = set()
+    by_name = {step.name: step for step in steps}
+
+    def visit(name: str) -> None:
+        if name in visited:
+            return
+        if name in visiting:
+            raise ValueError(f"Report steps contain a dependency cycle through {name!r}")
+        visiting.add(name)
+        for dependency in by_name[name].depends_on:
+            visit(dependency)
+        visiting.discard(name)
+        visited.add(name)
+
+    for name in names:
+        visit(name)
+
+
+async def run_reports(
+    *,
+    report_date: date | None,
+    env: str | None,
+    force: bool = False,
+    orders_sync_upstream_status: str | None = None,
+    orders_sync_upstream_run_id: str | None = None,
+    steps: tuple[ReportStep, ...] = REPORT_STEPS,
+    logger: JsonLogger | None = None,
+) -> dict[str, str]:
+    """Run ``steps`` concurrently in dependency order and return each step's status.
+
+    A failed step is logged and reported as ``"error"``; steps depending on it
+    still run once it has finished, as the cron and sequential scripts do.
+    """
+
+    _validate_steps(steps)
+    owns_logger = logger is None
+    logger = logger or get_logger(run_id=new_run_id())
+    done: dict[str, asyncio.Event] = {step.name: asyncio.Event() for step in steps}
+    statuses: dict[str, str] = {}
+
+    async def run_step(step: ReportStep) -> None:
+        try:
+            for dependency in step.depends_on:
+                await done[dependency].wait()
+            kwargs: dict[str, Any] = {"report_date": report_date, "env": env, "force": force}
+            if step.accepts_orders_sync_upstream:
+                kwargs["orders_sync_upstream_status"] = orders_sync_upstream_status
+                kwargs["orders_sync_upstream_run_id"] = orders_sync_upstream_run_id
+            started_at = perf_counter()
+            log_event(logger=logger, phase="run_all", message="report step started", step=step.name)
+            try:
+                overall = await step.run(**kwargs)
+            except Exception as exc:
+                statuses[step.name] = "error"
+                log_event(
+                    logger=logger,
+                    phase="run_all",
+                    status="error",
+                    message="report step failed",
+                    step=step.name,
+                    error=str(exc),
+                    duration_ms=int((perf_counter() - started_at) * 1000),
+                )
+                return
+            if overall == "error":
+                # Pipelines record failures such as a missing database URL or a
+                # PDF timeout in their tracker instead of raising.
+                statuses[step.name] = "error"
+                log_event(
+                    logger=logger,
+                    phase="run_all",
+                    status="error",
+                    message="report step failed",
+                    step=step.name,
+                    overall_status=overall,
+                    duration_ms=int((perf_counter() - started_at) * 1000),
+                )
+                return
+            statuses[step.name] = "ok"
+            log_event(
+                logger=logger,
+                phase="run_all",
+                message="report step complete",
+                step=step.name,
+                duration_ms=int((perf_counter() - started_at) * 1000),
+            )
+        finally:
+            done[step.name].set()
+
+    try:
+        with payment_reconciliation_cache():
+            await asyncio.gather(*(run_step(step) for step in steps))
+        log_event(
+            logger=logger,
+            phase="run_all",
+            status="error" if "error" in statuses.values() else "ok",
+            message="report steps complete",
+            statuses=statuses,
+        )
+    finally:
+        await close_pdf_renderer()
+        if owns_logger:
+            logger.close()
+    return {step.name: statuses.get(step.name, "error") for step in steps}
+
+
+def run_all(
+    *,
+    report_date: date | None = None,
+    env: str | None = None,
+    force: bool = False,
+    orders_sync_upstream_status: str | None = None,
+    orders_sync_upstream_run_id: str | None = None,
+) -> Mapping[str, str]:
+    return asyncio.run(
+        run_reports(
+            report_date=report_date,
+            env=env,
+            force=force,
+            orders_sync_upstream_status=orders_sync_upstream_status,
+            orders_sync_upstream_run_id=orders_sync_upstream_run_id,
+        )
+    )
+
+
+__all__ = ["REPORT_STEPS", "ReportStep", "run_all", "run_reports"]
@@ -14,10 +14,12 @@ therefore never matches ``ORD10`` unless a grouped evidence row explicitly names
 from __future__ import annotations
 
 from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass, field
 from datetime import date, datetime
 from decimal import Decimal, InvalidOperation
-from typing import Any, Iterable, Mapping, Sequence
+from typing import Any, Iterable, Iterator, Mapping, Sequence
 import re
 
 VALID_PAYMENT_SOURCE_TYPES = frozenset({"google_sheet", "legacy_sales"})
@@ -234,6 +236,30 @@ class PaymentReconciliationResult:
         return tuple(group for group in self.groups if group.data_quality_exception)
 
 
+_ACTIVE_RECONCILIATION_MEMO: ContextVar[
+    dict[tuple[Any, ...], PaymentReconciliationResult] | None
+] = ContextVar("reconciliation_memo", default=None)
+
+
+@contextmanager
+def use_reconciliation_memo() -> Iterator[None]:
+    """Let ``reconcile_payments`` calls in this context reuse results for equal inputs.
+
+    Entries are keyed by the full content of the input rows, so a row changed by
+    a sync or recovery update yields a different key and is reconciled afresh.
+    Nested contexts share the outermost memo.
+    """
+
+    if _ACTIVE_RECONCILIATION_MEMO.get() is not None:
+        yield
+        return
+    token = _ACTIVE_RECONCILIATION_MEMO.set({})
+    try:
+        yield
+    finally:
+        _ACTIVE_RECONCILIATION_MEMO.reset(token)
+
+
 @dataclass(frozen=True)
 class PaymentEvidenceAuditRow:
     payment_id: Any
@@ -356,8 +382,48 @@ def reconcile_payments(
     ``amount`` from ``payment_collections``. Payment collection ``bank_row_id`` is
     intentionally ignored because proof matching is based on source type, cost
     center, exact normalized order-number tokens, and amount.
+
+    Inside ``use_reconciliation_memo()`` a call with the same rows and options
+    as an earlier call returns that call's result.
     """
 
+    valid_source_types = tuple(valid_source_types)
+    memo = _ACTIVE_RECONCILIATION_MEMO.get()
+    memo_key = (
+        _reconciliation_inputs_key(
+            order_rows=order_rows,
+            sales_rows=sales_rows,
+            payment_evidence_rows=payment_evidence_rows,
+            tolerance=tolerance,
+            valid_source_types=valid_source_types,
+        )
+        if memo is not None
+        else None
+    )
+    if memo_key is not None:
+        cached = memo.get(memo_key)
+        if cached is not None:
+            return cached
+    result = _reconcile_payments(
+        order_rows=order_rows,
+        sales_rows=sales_rows,
+        payment_evidence_rows=payment_evidence_rows,
+        tolerance=tolerance,
+        valid_source_types=valid_source_types,
+    )
+    if memo_key is not None:
+        memo[memo_key] = result
+    return result
+
+
+def _reconcile_payments(
+    *,
+    order_rows: Sequence[Any],
+    sales_rows: Sequence[Any],
+    payment_evidence_rows: Sequence[Any],
+    tolerance: Decimal | int | str,
+    valid_source_types: Iterable[str],
+) -> PaymentReconciliationResult:
     tolerance_amount = _decimal(tolerance)
     valid_sources = {str(source).strip().lower() for source in valid_source_types}
 
@@ -1055,6 +1121,44 @@ def _unique_nonempty(values: Iterable[str]) -> tuple[str, ...]:
     return tuple(sorted(unique))
 
 
+def _reconciliation_inputs_key(
+    *,
+    order_rows: Sequence[Any],
+    sales_rows: Sequence[Any],
+    payment_evidence_rows: Sequence[Any],
+    tolerance: Decimal | int | str,
+    valid_source_types: tuple[str, ...],
+) -> tuple[Any, ...] | None:
+    """Hashable key over every input row, or None when a row cannot be keyed."""
+
+    def rows_key(rows: Sequence[Any]) -> tuple[Any, ...] | None:
+        keyed = []
+        for row in rows:
+            mapping = row if isinstance(row, Mapping) else getattr(row, "_mapping", None)
+            if mapping is None:
+                return None
+            keyed.append(tuple(sorted(mapping.items())))
+        return tuple(keyed)
+
+    parts = (
+        rows_key(order_rows),
+        rows_key(sales_rows),
+        rows_key(payment_evidence_rows),
+    )
+    if any(part is None for part in parts):
+        return None
+    key = (
+        *parts,
+        _decimal(tolerance),
+        tuple(sorted({str(source).strip().lower() for source in valid_source_types})),
+    )
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
 def _field(row: Any, name: str) -> Any:
     if isinstance(row, Mapping):
         return row.get(name)
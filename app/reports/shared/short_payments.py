@@ -8,24 +8,33 @@ by ``fetch_missing_payment_rows_without_proof``.
 
 from __future__ import annotations
 
+import asyncio
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
-from typing import Any
+from typing import Any, Iterator
 
 import sqlalchemy as sa
 from sqlalchemy.exc import OperationalError
 
 from app.reports.shared.payment_reconciliation import (
+    PaymentReconciliationResult,
     ReconciledOrderPayment,
     normalize_order_number,
     reconcile_payments,
     split_payment_order_numbers,
+    use_reconciliation_memo,
 )
 
 QUALIFYING_PAYMENT_SOURCE_TYPES = ("google_sheet", "legacy_sales")
 PAYMENT_REPORT_RECOVERY_STATUS = "NONE"
 
+_RECONCILIATION_CACHE: ContextVar[
+    dict[tuple[Any, ...], asyncio.Future[PaymentReconciliationResult]] | None
+] = ContextVar("payment_reconciliation_cache", default=None)
+
 
 @dataclass
 class ShortPaymentRow:
@@ -181,6 +190,63 @@ async def fetch_missing_payment_rows_without_proof(
     return rows
 
 
+@contextmanager
+def payment_reconciliation_cache() -> Iterator[None]:
+    """Share payment reconciliations between report loaders for one report run.
+
+    Short Payments and Actual Payments Not Found both reconcile the same
+    open-ended candidate set, and a nightly chain asks for it several times.
+    Inside this scope the first loader reconciles and later loaders with the
+    same database, table shapes and date filter reuse its result. Every other
+    ``reconcile_payments`` call in the scope (pending deliveries, same-day
+    fulfillment, payment evidence review, recovery auto-clear) is memoized by
+    the content of its input rows, so it is only reused while those rows are
+    unchanged.
+
+    Each report entrypoint and ``report run-all`` open a fresh scope, so rows
+    committed by an orders/sales sync before the run are always picked up.
+    Nested scopes reuse the outermost cache.
+    """
+
+    if _RECONCILIATION_CACHE.get() is not None:
+        yield
+        return
+    token = _RECONCILIATION_CACHE.set({})
+    try:
+        with use_reconciliation_memo():
+            yield
+    finally:
+        _RECONCILIATION_CACHE.reset(token)
+
+
+def _reconciliation_cache_key(
+    *,
+    session: Any,
+    orders: Any,
+    payment_collections: Any,
+    sales: Any | None,
+    start_datetime: datetime | None,
+    end_datetime: datetime | None,
+    filter_order_date: bool,
+) -> tuple[Any, ...] | None:
+    database_url = getattr(getattr(session, "bind", None), "url", None)
+    if database_url is None:
+        return None
+
+    def table_shape(table: Any | None) -> tuple[str, tuple[str, ...]] | None:
+        if table is None:
+            return None
+        return (table.name, tuple(table.c.keys()))
+
+    return (
+        str(database_url),
+        table_shape(orders),
+        table_shape(payment_collections),
+        table_shape(sales),
+        (start_datetime, end_datetime) if filter_order_date else None,
+    )
+
+
 async def _fetch_reconciliation(
     *,
     session: Any,
@@ -190,7 +256,72 @@ async def _fetch_reconciliation(
     start_datetime: datetime | None,
     end_datetime: datetime | None,
     filter_order_date: bool = True,
-):
+) -> PaymentReconciliationResult:
+    cache = _RECONCILIATION_CACHE.get()
+    cache_key = (
+        _reconciliation_cache_key(
+            session=session,
+            orders=orders,
+            payment_collections=payment_collections,
+            sales=sales,
+            start_datetime=start_datetime,
+            end_datetime=end_datetime,
+            filter_order_date=filter_order_date,
+        )
+        if cache is not None
+        else None
+    )
+    if cache is None or cache_key is None:
+        return await _load_reconciliation(
+            session=session,
+            orders=orders,
+            payment_collections=payment_collections,
+            sales=sales,
+            start_datetime=start_datetime,
+            end_datetime=end_datetime,
+            filter_order_date=filter_order_date,
+        )
+
+    cached = cache.get(cache_key)
+    if cached is not None:
+        return await asyncio.shield(cached)
+    # Store a future before loading so concurrent loaders wait for one result.
+    future: asyncio.Future[PaymentReconciliationResult] = asyncio.get_running_loop().create_future()
+    cache[cache_key] = future
+    try:
+        result = await _load_reconciliation(
+            session=session,
+            orders=orders,
+            payment_collections=payment_collections,
+            sales=sales,
+            start_datetime=start_datetime,
+            end_datetime=end_datetime,
+            filter_order_date=filter_order_date,
+        )
+    except Exception as exc:
+        cache.pop(cache_key, None)
+        future.set_exception(exc)
+        # Waiting loaders re-raise the error; this caller raises it directly.
+        future.exception()
+        raise
+    except BaseException:
+        cache.pop(cache_key, None)
+        future.cancel()
+        raise
+    future.set_result(result)
+    return result
+
+
+async def _load_reconciliation(
+    *,
+    session: Any,
+    orders: Any,
+    payment_collections: Any,
+    sales: Any | None,
+    start_datetime: datetime | None,
+    end_datetime: datetime | None,
+    filter_order_date: bool = True,
+) -> PaymentReconciliationResult:
     order_stmt = (
         sa.select(
             orders.c.cost_center,
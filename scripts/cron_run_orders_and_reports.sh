@@ -7,8 +7,8 @@ set -euo pipefail
 # macOS Big Sur compatible, production-grade cron wrapper for:
 #   1. orders_sync_run_profiler.sh
 #   2. recovery mark-aged-pending-deliveries
-#   3. run_local_reports_daily_sales.sh
-#   4. run_local_reports_pending_deliveries.sh
+#   3. run_local_reports_all.sh (Daily Sales, Pending Deliveries and MTD
+#      Same-Day Fulfillment in one `report run-all` process)
 #
 # Features:
 # - macOS-safe lock using mkdir
@@ -29,15 +29,17 @@ set -euo pipefail
 # - Set ORDERS_SYNC_PROFILER_FAIL_ON_FAILED_STATUS=1 to make that profiler CLI step
 #   return non-zero when the final profiler overall_status is "failed". This wrapper
 #   logs orders_sync_run_profiler_rc and continues to report pipelines; failures
-#   in orders sync or either required report control the final cron exit status.
+#   in orders sync or any required report control the final cron exit status.
 # ============================================================================
 # Usage examples:
 #   # Local/manual run; reports always regenerate.
 #   ./scripts/cron_run_orders_and_reports.sh
 #
 # Daily Sales, MTD Same-Day Fulfillment, and Pending Deliveries regeneration are
-# mandatory on the cron path. The underlying report CLIs always regenerate and
-# append new summaries/documents, so this wrapper does not rely on --force.
+# mandatory on the cron path. They run as one `report run-all` process so the
+# payment reconciliation cache is shared across reports for this cycle's sync.
+# The underlying report CLIs always regenerate and append new summaries/documents,
+# so this wrapper does not rely on --force.
 #
 SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
 ENV_FILE="${ENV_FILE:-${SCRIPT_DIR}/cron.env}"
@@ -80,20 +82,14 @@ ORDERS_PREFLIGHT_RETRY_BACKOFF_MULTIPLIER="${ORDERS_PREFLIGHT_RETRY_BACKOFF_MULT
 ORDERS_PREFLIGHT_RETRY_MAX_DELAY_SECONDS="${ORDERS_PREFLIGHT_RETRY_MAX_DELAY_SECONDS:-60}"
 RECOVERY_MAX_ATTEMPTS="${RECOVERY_MAX_ATTEMPTS:-1}"
 RECOVERY_RETRY_DELAY_SECONDS="${RECOVERY_RETRY_DELAY_SECONDS:-10}"
-DAILY_MAX_ATTEMPTS="${DAILY_MAX_ATTEMPTS:-3}"
-DAILY_RETRY_DELAY_SECONDS="${DAILY_RETRY_DELAY_SECONDS:-10}"
-PENDING_MAX_ATTEMPTS="${PENDING_MAX_ATTEMPTS:-3}"
-PENDING_RETRY_DELAY_SECONDS="${PENDING_RETRY_DELAY_SECONDS:-10}"
-MTD_SAME_DAY_MAX_ATTEMPTS="${MTD_SAME_DAY_MAX_ATTEMPTS:-3}"
-MTD_SAME_DAY_RETRY_DELAY_SECONDS="${MTD_SAME_DAY_RETRY_DELAY_SECONDS:-10}"
-DAILY_RESCUE_AFTER_PENDING_SUCCESS="${DAILY_RESCUE_AFTER_PENDING_SUCCESS:-1}"
-DAILY_RESCUE_MAX_ATTEMPTS="${DAILY_RESCUE_MAX_ATTEMPTS:-1}"
-DAILY_RESCUE_RETRY_DELAY_SECONDS="${DAILY_RESCUE_RETRY_DELAY_SECONDS:-5}"
+# A run-all retry regenerates every report and repeats their notifications, so
+# the reports step runs once by default.
+REPORTS_MAX_ATTEMPTS="${REPORTS_MAX_ATTEMPTS:-1}"
+REPORTS_RETRY_DELAY_SECONDS="${REPORTS_RETRY_DELAY_SECONDS:-10}"
 ORDERS_SYNC_PROFILER_FAIL_ON_FAILED_STATUS="${ORDERS_SYNC_PROFILER_FAIL_ON_FAILED_STATUS:-1}"
 ORDERS_STEP_TIMEOUT_SECONDS="${ORDERS_STEP_TIMEOUT_SECONDS:-5400}"
 RECOVERY_STEP_TIMEOUT_SECONDS="${RECOVERY_STEP_TIMEOUT_SECONDS:-1800}"
-DAILY_SALES_STEP_TIMEOUT_SECONDS="${DAILY_SALES_STEP_TIMEOUT_SECONDS:-1800}"
-PENDING_DELIVERIES_STEP_TIMEOUT_SECONDS="${PENDING_DELIVERIES_STEP_TIMEOUT_SECONDS:-1800}"
+REPORTS_STEP_TIMEOUT_SECONDS="${REPORTS_STEP_TIMEOUT_SECONDS:-3600}"
 
 if ! [[ "${ORDERS_REPORTS_STALE_OWNER_SECONDS}" =~ ^[0-9]+$ ]]; then
   ORDERS_REPORTS_STALE_OWNER_SECONDS=7200
@@ -104,9 +100,6 @@ fi
 if ! [[ "${STALE_OWNER_KILL_WAIT_SECONDS}" =~ ^[0-9]+$ ]]; then
   STALE_OWNER_KILL_WAIT_SECONDS=5
 fi
-if ! [[ "${DAILY_RESCUE_AFTER_PENDING_SUCCESS}" =~ ^[01]$ ]]; then
-  DAILY_RESCUE_AFTER_PENDING_SUCCESS=1
-fi
 if ! [[ "${ORDERS_PREFLIGHT_MAX_ATTEMPTS}" =~ ^[1-9][0-9]*$ ]]; then
   ORDERS_PREFLIGHT_MAX_ATTEMPTS=3
 fi
@@ -119,14 +112,13 @@ fi
 if ! [[ "${ORDERS_PREFLIGHT_RETRY_MAX_DELAY_SECONDS}" =~ ^[0-9]+$ ]]; then
   ORDERS_PREFLIGHT_RETRY_MAX_DELAY_SECONDS=60
 fi
-for timeout_var_name in ORDERS_STEP_TIMEOUT_SECONDS RECOVERY_STEP_TIMEOUT_SECONDS DAILY_SALES_STEP_TIMEOUT_SECONDS PENDING_DELIVERIES_STEP_TIMEOUT_SECONDS; do
+for timeout_var_name in ORDERS_STEP_TIMEOUT_SECONDS RECOVERY_STEP_TIMEOUT_SECONDS REPORTS_STEP_TIMEOUT_SECONDS; do
   timeout_var_value="${!timeout_var_name}"
   if ! [[ "${timeout_var_value}" =~ ^[0-9]+$ ]]; then
     case "${timeout_var_name}" in
       ORDERS_STEP_TIMEOUT_SECONDS) ORDERS_STEP_TIMEOUT_SECONDS=5400 ;;
       RECOVERY_STEP_TIMEOUT_SECONDS) RECOVERY_STEP_TIMEOUT_SECONDS=1800 ;;
-      DAILY_SALES_STEP_TIMEOUT_SECONDS) DAILY_SALES_STEP_TIMEOUT_SECONDS=1800 ;;
-      PENDING_DELIVERIES_STEP_TIMEOUT_SECONDS) PENDING_DELIVERIES_STEP_TIMEOUT_SECONDS=1800 ;;
+      REPORTS_STEP_TIMEOUT_SECONDS) REPORTS_STEP_TIMEOUT_SECONDS=3600 ;;
     esac
   fi
 done
@@ -524,12 +516,9 @@ log "STALE_OWNER_TERM_WAIT_SECONDS=${STALE_OWNER_TERM_WAIT_SECONDS}"
 log "STALE_OWNER_KILL_WAIT_SECONDS=${STALE_OWNER_KILL_WAIT_SECONDS}"
 log "ORDERS_MAX_ATTEMPTS=${ORDERS_MAX_ATTEMPTS} ORDERS_RETRY_DELAY_SECONDS=${ORDERS_RETRY_DELAY_SECONDS}"
 log "ORDERS_RETRY_BACKOFF_MULTIPLIER=${ORDERS_RETRY_BACKOFF_MULTIPLIER} ORDERS_RETRY_MAX_DELAY_SECONDS=${ORDERS_RETRY_MAX_DELAY_SECONDS} ORDERS_RETRY_JITTER_SECONDS=${ORDERS_RETRY_JITTER_SECONDS}"
-log "DAILY_MAX_ATTEMPTS=${DAILY_MAX_ATTEMPTS} DAILY_RETRY_DELAY_SECONDS=${DAILY_RETRY_DELAY_SECONDS}"
-log "MTD_SAME_DAY_MAX_ATTEMPTS=${MTD_SAME_DAY_MAX_ATTEMPTS} MTD_SAME_DAY_RETRY_DELAY_SECONDS=${MTD_SAME_DAY_RETRY_DELAY_SECONDS}"
-log "PENDING_MAX_ATTEMPTS=${PENDING_MAX_ATTEMPTS} PENDING_RETRY_DELAY_SECONDS=${PENDING_RETRY_DELAY_SECONDS}"
-log "DAILY_RESCUE_AFTER_PENDING_SUCCESS=${DAILY_RESCUE_AFTER_PENDING_SUCCESS} DAILY_RESCUE_MAX_ATTEMPTS=${DAILY_RESCUE_MAX_ATTEMPTS} DAILY_RESCUE_RETRY_DELAY_SECONDS=${DAILY_RESCUE_RETRY_DELAY_SECONDS}"
+log "REPORTS_MAX_ATTEMPTS=${REPORTS_MAX_ATTEMPTS} REPORTS_RETRY_DELAY_SECONDS=${REPORTS_RETRY_DELAY_SECONDS}"
 log "ORDERS_SYNC_PROFILER_FAIL_ON_FAILED_STATUS=${ORDERS_SYNC_PROFILER_FAIL_ON_FAILED_STATUS}"
-log "ORDERS_STEP_TIMEOUT_SECONDS=${ORDERS_STEP_TIMEOUT_SECONDS} DAILY_SALES_STEP_TIMEOUT_SECONDS=${DAILY_SALES_STEP_TIMEOUT_SECONDS} PENDING_DELIVERIES_STEP_TIMEOUT_SECONDS=${PENDING_DELIVERIES_STEP_TIMEOUT_SECONDS}"
+log "ORDERS_STEP_TIMEOUT_SECONDS=${ORDERS_STEP_TIMEOUT_SECONDS} REPORTS_STEP_TIMEOUT_SECONDS=${REPORTS_STEP_TIMEOUT_SECONDS}"
 log "LOCAL_LOCK_DIR=${RUN_LOCK_DIR}"
 log "poetry=$(command -v poetry || echo NOT_FOUND)"
 log "shell_pid=$$"
@@ -1139,12 +1128,9 @@ PY
 orders_rc=0
 orders_sync_report_args=""
 recovery_cmd="poetry run python -m app recovery mark-aged-pending-deliveries --env prod"
-daily_report_cmd="./scripts/run_local_reports_daily_sales.sh"
-pending_report_cmd="./scripts/run_local_reports_pending_deliveries.sh"
+reports_cmd="./scripts/run_local_reports_all.sh"
 recovery_rc=0
-daily_rc=0
-pending_rc=0
-daily_rescue_rc=0
+reports_rc=0
 run_started_epoch="$(date +%s)"
 
 # ORDERS_SYNC_PROFILER_FAIL_ON_FAILED_STATUS=1 makes this step return non-zero
@@ -1169,53 +1155,30 @@ if [[ "${orders_rc}" -ne 0 || "${orders_sync_upstream_status}" != "unknown" || -
   fi
 fi
 if [[ -n "${orders_sync_report_args}" ]]; then
-  daily_report_cmd="${daily_report_cmd} ${orders_sync_report_args}"
-  pending_report_cmd="${pending_report_cmd} ${orders_sync_report_args}"
+  reports_cmd="${reports_cmd} ${orders_sync_report_args}"
 fi
 log "orders_sync_downstream_report_args=${orders_sync_report_args:-<none>}"
 # Mark aged pending-delivery orders before Daily Sales builds its To-Be-Recovered attachment.
 run_step_with_retries "Script 2: recovery.mark-aged-pending-deliveries" "${recovery_cmd}" "${RECOVERY_MAX_ATTEMPTS}" "${RECOVERY_RETRY_DELAY_SECONDS}" 0 1 "${RECOVERY_RETRY_DELAY_SECONDS}" "${RECOVERY_STEP_TIMEOUT_SECONDS}" || recovery_rc=$?
-run_step_with_retries "Script 3: daily_sales_report" "${daily_report_cmd}" "${DAILY_MAX_ATTEMPTS}" "${DAILY_RETRY_DELAY_SECONDS}" 0 1 "${DAILY_RETRY_DELAY_SECONDS}" "${DAILY_SALES_STEP_TIMEOUT_SECONDS}" || daily_rc=$?
-# Pending Deliveries must not skip due to a prior successful summary; report CLIs always regenerate.
-run_step_with_retries "Script 4: pending_deliveries" "${pending_report_cmd}" "${PENDING_MAX_ATTEMPTS}" "${PENDING_RETRY_DELAY_SECONDS}" 0 1 "${PENDING_RETRY_DELAY_SECONDS}" "${PENDING_DELIVERIES_STEP_TIMEOUT_SECONDS}" || pending_rc=$?
-
-if [[ "${pending_rc}" -eq 0 && "${daily_rc}" -ne 0 && "${DAILY_RESCUE_AFTER_PENDING_SUCCESS}" -eq 1 ]]; then
-  section "OPTIONAL DAILY RESCUE PASS"
-  log "Pending deliveries succeeded while daily sales failed; running optional daily rescue pass."
-  run_step_with_retries \
-    "Script 2B: daily_sales_report_rescue" \
-    "${daily_report_cmd}" \
-    "${DAILY_RESCUE_MAX_ATTEMPTS}" \
-    "${DAILY_RESCUE_RETRY_DELAY_SECONDS}" \
-    0 \
-    1 \
-    "${DAILY_RESCUE_RETRY_DELAY_SECONDS}" \
-    "${DAILY_SALES_STEP_TIMEOUT_SECONDS}" || daily_rescue_rc=$?
-
-  if [[ "${daily_rescue_rc}" -eq 0 ]]; then
-    log "Daily rescue pass succeeded; preserving original daily_sales_report_rc=${daily_rc} for required-step status."
-  else
-    log "WARNING: Daily rescue pass failed with rc=${daily_rescue_rc}."
-  fi
-fi
+# run-all orders Pending Deliveries after Daily Sales and runs every report in
+# one process, so the payment reconciliation cache is shared across reports.
+run_step_with_retries "Script 3: reports.run-all" "${reports_cmd}" "${REPORTS_MAX_ATTEMPTS}" "${REPORTS_RETRY_DELAY_SECONDS}" 0 1 "${REPORTS_RETRY_DELAY_SECONDS}" "${REPORTS_STEP_TIMEOUT_SECONDS}" || reports_rc=$?
 
 run_finished_epoch="$(date +%s)"
 run_duration_seconds=$((run_finished_epoch - run_started_epoch))
 
-log "Report regeneration mode: daily_sales_regenerate=true pending_deliveries_regenerate=true (report CLIs always regenerate; --force is not required)"
+log "Report regeneration mode: daily_sales_regenerate=true pending_deliveries_regenerate=true mtd_same_day_fulfillment_regenerate=true (report CLIs always regenerate; --force is not required)"
 
 section "RUN STATUS SUMMARY"
 log "orders_sync_run_profiler_rc=${orders_rc}"
 log "orders_sync_preflight_classification=${ORDERS_SYNC_PREFLIGHT_CLASSIFICATION}"
 log "orders_sync_profiler_fail_on_failed_status=${ORDERS_SYNC_PROFILER_FAIL_ON_FAILED_STATUS}"
 log "recovery_mark_aged_pending_deliveries_rc=${recovery_rc}"
-log "daily_sales_report_rc=${daily_rc}"
-log "pending_deliveries_rc=${pending_rc}"
-log "daily_sales_report_rescue_rc=${daily_rescue_rc}"
+log "reports_run_all_rc=${reports_rc}"
 log "total_duration_seconds=${run_duration_seconds}"
 
-if [[ "${orders_rc}" -ne 0 || "${recovery_rc}" -ne 0 || "${daily_rc}" -ne 0 || "${pending_rc}" -ne 0 ]]; then
-  log "ERROR: One or more required cron steps failed (orders_sync_run_profiler_rc=${orders_rc}, recovery_mark_aged_pending_deliveries_rc=${recovery_rc}, daily_sales_report_rc=${daily_rc}, pending_deliveries_rc=${pending_rc})."
+if [[ "${orders_rc}" -ne 0 || "${recovery_rc}" -ne 0 || "${reports_rc}" -ne 0 ]]; then
+  log "ERROR: One or more required cron steps failed (orders_sync_run_profiler_rc=${orders_rc}, recovery_mark_aged_pending_deliveries_rc=${recovery_rc}, reports_run_all_rc=${reports_rc})."
   exit 1
 fi
 
@@ -0,0 +1,28 @@
+#!/usr/bin/env bash
+set -euo pipefail
+
+# Usage examples:
+#   # Local/manual run; reports always regenerate.
+#   ./scripts/run_local_reports_all.sh --report-date 2026-03-31
+#
+# Runs Daily Sales, Pending Deliveries and MTD Same-Day Fulfillment in one
+# process so they share the payment reconciliation cache. Regeneration is
+# mandatory for report wrappers; --force is not required.
+
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+REPO_ROOT="$(cd "${SCRIPT_DIR}/.." && pwd)"
+cd "${REPO_ROOT}"
+
+report_date="<default>"
+
+for ((i = 1; i <= $#; i++)); do
+  if [[ "${!i}" == "--report-date" ]] && ((i + 1 <= $#)); then
+    next_index=$((i + 1))
+    report_date="${!next_index}"
+    break
+  fi
+done
+
+echo "[run_local_reports_all] pipeline=run-all report_date=${report_date} regenerate=true"
+
+exec poetry run python -m app report run-all --env prod "$@"
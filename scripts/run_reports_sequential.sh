@@ -51,15 +51,9 @@ run_step() {
   fi
 }
 
-echo "--- Dependency order: reports.daily_sales_report must run before reports.pending_deliveries ---"
+# run-all orders reports.pending_deliveries after reports.daily_sales_report and
+# runs every report in one process so they share the payment reconciliation cache.
+echo "--- Dependency order: reports.pending_deliveries runs after reports.daily_sales_report ---"
 
-run_step "daily_sales_report" \
-  poetry run python -m app report daily-sales ${FORCE_ARGS[@]+"${FORCE_ARGS[@]}"} ${EXTRA_ARGS[@]+"${EXTRA_ARGS[@]}"}
-
-echo "--- Dependency order: reports.pending_deliveries runs immediately after reports.daily_sales_report ---"
-
-run_step "pending_deliveries" \
-  poetry run python -m app report pending-deliveries ${FORCE_ARGS[@]+"${FORCE_ARGS[@]}"} ${EXTRA_ARGS[@]+"${EXTRA_ARGS[@]}"}
-
-run_step "mtd_same_day_fulfillment" \
-  poetry run python -m app report mtd-same-day-fulfillment ${FORCE_ARGS[@]+"${FORCE_ARGS[@]}"} ${EXTRA_ARGS[@]+"${EXTRA_ARGS[@]}"}
+run_step "run_all" \
+  poetry run python -m app report run-all ${FORCE_ARGS[@]+"${FORCE_ARGS[@]}"} ${EXTRA_ARGS[@]+"${EXTRA_ARGS[@]}"}
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import importlib.util
+from pathlib import Path
+from typing import Callable
+
+import pytest
+import sqlalchemy as sa
+
+from alembic.migration import MigrationContext
+from alembic.operations import Operations
+
+
+def _load_migration_module():
+    project_root = Path(__file__).resolve().parents[2]
+    module_path = project_root / "alembic" / "versions" / "0138_orders_reporting.py"
+    spec = importlib.util.spec_from_file_location("v0138_orders_reporting", module_path)
+    if spec is None or spec.loader is None:
+        raise ImportError(f"Unable to load migration module from {module_path}")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+migration = _load_migration_module()
+
+
+def _run_migration(
+    connection: sa.Connection, fn: Callable[[], None], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    context = MigrationContext.configure(connection)
+    operations = Operations(context)
+    original_op = migration.op
+    monkeypatch.setattr(migration, "op", operations)
+    try:
+        fn()
+    finally:
+        monkeypatch.setattr(migration, "op", original_op)
+
+
+def test_orders_reporting_migration_chain() -> None:
+    assert migration.revision == "0138_orders_reporting"
+    assert migration.down_revision == "0137_package_sales_proof"
+
+
+def test_orders_reporting_migration_keeps_plain_view_on_sqlite(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    engine = sa.create_engine("sqlite://")
+
+    with engine.begin() as connection:
+        connection.execute(sa.text("CREATE TABLE orders (id INTEGER PRIMARY KEY, mobile_number TEXT)"))
+        connection.execute(sa.text("CREATE VIEW vw_orders AS SELECT id, mobile_number FROM orders"))
+        _run_migration(connection, migration.upgrade, monkeypatch)
+        _run_migration(connection, migration.downgrade, monkeypatch)
+
+    inspector = sa.inspect(engine)
+    assert "orders_reporting" not in inspector.get_table_names()
+    assert inspector.get_view_names() == ["vw_orders"]
+
+
+def test_orders_reporting_sync_trigger_refreshes_only_touched_orders() -> None:
+    sql = " ".join(migration.SYNC_FUNCTION_SQL.split())
+
+    assert "DELETE FROM public.orders_reporting AS r USING old_orders AS o WHERE r.id = o.id" in sql
+    assert "FROM public.vw_orders_source AS s WHERE s.id IN (SELECT n.id FROM new_orders AS n)" in sql
+    assert "OLD.id" not in sql and "NEW.id" not in sql
+
+
+def test_orders_reporting_sync_triggers_are_statement_level_per_event() -> None:
+    assert migration.SYNC_TRIGGERS == {
+        "trg_orders_reporting_insert": "INSERT ON public.orders REFERENCING NEW TABLE AS new_orders",
+        "trg_orders_reporting_update": (
+            "UPDATE ON public.orders REFERENCING OLD TABLE AS old_orders NEW TABLE AS new_orders"
+        ),
+        "trg_orders_reporting_delete": "DELETE ON public.orders REFERENCING OLD TABLE AS old_orders",
+    }
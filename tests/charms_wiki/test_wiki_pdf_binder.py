@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import json
+from pathlib import Path
+
+import pytest
+from pypdf import PdfReader, PdfWriter
+
+_WIKI_DIR = Path(__file__).resolve().parents[2] / "app" / "charms_wiki"
+
+
+def _load(name: str):
+    spec = importlib.util.spec_from_file_location(f"charms_wiki_{name}", _WIKI_DIR / f"{name}.py")
+    if spec is None or spec.loader is None:
+        raise RuntimeError(f"Unable to load {name}")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+blueprint = _load("blueprint_base_pdf")
+reference = _load("charmswiki_reference_for_srs")
+BINDERS = pytest.mark.parametrize("binder", [blueprint, reference], ids=["blueprint", "reference"])
+
+
+@pytest.fixture
+def binder_dirs(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir()
+    for module in (blueprint, reference):
+        monkeypatch.setattr(module, "CACHE_DIR", cache_dir)
+        monkeypatch.setattr(module, "STATE_PATH", tmp_path / "merge_state.json")
+        monkeypatch.setattr(module, "STATE_TMP", tmp_path / "merge_state.tmp.json")
+        monkeypatch.setattr(module, "DELAY_MIN", 0)
+        monkeypatch.setattr(module, "DELAY_MAX", 0)
+    return tmp_path
+
+
+def _row(module, design_seq: int, name: str | None = None):
+    return module.LinkRow(
+        design_seq=design_seq,
+        seq=design_seq,
+        group="Group",
+        subgroup="Subgroup",
+        name=name or f"Page {design_seq}",
+        url=f"https://example.test/{design_seq}",
+    )
+
+
+def _write_pdf(path: Path, pages: int) -> Path:
+    writer = PdfWriter()
+    for _ in range(pages):
+        writer.add_blank_page(width=200, height=200)
+    with path.open("wb") as handle:
+        writer.write(handle)
+    return path
+
+
+@BINDERS
+def test_load_state_returns_empty_manifest_without_state_file(binder, binder_dirs) -> None:
+    assert binder.load_state() == {"pages": {}}
+
+
+@BINDERS
+def test_load_state_ignores_legacy_state_without_manifest(binder, binder_dirs) -> None:
+    binder.STATE_PATH.write_text(json.dumps({"last_done": 12, "merged_pages": 40}), encoding="utf-8")
+
+    assert binder.load_state() == {"pages": {}}
+
+
+@BINDERS
+def test_load_state_round_trips_saved_manifest(binder, binder_dirs) -> None:
+    state = {"pages": {"0001": {"file": "0001 - Page 1.pdf", "page_count": 3}}}
+    binder.save_state(state)
+
+    assert binder.load_state() == state
+    assert not binder.STATE_TMP.exists()
+
+
+@BINDERS
+def test_manifest_entry_requires_recorded_page_with_cache_file(binder, binder_dirs) -> None:
+    recorded, missing_file, unrecorded = _row(binder, 1), _row(binder, 2), _row(binder, 3)
+    _write_pdf(binder.CACHE_DIR / "0001 - Page 1.pdf", 1)
+    state = {
+        "pages": {
+            "0001": {"file": "0001 - Page 1.pdf", "page_count": 1},
+            "0002": {"file": "0002 - Page 2.pdf", "page_count": 2},
+        }
+    }
+
+    assert binder.manifest_entry(state, recorded) == {"file": "0001 - Page 1.pdf", "page_count": 1}
+    assert binder.manifest_entry(state, missing_file) is None
+    assert binder.manifest_entry(state, unrecorded) is None
+
+
+@BINDERS
+def test_record_cached_page_stores_page_count_and_persists(binder, binder_dirs) -> None:
+    row = _row(binder, 7)
+    pdf_path = _write_pdf(binder.cache_pdf_path(row.design_seq, row.name), 3)
+    state = {"pages": {}}
+
+    binder.record_cached_page(state, row, pdf_path)
+
+    assert state["pages"]["0007"] == {"file": pdf_path.name, "page_count": 3}
+    assert binder.load_state() == state
+
+
+def test_compute_start_pages_offsets_by_frontmatter_and_skips_uncached(binder_dirs) -> None:
+    rows = [_row(reference, seq) for seq in (1, 2, 3, 4)]
+    state = {"pages": {}}
+    for row, pages in zip(rows, (2, 0, 3, 1)):
+        if pages:
+            _write_pdf(reference.cache_pdf_path(row.design_seq, row.name), pages)
+            reference.record_cached_page(state, row, reference.cache_pdf_path(row.design_seq, row.name))
+
+    assert reference.compute_start_pages(rows, state) == {1: 1, 3: 3, 4: 6}
+    assert reference.compute_start_pages(rows, state, frontmatter_pages=2) == {1: 3, 3: 5, 4: 8}
+
+
+@BINDERS
+def test_write_merged_pdf_concatenates_sources_in_order(binder, tmp_path: Path) -> None:
+    first = _write_pdf(tmp_path / "first.pdf", 2)
+    second = _write_pdf(tmp_path / "second.pdf", 3)
+    out_pdf = tmp_path / "merged.pdf"
+    tmp_pdf = tmp_path / "merged.tmp.pdf"
+    out_pdf.write_bytes(b"stale")
+
+    binder.write_merged_pdf([first, second], out_pdf, tmp_pdf)
+
+    assert len(PdfReader(str(out_pdf)).pages) == 5
+    assert not tmp_pdf.exists()
+
+
+class _FakePage:
+    def __init__(self, failures: list[Exception]) -> None:
+        self._failures = failures
+        self.closed = False
+
+    async def goto(self, url: str, **kwargs) -> None:
+        if self._failures:
+            raise self._failures.pop(0)
+
+    async def pdf(self, *, path: str, **kwargs) -> None:
+        _write_pdf(Path(path), 1)
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class _FakeContext:
+    def __init__(self, failures: list[Exception] | None = None) -> None:
+        self.failures = failures or []
+        self.pages: list[_FakePage] = []
+
+    async def new_page(self) -> _FakePage:
+        page = _FakePage(self.failures)
+        self.pages.append(page)
+        return page
+
+
+@pytest.mark.asyncio
+@BINDERS
+async def test_download_page_pdf_retries_on_a_fresh_tab(binder, binder_dirs, monkeypatch) -> None:
+    async def no_sleep(_seconds: float) -> None:
+        return None
+
+    monkeypatch.setattr(binder.asyncio, "sleep", no_sleep)
+    context = _FakeContext([RuntimeError("tab crashed")])
+    first = await context.new_page()
+
+    pdf_path, page = await binder.download_page_pdf(context, first, _row(binder, 1), 1, 1)
+
+    assert pdf_path.exists()
+    assert first.closed
+    assert page is context.pages[1] and not page.closed
+
+
+@pytest.mark.asyncio
+@BINDERS
+async def test_capture_pages_cancels_sibling_workers_when_one_fails(binder, binder_dirs, monkeypatch) -> None:
+    monkeypatch.setattr(binder, "RETRY_COUNT", 0)
+    monkeypatch.setattr(binder, "CAPTURE_CONCURRENCY", 2)
+    sibling_cancelled = asyncio.Event()
+    failing, slow = _row(binder, 1), _row(binder, 2)
+
+    async def fake_download(context, page, row, idx, total):
+        if row == slow:
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                sibling_cancelled.set()
+                raise
+        await asyncio.sleep(0)
+        raise RuntimeError("capture failed")
+
+    monkeypatch.setattr(binder, "download_page_pdf", fake_download)
+
+    with pytest.raises(RuntimeError, match="capture failed"):
+        await binder.capture_pages(_FakeContext(), [(1, failing), (2, slow)], {"pages": {}}, 2)
+
+    assert sibling_cancelled.is_set()
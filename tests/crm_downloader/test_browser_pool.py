@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import date
+from types import SimpleNamespace
+
+import pytest
+
+import app.crm_downloader.orders_sync_run_profiler.main as profiler
+from app.crm_downloader import browser as browser_module
+from app.crm_downloader.browser import BrowserPool
+from app.crm_downloader.orders_sync_run_profiler.main import StoreProfile
+from app.dashboard_downloader.json_logger import JsonLogger
+
+
+class _FakeContext:
+    def __init__(self, browser: "_FakeBrowser") -> None:
+        self._browser = browser
+
+    async def close(self) -> None:
+        self._browser.contexts.remove(self)
+
+
+class _FakeBrowser:
+    def __init__(self, index: int) -> None:
+        self.index = index
+        self.connected = True
+        self.closed = False
+        self.contexts: list[_FakeContext] = []
+
+    def is_connected(self) -> bool:
+        return self.connected and not self.closed
+
+    async def new_context(self) -> _FakeContext:
+        context = _FakeContext(self)
+        self.contexts.append(context)
+        return context
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class _FakePlaywright:
+    def __init__(self) -> None:
+        self.stopped = False
+
+    async def stop(self) -> None:
+        self.stopped = True
+
+
+@pytest.fixture
+def launched(monkeypatch: pytest.MonkeyPatch) -> list[_FakeBrowser]:
+    browsers: list[_FakeBrowser] = []
+    playwright = _FakePlaywright()
+
+    class _Starter:
+        async def start(self) -> _FakePlaywright:
+            return playwright
+
+    async def fake_launch_browser(*, playwright: object, logger: JsonLogger) -> _FakeBrowser:
+        browsers.append(_FakeBrowser(len(browsers)))
+        return browsers[-1]
+
+    monkeypatch.setattr(browser_module, "async_playwright", lambda: _Starter())
+    monkeypatch.setattr(browser_module, "launch_browser", fake_launch_browser)
+    return browsers
+
+
+@pytest.mark.asyncio
+async def test_browser_pool_launches_once_per_slot(launched: list[_FakeBrowser]) -> None:
+    pool = BrowserPool(size=2, logger=JsonLogger(log_file_path=None))
+    active = 0
+    peak = 0
+
+    async def window() -> int:
+        nonlocal active, peak
+        async with pool.lease() as browser:
+            active += 1
+            peak = max(peak, active)
+            await browser.new_context()
+            await asyncio.sleep(0)
+            active -= 1
+            return browser.index
+
+    used = await asyncio.gather(*(window() for _ in range(6)))
+    await pool.close()
+
+    assert len(launched) == 2
+    assert sorted(set(used)) == [0, 1]
+    assert peak == 2
+    # Contexts left open by a lease are closed before the browser is handed out again.
+    assert all(browser.contexts == [] and browser.closed for browser in launched)
+    assert pool.stats() == {
+        "browser_pool_size": 2,
+        "browser_pool_launches": 2,
+        "browser_pool_recycles": 0,
+        "browser_pool_leases": 6,
+    }
+
+
+@pytest.mark.asyncio
+async def test_browser_pool_recycles_after_max_uses_and_crash(launched: list[_FakeBrowser]) -> None:
+    pool = BrowserPool(size=1, logger=JsonLogger(log_file_path=None), max_uses=2)
+
+    for _ in range(3):
+        async with pool.lease():
+            pass
+    assert len(launched) == 2
+    assert launched[0].closed
+
+    with pytest.raises(RuntimeError):
+        async with pool.lease() as browser:
+            browser.connected = False
+            raise RuntimeError("Target page, context or browser has been closed")
+    async with pool.lease() as browser:
+        assert browser is launched[2]
+
+    await pool.close()
+    assert pool.recycles == 2
+
+
+@pytest.mark.asyncio
+async def test_run_store_windows_leases_pooled_browser_per_window(
+    monkeypatch: pytest.MonkeyPatch, launched: list[_FakeBrowser]
+) -> None:
+    monkeypatch.setattr(
+        profiler,
+        "config",
+        SimpleNamespace(database_url="sqlite+aiosqlite:///:memory:", run_env="test"),
+    )
+    shared_browsers: list[object] = []
+
+    async def fake_fetch_last_success_window_end(**_kwargs: object) -> None:
+        return None
+
+    async def fake_pipeline_fn(**kwargs: object) -> None:
+        shared_browsers.append(kwargs["shared_browser"])
+
+    async def fake_fetch_summary_for_run(_database_url: str, _run_id: str) -> dict:
+        return {"overall_status": "success", "metrics_json": {}}
+
+    async def fake_fetch_latest_log_row(**_kwargs: object) -> dict:
+        return {"id": 1, "status": "success", "error_message": None}
+
+    async def fake_insert_run_summary(_database_url: str, _summary_record: dict) -> None:
+        return None
+
+    monkeypatch.setattr(profiler, "fetch_last_success_window_end", fake_fetch_last_success_window_end)
+    monkeypatch.setattr(profiler, "fetch_summary_for_run", fake_fetch_summary_for_run)
+    monkeypatch.setattr(profiler, "_fetch_latest_log_row", fake_fetch_latest_log_row)
+    monkeypatch.setattr(profiler, "insert_run_summary", fake_insert_run_summary)
+
+    logger = JsonLogger(run_id="profiler-run", log_file_path=None)
+    pool = BrowserPool(size=1, logger=logger)
+    await profiler._run_store_windows(
+        logger=logger,
+        store=StoreProfile(
+            store_code="TD01",
+            store_name="TD Store",
+            cost_center="CC-TD01",
+            sync_config={},
+            start_date=None,
+        ),
+        pipeline_name="td_orders_sync",
+        pipeline_id=101,
+        pipeline_fn=fake_pipeline_fn,
+        run_env="test",
+        run_id="profiler-run",
+        backfill_days=3,
+        window_days=1,
+        overlap_days=0,
+        from_date=date(2024, 2, 1),
+        to_date=date(2024, 2, 3),
+        browser_pool=pool,
+    )
+    await pool.close()
+
+    assert len(shared_browsers) == 3
+    assert all(browser is launched[0] for browser in shared_browsers)
+    assert len(launched) == 1
@@ -2973,6 +2973,60 @@ async def test_source_both_preserves_td_parent_and_uc_child_window_behavior(
     ]
 
 
+@pytest.mark.asyncio
+async def test_run_rebuild_workers_rebuild_stores_concurrently_in_store_order(
+    patch_config_and_stores,
+) -> None:
+    db_url = patch_config_and_stores
+    await _create_common_tables(db_url)
+    uc_started = asyncio.Event()
+    worker_browsers: dict[str, set[int]] = {"TD001": set(), "UC001": set()}
+
+    async def fetcher(**kwargs):
+        store = kwargs["store"]
+        worker_browsers[store.store_code].add(id(rebuild._WORKER_BROWSER.get()))
+        if store.source == "uc":
+            uc_started.set()
+        else:
+            # The TD store only proceeds once the UC store is in flight.
+            await asyncio.wait_for(uc_started.wait(), timeout=5)
+        return rebuild.SourceSnapshot(line_item_rows=[], order_snapshots=[])
+
+    metrics = await rebuild.run_rebuild(
+        source_selection="both",
+        store_codes=None,
+        start_date=date(2025, 1, 1),
+        end_date=date(2025, 1, 2),
+        window_size_days=1,
+        dry_run=False,
+        run_id="parallel",
+        fetch_snapshot=fetcher,
+        skip_auth_preflight=True,
+        workers=2,
+    )
+
+    assert [(metric.source, metric.window_start) for metric in metrics] == [
+        ("td", date(2025, 1, 1)),
+        ("td", date(2025, 1, 2)),
+        ("uc", date(2025, 1, 1)),
+        ("uc", date(2025, 1, 2)),
+    ]
+    # Each store's windows share one worker browser slot; the stores do not.
+    assert all(len(ids) == 1 for ids in worker_browsers.values())
+    assert worker_browsers["TD001"] != worker_browsers["UC001"]
+    progress = await _rows(
+        db_url,
+        "SELECT source, store_code, window_start, status FROM order_line_items_rebuild_progress "
+        "ORDER BY source, window_start",
+    )
+    assert [(row.source, str(row.window_start), row.status) for row in progress] == [
+        ("td", "2025-01-01", "success"),
+        ("td", "2025-01-02", "success"),
+        ("uc", "2025-01-01", "success"),
+        ("uc", "2025-01-02", "success"),
+    ]
+
+
 @pytest.mark.asyncio
 async def test_resume_progress_uses_source_store_window_while_uc_staging_uses_child_run(
     patch_config_and_stores,
@@ -29,6 +29,8 @@ from app.crm_downloader.td_orders_sync.td_api_client import (
     TdApiFetchResult,
     build_garment_order_snapshots,
     td_api_fetch_auth_failure_endpoints,
+    _TdApiRequestScheduler,
+    _TokenBucket,
     _build_garments_incomplete_reason,
     _extract_row_ids,
     _extract_rows,
@@ -1907,6 +1909,123 @@ async def test_get_json_classifies_total_timeout_and_bounds_retries(tmp_path: Pa
     assert sleep_calls == [0.0, 0.0]
 
 
+def test_token_bucket_allows_burst_then_paces_at_rate() -> None:
+    bucket = _TokenBucket(rate=2.0, burst=2)
+
+    waits = [bucket.reserve(now=10.0) for _ in range(4)]
+
+    assert waits == [0.0, 0.0, pytest.approx(0.5), pytest.approx(1.0)]
+    # Idle time refills the bucket.
+    assert bucket.reserve(now=20.0) == 0.0
+    assert bucket.reserve(now=20.0, slowdown=4.0) == 0.0
+    assert bucket.reserve(now=20.0, slowdown=4.0) == pytest.approx(0.5)
+
+
+@pytest.mark.asyncio
+async def test_request_scheduler_combines_global_and_endpoint_buckets(monkeypatch: pytest.MonkeyPatch) -> None:
+    clock = {"now": 100.0}
+    sleeps: list[float] = []
+
+    async def _fake_sleep(seconds: float) -> None:
+        sleeps.append(seconds)
+        clock["now"] += seconds
+
+    monkeypatch.setattr("app.crm_downloader.td_orders_sync.td_api_client.time.monotonic", lambda: clock["now"])
+    monkeypatch.setattr("app.crm_downloader.td_orders_sync.td_api_client.asyncio.sleep", _fake_sleep)
+    scheduler = _TdApiRequestScheduler(
+        global_rate=10.0,
+        global_burst=10,
+        endpoint_rates={"/garments/details": 1.0, "/reports/order-report": 0.0},
+        endpoint_burst=1,
+        error_rate_threshold=0.2,
+        max_slowdown=8.0,
+    )
+
+    await scheduler.acquire("/garments/details")
+    await scheduler.acquire("/reports/order-report")
+    await scheduler.acquire("/garments/details")
+
+    assert sleeps == [pytest.approx(1.0)]
+    metrics = scheduler.metrics()
+    assert metrics["scheduler_requests_granted"] == 3
+    assert metrics["scheduler_total_wait_ms"] == 1000
+    assert metrics["scheduler_max_queue_depth"] == 1
+    assert metrics["scheduler_queue_depth"] == 0
+    assert metrics["scheduler_effective_rps"] == pytest.approx(0.3)
+
+
+def test_request_scheduler_adapts_to_throttling_and_recovers() -> None:
+    scheduler = _TdApiRequestScheduler(
+        global_rate=5.0,
+        global_burst=1,
+        endpoint_rates={},
+        endpoint_burst=1,
+        error_rate_threshold=0.2,
+        max_slowdown=4.0,
+    )
+
+    assert scheduler.record_outcome(status=429, error_class=None) is True
+    assert scheduler.record_outcome(status=None, error_class="read_timeout") is True
+    assert scheduler.record_outcome(status=503, error_class=None) is False
+    assert scheduler.slowdown == 4.0
+    assert scheduler.record_outcome(status=404, error_class=None) is False
+
+    for _ in range(30):
+        scheduler.record_outcome(status=200, error_class=None)
+    assert scheduler.slowdown == 1.0
+    assert scheduler.metrics()["scheduler_error_rate"] == 0.0
+
+
+@pytest.mark.asyncio
+async def test_get_json_feeds_request_scheduler_and_logs_backoff(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    request = _StubRequest(
+        responses=[
+            _StubResponse(status=429, url="https://reporting-api.quickdrycleaning.com/reports/order-report", payload={}),
+            _StubResponse(
+                status=200,
+                url="https://reporting-api.quickdrycleaning.com/reports/order-report",
+                payload={"data": [], "totalPages": 1},
+            ),
+        ]
+    )
+    client = _TokenRefreshingClient(
+        store_code="a123",
+        context=_StubContext(request=request),
+        storage_state_path=tmp_path / "s.json",
+        config=TdApiClientConfig(
+            max_retries=1,
+            min_interval_seconds=0,
+            backoff_base_seconds=0,
+            backoff_jitter_seconds=0,
+            global_requests_per_second=1000.0,
+            global_burst=100,
+        ),
+    )
+    client._request_scheduler = _TdApiRequestScheduler(
+        global_rate=1000.0,
+        global_burst=100,
+        endpoint_rates={},
+        endpoint_burst=1,
+        error_rate_threshold=0.2,
+        max_slowdown=8.0,
+    )
+    events: list[dict[str, object]] = []
+    monkeypatch.setattr(client, "_emit_source_fetch_event", lambda **kwargs: events.append(kwargs))
+
+    async def _fake_sleep(_: float) -> None:
+        return None
+
+    monkeypatch.setattr("app.crm_downloader.td_orders_sync.td_api_client.asyncio.sleep", _fake_sleep)
+
+    result = await client._get_json(endpoint="/reports/order-report", params={"page": 1}, metadata=[])
+
+    assert result.ok is True
+    assert client._request_scheduler.requests_granted == 2
+    backoff_events = [event for event in events if event["message"] == "TD API request scheduler backoff adjusted"]
+    assert backoff_events[0]["status"] == "warning"
+    assert backoff_events[0]["scheduler_slowdown_factor"] == 2.0
+
+
 @pytest.mark.asyncio
 async def test_fetch_reports_retries_timeout_then_falls_back_page_size(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
     request = _StubRequest(
@@ -2852,6 +2971,167 @@ async def test_garments_har_count_drives_complete_final_page_without_empty_probe
     assert health["garments_completeness_basis"] == "unique_row_ids"
 
 
+@pytest.mark.asyncio
+async def test_garments_prefetch_reassembles_pages_in_order(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    client = TdApiClient(
+        store_code="a123",
+        context=None,
+        storage_state_path=tmp_path / "s.json",  # type: ignore[arg-type]
+        config=TdApiClientConfig(min_interval_seconds=0, page_size=500, max_pages=30, page_prefetch_concurrency=4),
+    )
+    pages_by_number = {page["request"]["page"]: page for page in _har_fixture_pages()}
+    requested_pages: list[int] = []
+    in_flight = 0
+    max_in_flight = 0
+
+    async def _fake_get_json(**kwargs: object) -> object:
+        nonlocal in_flight, max_in_flight
+        page_number = int(kwargs["params"]["page"])  # type: ignore[index]
+        requested_pages.append(page_number)
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        # Later pages answer first so reassembly cannot rely on completion order.
+        await asyncio.sleep(0.002 * (30 - page_number) / 30)
+        in_flight -= 1
+        return _api_result(pages_by_number[page_number]["response"])
+
+    monkeypatch.setattr(client, "_get_json", _fake_get_json)
+    endpoint_health: dict[str, dict[str, object]] = {}
+    result = await client._fetch_endpoint_rows(
+        endpoint="/garments/details",
+        params={"startDate": "2026-03-01", "endDate": "2026-03-30", "page": 1, "pageSize": 500},
+        metadata=[],
+        errors={},
+        error_diagnostics={},
+        endpoint_health=endpoint_health,
+    )
+
+    health = endpoint_health["/garments/details"]
+    assert sorted(requested_pages) == list(range(1, 24))
+    assert 1 < max_in_flight <= 4
+    assert result["data"] == _har_fixture_rows()
+    assert result["pagination"]["pages_fetched"] == 23
+    assert health["garments_fetch_completeness"] == "complete"
+    assert health["garments_fetched_unique_row_ids"] == 2227
+    assert health["garments_completeness_basis"] == "unique_row_ids"
+
+
+@pytest.mark.asyncio
+async def test_garments_prefetch_keeps_window_end_in_fetch_events(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    client = TdApiClient(
+        store_code="a123",
+        context=None,
+        storage_state_path=tmp_path / "s.json",  # type: ignore[arg-type]
+        config=TdApiClientConfig(min_interval_seconds=0, page_size=500, max_pages=30, page_prefetch_concurrency=4),
+    )
+    pages_by_number = {page["request"]["page"]: page for page in _har_fixture_pages()}
+    emitted_events: list[dict[str, object]] = []
+
+    async def _fake_get_json(**kwargs: object) -> object:
+        page_number = int(kwargs["params"]["page"])  # type: ignore[index]
+        return _api_result(pages_by_number[page_number]["response"])
+
+    monkeypatch.setattr(client, "_get_json", _fake_get_json)
+    monkeypatch.setattr(client, "_emit_source_fetch_event", lambda **kwargs: emitted_events.append(kwargs))
+    await client._fetch_endpoint_rows(
+        endpoint="/garments/details",
+        params={"startDate": "2026-03-01", "endDate": "2026-03-30", "page": 1, "pageSize": 500},
+        metadata=[],
+        errors={},
+        error_diagnostics={},
+        endpoint_health={},
+    )
+
+    assert emitted_events
+    assert {event["window_end"] for event in emitted_events} == {"2026-03-30"}
+
+
+@pytest.mark.asyncio
+async def test_garments_prefetch_cancels_in_flight_pages_when_a_fetch_raises(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    client = TdApiClient(
+        store_code="a123",
+        context=None,
+        storage_state_path=tmp_path / "s.json",  # type: ignore[arg-type]
+        config=TdApiClientConfig(min_interval_seconds=0, page_size=500, max_pages=30, page_prefetch_concurrency=4),
+    )
+    pages_by_number = {page["request"]["page"]: page for page in _har_fixture_pages()}
+    completed_pages: list[int] = []
+
+    async def _fake_get_json(**kwargs: object) -> object:
+        page_number = int(kwargs["params"]["page"])  # type: ignore[index]
+        if page_number == 2:
+            raise RuntimeError("td transport failed")
+        if page_number > 2:
+            await asyncio.sleep(0.05)
+        completed_pages.append(page_number)
+        return _api_result(pages_by_number[page_number]["response"])
+
+    monkeypatch.setattr(client, "_get_json", _fake_get_json)
+    with pytest.raises(RuntimeError, match="td transport failed"):
+        await client._fetch_endpoint_rows(
+            endpoint="/garments/details",
+            params={"startDate": "2026-03-01", "endDate": "2026-03-30", "page": 1, "pageSize": 500},
+            metadata=[],
+            errors={},
+            error_diagnostics={},
+            endpoint_health={},
+        )
+    await asyncio.sleep(0.1)
+
+    assert completed_pages == [1]
+
+
+@pytest.mark.asyncio
+async def test_garments_prefetch_discards_pages_after_page_size_fallback(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    client = TdApiClient(
+        store_code="a123",
+        context=None,
+        storage_state_path=tmp_path / "s.json",  # type: ignore[arg-type]
+        config=TdApiClientConfig(
+            min_interval_seconds=0,
+            page_size_fallbacks=(1,),
+            page_prefetch_concurrency=3,
+            garments_max_timeout_pages=0,
+        ),
+    )
+    requests: list[tuple[int, int]] = []
+
+    async def _fake_get_json(**kwargs: object) -> object:
+        params = kwargs["params"]
+        page_number = int(params["page"])  # type: ignore[index]
+        page_size = int(params["pageSize"])  # type: ignore[index]
+        requests.append((page_number, page_size))
+        if page_size == 2 and page_number == 2:
+            return type("_Result", (), {"ok": False, "payload": None, "error": "read_timeout", "status": None, "attempts": 1, "latency_ms": None, "timeout_failures": 1})()
+        start = (page_number - 1) * page_size
+        rows = [_garment_row(index) for index in range(start, min(start + page_size, 4))]
+        return _api_result({"data": rows, "totalRows": 4})
+
+    monkeypatch.setattr(client, "_get_json", _fake_get_json)
+    result = await client._fetch_endpoint_rows(
+        endpoint="/garments/details",
+        params={"startDate": "2026-01-01", "endDate": "2026-01-02", "page": 1, "pageSize": 2},
+        metadata=[],
+        errors={},
+        error_diagnostics={},
+        endpoint_health={},
+    )
+
+    assert requests[0] == (1, 2)
+    assert (2, 1) in requests
+    # Only pages requested at the downgraded size contribute rows.
+    assert all(size == 1 for page_number, size in requests if page_number > 2)
+    assert result["pagination"]["rows_per_page"] == 1
+
+
 @pytest.mark.asyncio
 async def test_garments_fetch_complete_records_structured_page_metrics(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
     client = TdApiClient(
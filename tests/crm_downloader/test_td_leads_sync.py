@@ -3564,7 +3564,7 @@ async def test_td_leads_seeded_run_notification_plans_email(
         )
         sent_plans = []
 
-        def _capture_send_email(_smtp_config, plan):
+        def _capture_send_email(_smtp_config, plan, **_kwargs):
             sent_plans.append(plan)
             return True
 
@@ -4551,6 +4551,91 @@ async def test_td_leads_order_history_enrichment_adds_safe_diagnostics_for_exist
     assert "9000000002" not in json.dumps(warning_markers, sort_keys=True)
 
 
+@pytest.mark.asyncio
+async def test_td_leads_order_history_enrichment_indexes_orders_once_per_cost_center(tmp_path) -> None:
+    database_url = f"sqlite+aiosqlite:///{tmp_path / 'td_order_history_index.db'}"
+    engine = create_async_engine(database_url)
+    try:
+        async with engine.begin() as connection:
+            await connection.execute(sa.text("CREATE TABLE store_master (store_code TEXT, cost_center TEXT)"))
+            await connection.execute(sa.text("""
+                CREATE TABLE vw_orders (
+                    cost_center TEXT,
+                    store_code TEXT,
+                    mobile_number TEXT,
+                    order_number TEXT,
+                    order_date TEXT,
+                    order_amount NUMERIC
+                )
+            """))
+            await connection.execute(sa.text("CREATE TABLE sales (cost_center TEXT, order_number TEXT, payment_date TEXT)"))
+            await connection.execute(sa.text("CREATE TABLE order_line_items (cost_center TEXT, order_number TEXT, service_name TEXT)"))
+            await connection.execute(sa.text("INSERT INTO store_master (store_code, cost_center) VALUES ('A200', 'CC200')"))
+            for index in range(20):
+                mobile = f"90000000{index:02d}"
+                await connection.execute(
+                    sa.text(
+                        "INSERT INTO vw_orders (cost_center, store_code, mobile_number, order_number, order_date, order_amount) "
+                        "VALUES ('CC200', 'A200', :mobile, :old_order, '2026-05-01 10:00:00+00:00', 100), "
+                        "('CC200', 'A200', :formatted_mobile, :new_order, '2026-05-02 10:00:00+00:00', 300)"
+                    ),
+                    {
+                        "mobile": mobile,
+                        "formatted_mobile": f"+91 {mobile[:5]} {mobile[5:]}",
+                        "old_order": f"SO-{index}-A",
+                        "new_order": f"SO-{index}-B",
+                    },
+                )
+                await connection.execute(
+                    sa.text(
+                        "INSERT INTO sales (cost_center, order_number, payment_date) VALUES "
+                        "('CC200', :order, '2026-05-02 11:00:00+00:00'), ('CC200', :order, '2026-05-03 11:00:00+00:00')"
+                    ),
+                    {"order": f"SO-{index}-B"},
+                )
+                await connection.execute(
+                    sa.text(
+                        "INSERT INTO order_line_items (cost_center, order_number, service_name) VALUES "
+                        "('CC200', :order, 'Wash'), ('CC200', :order, ' Iron ')"
+                    ),
+                    {"order": f"SO-{index}-B"},
+                )
+
+        rows = [
+            {"store_code": "A200", "pickup_no": f"A200-{index}", "mobile": f"90000000{index:02d}", "customer_type": None}
+            for index in range(20)
+        ]
+        rows.append({"store_code": "A200", "pickup_no": "A200-NEW", "mobile": "9111111111", "customer_type": None})
+
+        statements: list[str] = []
+
+        def record_statement(_conn, _cursor, statement, *_args) -> None:
+            statements.append(statement)
+
+        sa.event.listen(sa.engine.Engine, "before_cursor_execute", record_statement)
+        try:
+            await td_leads_main._enrich_td_lead_rows_with_order_history(database_url=database_url, rows=rows)
+        finally:
+            sa.event.remove(sa.engine.Engine, "before_cursor_execute", record_statement)
+    finally:
+        await engine.dispose()
+
+    # store_master, one vw_orders scan, then one sales and one order_line_items lookup for the whole batch.
+    assert sum("vw_orders" in statement for statement in statements) == 1
+    assert len(statements) == 4
+    for index, row in enumerate(rows[:-1]):
+        assert row["customer_type"] == "Existing"
+        assert row["previous_number_of_orders"] == 2
+        assert str(row["average_order_amount"]) == "200"
+        assert row["last_order_number"] == f"SO-{index}-B"
+        assert row["last_order_date"] == "2026-05-02 10:00:00+00:00"
+        assert row["last_payment_date"] == "2026-05-03 11:00:00+00:00"
+        assert row["last_service_names"] == "Iron, Wash"
+        assert row["order_history_candidate_rows_for_store"] == 40
+    assert rows[-1]["customer_type"] == "New"
+    assert rows[-1]["last_order_number"] is None
+
+
 @pytest.mark.asyncio
 async def test_td_leads_order_history_enrichment_keeps_null_customer_zero_matches_new_without_warning(tmp_path) -> None:
     database_url = f"sqlite+aiosqlite:///{tmp_path / 'td_order_history_null_customer_zero.db'}"
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import io
+import re
+import zipfile
 from datetime import datetime, timedelta
 from decimal import Decimal
 from pathlib import Path
@@ -11,11 +13,14 @@ import pytest
 import sqlalchemy as sa
 
 from app.common.db import session_scope
+from app.common.workbook_ingest import bulk_upsert, without_trailing_footers
 from app.crm_downloader.td_orders_sync.ingest import (
     TdOrdersIngestResult,
     _expected_headers,
     _coerce_input_row,
     _orders_table,
+    _read_workbook_rows,
+    _is_footer_row,
     _stg_td_orders_table,
     ingest_td_orders_rows,
     ingest_td_orders_workbook,
@@ -531,6 +536,58 @@ async def test_td_amount_provenance_preserves_explicit_zero_and_degrades_unusabl
     ]
 
 
+@pytest.mark.asyncio
+async def test_ingest_td_orders_rows_bulk_upsert_collapses_duplicates_and_counts(tmp_path: Path) -> None:
+    db_path = tmp_path / "orders_bulk.db"
+    database_url = f"sqlite+aiosqlite:///{db_path}"
+    _create_tables(database_url)
+    run_date = datetime(2025, 5, 20, 12, 0, tzinfo=ZoneInfo("Asia/Kolkata"))
+
+    def _row(order_number: str, net_amount: str) -> dict[str, str]:
+        return {"orderNo": order_number, "orderDate": "2025-05-10 09:30", "mobileNumber": "9999988888", "netAmount": net_amount}
+
+    first = await ingest_td_orders_rows(
+        rows=[_row("BULK-1", "100"), _row("BULK-2", "200"), _row("BULK-1", "150")],
+        store_code="A668",
+        cost_center="UN3668",
+        run_id="bulk-1",
+        run_date=run_date,
+        database_url=database_url,
+        logger=get_logger(run_id="bulk-1"),
+    )
+    second = await ingest_td_orders_rows(
+        rows=[_row("BULK-2", "250"), _row("BULK-3", "300")],
+        store_code="A668",
+        cost_center="UN3668",
+        run_id="bulk-2",
+        run_date=run_date,
+        database_url=database_url,
+        logger=get_logger(run_id="bulk-2"),
+    )
+
+    assert (first.staging_rows, first.staging_inserted, first.staging_updated) == (3, 2, 0)
+    assert (first.final_inserted, first.final_updated) == (2, 0)
+    assert (second.staging_inserted, second.staging_updated) == (1, 1)
+    assert (second.final_inserted, second.final_updated) == (1, 1)
+
+    metadata = sa.MetaData()
+    orders_table = _orders_table(metadata)
+    async with session_scope(database_url) as session:
+        persisted = (
+            await session.execute(
+                sa.select(orders_table.c.order_number, orders_table.c.net_amount, orders_table.c.run_id).order_by(
+                    orders_table.c.order_number
+                )
+            )
+        ).all()
+    # The last duplicate in a batch wins, as it did with per-row upserts.
+    assert persisted == [
+        ("BULK-1", Decimal("150.00"), "bulk-1"),
+        ("BULK-2", Decimal("250.00"), "bulk-2"),
+        ("BULK-3", Decimal("300.00"), "bulk-2"),
+    ]
+
+
 @pytest.mark.asyncio
 async def test_ingest_td_orders_workbook(tmp_path: Path) -> None:
     db_path = tmp_path / "orders.db"
@@ -688,6 +745,60 @@ async def test_footer_row_is_skipped(tmp_path: Path) -> None:
     assert logs == []
 
 
+@pytest.mark.asyncio
+async def test_bulk_upsert_inserts_every_row_for_tables_without_a_key(tmp_path: Path) -> None:
+    database_url = f"sqlite+aiosqlite:///{tmp_path / 'keyless.db'}"
+    table = sa.Table("keyless_rows", sa.MetaData(), sa.Column("order_number", sa.String), sa.Column("amount", sa.Integer))
+    engine = sa.create_engine(f"sqlite:///{tmp_path / 'keyless.db'}")
+    table.metadata.create_all(engine)
+    engine.dispose()
+
+    rows = [{"order_number": "A", "amount": 1}, {"order_number": "A", "amount": 2}, {"order_number": "B", "amount": 3}]
+    async with session_scope(database_url) as session:
+        assert await bulk_upsert(session, table, rows, use_sqlite=True, chunk_size=2) == (3, 0)
+        await session.commit()
+        stored = (await session.execute(sa.select(table.c.amount).order_by(table.c.amount))).scalars().all()
+
+    assert stored == [1, 2, 3]
+
+
+def test_without_trailing_footers_keeps_footer_lookalikes_before_data() -> None:
+    rows = [
+        ("ORD-1", 10),
+        ("Total Order Summary", None),
+        ("ORD-2", 20),
+        (None, None),
+        ("Total Records: 2", None),
+        ("Report Generated On", "2025-05-20"),
+    ]
+
+    assert list(without_trailing_footers(iter(rows), is_footer=_is_footer_row)) == rows[:4]
+
+
+def test_read_workbook_rows_ignores_stale_sheet_dimension(tmp_path: Path) -> None:
+    source = _build_sample_workbook_with_footer(tmp_path / "orders_with_footer.xlsx")
+    stale = tmp_path / "orders_stale_dimension.xlsx"
+    # Some exporters write <dimension ref="A1"/>; read-only mode must not trust it.
+    with zipfile.ZipFile(source) as src, zipfile.ZipFile(stale, "w") as dst:
+        for item in src.infolist():
+            payload = src.read(item.filename)
+            if item.filename.startswith("xl/worksheets/sheet"):
+                payload = re.sub(rb'<dimension ref="[^"]+"', b'<dimension ref="A1"', payload)
+            dst.writestr(item, payload)
+
+    rows, _, dropped_rows, rows_downloaded, _ = _read_workbook_rows(
+        stale,
+        tz=ZoneInfo("Asia/Kolkata"),
+        warnings=[],
+        logger=JsonLogger(log_file_path=None),
+        store_code="A668",
+    )
+
+    assert rows_downloaded == 2
+    assert [row["order_number"] for row in rows] == ["ORD-001", "ORD-002"]
+    assert dropped_rows == []
+
+
 @pytest.mark.asyncio
 async def test_ingest_remarks_populated_for_invalid_data(tmp_path: Path) -> None:
     db_path = tmp_path / "orders.db"
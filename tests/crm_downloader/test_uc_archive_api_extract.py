@@ -445,3 +445,100 @@ def test_collect_archive_orders_logs_store_summary_payload() -> None:
     assert summary["invoice_latency_p95_ms"] is None
     assert summary["success_logging_mode"] == "aggregate"
     assert isinstance(summary["elapsed_seconds"], float)
+
+
+class _ConcurrentArchiveResponse:
+    def __init__(self, *, status: int, payload: object) -> None:
+        self.status = status
+        self._payload = payload
+
+    async def json(self) -> object:
+        return self._payload
+
+    async def text(self) -> str:
+        return str(self._payload)
+
+
+def _invoice_html(order_code: str, item_name: str) -> str:
+    return f"""
+    <div class="order-info-label">Order No. - {order_code} <span class="order-mode">(App)</span></div>
+    <table><tbody><tr>
+    <td>1.</td><td>Dry cleaning</td><td>999712</td><td><div>{item_name}</div></td><td><div>50</div></td><td><div>1</div></td><td>-</td><td>0</td><td><div>50</div></td>
+    </tr></tbody></table>
+    """
+
+
+class _ConcurrentArchivePage:
+    """Serves one delivered-orders page whose invoices finish in reverse order."""
+
+    def __init__(self, booking_count: int) -> None:
+        self.request = self
+        self.bookings = [
+            {"id": 500 + index, "booking_code": f"UC610-{index:04d}", "status": 7, "payment_details": "[]"}
+            for index in range(booking_count)
+        ]
+        self.token_resolutions = 0
+        self.invoice_authorizations: list[str | None] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def evaluate(self, _script: str, arg: dict | None = None):
+        if arg is not None:
+            booking_id = int(arg["requestUrl"].split("/")[-1].split("?")[0])
+            return {"ok": True, "status": 200, "payload": self._invoice_for(booking_id)}
+        self.token_resolutions += 1
+        return {"token": f"token.{self.token_resolutions}.sig", "tokenSourceType": "localStorage_direct_key"}
+
+    def _invoice_for(self, booking_id: int) -> str:
+        index = booking_id - 500
+        return _invoice_html(f"UC610-{index:04d}", f"Item {index}")
+
+    async def get(self, url: str, timeout: int, headers: dict[str, str]) -> _ConcurrentArchiveResponse:
+        if "getDeliveredOrders" in url:
+            return _ConcurrentArchiveResponse(
+                status=200,
+                payload={"data": self.bookings, "pagination": {"total": len(self.bookings), "totalPages": 1}},
+            )
+        booking_id = int(url.split("/")[-1].split("?")[0])
+        authorization = headers.get("Authorization")
+        self.invoice_authorizations.append(authorization)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01 * (len(self.bookings) - (booking_id - 500)))
+        finally:
+            self.in_flight -= 1
+        if authorization == "Bearer token.1.sig":
+            return _ConcurrentArchiveResponse(status=401, payload="")
+        return _ConcurrentArchiveResponse(status=200, payload=self._invoice_for(booking_id))
+
+
+def test_collect_archive_orders_fetches_invoices_concurrently_in_booking_order(monkeypatch) -> None:
+    archive_api_extract._TOKEN_DIAGNOSTICS_LOGGED_STORES.clear()
+    archive_api_extract._TOKEN_KEY_DEBUG_LOGGED_STORES.clear()
+    monkeypatch.setattr(archive_api_extract, "ARCHIVE_INVOICE_CONCURRENCY", 3)
+    monkeypatch.setattr(archive_api_extract, "ARCHIVE_INVOICE_MIN_INTERVAL_SECONDS", 0.0)
+    page = _ConcurrentArchivePage(booking_count=6)
+    logger = JsonLogger(run_id="test", stream=io.StringIO(), log_file_path=None)
+
+    extract = asyncio.run(
+        collect_archive_orders_via_api(
+            page=page,
+            store_code="UC610",
+            logger=logger,
+            from_date=date(2026, 6, 1),
+            to_date=date(2026, 6, 2),
+        )
+    )
+
+    assert page.max_in_flight == 3
+    # The first token is resolved once for the page and refreshed once after the
+    # initial wave of 401s; later invoices go out with the refreshed token.
+    assert page.token_resolutions == 2
+    assert page.invoice_authorizations[-1] == "Bearer token.2.sig"
+    expected_codes = [f"UC610-{index:04d}" for index in range(6)]
+    assert [row["order_code"] for row in extract.base_rows] == expected_codes
+    assert [row["order_code"] for row in extract.order_detail_rows] == expected_codes
+    assert [row["item_name"] for row in extract.order_detail_rows] == [f"Item {index}" for index in range(6)]
+    assert all(row["customer_source"] == "App" for row in extract.base_rows)
+    assert extract.skipped_order_codes == []
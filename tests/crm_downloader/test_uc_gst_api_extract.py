@@ -9,6 +9,7 @@ from urllib.parse import parse_qs, urlparse
 
 from app.crm_downloader.uc_orders_sync import gst_api_extract
 from app.crm_downloader.uc_orders_sync.gst_api_extract import collect_gst_orders_via_api
+from app.crm_downloader.uc_orders_sync.gst_invoice_cache import GstInvoiceCache
 from app.dashboard_downloader.json_logger import JsonLogger, get_logger
 
 
@@ -770,3 +771,92 @@ def test_collect_gst_orders_via_api_non_empty_data_preserves_current_status(monk
     assert events[-1]["message"] == "GST API experimental extraction complete"
     assert events[-1]["source_fetch_status"] == "success"
     assert events[-1]["confirmed_empty"] is False
+
+
+def test_collect_gst_orders_via_api_reuses_cached_final_invoices(monkeypatch, tmp_path) -> None:
+    tax_rows = [
+        {
+            "order_number": "UC610-0001",
+            "invoice_number": "INV-001",
+            "invoice_date": "2026-01-01",
+            "final_amount": 50,
+            "payment_status": "Paid",
+        },
+        {
+            "order_number": "UC610-0002",
+            "invoice_number": "INV-002",
+            "invoice_date": "2026-01-01",
+            "final_amount": 75,
+            "payment_status": "Pending",
+        },
+    ]
+    booking_lookups: list[str] = []
+    invoice_fetches: list[str] = []
+
+    async def _fake_resolve_archive_bearer_token(*, page, logger, store_code):
+        return "token"
+
+    async def _fake_request_json_with_retries(*, page, method, url, headers, data):
+        if "tax-report" in url:
+            return {"data": [dict(row) for row in tax_rows]}
+        return {"data": []}
+
+    async def _fake_resolve_booking_id_for_order(*, page, order_code, headers):
+        booking_lookups.append(order_code)
+        return 101, {"booking_code": order_code, "id": 101, "suggestions": "Fold only"}
+
+    async def _fake_fetch_invoice_html_with_retries(*, order_code, **_kwargs):
+        invoice_fetches.append(order_code)
+        return (
+            f"""
+            <div class="order-info-label">Order No. - {order_code} <span class="order-mode">(App)</span></div>
+            <table><tbody><tr>
+            <td>1.</td><td>Dry cleaning</td><td>999712</td><td><div>Shirt</div></td><td><div>50</div></td><td><div>1</div></td><td>-</td><td>0</td><td><div>50</div></td>
+            </tr></tbody></table>
+            """,
+            0,
+        )
+
+    monkeypatch.setattr(gst_api_extract, "_resolve_archive_bearer_token", _fake_resolve_archive_bearer_token)
+    monkeypatch.setattr(gst_api_extract, "_request_json_with_retries", _fake_request_json_with_retries)
+    monkeypatch.setattr(gst_api_extract, "_resolve_booking_id_for_order", _fake_resolve_booking_id_for_order)
+    monkeypatch.setattr(gst_api_extract, "_fetch_invoice_html_with_retries", _fake_fetch_invoice_html_with_retries)
+    cache = GstInvoiceCache(tmp_path / "invoice_cache", ttl_days=30)
+
+    def _run():
+        return asyncio.run(
+            collect_gst_orders_via_api(
+                page=_FakePage(),
+                store_code="UC610",
+                logger=get_logger("test_uc_gst_api_extract"),
+                from_date=date(2026, 1, 1),
+                to_date=date(2026, 1, 31),
+                invoice_cache=cache,
+            )
+        )
+
+    first = _run()
+    assert (first.invoice_cache_hits, first.invoice_cache_misses) == (0, 2)
+    assert booking_lookups == invoice_fetches == ["UC610-0001", "UC610-0002"]
+
+    booking_lookups.clear()
+    invoice_fetches.clear()
+    second = _run()
+
+    # Only the pending order goes back to the network; the paid one is replayed.
+    assert (second.invoice_cache_hits, second.invoice_cache_misses) == (1, 1)
+    assert booking_lookups == invoice_fetches == ["UC610-0002"]
+    assert second.order_detail_rows == first.order_detail_rows
+    assert second.base_rows == first.base_rows
+    assert second.gst_rows == first.gst_rows
+    assert second.order_detail_snapshot_rows == first.order_detail_snapshot_rows
+    # A replayed invoice performs no booking lookup.
+    assert first.booking_lookup_hits == 2
+    assert second.booking_lookup_hits == 1
+
+    # A changed invoice fingerprint drops the cached entry.
+    tax_rows[0]["final_amount"] = 60
+    booking_lookups.clear()
+    third = _run()
+    assert third.invoice_cache_hits == 0
+    assert booking_lookups == ["UC610-0001", "UC610-0002"]
@@ -330,6 +330,45 @@ async def test_recovery_detection_recovers_lead_once_when_multiple_orders_match(
         assert recovered_order_id == "FIRST"
 
 
+@pytest.mark.asyncio
+async def test_recovery_detection_writes_in_fixed_statement_count_for_large_backlog(tmp_path: Path) -> None:
+    url = await _prepare_db(tmp_path)
+    async with session_scope(url) as session:
+        for index in range(40):
+            mobile = f"98765{index:05d}"
+            await _insert_lead(session, lead_id=index * 3 + 1, mobile=mobile, lead_date=date(2026, 6, 1))
+            await _insert_lead(session, lead_id=index * 3 + 2, mobile=mobile, lead_date=date(2026, 6, 3))
+            await _insert_lead(session, lead_id=index * 3 + 3, mobile=mobile, lead_date=date(2026, 6, 20))
+            await session.execute(
+                sa.text("INSERT INTO vw_orders (cost_center, order_number, order_date, customer_name, mobile_number, order_amount) VALUES ('A100', :order_number, '2026-06-10 10:00:00', 'C', :mobile, 100.00)"),
+                {"order_number": f"O{index:03d}", "mobile": mobile},
+            )
+        await session.commit()
+
+    statements: list[str] = []
+
+    def _record(_conn, _cursor, statement, *_args) -> None:
+        statements.append(statement.split(None, 1)[0].upper())
+
+    async with session_scope(url) as session:
+        sync_engine = session.bind.sync_engine
+        sa.event.listen(sync_engine, "before_cursor_execute", _record)
+        try:
+            result = await detect_recoveries(session, as_of_date=date(2026, 6, 30), pipeline_run_id="run1")
+        finally:
+            sa.event.remove(sync_engine, "before_cursor_execute", _record)
+        await session.commit()
+        statuses = dict((await session.execute(sa.select(trx_customer_followup_leads.c.lead_id, trx_customer_followup_leads.c.lead_status))).all())
+
+    assert (result.leads_recovered, result.leads_closed, result.history_inserted) == (40, 40, 80)
+    # Leads, history keys, orders, SQLite history id, then one statement per write kind.
+    assert statements.count("UPDATE") == 2
+    assert statements.count("INSERT") == 1
+    assert len(statements) == 7
+    assert [statuses[lead_id] for lead_id in (1, 2, 3)] == [LEAD_STATUS_CLOSED, LEAD_STATUS_RECOVERED, LEAD_STATUS_OPEN]
+    assert {match.lead_id for match in result.matches} == {index * 3 + 2 for index in range(40)}
+
+
 @pytest.mark.asyncio
 async def test_snapshot_excludes_suppressed_open_leads_and_invalid_mobile(tmp_path: Path) -> None:
     url = await _prepare_db(tmp_path)
@@ -358,6 +397,43 @@ async def test_snapshot_excludes_suppressed_open_leads_and_invalid_mobile(tmp_pa
         assert snapshot.rows_existing_open_lead == 1
 
 
+@pytest.mark.asyncio
+async def test_snapshot_lookups_do_not_scale_with_customer_count(tmp_path: Path) -> None:
+    url = await _prepare_db(tmp_path)
+    async with session_scope(url) as session:
+        values = ", ".join(
+            f"('{center}', 'O{center}{index}', '2026-04-01 10:00:00', 'C{index}', '98765{index:05d}', 100.00)"
+            for center in ("A100", "B200")
+            for index in range(40)
+        )
+        await session.execute(sa.text(f"INSERT INTO vw_orders (cost_center, order_number, order_date, customer_name, mobile_number, order_amount) VALUES {values}"))
+        await _insert_lead(session, lead_id=1, cost_center="A100", mobile="9876500001", lead_date=date(2026, 1, 5), status=LEAD_STATUS_CLOSED)
+        await _insert_lead(session, lead_id=2, cost_center="A100", mobile="9876500001", lead_date=date(2026, 2, 5), status=LEAD_STATUS_CLOSED)
+        await _insert_lead(session, lead_id=3, cost_center="B200", mobile="9876500002", lead_date=date(2026, 2, 1))
+        await create_time_bound_suppression(session, cost_center="B200", normalized_mobile_number="9876500003", reason=WORKBOOK_OUTCOME_NOT_INTERESTED, start_date=date(2026, 6, 1), source_lead_id=3, pipeline_run_id="run1")
+        await session.commit()
+
+        statements: list[str] = []
+        sync_engine = session.bind.sync_engine
+        listener = lambda *args: statements.append(args[2])  # noqa: E731
+        sa.event.listen(sync_engine, "before_cursor_execute", listener)
+        try:
+            snapshot = await build_customer_retention_snapshot(session, snapshot_date=date(2026, 6, 12))
+        finally:
+            sa.event.remove(sync_engine, "before_cursor_execute", listener)
+
+        # One order scan plus followup, open-lead and suppression loads per cost center.
+        assert len(statements) == 1 + 3 * 2
+        by_key = {(row.cost_center, row.normalized_mobile_number): row for row in snapshot.rows}
+        assert len(snapshot.rows) == 78
+        assert by_key[("A100", "9876500001")].last_followup_date == date(2026, 2, 5)
+        assert ("B200", "9876500002") not in by_key
+        assert ("B200", "9876500003") not in by_key
+        assert by_key[("A100", "9876500002")].last_followup_date is None
+        assert snapshot.rows_existing_open_lead == 1
+        assert snapshot.rows_suppressed == 1
+
+
 @pytest.mark.asyncio
 async def test_lifecycle_suppression_and_recovery_changes_are_transactional(tmp_path: Path) -> None:
     url = await _prepare_db(tmp_path)
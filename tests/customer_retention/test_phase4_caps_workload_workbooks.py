@@ -12,7 +12,7 @@ import pytest
 import sqlalchemy as sa
 from sqlalchemy.ext.asyncio import create_async_engine
 
-from app.common.db import session_scope
+from app.common.db import _ensure_async_engine, session_scope
 from app.dashboard_downloader.json_logger import JsonLogger
 from app.customer_retention.caps import resolve_active_cap
 from app.customer_retention.retention_generation import allocate_and_generate_retention_leads
@@ -756,6 +756,63 @@ async def test_generated_workbook_reingestion_ignores_protected_edits_and_preser
     assert history["staff_remarks"] == "Valid editable values"
 
 
+@pytest.mark.asyncio
+async def test_returned_workbook_resolves_leads_in_bulk_and_rereads_transitioned_leads(tmp_path: Path) -> None:
+    url = await _prepare_db(tmp_path)
+    async with session_scope(url) as session:
+        for lead_id in range(601, 621):
+            await _insert_lead(session, lead_id=lead_id, mobile=f"9876500{lead_id}")
+        await session.commit()
+
+    workbook = openpyxl.Workbook()
+    workbook.active.title = READ_ME_SHEET
+    sheet = workbook.create_sheet(FOLLOWUP_SHEET)
+    sheet.append(["lead_id", "cost_center", "mobile_number", "Contact Attempted", "Customer Response", "Complaint", "Do Not Contact"])
+    for lead_id in range(601, 621):
+        # Even rows are matched by lead_id, odd rows by cost center and mobile;
+        # every fourth row is left pending.
+        response = None if lead_id % 4 == 0 else "Interested"
+        sheet.append([lead_id if lead_id % 2 == 0 else None, "a100", f"9876500{lead_id}", "Yes", response, "No", "No"])
+    sheet.append([None, "A100", "9876500601", "Yes", None, "No", "No"])
+    path = tmp_path / "returned.xlsx"
+    workbook.save(path)
+
+    lead_selects: list[str] = []
+
+    def _record(_conn, _cursor, statement, *_args) -> None:
+        if statement.lstrip().upper().startswith("SELECT") and "FROM trx_customer_followup_leads" in statement:
+            lead_selects.append(statement)
+
+    sync_engine = _ensure_async_engine(url).sync_engine
+    sa.event.listen(sync_engine, "before_cursor_execute", _record)
+    try:
+        result = await ingest_returned_workbook(database_url=url, path=path, pipeline_run_id="run-bulk-return")
+    finally:
+        sa.event.remove(sync_engine, "before_cursor_execute", _record)
+
+    assert result.rows_seen == 21
+    assert result.rows_skipped == 0
+    assert result.rows_pending_not_updated == 6
+    assert result.history_inserted == 21
+    # One bulk query per lookup kind, plus a re-read of lead 601 for the last
+    # row because an earlier row already transitioned it.
+    assert len(lead_selects) == 3
+
+    async with session_scope(url) as session:
+        pending_601 = (
+            await session.execute(
+                sa.select(trx_customer_followup_history.c.previous_status).where(
+                    trx_customer_followup_history.c.lead_id == 601,
+                    trx_customer_followup_history.c.event_type.like("Pending_Not_Updated:%"),
+                )
+            )
+        ).scalar_one()
+        statuses = dict((await session.execute(sa.select(trx_customer_followup_leads.c.lead_id, trx_customer_followup_leads.c.lead_status))).all())
+
+    assert pending_601 == statuses[601] != LEAD_STATUS_OPEN
+    assert statuses[604] == LEAD_STATUS_OPEN
+
+
 def _snapshot_row(index: int, *, cost_center: str = "A100", snapshot_date: date = date(2026, 6, 12), priority: Decimal | None = None) -> CustomerRetentionSnapshotRow:
     mobile = f"987650{index:04d}"
     return CustomerRetentionSnapshotRow(
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+from decimal import Decimal
+from io import StringIO
+from typing import Any
+
+import pytest
+
+from app.dashboard_downloader.dashboard_scraper import (
+    _DASHBOARD_TABLES_SNAPSHOT_JS,
+    extract_dashboard_summary,
+)
+from app.dashboard_downloader.json_logger import JsonLogger
+
+
+def _table(header_text: str, headers: list[str], rows: list[list[str]], *, bordered: bool = False) -> dict:
+    return {"header_text": header_text, "headers": headers, "rows": rows, "bordered": bordered}
+
+
+def _heading(text: str, *, section_title: bool = False, **tables: list[int]) -> dict:
+    return {
+        "text": text.lower(),
+        "inner_text": text,
+        "section_title": section_title,
+        "following_tables": tables.get("following", []),
+        "container_tables": tables.get("container", []),
+        "parent_tables": tables.get("parent", []),
+    }
+
+
+SNAPSHOT = {
+    "tables": [
+        _table("Unrelated totals", ["A", "B"], [["1", "2"]]),
+        _table(
+            "Prev Month Target LMTD MTD FTD Revenue",
+            ["", "Prev Month", "Target", "LMTD", "MTD", "FTD"],
+            [["Revenue", "1,000", "2,000", "900", "1,200", "80"]],
+        ),
+        _table(
+            "Pickup New Existing Total Conversion",
+            ["New", "New Conv", "New %", "Total", "Total Conv", "Total %"],
+            [["10", "4", "40", "25", "10", "40"]],
+        ),
+        _table(
+            "Delivery Total Orders Delivered Undelivered TAT",
+            ["Total Orders", "Within TAT", "TAT (%)", "Total Delivered", "Undel. > 10 Days", "Total Undel."],
+            [["50", "45", "90", "48", "2 orders", "5"]],
+            bordered=True,
+        ),
+        _table(
+            "Repeat Customer (6 months ago) Repeat Orders Total Base (%)",
+            ["Repeat Customer (6 months ago)", "Repeat Orders", "Total Base (%)"],
+            [["120", "30", "25"]],
+            bordered=True,
+        ),
+        _table(
+            "Package Target New FTD Achievement Overall",
+            ["Target", "New", "FTD", "Achievement", "Overall"],
+            [["20", "5", "1", "25", "60"]],
+        ),
+    ],
+    "headings": [
+        _heading("Revenue", container=[0, 1]),
+        _heading("Pickup", following=[2]),
+        _heading("Delivery", section_title=True, following=[3, 4]),
+        _heading("Repeat Customers", section_title=True, following=[4]),
+        _heading("Package", parent=[5]),
+    ],
+}
+
+
+class _EmptyLocator:
+    first: "_EmptyLocator"
+
+    def __init__(self) -> None:
+        self.first = self
+
+    async def count(self) -> int:
+        return 0
+
+    def locator(self, _selector: str) -> "_EmptyLocator":
+        return self
+
+
+class _SnapshotPage:
+    def __init__(self) -> None:
+        self.scripts: list[str] = []
+        self.selectors: list[str] = []
+
+    async def evaluate(self, script: str) -> Any:
+        self.scripts.append(script)
+        return SNAPSHOT
+
+    def locator(self, selector: str, *_args: Any, **_kwargs: Any) -> _EmptyLocator:
+        self.selectors.append(selector)
+        return _EmptyLocator()
+
+
+@pytest.mark.asyncio
+async def test_extract_dashboard_summary_parses_sections_from_one_dom_snapshot() -> None:
+    page = _SnapshotPage()
+
+    data = await extract_dashboard_summary(
+        page,
+        {"store_code": "A001", "store_name": "Demo Store"},
+        logger=JsonLogger(stream=StringIO(), log_file_path=None),
+    )
+
+    assert page.scripts == [_DASHBOARD_TABLES_SNAPSHOT_JS]
+    # Tables come from the snapshot; only the title/GSTIN/launch-date lookups use locators.
+    assert not any("table" in selector or "h3[contains" in selector for selector in page.selectors)
+    assert data["prev_month_revenue"] == Decimal("1000")
+    assert data["mtd_revenue"] == Decimal("1200")
+    assert data["pickup_new_count"] == 10
+    assert data["pickup_total_conv_pct"] == Decimal("40")
+    assert data["delivery_tat_pct"] == Decimal("90")
+    assert data["delivery_undel_over_10_days"] == 2
+    assert data["delivery_total_undelivered"] == 5
+    assert data["repeat_customer_base_6m"] == 120
+    assert data["repeat_orders"] == 30
+    assert data["repeat_total_base_pct"] == Decimal("25")
+    assert data["package_target"] == 20
+    assert data["package_overall"] == 60
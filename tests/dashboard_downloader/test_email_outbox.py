@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import asyncio
+import socketserver
+import threading
+import time
+from email import message_from_bytes
+
+import pytest
+
+from app.dashboard_downloader import notifications
+from app.dashboard_downloader.notifications import (
+    EmailOutbox,
+    EmailPlan,
+    NotificationSendRetryConfig,
+    SmtpConfig,
+)
+
+
+class _StandInSmtpServer(socketserver.ThreadingTCPServer):
+    """Minimal SMTP server that records sessions and delivered messages."""
+
+    allow_reuse_address = True
+    daemon_threads = True
+
+    def __init__(self, *, drop_after_messages: int | None = None, data_delay: float = 0.0) -> None:
+        super().__init__(("127.0.0.1", 0), _StandInSmtpHandler)
+        self.drop_after_messages = drop_after_messages
+        self.data_delay = data_delay
+        self.connections = 0
+        self.messages: list[tuple[list[str], bytes]] = []
+
+    @property
+    def port(self) -> int:
+        return self.server_address[1]
+
+
+class _StandInSmtpHandler(socketserver.StreamRequestHandler):
+    server: _StandInSmtpServer
+
+    def _reply(self, line: str) -> None:
+        self.wfile.write(f"{line}\r\n".encode())
+
+    def handle(self) -> None:
+        self.server.connections += 1
+        recipients: list[str] = []
+        self._reply("220 stand-in ready")
+        while line := self.rfile.readline():
+            command = line.decode().strip()
+            verb = command.split(" ", 1)[0].upper()
+            if verb in {"EHLO", "HELO"}:
+                self._reply("250 stand-in")
+            elif verb == "MAIL":
+                recipients = []
+                self._reply("250 OK")
+            elif verb == "RCPT":
+                recipients.append(command.split(":", 1)[1].strip(" <>"))
+                self._reply("250 OK")
+            elif verb == "DATA":
+                self._reply("354 go ahead")
+                body = b""
+                while (chunk := self.rfile.readline()) != b".\r\n":
+                    body += chunk
+                time.sleep(self.server.data_delay)
+                self.server.messages.append((recipients, body))
+                self._reply("250 queued")
+                drop_after = self.server.drop_after_messages
+                if drop_after is not None and len(self.server.messages) == drop_after:
+                    return
+            elif verb == "QUIT":
+                self._reply("221 bye")
+                return
+            else:
+                self._reply("250 OK")
+
+
+@pytest.fixture
+def smtp_server(request):
+    server = _StandInSmtpServer(**getattr(request, "param", {}))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _plan(index: int) -> EmailPlan:
+    return EmailPlan(
+        profile_code="store_daily_reports",
+        scope="store",
+        store_code=f"A00{index}",
+        subject=f"Store report {index}",
+        body="body",
+        to=[f"store{index}@example.test"],
+        cc=[],
+        bcc=[],
+        attachments=[],
+    )
+
+
+def _config(port: int) -> SmtpConfig:
+    return SmtpConfig(
+        host="127.0.0.1",
+        port=port,
+        sender="reports@example.test",
+        username=None,
+        password=None,
+        use_tls=False,
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("smtp_server", [{"data_delay": 0.05}], indirect=True)
+async def test_outbox_sends_plans_over_one_connection_off_the_event_loop(smtp_server) -> None:
+    outbox = EmailOutbox(_config(smtp_server.port))
+    for index in range(3):
+        outbox.add(_plan(index))
+    ticks = 0
+
+    async def ticker() -> None:
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    ticker_task = asyncio.create_task(ticker())
+    results = await outbox.flush()
+    ticker_task.cancel()
+
+    assert [result.sent for result in results] == [True, True, True]
+    assert smtp_server.connections == 1
+    assert outbox.connections_opened == 1
+    assert [recipients for recipients, _ in smtp_server.messages] == [
+        ["store0@example.test"],
+        ["store1@example.test"],
+        ["store2@example.test"],
+    ]
+    assert message_from_bytes(smtp_server.messages[2][1])["Subject"] == "Store report 2"
+    # Three 50ms DATA replies ran in the worker thread while the loop kept ticking.
+    assert ticks >= 5
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("smtp_server", [{"drop_after_messages": 1}], indirect=True)
+async def test_outbox_reconnects_after_server_drops_session(monkeypatch, smtp_server) -> None:
+    monkeypatch.setattr(
+        notifications,
+        "_load_notification_send_retry_config",
+        lambda: NotificationSendRetryConfig(
+            max_attempts=2,
+            initial_delay_seconds=0,
+            max_delay_seconds=0,
+            transient_exception_types=(notifications.smtplib.SMTPServerDisconnected,),
+        ),
+    )
+    outbox = EmailOutbox(_config(smtp_server.port))
+    outbox.add(_plan(0))
+    outbox.add(_plan(1))
+
+    results = await outbox.flush()
+
+    assert [result.sent for result in results] == [True, True]
+    assert [result.attempt_count for result in results] == [1, 2]
+    assert smtp_server.connections == 2
+    assert len(smtp_server.messages) == 2
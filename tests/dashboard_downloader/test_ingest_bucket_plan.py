@@ -0,0 +1,149 @@
+import csv
+import io
+import random
+from datetime import date
+
+import pytest
+
+from app.common.ingest.schemas import (
+    SkipRow,
+    _DateColumnParser,
+    _parse_date_text,
+    coerce_csv_row,
+    compile_bucket_plan,
+    normalize_headers,
+)
+
+HEADERS_BY_BUCKET = {
+    "missed_leads": [
+        "Pickup Row Id",
+        "Mobile Number",
+        "pickup_no",
+        "Pickup Created Date",
+        "pickup-created-time",
+        "Store Code",
+        "store_name",
+        "Customer Name",
+        "is_order_placed",
+    ],
+    "undelivered_all": [
+        "order_no",
+        "order_date",
+        "store_code",
+        "taxable_amount",
+        "net_amount",
+        "mobile_no",
+        "expected_deliver_on",
+        "actual_deliver_on",
+    ],
+    "repeat_customers": ["Store Code", "Mobile No.", "Status"],
+    "nonpackage_all": [
+        "Store Code",
+        "Store Name",
+        "Mobile No",
+        "Taxable Amount",
+        "Order Date",
+        "Expected Delivery Date",
+        "Actual Delivery Date",
+        "Mobile No",
+    ],
+}
+
+DATE_VALUES = [
+    "",
+    "  ",
+    "2024-05-01",
+    "2024-05-01 10:30:00",
+    "2024-05-01 10:30",
+    "01-05-2024",
+    "01-05-2024 10:30",
+    "01/05/2024",
+    "12/25/2024",
+    "03/04/2024 09:15:00",
+    "12/25/2024 09:15",
+    "2024-05-01T10:30:00",
+    "not a date",
+]
+NUMBER_VALUES = ["", "12", "12.9", " 7 ", "-3", "abc", "1e3"]
+TEXT_VALUES = ["", "  ", "A001", " B002 ", "9876543210", "+91 98765 43210", "0O98765432"]
+BOOL_VALUES = ["", "1", "0", "true", "FALSE", "yes"]
+
+
+def _value_for(header: str, rng: random.Random) -> str:
+    lowered = header.lower()
+    if "date" in lowered or "deliver_on" in lowered:
+        return rng.choice(DATE_VALUES)
+    if "amount" in lowered or "row id" in lowered:
+        return rng.choice(NUMBER_VALUES)
+    if "placed" in lowered:
+        return rng.choice(BOOL_VALUES)
+    return rng.choice(TEXT_VALUES)
+
+
+def _outcome(func):
+    try:
+        return ("ok", func())
+    except SkipRow as exc:
+        return ("skip", str(exc), exc.store_code, exc.report_date, sorted(exc.missing_columns))
+    except ValueError as exc:
+        return ("error", type(exc).__name__, str(exc))
+
+
+@pytest.mark.parametrize("bucket", sorted(HEADERS_BY_BUCKET))
+def test_compiled_plan_matches_coerce_csv_row(bucket):
+    rng = random.Random(f"plan-parity-{bucket}")
+    headers = HEADERS_BY_BUCKET[bucket]
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(headers)
+    for _ in range(400):
+        row = [_value_for(header, rng) for header in headers]
+        if rng.random() < 0.1:
+            row = row[: rng.randrange(len(row))]
+        writer.writerow(row)
+    text = buffer.getvalue()
+    extra_fields = {"run_id": "run-1", "run_date": date(2024, 5, 2)}
+
+    dict_reader = csv.DictReader(io.StringIO(text))
+    header_map = normalize_headers(dict_reader.fieldnames)
+    expected = [
+        _outcome(lambda row=row: coerce_csv_row(bucket, row, header_map, extra_fields=extra_fields))
+        for row in dict_reader
+    ]
+
+    list_reader = csv.reader(io.StringIO(text))
+    plan = compile_bucket_plan(bucket, next(list_reader))
+    actual = [
+        _outcome(lambda values=values: plan.coerce_row(values, extra_fields=extra_fields))
+        for values in list_reader
+        if values
+    ]
+
+    assert actual == expected
+    assert any(result[0] == "ok" for result in actual)
+
+
+def test_compiled_plan_preserves_output_key_order():
+    headers = HEADERS_BY_BUCKET["undelivered_all"]
+    header_map = normalize_headers(headers)
+    values = ["O1", "2024-05-01", "A001", "1", "2", "9876543210", "", ""]
+    extra_fields = {"run_id": "run-1", "run_date": date(2024, 5, 2), "source": "csv"}
+
+    expected = coerce_csv_row(
+        "undelivered_all", dict(zip(headers, values)), header_map, extra_fields=extra_fields
+    )
+    actual = compile_bucket_plan("undelivered_all", headers).coerce_row(
+        values, extra_fields=extra_fields
+    )
+
+    assert list(actual.items()) == list(expected.items())
+
+
+def test_date_parser_hint_keeps_day_first_precedence():
+    parser = _DateColumnParser()
+
+    assert parser("12/25/2024") == date(2024, 12, 25)
+    # Month-first is now the hinted format, but day-first still wins when valid.
+    assert parser("03/04/2024") == _parse_date_text("03/04/2024")[0] == date(2024, 4, 3)
+    assert parser("2024-05-01") == date(2024, 5, 1)
+    assert parser("garbage") is None
@@ -0,0 +1,209 @@
+from contextlib import asynccontextmanager
+from datetime import date
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.common.ingest import service
+from app.dashboard_downloader.json_logger import JsonLogger
+
+
+def _compile(stmt) -> str:
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+class _FakeDriverConnection:
+    def __init__(self):
+        self.copies: list[dict] = []
+
+    async def copy_records_to_table(self, table_name, *, records, columns):
+        self.copies.append({"table": table_name, "records": list(records), "columns": columns})
+
+
+class _FakeConnection:
+    def __init__(self, driver_connection):
+        self.driver = driver_connection
+        self.statements = []
+
+    async def execute(self, stmt):
+        self.statements.append(stmt)
+
+    async def get_raw_connection(self):
+        return SimpleNamespace(driver_connection=self.driver)
+
+
+class _FakeResult:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def __iter__(self):
+        return iter(self._rows)
+
+    def one(self):
+        return self._rows[0]
+
+
+class _FakeSession:
+    def __init__(self, *, driver: str = "asyncpg", results=None):
+        self.driver = _FakeDriverConnection()
+        self.connection_obj = _FakeConnection(self.driver)
+        self.statements = []
+        self._results = list(results or [])
+        self._driver_name = driver
+
+    def get_bind(self):
+        return SimpleNamespace(dialect=SimpleNamespace(name="postgresql", driver=self._driver_name))
+
+    async def connection(self):
+        return self.connection_obj
+
+    async def execute(self, stmt):
+        self.statements.append(stmt)
+        return _FakeResult(self._results.pop(0))
+
+
+def _undelivered_row(order_id: str, actual_deliver_on: date | None = None) -> dict:
+    return {
+        "order_id": order_id,
+        "order_date": date(2025, 1, 1),
+        "store_code": "A001",
+        "store_name": None,
+        "taxable_amount": 10.0,
+        "net_amount": 11.0,
+        "service_code": None,
+        "mobile_no": None,
+        "status": None,
+        "customer_id": None,
+        "expected_deliver_on": None,
+        "actual_deliver_on": actual_deliver_on,
+        "run_id": "run-1",
+        "run_date": date(2025, 1, 2),
+    }
+
+
+@pytest.mark.asyncio
+async def test_copy_upsert_rows_streams_chunks_and_promotes_once():
+    rows = [_undelivered_row(f"O{i}") for i in range(5)]
+    session = _FakeSession(results=[[(4, 3)]])
+
+    totals = await service._copy_upsert_rows(session, "undelivered_all", iter(rows), batch_size=2)
+
+    assert totals == {"affected_rows": 3, "deduped_rows": 4}
+    create_sql = _compile(session.connection_obj.statements[0])
+    assert "CREATE TEMPORARY TABLE _ingest_stage_undelivered_all" in create_sql
+    assert "ON COMMIT DROP" in create_sql
+
+    copies = session.driver.copies
+    assert [len(copy["records"]) for copy in copies] == [2, 2, 1]
+    assert copies[0]["columns"][-1] == service.STAGING_ORDINAL_COLUMN
+    assert [copy["records"][-1][-1] for copy in copies] == [2, 4, 5]
+
+    assert len(session.statements) == 1
+    promote_sql = _compile(session.statements[0])
+    assert "DISTINCT ON (_ingest_stage_undelivered_all.store_code, _ingest_stage_undelivered_all.order_id)" in promote_sql
+    assert "INSERT INTO undelivered_orders" in promote_sql
+    assert "ON CONFLICT (store_code, order_id) DO UPDATE SET actual_deliver_on = excluded.actual_deliver_on" in promote_sql
+    assert "WHERE undelivered_orders.actual_deliver_on IS DISTINCT FROM excluded.actual_deliver_on" in promote_sql
+
+
+@pytest.mark.asyncio
+async def test_copy_upsert_rows_falls_back_to_deduped_count_when_nothing_changes():
+    session = _FakeSession(results=[[(2, 0)]])
+
+    totals = await service._copy_upsert_rows(
+        session,
+        "undelivered_all",
+        [_undelivered_row("O1"), _undelivered_row("O2")],
+        batch_size=10,
+    )
+
+    assert totals == {"affected_rows": 2, "deduped_rows": 2}
+
+
+@pytest.mark.asyncio
+async def test_copy_upsert_rows_skips_staging_for_empty_input():
+    session = _FakeSession()
+
+    totals = await service._copy_upsert_rows(session, "undelivered_all", [], batch_size=10)
+
+    assert totals == {"affected_rows": 0, "deduped_rows": 0}
+    assert session.connection_obj.statements == []
+    assert session.statements == []
+
+
+@pytest.mark.asyncio
+async def test_copy_upsert_rows_collects_missed_lead_store_counts():
+    row = {
+        "pickup_row_id": 1,
+        "mobile_number": "9999999999",
+        "store_code": "A001",
+        "is_order_placed": True,
+        "pickup_created_date": None,
+        "pickup_created_time": None,
+        "run_id": "run-1",
+        "run_date": date(2025, 1, 2),
+    }
+    session = _FakeSession(results=[[("A001", 1)], [(1, 1)]])
+    store_counts: dict[str, int] = {"A001": 0}
+
+    await service._copy_upsert_rows(
+        session, "missed_leads", [row], batch_size=10, store_counts=store_counts
+    )
+
+    assert store_counts == {"A001": 1}
+    promote_sql = _compile(session.statements[1])
+    order_by = promote_sql.split("ORDER BY", 1)[1]
+    assert order_by.index("is_order_placed, false) DESC") < order_by.index(
+        "pickup_created_date DESC NULLS LAST"
+    )
+    assert "WHERE missed_leads.is_order_placed IS DISTINCT FROM excluded.is_order_placed" in promote_sql
+
+
+@pytest.mark.asyncio
+async def test_ingest_bucket_bulk_load_falls_back_without_asyncpg(monkeypatch, tmp_path: Path):
+    csv_path = tmp_path / "undelivered.csv"
+    csv_path.write_text("order_id,store_code\nO1,A001\n", encoding="utf-8")
+
+    session = _FakeSession(driver="psycopg")
+
+    @asynccontextmanager
+    async def fake_begin():
+        yield
+
+    session.begin = fake_begin
+
+    @asynccontextmanager
+    async def fake_session_scope(database_url):
+        yield session
+
+    batches: list[list[dict]] = []
+
+    async def fake_upsert_batch(_session, _bucket, rows, **_kwargs):
+        batches.append(rows)
+        return {"affected_rows": len(rows), "deduped_rows": len(rows)}
+
+    async def fail_copy(*_args, **_kwargs):
+        raise AssertionError("COPY path must not run without asyncpg")
+
+    events: list[dict] = []
+    monkeypatch.setattr(service, "session_scope", fake_session_scope)
+    monkeypatch.setattr(service, "_upsert_batch", fake_upsert_batch)
+    monkeypatch.setattr(service, "_copy_upsert_rows", fail_copy)
+    monkeypatch.setattr(service, "log_event", lambda **kwargs: events.append(kwargs))
+
+    totals = await service.ingest_bucket(
+        bucket="undelivered_all",
+        csv_path=csv_path,
+        batch_size=10,
+        database_url="postgresql://example",
+        logger=JsonLogger(log_file_path=None),
+        run_id="run-1",
+        run_date=date(2025, 1, 2),
+        bulk_load=True,
+    )
+
+    assert totals["rows"] == 1
+    assert len(batches) == 1
+    assert any("bulk load requires" in event.get("message", "") for event in events)
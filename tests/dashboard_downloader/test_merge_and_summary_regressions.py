@@ -2,6 +2,7 @@ from datetime import datetime, timezone
 from pathlib import Path
 
 from app.dashboard_downloader import run_downloads
+from app.dashboard_downloader.json_logger import JsonLogger
 from app.dashboard_downloader.run_summary import RunAggregator
 
 
@@ -136,3 +137,35 @@ async def test_finalize_summary_and_email_marks_warning_when_zero_emails_sent(mo
     assert aggregator.email_metrics["emails_planned"] == 0
     assert aggregator.email_metrics["emails_sent"] == 0
     assert aggregator.email_metrics["message"] != "notification dispatch completed"
+
+
+def test_finalize_merges_counts_rows_in_merge_pass(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(run_downloads, "DATA_DIR", tmp_path)
+    monkeypatch.setattr(run_downloads, "MERGED_NAMES", {"missed_leads": "merged_missed_leads_test.csv"})
+
+    first = tmp_path / "A001-missed-leads.csv"
+    # No trailing newline: the next file's rows must still start on their own line.
+    first.write_bytes(b'Mobile,Note\r\n111,"two\nlines"\r\n222,plain')
+    second = tmp_path / "A002-missed-leads.csv"
+    second.write_bytes(b"No data available to export.\nMobile,Note\n333,x\n")
+    empty = tmp_path / "A003-missed-leads.csv"
+    empty.write_bytes(b"No data available to export.")
+
+    download_counts = {
+        "missed_leads": {
+            code: {"rows": 0, "path": str(path)}
+            for code, path in (("A001", first), ("A002", second), ("A003", empty))
+        }
+    }
+    run_downloads._finalize_merges(
+        {"missed_leads": [first, second, empty]},
+        download_counts,
+        logger=JsonLogger(log_file_path=None),
+    )
+
+    counts = download_counts["missed_leads"]
+    assert [counts[code]["rows"] for code in ("A001", "A002", "A003")] == [2, 1, 0]
+    assert counts["__merged__"]["rows"] == 3
+    merged = tmp_path / "merged_missed_leads_test.csv"
+    assert merged.read_bytes() == b'Mobile,Note\r\n111,"two\nlines"\r\n222,plain\n333,x\n'
+    assert run_downloads._count_rows(merged) == 3
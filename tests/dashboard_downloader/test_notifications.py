@@ -1142,6 +1142,15 @@ async def test_send_notifications_retries_transient_smtp_failure_then_succeeds(m
     assert result["emails_planned"] == 1
     assert result["emails_sent"] == 1
     assert result["errors"] == []
+    assert result["deliveries"] == [
+        {
+            "profile_code": "run_summary",
+            "store_code": None,
+            "subject": "Run run-1",
+            "status": "sent",
+            "attempt_count": 3,
+        }
+    ]
 
 
 def test_resolve_transient_exception_types_includes_ssl_eof() -> None:
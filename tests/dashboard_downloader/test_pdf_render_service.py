@@ -0,0 +1,124 @@
+import asyncio
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+import app.config
+from app.dashboard_downloader import report_generator
+from app.dashboard_downloader.json_logger import JsonLogger
+
+
+class _FakePage:
+    def __init__(self, browser: "_FakeBrowser") -> None:
+        self.browser = browser
+        self.closed = False
+
+    def is_closed(self) -> bool:
+        return self.closed
+
+    async def set_content(self, html: str, wait_until: str) -> None:
+        self.browser.state["active"] += 1
+        self.browser.state["peak"] = max(self.browser.state["peak"], self.browser.state["active"])
+        await asyncio.sleep(0)
+        self.browser.state["active"] -= 1
+        if html == "crash":
+            self.browser.connected = False
+            raise RuntimeError("Target closed")
+
+    async def pdf(self, *, path: str, **_options) -> None:
+        Path(path).write_bytes(b"%PDF")
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class _FakeBrowser:
+    def __init__(self, state: dict) -> None:
+        self.state = state
+        self.connected = True
+        self.pages: list[_FakePage] = []
+
+    def is_connected(self) -> bool:
+        return self.connected
+
+    async def new_page(self) -> _FakePage:
+        self.pages.append(_FakePage(self))
+        return self.pages[-1]
+
+    async def close(self) -> None:
+        self.connected = False
+
+
+@pytest.fixture
+def fake_browsers(monkeypatch: pytest.MonkeyPatch) -> list[_FakeBrowser]:
+    browsers: list[_FakeBrowser] = []
+    state = {"active": 0, "peak": 0}
+
+    async def launch(**_kwargs) -> _FakeBrowser:
+        browsers.append(_FakeBrowser(state))
+        return browsers[-1]
+
+    class _Playwright:
+        chromium = SimpleNamespace(launch=launch, executable_path="/bundled/chromium")
+
+        async def stop(self) -> None:
+            return None
+
+    class _Starter:
+        async def start(self) -> _Playwright:
+            return _Playwright()
+
+    monkeypatch.setattr(report_generator, "async_playwright", lambda: _Starter())
+    monkeypatch.setattr(
+        app.config,
+        "config",
+        SimpleNamespace(
+            pdf_render_backend="bundled_chromium",
+            pdf_render_headless=True,
+            pdf_render_chrome_executable=None,
+            pdf_render_timeout_seconds=5,
+            pdf_render_concurrency=2,
+        ),
+    )
+    return browsers
+
+
+@pytest.mark.asyncio
+async def test_renders_share_one_warm_browser_with_bounded_pages(fake_browsers, tmp_path: Path):
+    logger = JsonLogger(log_file_path=None)
+
+    paths = await asyncio.gather(
+        *(
+            report_generator.render_pdf_with_configured_browser(
+                f"<p>{index}</p>", tmp_path / f"report_{index}.pdf", logger=logger
+            )
+            for index in range(5)
+        )
+    )
+    await report_generator.close_pdf_renderer()
+
+    assert paths == [tmp_path / f"report_{index}.pdf" for index in range(5)]
+    assert all(path.read_bytes() == b"%PDF" for path in paths)
+    assert len(fake_browsers) == 1
+    assert len(fake_browsers[0].pages) == 2
+    assert fake_browsers[0].state["peak"] == 2
+    assert not fake_browsers[0].connected
+
+
+@pytest.mark.asyncio
+async def test_renderer_relaunches_browser_after_crash(fake_browsers, tmp_path: Path):
+    logger = JsonLogger(log_file_path=None)
+
+    with pytest.raises(RuntimeError):
+        await report_generator.render_pdf_with_configured_browser(
+            "crash", tmp_path / "crash.pdf", logger=logger
+        )
+    await report_generator.render_pdf_with_configured_browser(
+        "<p>ok</p>", tmp_path / "ok.pdf", logger=logger
+    )
+    await report_generator.close_pdf_renderer()
+
+    assert len(fake_browsers) == 2
+    assert fake_browsers[0].pages[0].closed
+    assert (tmp_path / "ok.pdf").exists()
@@ -0,0 +1,86 @@
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from app.dashboard_downloader import run_downloads
+from app.dashboard_downloader.json_logger import JsonLogger
+from app.dashboard_downloader.run_downloads import (
+    NavigationTooManyRequestsError,
+    SkipStoreDashboardError,
+    _RequestRateLimiter,
+    _run_store_download_worker,
+)
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_spaces_concurrent_callers(monkeypatch):
+    clock = {"now": 100.0}
+    sleeps: list[float] = []
+
+    async def fake_sleep(delay):
+        sleeps.append(delay)
+        clock["now"] += delay
+
+    monkeypatch.setattr(run_downloads.time, "monotonic", lambda: clock["now"])
+    monkeypatch.setattr(run_downloads.asyncio, "sleep", fake_sleep)
+
+    limiter = _RequestRateLimiter(0.5)
+    await asyncio.gather(*(limiter.wait_turn() for _ in range(3)))
+
+    assert sleeps == [pytest.approx(0.5), pytest.approx(0.5)]
+
+
+@pytest.mark.asyncio
+async def test_workers_record_results_per_store_position(monkeypatch):
+    async def fake_switch(page, store_cfg, *, merged_buckets, download_counts, **_kwargs):
+        sc = store_cfg["store_code"]
+        if sc == "A002":
+            raise SkipStoreDashboardError("closed")
+        if sc == "A003":
+            raise NavigationTooManyRequestsError("429")
+        # Finish later stores first so ordering must come from the position key.
+        await asyncio.sleep(0.01 if sc == "A001" else 0)
+        merged_buckets.setdefault("missed_leads", []).append(Path(f"{sc}.csv"))
+        download_counts.setdefault("missed_leads", {})[sc] = {"rows": 1}
+        return page
+
+    monkeypatch.setattr(run_downloads, "_switch_to_store_dashboard_and_download", fake_switch)
+    monkeypatch.setattr(run_downloads, "log_event", lambda **_kwargs: None)
+
+    queue: asyncio.Queue = asyncio.Queue()
+    for position, sc in enumerate(["A001", "A002", "A003", "A004"]):
+        queue.put_nowait((position, {"store_code": sc}))
+
+    download_counts: dict = {}
+    store_results: dict = {}
+    original_sleep = asyncio.sleep
+
+    async def patched_sleep(delay):
+        # Skip the 429 backoff but keep the short ordering delays.
+        if delay < 1:
+            await original_sleep(delay)
+
+    monkeypatch.setattr(run_downloads.asyncio, "sleep", patched_sleep)
+
+    await asyncio.gather(
+        *(
+            _run_store_download_worker(
+                object(),
+                queue,
+                logger=JsonLogger(log_file_path=None),
+                nav_timeout_ms=1000,
+                settings=None,
+                download_counts=download_counts,
+                store_results=store_results,
+            )
+            for _ in range(2)
+        )
+    )
+
+    assert sorted(store_results) == [0, 1, 2, 3]
+    assert store_results[0][0] == {"missed_leads": [Path("A001.csv")]}
+    assert store_results[1] == ({}, {})
+    assert store_results[2] == ({}, {})
+    assert store_results[3][1] == {"missed_leads": {"A004": {"rows": 1}}}
+    assert download_counts == {"_meta": {"rate_limited_skips": 1}}
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+from datetime import date, datetime
+
+import pytest
+import sqlalchemy as sa
+
+from app.common.dashboard_store import DASHBOARD_SUMMARY_COLUMNS
+from app.common.db import _ensure_async_engine
+from app.common.ingest.models import Base
+from app.dashboard_downloader.report_generator import (
+    StoreReportDataNotFound,
+    build_store_context,
+    build_store_contexts,
+)
+
+REPORT_DATE = date(2026, 3, 10)
+
+
+async def _seed(database_url: str) -> None:
+    engine = _ensure_async_engine(database_url)
+    numeric_columns = ",\n".join(f"{column} NUMERIC" for column in DASHBOARD_SUMMARY_COLUMNS)
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+        await connection.execute(
+            sa.text(
+                "CREATE TABLE store_master (id INTEGER PRIMARY KEY, store_code TEXT NOT NULL, store_name TEXT)"
+            )
+        )
+        await connection.execute(
+            sa.text(
+                f"""
+                CREATE TABLE store_dashboard_summary (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    store_id INTEGER NOT NULL,
+                    dashboard_date DATE NOT NULL,
+                    run_date_time DATETIME NOT NULL,
+                    {numeric_columns},
+                    created_at DATETIME,
+                    updated_at DATETIME
+                )
+                """
+            )
+        )
+        await connection.execute(
+            sa.text(
+                "INSERT INTO store_master (id, store_code, store_name) VALUES "
+                "(1, 'a001', 'Alpha Store'), (2, 'B002', 'Beta Store'), (3, 'C003', 'Gamma Store')"
+            )
+        )
+        summaries = [
+            (1, REPORT_DATE, datetime(2026, 3, 10, 8), 40),
+            (1, REPORT_DATE, datetime(2026, 3, 10, 20), 45),
+            (1, date(2026, 3, 9), datetime(2026, 3, 9, 20), 30),
+            (1, date(2026, 3, 8), datetime(2026, 3, 8, 20), 10),
+            (2, REPORT_DATE, datetime(2026, 3, 10, 20), 7),
+            (3, date(2026, 3, 9), datetime(2026, 3, 9, 20), 99),
+        ]
+        for store_id, dashboard_date, run_date_time, pickups in summaries:
+            await connection.execute(
+                sa.text(
+                    "INSERT INTO store_dashboard_summary (store_id, dashboard_date, run_date_time, pickup_total_count) "
+                    "VALUES (:store_id, :dashboard_date, :run_date_time, :pickups)"
+                ),
+                {
+                    "store_id": store_id,
+                    "dashboard_date": dashboard_date,
+                    "run_date_time": run_date_time,
+                    "pickups": pickups,
+                },
+            )
+        await connection.execute(
+            sa.text(
+                """
+                INSERT INTO missed_leads
+                    (pickup_row_id, mobile_number, store_code, pickup_created_date, pickup_date, is_order_placed, customer_type)
+                VALUES
+                    (1, '9000000001', 'A001', '2026-03-10', '2026-03-10', 0, 'New'),
+                    (2, '9000000002', 'A001', '2026-03-09', '2026-03-09', 0, 'Existing'),
+                    (3, '9000000003', 'a001', '2026-03-08', '2026-03-10', 1, 'New'),
+                    (4, '9000000004', 'B002', '2026-03-10', '2026-03-09', 0, 'New')
+                """
+            )
+        )
+        await connection.execute(
+            sa.text(
+                """
+                INSERT INTO undelivered_orders
+                    (order_id, store_code, order_date, expected_deliver_on, net_amount)
+                VALUES
+                    ('O1', 'A001', '2026-03-10', NULL, 100.0),
+                    ('O2', 'A001', '2026-03-01', '2026-03-04', 50.0),
+                    ('O3', 'B002', '2026-03-10', '2026-03-12', 25.0)
+                """
+            )
+        )
+        await connection.execute(
+            sa.text(
+                "INSERT INTO repeat_customers (store_code, mobile_no) VALUES "
+                "('A001', '1'), ('A001', '2'), ('B002', '3')"
+            )
+        )
+
+
+@pytest.mark.asyncio
+async def test_build_store_contexts_loads_all_stores_with_fixed_query_count(tmp_path) -> None:
+    database_url = f"sqlite+aiosqlite:///{tmp_path / 'store_reports.db'}"
+    await _seed(database_url)
+    statements: list[str] = []
+    engine = _ensure_async_engine(database_url)
+
+    def record(_conn, _cursor, statement, *_args) -> None:
+        statements.append(statement)
+
+    sa.event.listen(engine.sync_engine, "before_cursor_execute", record)
+    try:
+        contexts = await build_store_contexts(
+            ["A001", "b002", "C003"], REPORT_DATE, "run-1", database_url=database_url
+        )
+    finally:
+        sa.event.remove(engine.sync_engine, "before_cursor_execute", record)
+
+    assert len(statements) == 6
+    # C003 only has an earlier snapshot, so it has no report for the day.
+    assert sorted(contexts) == ["A001", "B002"]
+
+    alpha = contexts["A001"]
+    assert alpha["store_name"] == "Alpha Store"
+    assert (alpha["pickups_today"], alpha["pickups_yday"], alpha["pickups_delta"]) == (45, 30, 15.0)
+    assert (alpha["leads_today"], alpha["leads_yday"]) == (2, 1)
+    assert alpha["undelivered_snapshot_count"] == 1
+    assert [row["order_id"] for row in alpha["undelivered_orders_rows"]] == ["O2", "O1"]
+    assert alpha["undelivered_orders_total_amount"] == 150.0
+    assert [row["phone"] for row in alpha["missed_leads_rows"]] == ["9000000002", "9000000001"]
+
+    beta = contexts["B002"]
+    assert (beta["pickups_today"], beta["pickups_yday"]) == (7, None)
+    assert (beta["leads_today"], beta["leads_yday"]) == (0, 1)
+    assert beta["repeat_customers_today"] == 1
+    assert [row["order_id"] for row in beta["undelivered_orders_rows"]] == ["O3"]
+
+    single = await build_store_context("a001", REPORT_DATE, "run-1", database_url=database_url)
+    assert {key: value for key, value in single.items() if key != "generated_at"} == {
+        key: value for key, value in alpha.items() if key != "generated_at"
+    }
+    with pytest.raises(StoreReportDataNotFound):
+        await build_store_context("C003", REPORT_DATE, "run-1", database_url=database_url)
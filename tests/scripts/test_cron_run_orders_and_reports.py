@@ -59,8 +59,7 @@ def test_cron_uses_bsd_safe_mktemp_templates(tmp_path: Path) -> None:
     _write_successful_preflight(scripts_dir)
     for child_script in (
         "orders_sync_run_profiler.sh",
-        "run_local_reports_daily_sales.sh",
-        "run_local_reports_pending_deliveries.sh",
+        "run_local_reports_all.sh",
     ):
         _write_executable(scripts_dir / child_script, "#!/usr/bin/env bash\nexit 0\n")
 
@@ -93,9 +92,7 @@ def test_cron_uses_bsd_safe_mktemp_templates(tmp_path: Path) -> None:
             "CRON_PATH": str(bin_dir),
             "ORDERS_MAX_ATTEMPTS": "1",
             "ORDERS_PREFLIGHT_MAX_ATTEMPTS": "1",
-            "DAILY_MAX_ATTEMPTS": "1",
-            "PENDING_MAX_ATTEMPTS": "1",
-            "DAILY_RESCUE_AFTER_PENDING_SUCCESS": "0",
+            "REPORTS_MAX_ATTEMPTS": "1",
             "TMPDIR": str(tmp_path),
         }
     )
@@ -136,8 +133,7 @@ def test_cron_mktemp_empty_path_fails_before_launching_children(tmp_path: Path)
     for child_script in (
         "orders_sync_connectivity_preflight.sh",
         "orders_sync_run_profiler.sh",
-        "run_local_reports_daily_sales.sh",
-        "run_local_reports_pending_deliveries.sh",
+        "run_local_reports_all.sh",
     ):
         _write_executable(
             scripts_dir / child_script,
@@ -159,9 +155,7 @@ def test_cron_mktemp_empty_path_fails_before_launching_children(tmp_path: Path)
             "CRON_PATH": str(bin_dir),
             "ORDERS_MAX_ATTEMPTS": "1",
             "ORDERS_PREFLIGHT_MAX_ATTEMPTS": "1",
-            "DAILY_MAX_ATTEMPTS": "1",
-            "PENDING_MAX_ATTEMPTS": "1",
-            "DAILY_RESCUE_AFTER_PENDING_SUCCESS": "0",
+            "REPORTS_MAX_ATTEMPTS": "1",
             "TMPDIR": str(tmp_path),
         }
     )
@@ -288,6 +282,7 @@ from pathlib import Path
 
 from app.recovery import main as recovery_main
 from app.reports.daily_sales_report import pipeline as daily_pipeline
+from app.reports.mtd_same_day_fulfillment import pipeline as mtd_pipeline
 from app.reports.pending_deliveries import pipeline as pending_pipeline
 
 
@@ -335,9 +330,14 @@ async def _fake_daily_run(
     )
 
 
+async def _fake_mtd_run(report_date, env, force):
+    _record("mtd-same-day-fulfillment", report_date=report_date, env=env, force=force)
+
+
 recovery_main._run = _fake_recovery_run
 pending_pipeline._run = _fake_pending_run
 daily_pipeline._run = _fake_daily_run
+mtd_pipeline._run = _fake_mtd_run
 """.lstrip(),
         encoding="utf-8",
     )
@@ -419,6 +419,33 @@ def test_daily_sales_wrapper_reaches_async_pipeline_with_cron_upstream_args(
     }
 
 
+def test_run_all_wrapper_reaches_every_report_pipeline_with_cron_upstream_args(
+    tmp_path: Path,
+) -> None:
+    result, invocations = _run_report_wrapper_through_app(
+        tmp_path, "run_local_reports_all.sh", *_CRON_UPSTREAM_ARGS
+    )
+
+    _assert_wrapper_smoke_succeeded(result)
+    by_pipeline = {invocation.pop("pipeline"): invocation for invocation in invocations}
+    assert sorted(by_pipeline) == [
+        "daily-sales",
+        "mtd-same-day-fulfillment",
+        "pending-deliveries",
+    ]
+    pipelines = [invocation for invocation in by_pipeline.values()]
+    assert all(invocation.pop("report_date") is None for invocation in pipelines)
+    assert by_pipeline["mtd-same-day-fulfillment"] == {"env": "prod", "force": False}
+    for name in ("daily-sales", "pending-deliveries"):
+        assert by_pipeline[name] == {
+            "env": "prod",
+            "force": False,
+            "orders_sync_upstream_status": "success_with_warnings",
+            "orders_sync_upstream_run_id": "profiler-cron-smoke",
+        }
+    assert "report pending_deliveries status=ok" in result.stdout
+
+
 def test_pending_deliveries_cron_path_always_regenerates_without_force_gate() -> None:
     cron_source = Path("scripts/cron_run_orders_and_reports.sh").read_text(encoding="utf-8")
     local_pending_source = Path("scripts/run_local_reports_pending_deliveries.sh").read_text(
@@ -429,29 +456,30 @@ def test_pending_deliveries_cron_path_always_regenerates_without_force_gate() ->
     assert 'ORDERS_MAX_ATTEMPTS="${ORDERS_MAX_ATTEMPTS:-3}"' in cron_source
     assert 'ORDERS_RETRY_DELAY_SECONDS="${ORDERS_RETRY_DELAY_SECONDS:-30}"' in cron_source
     assert "PENDING_DELIVERIES_REGENERATE_ARGS" not in cron_source
-    assert 'run_local_reports_pending_deliveries.sh"' in cron_source
+    assert 'run_local_reports_all.sh"' in cron_source
     assert "pending-deliveries --env prod --force" not in local_pending_source
     assert "pending-deliveries --env prod" in local_pending_source
     assert "recovery mark-aged-pending-deliveries" in cron_source
     assert "recovery mark-aged-pending-deliveries" not in local_pending_source
 
 
-def test_cron_marks_aged_pending_deliveries_before_daily_sales_report() -> None:
+def test_cron_marks_aged_pending_deliveries_before_reports_run_all() -> None:
     cron_source = Path("scripts/cron_run_orders_and_reports.sh").read_text(
         encoding="utf-8"
     )
+    run_all_source = Path("scripts/run_local_reports_all.sh").read_text(encoding="utf-8")
 
     recovery_index = cron_source.index(
         'run_step_with_retries "Script 2: recovery.mark-aged-pending-deliveries"'
     )
-    daily_index = cron_source.index(
-        'run_step_with_retries "Script 3: daily_sales_report"'
-    )
-    pending_index = cron_source.index(
-        'run_step_with_retries "Script 4: pending_deliveries"'
+    reports_index = cron_source.index(
+        'run_step_with_retries "Script 3: reports.run-all"'
     )
 
-    assert recovery_index < daily_index < pending_index
+    assert recovery_index < reports_index
+    assert "run_local_reports_daily_sales.sh" not in cron_source
+    assert "exec poetry run python -m app report run-all --env prod" in run_all_source
+    assert "--force" not in run_all_source.split("exec ", 1)[1]
 
 
 def test_cron_marks_environment_and_cli_errors_as_deterministic() -> None:
@@ -464,7 +492,9 @@ def test_cron_marks_environment_and_cli_errors_as_deterministic() -> None:
     assert "Poetry could not find a pyproject\\.toml" in cron_source
 
 
-def test_cron_returns_non_zero_when_daily_fails_even_if_rescue_succeeds(tmp_path: Path) -> None:
+def test_cron_runs_reports_once_by_default_and_fails_when_a_report_fails(
+    tmp_path: Path,
+) -> None:
     repo_root = tmp_path
     scripts_dir = repo_root / "scripts"
     logs_dir = repo_root / "logs"
@@ -482,38 +512,22 @@ def test_cron_returns_non_zero_when_daily_fails_even_if_rescue_succeeds(tmp_path
         "#!/usr/bin/env bash\nexit 0\n",
     )
     _write_executable(
-        scripts_dir / "run_local_reports_mtd_same_day_fulfillment.sh",
-        "#!/usr/bin/env bash\nexit 0\n",
-    )
-    _write_executable(
-        scripts_dir / "run_local_reports_pending_deliveries.sh",
-        "#!/usr/bin/env bash\nexit 0\n",
-    )
-    _write_executable(
-        scripts_dir / "run_local_reports_daily_sales.sh",
+        scripts_dir / "run_local_reports_all.sh",
         "#!/usr/bin/env bash\n"
-        "COUNT_FILE=\"${TMPDIR:-/tmp}/daily-call-count\"\n"
-        "count=0\n"
-        "[[ -f \"${COUNT_FILE}\" ]] && count=$(cat \"${COUNT_FILE}\")\n"
-        "count=$((count + 1))\n"
-        "printf '%s' \"${count}\" > \"${COUNT_FILE}\"\n"
-        "printf '%s\\n' \"$*\" >> \"${TMPDIR:-/tmp}/daily-args.log\"\n"
-        "if [[ \"${count}\" -le 3 ]]; then exit 1; fi\n"
-        "exit 0\n",
+        "printf '%s\\n' \"$*\" >> \"${TMPDIR:-/tmp}/reports-args.log\"\n"
+        "echo 'report daily_sales_report status=error'\n"
+        "echo 'report pending_deliveries status=ok'\n"
+        "exit 1\n",
     )
 
     env = os.environ.copy()
     env.update(
         {
             "ORDERS_MAX_ATTEMPTS": "1",
-            "DAILY_MAX_ATTEMPTS": "3",
-            "MTD_SAME_DAY_MAX_ATTEMPTS": "1",
-            "PENDING_MAX_ATTEMPTS": "1",
-            "DAILY_RESCUE_AFTER_PENDING_SUCCESS": "1",
-            "DAILY_RESCUE_MAX_ATTEMPTS": "1",
             "TMPDIR": str(tmp_path),
         }
     )
+    env.pop("REPORTS_MAX_ATTEMPTS", None)
 
     result = subprocess.run(
         [str(scripts_dir / "cron_run_orders_and_reports.sh")],
@@ -529,13 +543,14 @@ def test_cron_returns_non_zero_when_daily_fails_even_if_rescue_succeeds(tmp_path
     log_files = sorted(logs_dir.glob("cron_run_orders_and_reports_*.log"))
     assert log_files
     log_text = log_files[-1].read_text(encoding="utf-8")
-    assert "daily_sales_report_rc=1" in log_text
-    assert "daily_sales_report_rescue_rc=0" in log_text
+    assert "Script 3: reports.run-all: attempt 1/1 starting" in log_text
+    assert "report daily_sales_report status=error" in log_text
+    assert "reports_run_all_rc=1" in log_text
     assert "ERROR: One or more required cron steps failed" in log_text
 
-    args_lines = (tmp_path / "daily-args.log").read_text(encoding="utf-8").splitlines()
-    assert len(args_lines) == 4
-    assert all("--force" not in line for line in args_lines)
+    args_lines = (tmp_path / "reports-args.log").read_text(encoding="utf-8").splitlines()
+    assert len(args_lines) == 1
+    assert "--force" not in args_lines[0]
 
 
 def test_cron_fail_fast_on_deterministic_code_error(tmp_path: Path) -> None:
@@ -553,14 +568,9 @@ def test_cron_fail_fast_on_deterministic_code_error(tmp_path: Path) -> None:
 
     _write_executable(scripts_dir / "orders_sync_run_profiler.sh", "#!/usr/bin/env bash\nexit 0\n")
     _write_executable(
-        scripts_dir / "run_local_reports_mtd_same_day_fulfillment.sh",
-        "#!/usr/bin/env bash\nexit 0\n",
-    )
-    _write_executable(scripts_dir / "run_local_reports_pending_deliveries.sh", "#!/usr/bin/env bash\nexit 0\n")
-    _write_executable(
-        scripts_dir / "run_local_reports_daily_sales.sh",
+        scripts_dir / "run_local_reports_all.sh",
         "#!/usr/bin/env bash\n"
-        "COUNT_FILE=\"${TMPDIR:-/tmp}/daily-call-count\"\n"
+        "COUNT_FILE=\"${TMPDIR:-/tmp}/reports-call-count\"\n"
         "count=0\n"
         "[[ -f \"${COUNT_FILE}\" ]] && count=$(cat \"${COUNT_FILE}\")\n"
         "count=$((count + 1))\n"
@@ -572,12 +582,9 @@ def test_cron_fail_fast_on_deterministic_code_error(tmp_path: Path) -> None:
     env = os.environ.copy()
     env.update(
         {
-            "DAILY_MAX_ATTEMPTS": "4",
-            "DAILY_RETRY_DELAY_SECONDS": "0",
+            "REPORTS_MAX_ATTEMPTS": "4",
+            "REPORTS_RETRY_DELAY_SECONDS": "0",
             "ORDERS_MAX_ATTEMPTS": "1",
-            "MTD_SAME_DAY_MAX_ATTEMPTS": "1",
-            "PENDING_MAX_ATTEMPTS": "1",
-            "DAILY_RESCUE_AFTER_PENDING_SUCCESS": "0",
             "TMPDIR": str(tmp_path),
         }
     )
@@ -592,7 +599,7 @@ def test_cron_fail_fast_on_deterministic_code_error(tmp_path: Path) -> None:
     )
 
     assert result.returncode == 1
-    assert (tmp_path / "daily-call-count").read_text(encoding="utf-8") == "1"
+    assert (tmp_path / "reports-call-count").read_text(encoding="utf-8") == "1"
 
     log_files = sorted(logs_dir.glob("cron_run_orders_and_reports_*.log"))
     assert log_files
@@ -630,18 +637,10 @@ exit 0
 """,
     )
     _write_executable(
-        scripts_dir / "run_local_reports_pending_deliveries.sh",
+        scripts_dir / "run_local_reports_all.sh",
         """#!/usr/bin/env bash
-printf 'pending ran\n' >> "${TMPDIR:-/tmp}/pending-ran.log"
-printf '%s\n' "$*" >> "${TMPDIR:-/tmp}/pending-args.log"
-exit 0
-""",
-    )
-    _write_executable(
-        scripts_dir / "run_local_reports_daily_sales.sh",
-        """#!/usr/bin/env bash
-printf 'daily ran\n' >> "${TMPDIR:-/tmp}/daily-ran.log"
-printf '%s\n' "$*" >> "${TMPDIR:-/tmp}/daily-args.log"
+printf 'reports ran\n' >> "${TMPDIR:-/tmp}/reports-ran.log"
+printf '%s\n' "$*" >> "${TMPDIR:-/tmp}/reports-args.log"
 exit 0
 """,
     )
@@ -652,9 +651,7 @@ exit 0
             "ORDERS_MAX_ATTEMPTS": "1",
             "ORDERS_PREFLIGHT_MAX_ATTEMPTS": "3",
             "ORDERS_PREFLIGHT_RETRY_DELAY_SECONDS": "0",
-            "DAILY_MAX_ATTEMPTS": "1",
-            "PENDING_MAX_ATTEMPTS": "1",
-            "DAILY_RESCUE_AFTER_PENDING_SUCCESS": "0",
+            "REPORTS_MAX_ATTEMPTS": "1",
             "TMPDIR": str(tmp_path),
         }
     )
@@ -670,12 +667,9 @@ exit 0
 
     assert result.returncode == 1
     assert not (tmp_path / "orders-sync-invoked.log").exists()
-    assert (tmp_path / "daily-ran.log").read_text(encoding="utf-8") == "daily ran\n"
-    assert (tmp_path / "pending-ran.log").read_text(encoding="utf-8") == "pending ran\n"
-    daily_args = (tmp_path / "daily-args.log").read_text(encoding="utf-8")
-    pending_args = (tmp_path / "pending-args.log").read_text(encoding="utf-8")
-    assert "--orders-sync-upstream-status failed" in daily_args
-    assert "--orders-sync-upstream-status failed" in pending_args
+    assert (tmp_path / "reports-ran.log").read_text(encoding="utf-8") == "reports ran\n"
+    reports_args = (tmp_path / "reports-args.log").read_text(encoding="utf-8")
+    assert "--orders-sync-upstream-status failed" in reports_args
 
     log_files = sorted(logs_dir.glob("cron_run_orders_and_reports_*.log"))
     assert log_files
@@ -703,26 +697,15 @@ def test_cron_runs_reports_without_force_flags(tmp_path: Path) -> None:
 
     _write_executable(scripts_dir / "orders_sync_run_profiler.sh", "#!/usr/bin/env bash\nexit 0\n")
     _write_executable(
-        scripts_dir / "run_local_reports_mtd_same_day_fulfillment.sh",
-        "#!/usr/bin/env bash\nprintf '%s\\n' \"$*\" >> \"${TMPDIR:-/tmp}/mtd-args.log\"\nexit 0\n",
-    )
-    _write_executable(
-        scripts_dir / "run_local_reports_pending_deliveries.sh",
-        "#!/usr/bin/env bash\nprintf '%s\\n' \"$*\" >> \"${TMPDIR:-/tmp}/pending-args.log\"\nexit 0\n",
-    )
-    _write_executable(
-        scripts_dir / "run_local_reports_daily_sales.sh",
-        "#!/usr/bin/env bash\nprintf '%s\\n' \"$*\" >> \"${TMPDIR:-/tmp}/daily-args.log\"\nexit 0\n",
+        scripts_dir / "run_local_reports_all.sh",
+        "#!/usr/bin/env bash\nprintf '%s\\n' \"$*\" >> \"${TMPDIR:-/tmp}/reports-args.log\"\nexit 0\n",
     )
 
     env = os.environ.copy()
     env.update(
         {
             "ORDERS_MAX_ATTEMPTS": "1",
-            "DAILY_MAX_ATTEMPTS": "1",
-            "MTD_SAME_DAY_MAX_ATTEMPTS": "1",
-            "PENDING_MAX_ATTEMPTS": "1",
-            "DAILY_RESCUE_AFTER_PENDING_SUCCESS": "0",
+            "REPORTS_MAX_ATTEMPTS": "1",
             "TMPDIR": str(tmp_path),
         }
     )
@@ -737,10 +720,8 @@ def test_cron_runs_reports_without_force_flags(tmp_path: Path) -> None:
     )
 
     assert result.returncode == 0
-    daily_invocations = (tmp_path / "daily-args.log").read_text(encoding="utf-8").splitlines()
-    pending_invocations = (tmp_path / "pending-args.log").read_text(encoding="utf-8").splitlines()
-    assert daily_invocations == [""]
-    assert pending_invocations == [""]
+    reports_invocations = (tmp_path / "reports-args.log").read_text(encoding="utf-8").splitlines()
+    assert reports_invocations == [""]
 
 
 def test_cron_retries_preserve_mandatory_regeneration_without_force(tmp_path: Path) -> None:
@@ -757,17 +738,15 @@ def test_cron_retries_preserve_mandatory_regeneration_without_force(tmp_path: Pa
     _write_successful_preflight(scripts_dir)
 
     _write_executable(scripts_dir / "orders_sync_run_profiler.sh", "#!/usr/bin/env bash\nexit 0\n")
-    _write_executable(scripts_dir / "run_local_reports_mtd_same_day_fulfillment.sh", "#!/usr/bin/env bash\nexit 0\n")
-    _write_executable(scripts_dir / "run_local_reports_pending_deliveries.sh", "#!/usr/bin/env bash\nexit 0\n")
     _write_executable(
-        scripts_dir / "run_local_reports_daily_sales.sh",
+        scripts_dir / "run_local_reports_all.sh",
         """#!/usr/bin/env bash
-COUNT_FILE="${TMPDIR:-/tmp}/daily-count"
+COUNT_FILE="${TMPDIR:-/tmp}/reports-count"
 count=0
 [[ -f "${COUNT_FILE}" ]] && count=$(cat "${COUNT_FILE}")
 count=$((count + 1))
 printf '%s' "${count}" > "${COUNT_FILE}"
-printf '%s\n' "$*" >> "${TMPDIR:-/tmp}/daily-args.log"
+printf '%s\n' "$*" >> "${TMPDIR:-/tmp}/reports-args.log"
 if [[ "${count}" -eq 1 ]]; then exit 1; fi
 exit 0
 """,
@@ -777,11 +756,8 @@ exit 0
     env.update(
         {
             "ORDERS_MAX_ATTEMPTS": "1",
-            "DAILY_MAX_ATTEMPTS": "2",
-            "DAILY_RETRY_DELAY_SECONDS": "0",
-            "MTD_SAME_DAY_MAX_ATTEMPTS": "1",
-            "PENDING_MAX_ATTEMPTS": "1",
-            "DAILY_RESCUE_AFTER_PENDING_SUCCESS": "0",
+            "REPORTS_MAX_ATTEMPTS": "2",
+            "REPORTS_RETRY_DELAY_SECONDS": "0",
             "TMPDIR": str(tmp_path),
         }
     )
@@ -796,7 +772,7 @@ exit 0
     )
 
     assert result.returncode == 0
-    args_lines = (tmp_path / "daily-args.log").read_text(encoding="utf-8").splitlines()
+    args_lines = (tmp_path / "reports-args.log").read_text(encoding="utf-8").splitlines()
     assert len(args_lines) == 2
     assert all("--force" not in line for line in args_lines)
 
@@ -830,8 +806,7 @@ printf 'orders sync should not run\n' >> "${TMPDIR:-/tmp}/orders-sync-invoked.lo
 exit 0
 """,
     )
-    _write_executable(scripts_dir / "run_local_reports_pending_deliveries.sh", "#!/usr/bin/env bash\nexit 0\n")
-    _write_executable(scripts_dir / "run_local_reports_daily_sales.sh", "#!/usr/bin/env bash\nexit 0\n")
+    _write_executable(scripts_dir / "run_local_reports_all.sh", "#!/usr/bin/env bash\nexit 0\n")
 
     env = os.environ.copy()
     env.update(
@@ -839,9 +814,7 @@ exit 0
             "ORDERS_MAX_ATTEMPTS": "1",
             "ORDERS_PREFLIGHT_MAX_ATTEMPTS": "1",
             "ORDERS_PREFLIGHT_RETRY_DELAY_SECONDS": "0",
-            "DAILY_MAX_ATTEMPTS": "1",
-            "PENDING_MAX_ATTEMPTS": "1",
-            "DAILY_RESCUE_AFTER_PENDING_SUCCESS": "0",
+            "REPORTS_MAX_ATTEMPTS": "1",
             "TMPDIR": str(tmp_path),
         }
     )
@@ -902,10 +875,7 @@ def test_cron_does_not_retry_deterministic_environment_or_cli_errors(
         "exit 1\n",
     )
     _write_executable(
-        scripts_dir / "run_local_reports_pending_deliveries.sh", "#!/usr/bin/env bash\nexit 0\n"
-    )
-    _write_executable(
-        scripts_dir / "run_local_reports_daily_sales.sh", "#!/usr/bin/env bash\nexit 0\n"
+        scripts_dir / "run_local_reports_all.sh", "#!/usr/bin/env bash\nexit 0\n"
     )
 
     env = os.environ.copy()
@@ -914,9 +884,7 @@ def test_cron_does_not_retry_deterministic_environment_or_cli_errors(
             "ORDERS_MAX_ATTEMPTS": "3",
             "ORDERS_RETRY_DELAY_SECONDS": "0",
             "ORDERS_RETRY_JITTER_SECONDS": "0",
-            "DAILY_MAX_ATTEMPTS": "1",
-            "PENDING_MAX_ATTEMPTS": "1",
-            "DAILY_RESCUE_AFTER_PENDING_SUCCESS": "0",
+            "REPORTS_MAX_ATTEMPTS": "1",
             "TMPDIR": str(tmp_path),
         }
     )
@@ -965,15 +933,9 @@ exit 1
 """,
     )
     _write_executable(
-        scripts_dir / "run_local_reports_daily_sales.sh",
+        scripts_dir / "run_local_reports_all.sh",
         "#!/usr/bin/env bash\n"
-        "printf '%s\\n' \"$*\" >> \"${TMPDIR:-/tmp}/daily-args.log\"\n"
-        "exit 0\n",
-    )
-    _write_executable(
-        scripts_dir / "run_local_reports_pending_deliveries.sh",
-        "#!/usr/bin/env bash\n"
-        "printf '%s\\n' \"$*\" >> \"${TMPDIR:-/tmp}/pending-args.log\"\n"
+        "printf '%s\\n' \"$*\" >> \"${TMPDIR:-/tmp}/reports-args.log\"\n"
         "exit 0\n",
     )
 
@@ -983,9 +945,7 @@ exit 1
             "ORDERS_MAX_ATTEMPTS": "3",
             "ORDERS_RETRY_DELAY_SECONDS": "0",
             "ORDERS_RETRY_JITTER_SECONDS": "0",
-            "DAILY_MAX_ATTEMPTS": "1",
-            "PENDING_MAX_ATTEMPTS": "1",
-            "DAILY_RESCUE_AFTER_PENDING_SUCCESS": "0",
+            "REPORTS_MAX_ATTEMPTS": "1",
             "TMPDIR": str(tmp_path),
         }
     )
@@ -1002,10 +962,8 @@ exit 1
     assert result.returncode == 1
     assert (tmp_path / "orders-call-count").read_text(encoding="utf-8") == "1"
 
-    daily_args = (tmp_path / "daily-args.log").read_text(encoding="utf-8")
-    pending_args = (tmp_path / "pending-args.log").read_text(encoding="utf-8")
-    assert "--orders-sync-upstream-status failed" in daily_args
-    assert "--orders-sync-upstream-status failed" in pending_args
+    reports_args = (tmp_path / "reports-args.log").read_text(encoding="utf-8")
+    assert "--orders-sync-upstream-status failed" in reports_args
 
     log_files = sorted(logs_dir.glob("cron_run_orders_and_reports_*.log"))
     assert log_files
@@ -1045,8 +1003,7 @@ echo '{"run_id":"orders-transient-success"}'
 exit 0
 """,
     )
-    _write_executable(scripts_dir / "run_local_reports_pending_deliveries.sh", "#!/usr/bin/env bash\nexit 0\n")
-    _write_executable(scripts_dir / "run_local_reports_daily_sales.sh", "#!/usr/bin/env bash\nexit 0\n")
+    _write_executable(scripts_dir / "run_local_reports_all.sh", "#!/usr/bin/env bash\nexit 0\n")
 
     env = os.environ.copy()
     env.update(
@@ -1056,9 +1013,7 @@ exit 0
             "ORDERS_RETRY_JITTER_SECONDS": "0",
             "ORDERS_RETRY_BACKOFF_MULTIPLIER": "2",
             "ORDERS_RETRY_MAX_DELAY_SECONDS": "2",
-            "DAILY_MAX_ATTEMPTS": "1",
-            "PENDING_MAX_ATTEMPTS": "1",
-            "DAILY_RESCUE_AFTER_PENDING_SUCCESS": "0",
+            "REPORTS_MAX_ATTEMPTS": "1",
             "TMPDIR": str(tmp_path),
         }
     )
@@ -1110,8 +1065,7 @@ echo 'SyntaxError: invalid syntax' >&2
 exit 1
 """,
     )
-    _write_executable(scripts_dir / "run_local_reports_pending_deliveries.sh", "#!/usr/bin/env bash\nexit 0\n")
-    _write_executable(scripts_dir / "run_local_reports_daily_sales.sh", "#!/usr/bin/env bash\nexit 0\n")
+    _write_executable(scripts_dir / "run_local_reports_all.sh", "#!/usr/bin/env bash\nexit 0\n")
 
     env = os.environ.copy()
     env.update(
@@ -1119,9 +1073,7 @@ exit 1
             "ORDERS_MAX_ATTEMPTS": "3",
             "ORDERS_RETRY_DELAY_SECONDS": "0",
             "ORDERS_RETRY_JITTER_SECONDS": "0",
-            "DAILY_MAX_ATTEMPTS": "1",
-            "PENDING_MAX_ATTEMPTS": "1",
-            "DAILY_RESCUE_AFTER_PENDING_SUCCESS": "0",
+            "REPORTS_MAX_ATTEMPTS": "1",
             "TMPDIR": str(tmp_path),
         }
     )
@@ -1173,8 +1125,7 @@ fi
 exit 0
 """,
     )
-    _write_executable(scripts_dir / "run_local_reports_pending_deliveries.sh", "#!/usr/bin/env bash\nexit 0\n")
-    _write_executable(scripts_dir / "run_local_reports_daily_sales.sh", "#!/usr/bin/env bash\nexit 0\n")
+    _write_executable(scripts_dir / "run_local_reports_all.sh", "#!/usr/bin/env bash\nexit 0\n")
 
     env = os.environ.copy()
     env.update(
@@ -1182,9 +1133,7 @@ exit 0
             "ORDERS_MAX_ATTEMPTS": "2",
             "ORDERS_RETRY_DELAY_SECONDS": "0",
             "ORDERS_RETRY_JITTER_SECONDS": "0",
-            "DAILY_MAX_ATTEMPTS": "1",
-            "PENDING_MAX_ATTEMPTS": "1",
-            "DAILY_RESCUE_AFTER_PENDING_SUCCESS": "0",
+            "REPORTS_MAX_ATTEMPTS": "1",
             "TMPDIR": str(tmp_path),
         }
     )
@@ -1233,15 +1182,9 @@ def _run_cron_with_profiler_events(tmp_path: Path, events: list[dict[str, object
         "exit 0\n",
     )
     _write_executable(
-        scripts_dir / "run_local_reports_pending_deliveries.sh",
-        "#!/usr/bin/env bash\n"
-        "printf '%s\\n' \"$*\" >> \"${TMPDIR:-/tmp}/pending-args.log\"\n"
-        "exit 0\n",
-    )
-    _write_executable(
-        scripts_dir / "run_local_reports_daily_sales.sh",
+        scripts_dir / "run_local_reports_all.sh",
         "#!/usr/bin/env bash\n"
-        "printf '%s\\n' \"$*\" >> \"${TMPDIR:-/tmp}/daily-args.log\"\n"
+        "printf '%s\\n' \"$*\" >> \"${TMPDIR:-/tmp}/reports-args.log\"\n"
         "exit 0\n",
     )
 
@@ -1249,9 +1192,7 @@ def _run_cron_with_profiler_events(tmp_path: Path, events: list[dict[str, object
     env.update(
         {
             "ORDERS_MAX_ATTEMPTS": "1",
-            "DAILY_MAX_ATTEMPTS": "1",
-            "PENDING_MAX_ATTEMPTS": "1",
-            "DAILY_RESCUE_AFTER_PENDING_SUCCESS": "0",
+            "REPORTS_MAX_ATTEMPTS": "1",
             "JSON_LOG_FILE": str(logs_dir / "simplify_downloader.jsonl"),
             "TMPDIR": str(tmp_path),
         }
@@ -1502,24 +1443,17 @@ def test_cron_terminates_timed_out_orders_group_releases_lock_and_runs_reports(
         "while :; do sleep 1; done\n",
     )
     _write_executable(
-        scripts_dir / "run_local_reports_daily_sales.sh",
-        "#!/usr/bin/env bash\nprintf 'daily ran\\n' > \"${TMPDIR:-/tmp}/daily-ran.log\"\nexit 0\n",
-    )
-    _write_executable(
-        scripts_dir / "run_local_reports_pending_deliveries.sh",
-        "#!/usr/bin/env bash\nprintf 'pending ran\\n' > \"${TMPDIR:-/tmp}/pending-ran.log\"\nexit 0\n",
+        scripts_dir / "run_local_reports_all.sh",
+        "#!/usr/bin/env bash\nprintf 'reports ran\\n' > \"${TMPDIR:-/tmp}/reports-ran.log\"\nexit 0\n",
     )
 
     env = os.environ.copy()
     env.update(
         {
             "ORDERS_MAX_ATTEMPTS": "1",
-            "DAILY_MAX_ATTEMPTS": "1",
-            "PENDING_MAX_ATTEMPTS": "1",
-            "DAILY_RESCUE_AFTER_PENDING_SUCCESS": "0",
+            "REPORTS_MAX_ATTEMPTS": "1",
             "ORDERS_STEP_TIMEOUT_SECONDS": "1",
-            "DAILY_SALES_STEP_TIMEOUT_SECONDS": "5",
-            "PENDING_DELIVERIES_STEP_TIMEOUT_SECONDS": "5",
+            "REPORTS_STEP_TIMEOUT_SECONDS": "5",
             "KILL_WAIT_SECONDS": "1",
             "TMPDIR": str(tmp_path),
         }
@@ -1536,8 +1470,7 @@ def test_cron_terminates_timed_out_orders_group_releases_lock_and_runs_reports(
     )
 
     assert result.returncode == 1
-    assert (tmp_path / "daily-ran.log").read_text(encoding="utf-8").strip() == "daily ran"
-    assert (tmp_path / "pending-ran.log").read_text(encoding="utf-8").strip() == "pending ran"
+    assert (tmp_path / "reports-ran.log").read_text(encoding="utf-8").strip() == "reports ran"
     descendant_pid = int((tmp_path / "orders-descendant-pid").read_text(encoding="utf-8").strip())
     assert not _pid_is_non_zombie_alive(descendant_pid)
     assert not (tmp_dir / "cron_run_orders_and_reports.lock").exists()
@@ -1554,7 +1487,7 @@ def test_cron_terminates_timed_out_orders_group_releases_lock_and_runs_reports(
         "Script 2: recovery.mark-aged-pending-deliveries: attempt 1/1 succeeded"
         in log_text
     )
-    assert "Script 3: daily_sales_report: attempt 1/1 succeeded" in log_text
+    assert "Script 3: reports.run-all: attempt 1/1 succeeded" in log_text
 
 
 def test_cron_preserves_lock_and_aborts_when_timeout_group_verification_fails(
@@ -1573,12 +1506,8 @@ def test_cron_preserves_lock_and_aborts_when_timeout_group_verification_fails(
         "#!/usr/bin/env bash\nexec sleep 30\n",
     )
     _write_executable(
-        scripts_dir / "run_local_reports_daily_sales.sh",
-        "#!/usr/bin/env bash\nprintf 'daily ran\n' > \"${TMPDIR:-/tmp}/daily-ran.log\"\n",
-    )
-    _write_executable(
-        scripts_dir / "run_local_reports_pending_deliveries.sh",
-        "#!/usr/bin/env bash\nprintf 'pending ran\n' > \"${TMPDIR:-/tmp}/pending-ran.log\"\n",
+        scripts_dir / "run_local_reports_all.sh",
+        "#!/usr/bin/env bash\nprintf 'reports ran\n' > \"${TMPDIR:-/tmp}/reports-ran.log\"\n",
     )
     env = os.environ.copy()
     env.update(
@@ -1602,8 +1531,7 @@ def test_cron_preserves_lock_and_aborts_when_timeout_group_verification_fails(
 
     assert result.returncode == 1
     assert (repo_root / "tmp" / "cron_run_orders_and_reports.lock").is_dir()
-    assert not (repo_root / "daily-ran.log").exists()
-    assert not (repo_root / "pending-ran.log").exists()
+    assert not (repo_root / "reports-ran.log").exists()
     log_text = _latest_orders_log_text(repo_root)
     assert "still has non-zombie members after KILL" in log_text
     assert (
@@ -1627,9 +1555,7 @@ def test_zombie_only_process_group_remnants_do_not_retain_orders_reports_lock(
     env.update(
         {
             "ORDERS_MAX_ATTEMPTS": "1",
-            "DAILY_MAX_ATTEMPTS": "1",
-            "PENDING_MAX_ATTEMPTS": "1",
-            "DAILY_RESCUE_AFTER_PENDING_SUCCESS": "0",
+            "REPORTS_MAX_ATTEMPTS": "1",
             "ORDERS_STEP_TIMEOUT_SECONDS": "1",
             "KILL_WAIT_SECONDS": "1",
             "TMPDIR": str(repo_root),
@@ -1686,9 +1612,7 @@ def test_cron_signal_terminates_active_orders_process_group_and_releases_lock(
     env.update(
         {
             "ORDERS_MAX_ATTEMPTS": "1",
-            "DAILY_MAX_ATTEMPTS": "1",
-            "PENDING_MAX_ATTEMPTS": "1",
-            "DAILY_RESCUE_AFTER_PENDING_SUCCESS": "0",
+            "REPORTS_MAX_ATTEMPTS": "1",
             "ORDERS_STEP_TIMEOUT_SECONDS": "30",
             "KILL_WAIT_SECONDS": "1",
             "TMPDIR": str(repo_root),
@@ -1837,9 +1761,7 @@ def _prepare_minimal_orders_cron(tmp_path: Path) -> tuple[Path, Path]:
     _write_successful_preflight(scripts_dir)
     for name in (
         "orders_sync_run_profiler.sh",
-        "run_local_reports_daily_sales.sh",
-        "run_local_reports_mtd_same_day_fulfillment.sh",
-        "run_local_reports_pending_deliveries.sh",
+        "run_local_reports_all.sh",
     ):
         _write_executable(scripts_dir / name, "#!/usr/bin/env bash\nexit 0\n")
     return repo_root, scripts_dir
@@ -1850,10 +1772,7 @@ def _run_minimal_orders_cron(repo_root: Path, scripts_dir: Path) -> subprocess.C
     env.update(
         {
             "ORDERS_MAX_ATTEMPTS": "1",
-            "DAILY_MAX_ATTEMPTS": "1",
-            "MTD_SAME_DAY_MAX_ATTEMPTS": "1",
-            "PENDING_MAX_ATTEMPTS": "1",
-            "DAILY_RESCUE_AFTER_PENDING_SUCCESS": "0",
+            "REPORTS_MAX_ATTEMPTS": "1",
             "TMPDIR": str(repo_root),
         }
     )
@@ -1929,10 +1848,7 @@ def test_cron_streams_long_running_step_output_before_child_exits(
     env.update(
         {
             "ORDERS_MAX_ATTEMPTS": "1",
-            "DAILY_MAX_ATTEMPTS": "1",
-            "MTD_SAME_DAY_MAX_ATTEMPTS": "1",
-            "PENDING_MAX_ATTEMPTS": "1",
-            "DAILY_RESCUE_AFTER_PENDING_SUCCESS": "0",
+            "REPORTS_MAX_ATTEMPTS": "1",
             "TMPDIR": str(repo_root),
         }
     )
@@ -2041,7 +1957,7 @@ def test_orders_reports_stale_owner_group_is_terminated_and_lock_reacquired(tmp_
     lock_dir = repo_root / "tmp" / "cron_run_orders_and_reports.lock"
     _write_executable(scripts_dir / "orders_sync_run_profiler.sh", "#!/usr/bin/env bash\nif mkdir \"${TMPDIR:-/tmp}/hold-once\" 2>/dev/null; then exec sleep 30; fi\nexit 0\n")
     env = os.environ.copy()
-    env.update({"ORDERS_REPORTS_STALE_OWNER_SECONDS": "0", "STALE_OWNER_TERM_WAIT_SECONDS": "2", "STALE_OWNER_KILL_WAIT_SECONDS": "2", "ORDERS_MAX_ATTEMPTS": "1", "DAILY_MAX_ATTEMPTS": "1", "MTD_SAME_DAY_MAX_ATTEMPTS": "1", "PENDING_MAX_ATTEMPTS": "1", "DAILY_RESCUE_AFTER_PENDING_SUCCESS": "0", "TMPDIR": str(repo_root)})
+    env.update({"ORDERS_REPORTS_STALE_OWNER_SECONDS": "0", "STALE_OWNER_TERM_WAIT_SECONDS": "2", "STALE_OWNER_KILL_WAIT_SECONDS": "2", "ORDERS_MAX_ATTEMPTS": "1", "REPORTS_MAX_ATTEMPTS": "1", "TMPDIR": str(repo_root)})
     owner = subprocess.Popen([str(scripts_dir / "cron_run_orders_and_reports.sh")], cwd=repo_root, env=env, start_new_session=True)
     try:
         _wait_for_orders_path(lock_dir / "pid")
@@ -2097,12 +2013,8 @@ def _run_cron_with_preflight(
         "#!/usr/bin/env bash\nprintf 'orders profiler ran\\n' >> \"${TMPDIR:-/tmp}/orders-ran.log\"\nexit 0\n",
     )
     _write_executable(
-        scripts_dir / "run_local_reports_daily_sales.sh",
-        "#!/usr/bin/env bash\nprintf '%s\\n' \"$*\" >> \"${TMPDIR:-/tmp}/daily-args.log\"\nexit 0\n",
-    )
-    _write_executable(
-        scripts_dir / "run_local_reports_pending_deliveries.sh",
-        "#!/usr/bin/env bash\nprintf '%s\\n' \"$*\" >> \"${TMPDIR:-/tmp}/pending-args.log\"\nexit 0\n",
+        scripts_dir / "run_local_reports_all.sh",
+        "#!/usr/bin/env bash\nprintf '%s\\n' \"$*\" >> \"${TMPDIR:-/tmp}/reports-args.log\"\nexit 0\n",
     )
 
     env = os.environ.copy()
@@ -2111,9 +2023,7 @@ def _run_cron_with_preflight(
             "ORDERS_MAX_ATTEMPTS": "1",
             "ORDERS_PREFLIGHT_MAX_ATTEMPTS": preflight_attempts,
             "ORDERS_PREFLIGHT_RETRY_DELAY_SECONDS": "0",
-            "DAILY_MAX_ATTEMPTS": "1",
-            "PENDING_MAX_ATTEMPTS": "1",
-            "DAILY_RESCUE_AFTER_PENDING_SUCCESS": "0",
+            "REPORTS_MAX_ATTEMPTS": "1",
             "TMPDIR": str(tmp_path),
         }
     )
@@ -58,6 +58,38 @@ def test_report_cli_invokes_daily_sales_runner_with_common_args(monkeypatch) ->
     assert captured == [["--env", "stage"]]
 
 
+def test_report_cli_run_all_forwards_args_and_fails_on_step_error(monkeypatch) -> None:
+    captured: list[dict[str, object]] = []
+
+    def _fake_run_all(**kwargs: object) -> dict[str, str]:
+        captured.append(kwargs)
+        return {"daily_sales_report": "ok", "pending_deliveries": "error"}
+
+    monkeypatch.setattr("app.reports.run_all.run_all", _fake_run_all)
+
+    exit_code = app_main.main(
+        [
+            "report",
+            "run-all",
+            "--report-date",
+            "2026-04-29",
+            "--orders-sync-upstream-status",
+            "success",
+        ]
+    )
+
+    assert exit_code == 1
+    assert captured == [
+        {
+            "report_date": datetime(2026, 4, 29).date(),
+            "env": None,
+            "force": False,
+            "orders_sync_upstream_status": "success",
+            "orders_sync_upstream_run_id": None,
+        }
+    ]
+
+
 def test_report_cli_invokes_pending_deliveries_runner_with_upstream_args(
     monkeypatch,
 ) -> None:
@@ -186,6 +218,31 @@ def test_crm_order_line_items_rebuild_aliases_forward_to_rebuild_runner(
     ]
 
 
+def test_crm_order_line_items_rebuild_forwards_workers(monkeypatch) -> None:
+    captured: list[list[str] | None] = []
+
+    def _fake_runner(argv: list[str] | None = None) -> None:
+        captured.append(argv)
+
+    monkeypatch.setattr("app.crm_downloader.order_line_items_rebuild.run", _fake_runner)
+
+    exit_code = app_main.main(
+        [
+            "crm",
+            "rebuild-order-line-items",
+            "--source",
+            "both",
+            "--window-size",
+            "15",
+            "--workers",
+            "3",
+        ]
+    )
+
+    assert exit_code == 0
+    assert captured == [["--source", "both", "--window-size", "15", "--workers", "3"]]
+
+
 def test_pending_deliveries_direct_cli_accepts_upstream_args(monkeypatch) -> None:
     import app.reports.pending_deliveries.main as pending_main
 
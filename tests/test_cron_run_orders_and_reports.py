@@ -18,14 +18,14 @@ def _write_successful_preflight(scripts_dir: Path) -> None:
     )
 
 
-def test_cron_reports_fail_when_daily_sales_fails(tmp_path: Path) -> None:
+def test_cron_reports_fail_when_run_all_fails(tmp_path: Path) -> None:
     repo_root = Path(__file__).resolve().parents[1]
     fake_bin = tmp_path / "bin"
     fake_bin.mkdir(parents=True, exist_ok=True)
     fake_poetry = fake_bin / "poetry"
     fake_poetry.write_text(
         "#!/usr/bin/env bash\n"
-        "if [[ \"$*\" == *\"report daily-sales\"* ]]; then exit 1; fi\n"
+        "if [[ \"$*\" == *\"report run-all\"* ]]; then exit 1; fi\n"
         "exit 0\n"
     )
     fake_poetry.chmod(0o755)
@@ -36,11 +36,8 @@ def test_cron_reports_fail_when_daily_sales_fails(tmp_path: Path) -> None:
             "PATH": f"{fake_bin}:{env.get('PATH', '')}",
             "CRON_HOME": str(tmp_path),
             "CRON_PATH": str(fake_bin),
-            "DAILY_MAX_ATTEMPTS": "1",
-            "MTD_SAME_DAY_MAX_ATTEMPTS": "1",
-            "PENDING_MAX_ATTEMPTS": "1",
+            "REPORTS_MAX_ATTEMPTS": "1",
             "ORDERS_MAX_ATTEMPTS": "1",
-            "DAILY_RESCUE_AFTER_PENDING_SUCCESS": "0",
             "ORDERS_SYNC_SKIP_CONNECTIVITY_PREFLIGHT": "1",
         }
     )
@@ -69,12 +66,10 @@ def test_cron_does_not_retry_for_undefined_function_error(tmp_path: Path) -> Non
     _write_executable(scripts_dir / "cron_run_orders_and_reports.sh", source_cron)
     _write_successful_preflight(scripts_dir)
     _write_executable(scripts_dir / "orders_sync_run_profiler.sh", "#!/usr/bin/env bash\nexit 0\n")
-    _write_executable(scripts_dir / "run_local_reports_mtd_same_day_fulfillment.sh", "#!/usr/bin/env bash\nexit 0\n")
-    _write_executable(scripts_dir / "run_local_reports_pending_deliveries.sh", "#!/usr/bin/env bash\nexit 0\n")
     _write_executable(
-        scripts_dir / "run_local_reports_daily_sales.sh",
+        scripts_dir / "run_local_reports_all.sh",
         "#!/usr/bin/env bash\n"
-        "COUNT_FILE=\"${TMPDIR:-/tmp}/daily-call-count\"\n"
+        "COUNT_FILE=\"${TMPDIR:-/tmp}/reports-call-count\"\n"
         "count=0\n"
         "[[ -f \"${COUNT_FILE}\" ]] && count=$(cat \"${COUNT_FILE}\")\n"
         "count=$((count + 1))\n"
@@ -86,12 +81,9 @@ def test_cron_does_not_retry_for_undefined_function_error(tmp_path: Path) -> Non
     env = os.environ.copy()
     env.update(
         {
-            "DAILY_MAX_ATTEMPTS": "5",
-            "DAILY_RETRY_DELAY_SECONDS": "0",
+            "REPORTS_MAX_ATTEMPTS": "5",
+            "REPORTS_RETRY_DELAY_SECONDS": "0",
             "ORDERS_MAX_ATTEMPTS": "1",
-            "MTD_SAME_DAY_MAX_ATTEMPTS": "1",
-            "PENDING_MAX_ATTEMPTS": "1",
-            "DAILY_RESCUE_AFTER_PENDING_SUCCESS": "0",
             "TMPDIR": str(tmp_path),
         }
     )
@@ -106,7 +98,7 @@ def test_cron_does_not_retry_for_undefined_function_error(tmp_path: Path) -> Non
     )
 
     assert result.returncode == 1
-    assert (tmp_path / "daily-call-count").read_text(encoding="utf-8") == "1"
+    assert (tmp_path / "reports-call-count").read_text(encoding="utf-8") == "1"
 
     log_files = sorted(logs_dir.glob("cron_run_orders_and_reports_*.log"))
     assert log_files
@@ -14,10 +14,12 @@ from sqlalchemy.dialects import postgresql
 from alembic.migration import MigrationContext
 from alembic.operations import Operations
 from app.common.db import session_scope
+from app.reports.shared import short_payments
 from app.reports.shared.short_payments import (
     _fetch_payment_rows_for_orders,
     fetch_missing_payment_rows_without_proof,
     fetch_short_payment_rows,
+    payment_reconciliation_cache,
 )
 
 
@@ -650,6 +652,92 @@ async def test_fetch_short_payment_rows_requires_recovery_status_column(tmp_path
             )
 
 
+@pytest.mark.asyncio
+async def test_payment_reconciliation_cache_reconciles_once_per_report_run(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    db_path = tmp_path / "payment_reconciliation_cache.db"
+    engine = sa.create_engine(f"sqlite:///{db_path}")
+    with engine.begin() as connection:
+        connection.execute(sa.text("""
+            CREATE TABLE vw_orders (
+                cost_center TEXT NOT NULL,
+                order_number TEXT NOT NULL,
+                order_date TEXT NOT NULL,
+                customer_name TEXT,
+                mobile_number TEXT,
+                order_amount NUMERIC(12, 2) NOT NULL,
+                recovery_status TEXT
+            )
+        """))
+        connection.execute(sa.text(
+            "CREATE TABLE sales (cost_center TEXT, order_number TEXT, payment_received NUMERIC(12, 2))"
+        ))
+        connection.execute(sa.text(
+            "CREATE TABLE payment_collections (cost_center TEXT, order_number TEXT, amount NUMERIC(12, 2), source_type TEXT)"
+        ))
+        connection.execute(sa.text("""
+            INSERT INTO vw_orders VALUES
+                ('CC1', 'SHORT', '2026-05-01T09:00:00', 'Alice', '9001', 100, 'NONE'),
+                ('CC1', 'MISSING', '2026-05-01T10:00:00', 'Bob', '9002', 100, 'NONE')
+        """))
+        connection.execute(sa.text("INSERT INTO sales VALUES ('CC1', 'SHORT', 80), ('CC1', 'MISSING', 80)"))
+        connection.execute(sa.text("INSERT INTO payment_collections VALUES ('CC1', 'SHORT', 80, 'google_sheet')"))
+    engine.dispose()
+
+    loads: list[bool] = []
+    load_reconciliation = short_payments._load_reconciliation
+
+    async def counting_load(**kwargs):
+        loads.append(kwargs["filter_order_date"])
+        return await load_reconciliation(**kwargs)
+
+    monkeypatch.setattr(short_payments, "_load_reconciliation", counting_load)
+    tables = {
+        "orders": sa.table(
+            "vw_orders",
+            *(sa.column(name) for name in (
+                "cost_center", "order_number", "order_date", "customer_name",
+                "mobile_number", "order_amount", "recovery_status",
+            )),
+        ),
+        "payment_collections": sa.table(
+            "payment_collections",
+            *(sa.column(name) for name in ("cost_center", "order_number", "amount", "source_type")),
+        ),
+        "sales": sa.table(
+            "sales", *(sa.column(name) for name in ("cost_center", "order_number", "payment_received"))
+        ),
+    }
+
+    async def load_buckets(session, start: datetime) -> tuple[list, list]:
+        window = {"start_datetime": start, "end_datetime": start.replace(day=start.day + 1)}
+        short_rows = await fetch_short_payment_rows(session=session, **tables, **window)
+        missing_rows = await fetch_missing_payment_rows_without_proof(
+            session=session, **tables, **window, row_factory=MissingPaymentReportRow
+        )
+        return short_rows, missing_rows
+
+    async with session_scope(f"sqlite+aiosqlite:///{db_path}") as session:
+        uncached = await load_buckets(session, datetime(2026, 5, 1))
+        assert len(loads) == 2
+
+        with payment_reconciliation_cache():
+            # Open-ended buckets share one reconciliation across report windows.
+            first = await load_buckets(session, datetime(2026, 5, 1))
+            second = await load_buckets(session, datetime(2026, 5, 10))
+            assert len(loads) == 3
+
+        # A new report run opens a fresh scope and reads committed rows again.
+        with payment_reconciliation_cache():
+            await load_buckets(session, datetime(2026, 5, 1))
+            assert len(loads) == 4
+
+    assert first == second == uncached
+    assert [row.order_number for row in first[0]] == ["SHORT"]
+    assert [row.order_number for row in first[1]] == ["MISSING"]
+
+
 def test_postgres_view_sql_documents_python_compatibility_contract() -> None:
     assert migration.revision == "0115_canon_missing_view"
     assert migration.down_revision == "0114_payment_audit_canon"
@@ -209,6 +209,27 @@ async def test_mtd_pipeline_has_no_missing_payment_fetch_dependency(monkeypatch,
 
 
 
+def test_mtd_run_pipeline_closes_pdf_renderer_before_loop_teardown(monkeypatch) -> None:
+    import app.dashboard_downloader.report_generator as report_generator
+
+    events: list[str] = []
+
+    async def _fake_run(report_date, env, force):
+        events.append("run")
+        raise RuntimeError("render failed")
+
+    async def _fake_close_pdf_renderer() -> None:
+        events.append("close")
+
+    monkeypatch.setattr(mtd_pipeline, "_run", _fake_run)
+    monkeypatch.setattr(report_generator, "close_pdf_renderer", _fake_close_pdf_renderer)
+
+    with pytest.raises(RuntimeError, match="render failed"):
+        mtd_pipeline.run_pipeline(report_date=date(2026, 4, 29), env="test")
+
+    assert events == ["run", "close"]
+
+
 @pytest.mark.asyncio
 async def test_fetch_short_payments_mtd_uses_global_orders_for_grouped_reconciliation(tmp_path, monkeypatch) -> None:
     db_path = tmp_path / 'mtd_short_payments.db'
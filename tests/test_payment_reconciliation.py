@@ -8,6 +8,7 @@ from app.reports.shared.payment_reconciliation import (
     normalize_order_number,
     reconcile_payments,
     split_payment_order_numbers,
+    use_reconciliation_memo,
 )
 
 
@@ -811,3 +812,25 @@ def test_package_sales_short_by_more_than_tolerance_does_not_auto_clear() -> Non
     )
 
     assert result.recovery_auto_clear_orders == ()
+
+
+def test_reconciliation_memo_reuses_results_only_for_unchanged_rows() -> None:
+    def reconcile(amount: str):
+        return reconcile_payments(
+            order_rows=[_order("TD123", "100")],
+            sales_rows=[_sale("TD123", "100")],
+            payment_evidence_rows=[_proof("TD123", amount)],
+        )
+
+    assert reconcile("100") is not reconcile("100")
+
+    with use_reconciliation_memo():
+        first = reconcile("100")
+        assert reconcile("100") is first
+        changed = reconcile("50")
+        with use_reconciliation_memo():
+            assert reconcile("50") is changed
+
+    assert changed is not first
+    assert first.groups[0].status == "paid"
+    assert changed.groups[0].status == "short"
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import date
+
+import pytest
+
+from app.dashboard_downloader.json_logger import JsonLogger
+from app.reports import run_all
+from app.reports.run_all import ReportStep, run_reports
+from app.reports.shared import short_payments
+
+
+@pytest.mark.asyncio
+async def test_run_reports_runs_independent_steps_concurrently_after_dependencies(monkeypatch) -> None:
+    events: list[str] = []
+    daily_release = asyncio.Event()
+    closed: list[bool] = []
+
+    async def fake_close_pdf_renderer() -> None:
+        closed.append(True)
+
+    async def daily(**kwargs) -> None:
+        events.append(f"daily:start:{kwargs['orders_sync_upstream_status']}")
+        assert short_payments._RECONCILIATION_CACHE.get() is not None
+        await daily_release.wait()
+        events.append("daily:end")
+        raise RuntimeError("daily failed")
+
+    async def pending(**kwargs) -> str:
+        events.append("pending:start")
+        return "warning"
+
+    async def mtd(**kwargs) -> str:
+        assert "orders_sync_upstream_status" not in kwargs
+        events.append("mtd:start")
+        # MTD does not wait for Daily Sales; let Daily Sales finish afterwards.
+        daily_release.set()
+        return "ok"
+
+    monkeypatch.setattr(run_all, "close_pdf_renderer", fake_close_pdf_renderer)
+    statuses = await run_reports(
+        report_date=date(2026, 5, 1),
+        env="test",
+        orders_sync_upstream_status="success",
+        steps=(
+            ReportStep("daily_sales_report", daily, accepts_orders_sync_upstream=True),
+            ReportStep("pending_deliveries", pending, depends_on=("daily_sales_report",)),
+            ReportStep("mtd_same_day_fulfillment", mtd),
+        ),
+        logger=JsonLogger(log_file_path=None),
+    )
+
+    assert events == ["daily:start:success", "mtd:start", "daily:end", "pending:start"]
+    assert statuses == {
+        "daily_sales_report": "error",
+        "pending_deliveries": "ok",
+        "mtd_same_day_fulfillment": "ok",
+    }
+    assert closed == [True]
+
+
+@pytest.mark.asyncio
+async def test_run_reports_rejects_dependency_cycles() -> None:
+    async def noop(**_kwargs) -> None:
+        return None
+
+    with pytest.raises(ValueError, match="cycle"):
+        await run_reports(
+            report_date=None,
+            env=None,
+            steps=(ReportStep("a", noop, depends_on=("b",)), ReportStep("b", noop, depends_on=("a",))),
+            logger=JsonLogger(log_file_path=None),
+        )
+
+
+def test_default_report_steps_keep_pending_deliveries_after_daily_sales() -> None:
+    steps = {step.name: step for step in run_all.REPORT_STEPS}
+
+    assert steps["pending_deliveries"].depends_on == ("daily_sales_report",)
+    assert steps["mtd_same_day_fulfillment"].depends_on == ()
+
+
+@pytest.mark.asyncio
+async def test_run_reports_marks_steps_whose_tracker_reports_error_as_failed(monkeypatch) -> None:
+    async def fake_close_pdf_renderer() -> None:
+        return None
+
+    async def missing_database(**_kwargs) -> str:
+        # Pipelines record a missing database URL or PDF timeout without raising.
+        return "error"
+
+    monkeypatch.setattr(run_all, "close_pdf_renderer", fake_close_pdf_renderer)
+    statuses = await run_reports(
+        report_date=None,
+        env=None,
+        steps=(ReportStep("mtd_same_day_fulfillment", missing_database),),
+        logger=JsonLogger(log_file_path=None),
+    )
+
+    assert statuses == {"mtd_same_day_fulfillment": "error"}
+
+
+def test_default_report_steps_use_public_report_entrypoints() -> None:
+    assert {step.run.__name__ for step in run_all.REPORT_STEPS} == {"run_report"}